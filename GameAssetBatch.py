@@ -0,0 +1,377 @@
+################################################################################
+## Game Asset Batch
+##
+## Runs a pipeline of Game Asset Helper Scripts operations on many scene files
+## without the user interface, spread over a pool of mayapy worker processes.
+##
+## Usage:
+##   mayapy GameAssetBatch.py <directory or manifest> --pipeline unitize_planar
+##   mayapy GameAssetBatch.py <directory or manifest> --ops "Initialize UVs,Fix Normals"
+##
+## A manifest is a text file with one scene path per line. Scenes are saved in
+## place unless an output directory is given. Use --standin <module> to run the
+## pipeline against a stand-in maya package instead of a licensed Maya session.
+##
+## Each worker starts Maya once and then processes one scene after another. A
+## scene that crashes Maya, or runs past --timeout, is recorded in the report as
+## "crashed" or "timeout", its worker is replaced by a fresh one, and the batch
+## carries on with the next scene.
+################################################################################
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import multiprocessing.connection
+import os
+import sys
+import time
+import traceback
+
+################################################################################
+## Operations
+################################################################################
+
+# the seed of "Random Rotation Y", fixed so that a batch run gives the same rotations every time
+# ( in the UI a seed of 0 draws a new one, here any seed is used as it is, so it is never 0 )
+RANDOM_ROTATION_SEED = 1
+
+# operation name: ( operation, arguments after the objects )
+OPERATIONS = {
+	"Initialize UVs": ( "initializeUVs", () ),
+	"Delete UVs": ( "deleteUVs", () ),
+	"Unitize Planar": ( "unitizeUVPlanar", ( "map1", ) ),
+	"Unitize Planar ( UnitizeUV )": ( "unitizeUVPlanar", ( "UnitizeUV", ) ),
+	"Unitize Polar": ( "unitizeUVPolar", ( "map1", ) ),
+	"Unitize Polar ( UnitizeUV )": ( "unitizeUVPolar", ( "UnitizeUV", ) ),
+	"Scale UV Quad": ( "scaleUVQuad", ( "map1", ) ),
+	"Fit UVs U": ( "fitMeshUVsToDimension", ( "u", ) ),
+	"Fit UVs V": ( "fitMeshUVsToDimension", ( "v", ) ),
+	"Unfold Layout": ( "unfoldLayout", () ),
+	"Fix Normals": ( "fixNormals", () ),
+	"Delete Back Face Extruded": ( "deleteExtruded", () ),
+	"Close Holes and Bevel": ( "closeHolesAndBevel", () ),
+	"Separate": ( "separateMeshes", () ),
+	"Delete History": ( "deleteHistory", () ),
+	"Center Y Min": ( "centerYMin", () ),
+	"Center Pole": ( "centerPole", () ),
+	"Pivot to World Origin": ( "pivotToWorldOrigin", () ),
+	"Random Rotation Y": ( "randomizeRotation", ( "y", 0, 360, RANDOM_ROTATION_SEED ) ),
+	"Vertex Color Black": ( "applyVertexColor", ( "clear", "r" ) ),
+	"V Coord to R": ( "applyVertexColor", ( "uv_v", "r" ) ),
+}
+
+# named pipelines
+PIPELINES = {
+	"unitize_planar": [ "Initialize UVs", "Unitize Planar", "Fix Normals", "Delete History" ],
+	"unitize_polar": [ "Initialize UVs", "Unitize Polar", "Fix Normals", "Delete History" ],
+	"stacked_uv": [ "Initialize UVs", "Unfold Layout", "Delete History" ],
+	"cleanup": [ "Fix Normals", "Delete History" ],
+}
+
+SCENE_TYPES = {
+	".ma": "mayaAscii",
+	".mb": "mayaBinary",
+	".fbx": "FBX export",
+}
+
+################################################################################
+## Worker
+################################################################################
+
+def initializeWorker( standin ):
+
+	# start maya, or install the stand-in maya package
+	if standin:
+		importlib.import_module( standin ).install()
+	else:
+		import maya.standalone
+		maya.standalone.initialize( name="python" )
+
+	global cmds, helpers
+	import maya.cmds as cmds
+	import GameAssetHelperScripts as helpers
+
+	# the fbx plug-in is needed for fbx scenes, and Unfold3D for u3dUnfold and u3dLayout,
+	# neither of which mayapy loads on its own
+	if not standin:
+		cmds.loadPlugin( "fbxmaya", quiet=True )
+		cmds.loadPlugin( "Unfold3D", quiet=True )
+
+def getMeshTransforms():
+
+	# get the transforms of all of the meshes in the scene
+	shapes = cmds.ls( type="mesh", noIntermediate=True, long=True ) or list()
+	transforms = set()
+	for shape in shapes:
+		parent = cmds.listRelatives( shape, parent=True, fullPath=True )
+		if parent:
+			transforms.add( parent[0] )
+
+	return sorted( transforms )
+
+def processScene( job ):
+
+	path, operations, output_dir = job
+
+	result = dict()
+	result["file"] = path
+	result["status"] = "ok"
+	result["operations"] = list()
+	start_time = time.time()
+
+	try:
+		# open the scene
+		if path.lower().endswith( ".fbx" ):
+			cmds.file( new=True, force=True )
+			cmds.file( path, i=True, type="FBX", ignoreVersion=True )
+		else:
+			cmds.file( path, open=True, force=True, ignoreVersion=True )
+
+		# nothing cached from the previous scene applies to this one
+		helpers.mesh_cache.clear()
+
+		for name in operations:
+
+			operation_name, args = OPERATIONS[name]
+			op_result = dict()
+			op_result["name"] = name
+			op_start = time.time()
+
+			# every operation works on all of the meshes in the scene
+			transforms = getMeshTransforms()
+			if not transforms:
+				op_result["status"] = "skipped"
+			else:
+				getattr( helpers, operation_name )( transforms, *args )
+				op_result["status"] = "ok"
+
+			op_result["seconds"] = time.time() - op_start
+			result["operations"].append( op_result )
+
+		# save the scene
+		save_path = path
+		if output_dir:
+			save_path = os.path.join( output_dir, os.path.basename( path ) )
+
+		scene_type = SCENE_TYPES[ os.path.splitext( save_path )[1].lower() ]
+		if scene_type == "FBX export":
+			cmds.file( save_path, exportAll=True, type=scene_type, force=True )
+		else:
+			cmds.file( rename=save_path )
+			cmds.file( save=True, type=scene_type, force=True )
+		result["output"] = save_path
+
+	except Exception as e:
+		result["status"] = "failed"
+		result["error"] = str( e )
+		result["traceback"] = traceback.format_exc()
+
+	result["seconds"] = time.time() - start_time
+
+	return result
+
+def runWorker( standin, connection ):
+
+	# A worker process: starts maya once, then processes the scenes it is sent through the pipe
+	# and sends back their results, until it is sent None.
+	initializeWorker( standin )
+	while True:
+		job = connection.recv()
+		if job is None:
+			break
+		result = processScene( job )
+		result["worker"] = os.getpid()
+		connection.send( result )
+	connection.close()
+
+class Worker( object ):
+
+	# a worker process, the pipe to it, and the scene it is working on
+
+	def __init__( self, standin ):
+		self.connection, worker_connection = multiprocessing.Pipe()
+		# a daemon, so that the uv kernels it runs stay in the worker instead of each worker
+		# starting a pool of its own on every core
+		self.process = multiprocessing.Process( target=runWorker, args=( standin, worker_connection ), daemon=True )
+		self.process.start()
+		worker_connection.close()
+		self.job = None
+		self.start = None
+
+	def send( self, job ):
+		self.job = job
+		self.start = time.time()
+		self.connection.send( job )
+
+	def stop( self ):
+
+		# an idle worker is asked to finish, a busy one is stopped where it is
+		if self.job is None and self.process.is_alive():
+			try:
+				self.connection.send( None )
+			except OSError:
+				pass
+			self.process.join( 10 )
+		if self.process.is_alive():
+			self.process.terminate()
+		self.process.join()
+		self.connection.close()
+
+################################################################################
+## Runner
+################################################################################
+
+def findScenes( source ):
+
+	# a manifest lists one scene per line
+	if os.path.isfile( source ):
+		with open( source ) as manifest:
+			lines = [ line.strip() for line in manifest ]
+		base_dir = os.path.dirname( os.path.abspath( source ) )
+		return [ os.path.join( base_dir, line ) for line in lines if line and not line.startswith( "#" ) ]
+
+	# otherwise find all of the scenes in the directory
+	scenes = list()
+	for root, dirs, files in os.walk( source ):
+		dirs.sort()
+		for f in sorted( files ):
+			if os.path.splitext( f )[1].lower() in SCENE_TYPES:
+				scenes.append( os.path.join( root, f ) )
+
+	return scenes
+
+def lostResult( path, status, error, seconds ):
+
+	# the result of a scene whose worker never sent one
+	result = dict()
+	result["file"] = path
+	result["status"] = status
+	result["operations"] = list()
+	result["error"] = error
+	result["seconds"] = seconds
+
+	return result
+
+def runBatch( scenes, operations, workers=None, output_dir=None, standin=None, timeout=None ):
+
+	# check the operations before starting any workers
+	for name in operations:
+		if name not in OPERATIONS:
+			raise ValueError( "Unknown operation: " + name )
+
+	if output_dir and not os.path.isdir( output_dir ):
+		os.makedirs( output_dir )
+
+	if workers is None:
+		workers = multiprocessing.cpu_count()
+
+	jobs = [ ( scene, operations, output_dir ) for scene in scenes ]
+	results = list()
+
+	# Fan the scenes out over up to workers long-lived processes, which each start maya only once.
+	# A worker that dies or hangs costs only its own scene: it is not given another one, and a fresh
+	# worker is started in its place when there are scenes left.
+	pending = list( reversed( jobs ) )
+	idle = list()
+	busy = list()
+	try:
+		while pending or busy:
+
+			while pending and ( idle or len( busy ) < workers ):
+				worker = idle.pop() if idle else Worker( standin )
+				worker.send( pending.pop() )
+				busy.append( worker )
+
+			# wait for a result, a worker that exited, or the next timeout
+			wait_time = None
+			if timeout is not None:
+				wait_time = max( min( worker.start + timeout for worker in busy ) - time.time(), 0 )
+			ready = multiprocessing.connection.wait( [ worker.connection for worker in busy ] + [ worker.process.sentinel for worker in busy ], wait_time )
+
+			for worker in list( busy ):
+
+				seconds = time.time() - worker.start
+				alive = True
+				if worker.connection in ready or worker.process.sentinel in ready:
+					try:
+						result = worker.connection.recv()
+					except EOFError:
+						# the worker exited without a result, as when Maya crashes on a scene
+						worker.process.join()
+						result = lostResult( worker.job[0], "crashed", "the worker process exited with code " + str( worker.process.exitcode ), seconds )
+						alive = False
+				elif timeout is not None and seconds >= timeout:
+					result = lostResult( worker.job[0], "timeout", "the scene took longer than " + str( timeout ) + "s", seconds )
+					alive = False
+				else:
+					continue
+
+				busy.remove( worker )
+				if alive:
+					worker.job = None
+					idle.append( worker )
+				else:
+					worker.stop()
+				results.append( result )
+				print( "[" + str( len( results ) ) + "/" + str( len( jobs ) ) + "] " + result["status"] + " " + "%.2f" % result["seconds"] + "s " + result["file"] )
+	finally:
+		for worker in idle + busy:
+			worker.stop()
+
+	results.sort( key=lambda r: r["file"] )
+
+	return results
+
+def writeReport( results, operations, report_path, wall_time ):
+
+	report = dict()
+	report["operations"] = operations
+	report["wall_seconds"] = wall_time
+	report["files"] = len( results )
+	report["failed"] = len( [ r for r in results if r["status"] != "ok" ] )
+	report["results"] = results
+
+	with open( report_path, "w" ) as f:
+		json.dump( report, f, indent=2 )
+
+	# print the total time per operation
+	print( "" )
+	print( "Processed " + str( report["files"] ) + " files in " + "%.2f" % wall_time + "s, " + str( report["failed"] ) + " failed." )
+	for name in operations:
+		seconds = sum( op["seconds"] for r in results for op in r["operations"] if op["name"] == name )
+		print( "  " + name.ljust( 32 ) + "%10.2f" % seconds + "s" )
+	print( "Report written to " + report_path )
+
+def main( argv=None ):
+
+	parser = argparse.ArgumentParser( description="Run Game Asset Helper Scripts operations on many scenes." )
+	parser.add_argument( "source", help="a directory of .ma/.mb/.fbx scenes or a manifest with one scene per line" )
+	parser.add_argument( "--pipeline", choices=sorted( PIPELINES ), help="a named pipeline of operations" )
+	parser.add_argument( "--ops", help="a comma separated list of operations: " + ", ".join( sorted( OPERATIONS ) ) )
+	parser.add_argument( "--workers", type=int, default=None, help="the number of worker processes ( default: one per core )" )
+	parser.add_argument( "--output-dir", default=None, help="save the scenes here instead of in place" )
+	parser.add_argument( "--report", default="batch_report.json", help="the path of the json report" )
+	parser.add_argument( "--standin", default=None, help="a module with an install() function that provides a stand-in maya package" )
+	parser.add_argument( "--timeout", type=float, default=None, help="stop a scene that takes longer than this many seconds ( for a fresh worker, this includes starting Maya )" )
+	args = parser.parse_args( argv )
+
+	if args.ops:
+		operations = [ op.strip() for op in args.ops.split( "," ) if op.strip() ]
+	elif args.pipeline:
+		operations = PIPELINES[args.pipeline]
+	else:
+		parser.error( "either --pipeline or --ops is required" )
+
+	scenes = findScenes( args.source )
+	if not scenes:
+		parser.error( "no scenes found in " + args.source )
+
+	start_time = time.time()
+	results = runBatch( scenes, operations, args.workers, args.output_dir, args.standin, args.timeout )
+	writeReport( results, operations, args.report, time.time() - start_time )
+
+	return 1 if any( r["status"] != "ok" for r in results ) else 0
+
+if __name__ == "__main__":
+	sys.exit( main() )
@@ -0,0 +1,246 @@
+################################################################################
+## Game Asset Benchmarks
+##
+## Times the Game Asset Helper Scripts operations on synthetic meshes of 1k to
+## 1M vertices, without Maya, against the in-memory MayaSceneEmulator scene.
+## The mesh operations run on one mesh of that size, the transform operations
+## on as many 100 vertex pieces as make up that size. Reports the time and the
+## peak Python memory of every operation and size and compares both with a
+## stored baseline.
+##
+## Usage:
+##   python GameAssetBenchmarks.py
+##   python GameAssetBenchmarks.py --max-verts 100000 --only unitizeUVPlanar,separateMeshes
+##   python GameAssetBenchmarks.py --save-baseline
+##
+## The exit code is 1 when an operation is slower, or peaks at more memory, than
+## the baseline by more than the tolerance, so the suite can gate a CI job.
+##
+## benchmarks_baseline.json holds the 1k, 10k and 100k sizes, best of three, made with:
+##   python GameAssetBenchmarks.py --max-verts 100000 --repeat 3 --save-baseline
+## The times only compare on the machine that made them. A CI runner should
+## make its own baseline with the same command from the commit it gates against,
+## and pass it with --baseline.
+################################################################################
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import MayaSceneEmulator
+
+# the scripts import maya at the top, so the stand-in has to be in place first
+MayaSceneEmulator.install()
+
+import GameAssetHelperScripts as helpers
+
+SIZES = [ 1000, 10000, 100000, 1000000 ]
+DEFAULT_BASELINE = os.path.join( os.path.dirname( os.path.abspath( __file__ ) ), "benchmarks_baseline.json" )
+
+# peaks below this are compared as this much, so that noise in tiny peaks does not count as a change
+MEMORY_FLOOR_MB = 1.0
+
+################################################################################
+## Scenes
+################################################################################
+
+# the vertex count of one piece in the scenes of many pieces
+PIECE_VERTS = 100
+
+def makePieces( num_verts, group, seed=0 ):
+
+	# small grids under a group, as many as make up the vertex count, scattered with random transforms
+	scene = MayaSceneEmulator.scene
+	group_node = scene.createNode( "transform", group )
+	points, face_counts, face_verts, uvs = MayaSceneEmulator.makeGrid( PIECE_VERTS )
+	rng = np.random.default_rng( seed )
+	num_pieces = max( num_verts // len( points ), 2 )
+
+	pieces = list()
+	for i in range( num_pieces ):
+		piece = scene.createMesh( "piece%d" % i, points, face_counts, face_verts, uvs, parent=group_node )
+		attrs = scene.node( piece ).attrs
+		attrs["translate"] = rng.uniform( -50, 50, 3 ).tolist()
+		attrs["rotate"] = rng.uniform( 0, 360, 3 ).tolist()
+		attrs["scale"] = rng.uniform( 0.5, 2, 3 ).tolist()
+		pieces.append( piece )
+
+	return pieces, num_pieces * len( points )
+
+################################################################################
+## Benchmarks
+################################################################################
+
+# operation name: ( scene type, operation on a list of objects ), where the scene type is a mesh
+# type for one mesh, "pieces" for many small meshes, or "twin_pieces" for two groups of them
+BENCHMARKS = collections.OrderedDict( [
+	( "unitizeUVPlanar", ( "grid", lambda objs: helpers.unitizeUVPlanar( objs, "map1" ) ) ),
+	( "scaleUVQuad", ( "grid", lambda objs: helpers.scaleUVQuad( objs, "map1" ) ) ),
+	( "fitMeshUVsToDimension", ( "grid", lambda objs: helpers.fitMeshUVsToDimension( objs, "u" ) ) ),
+	( "applyVertexColor", ( "grid", lambda objs: helpers.applyVertexColor( objs, "uv_v", "r" ) ) ),
+	( "unitizeUVPolar", ( "tube", lambda objs: helpers.unitizeUVPolar( objs, "map1" ) ) ),
+	( "packUVs", ( "shells", lambda objs: helpers.packUVs( objs, "map1" ) ) ),
+	( "separateMeshes", ( "shells", lambda objs: helpers.separateMeshes( objs ) ) ),
+	( "closeHolesAndBevel", ( "open", lambda objs: helpers.closeHolesAndBevel( objs ) ) ),
+	( "deleteExtruded", ( "slab", lambda objs: helpers.deleteExtruded( objs ) ) ),
+	( "centerYMin", ( "grid", lambda objs: helpers.centerYMin( objs ) ) ),
+	( "centerPole", ( "tube", lambda objs: helpers.centerPole( objs ) ) ),
+	( "cameraProjectUVs", ( "grid", lambda objs: helpers.cameraProjectUVs( objs, MayaSceneEmulator.scene.createCamera( "camera1", ( 1.0, 0.5, 5.0 ) ), "map1", 1 ) ) ),
+	( "transferUVSet", ( "pieces", lambda objs: helpers.transferUVSet( objs[0], objs[1:], "map1" ) ) ),
+	( "packUVsPieces", ( "pieces", lambda objs: helpers.packUVs( objs, "map1" ) ) ),
+	( "setPivot", ( "pieces", lambda objs: helpers.setPivot( objs, "ymin" ) ) ),
+	( "distribute", ( "pieces", lambda objs: helpers.distribute( objs, "x", 0.1 ) ) ),
+	( "randomizeRotation", ( "pieces", lambda objs: helpers.randomizeRotation( objs, "xyz", 0, 360, 1 ) ) ),
+	( "resetTransforms", ( "pieces", lambda objs: helpers.resetTransforms( objs, ( "trans", "rot", "scale" ) ) ) ),
+	( "matchGroupTransforms", ( "twin_pieces", lambda objs: helpers.matchGroupTransforms( objs[0], objs[1], True ) ) ),
+] )
+
+def makeScene( scene_type, num_verts ):
+
+	# a fresh scene with one synthetic mesh, or with many pieces
+	MayaSceneEmulator.scene.reset()
+	helpers.mesh_cache.clear()
+
+	if scene_type == "pieces":
+		return makePieces( num_verts, "pieces" )
+
+	if scene_type == "twin_pieces":
+		pieces, total_verts = makePieces( num_verts, "pieces", seed=0 )
+		makePieces( num_verts, "targets", seed=1 )
+		return [ "|pieces", "|targets" ], total_verts
+
+	points, face_counts, face_verts, uvs = MayaSceneEmulator.MESH_MAKERS[scene_type]( num_verts )
+	obj = MayaSceneEmulator.scene.createMesh( scene_type, points, face_counts, face_verts, uvs )
+	return [ obj ], len( points )
+
+def runBenchmark( name, num_verts, repeat=1, measure_memory=True ):
+
+	scene_type, operation = BENCHMARKS[name]
+
+	# the best time of the repeats, each on a fresh scene
+	times = list()
+	for i in range( repeat ):
+		objs, mesh_verts = makeScene( scene_type, num_verts )
+		start_time = time.perf_counter()
+		operation( objs )
+		times.append( time.perf_counter() - start_time )
+
+	result = dict()
+	result["name"] = name
+	result["size"] = num_verts
+	result["verts"] = mesh_verts
+	result["seconds"] = min( times )
+
+	# a separate run for memory, as tracing slows everything down
+	if measure_memory:
+		objs, mesh_verts = makeScene( scene_type, num_verts )
+		tracemalloc.start()
+		try:
+			operation( objs )
+			result["peak_mb"] = tracemalloc.get_traced_memory()[1] / 1048576.0
+		finally:
+			tracemalloc.stop()
+
+	return result
+
+def compareRatio( ratio, tolerance, worse, better ):
+	if ratio > tolerance:
+		return worse
+	if ratio < 1.0 / tolerance:
+		return better
+	return "ok"
+
+def compareToBaseline( results, baseline, tolerance, memory_tolerance ):
+
+	for result in results:
+		key = result["name"] + "@" + str( result["size"] )
+		base = baseline.get( key )
+		if base is None:
+			result["status"] = "new"
+			continue
+		result["baseline_seconds"] = base["seconds"]
+		result["ratio"] = result["seconds"] / max( base["seconds"], 1e-9 )
+		result["status"] = compareRatio( result["ratio"], tolerance, "slower", "faster" )
+
+		# peak memory, when both runs measured it
+		if "peak_mb" in result and base.get( "peak_mb" ) is not None:
+			result["baseline_peak_mb"] = base["peak_mb"]
+			result["memory_ratio"] = max( result["peak_mb"], MEMORY_FLOOR_MB ) / max( base["peak_mb"], MEMORY_FLOOR_MB )
+			result["memory_status"] = compareRatio( result["memory_ratio"], memory_tolerance, "more", "less" )
+
+def printTable( results ):
+
+	print( "operation".ljust( 24 ) + "verts".rjust( 10 ) + "seconds".rjust( 12 ) + "baseline".rjust( 12 ) + "ratio".rjust( 8 ) + "  status".ljust( 10 ) + "peak MB".rjust( 10 ) + "baseline".rjust( 10 ) + "ratio".rjust( 8 ) + "  memory" )
+	for r in results:
+		line = r["name"].ljust( 24 ) + str( r["verts"] ).rjust( 10 ) + ( "%12.4f" % r["seconds"] )
+		line += ( "%12.4f" % r["baseline_seconds"] ) if "baseline_seconds" in r else " " * 12
+		line += ( "%8.2f" % r["ratio"] ) if "ratio" in r else " " * 8
+		line += ( "  " + r.get( "status", "" ) ).ljust( 10 )
+		line += ( "%10.1f" % r["peak_mb"] ) if "peak_mb" in r else " " * 10
+		line += ( "%10.1f" % r["baseline_peak_mb"] ) if "baseline_peak_mb" in r else " " * 10
+		line += ( "%8.2f" % r["memory_ratio"] ) if "memory_ratio" in r else " " * 8
+		line += "  " + r.get( "memory_status", "" )
+		print( line )
+
+def main( argv=None ):
+
+	parser = argparse.ArgumentParser( description="Benchmark the Game Asset Helper Scripts operations on synthetic meshes." )
+	parser.add_argument( "--sizes", default=",".join( str( s ) for s in SIZES ), help="comma separated vertex counts" )
+	parser.add_argument( "--max-verts", type=int, default=None, help="skip the sizes above this vertex count" )
+	parser.add_argument( "--only", default=None, help="a comma separated list of operations: " + ", ".join( BENCHMARKS ) )
+	parser.add_argument( "--repeat", type=int, default=1, help="run every benchmark this many times and keep the best time" )
+	parser.add_argument( "--no-memory", action="store_true", help="skip the peak memory run" )
+	parser.add_argument( "--baseline", default=DEFAULT_BASELINE, help="the baseline json to compare with" )
+	parser.add_argument( "--save-baseline", action="store_true", help="store these results as the new baseline" )
+	parser.add_argument( "--tolerance", type=float, default=1.25, help="the time ratio above which an operation counts as slower" )
+	parser.add_argument( "--memory-tolerance", type=float, default=1.5, help="the peak memory ratio above which an operation counts as using more memory" )
+	parser.add_argument( "--report", default=None, help="write the results to this json file" )
+	args = parser.parse_args( argv )
+
+	sizes = [ int( s ) for s in args.sizes.split( "," ) if s.strip() ]
+	if args.max_verts:
+		sizes = [ s for s in sizes if s <= args.max_verts ]
+
+	names = list( BENCHMARKS )
+	if args.only:
+		names = [ n.strip() for n in args.only.split( "," ) if n.strip() ]
+		for name in names:
+			if name not in BENCHMARKS:
+				parser.error( "unknown operation: " + name )
+
+	results = list()
+	for name in names:
+		for size in sizes:
+			results.append( runBenchmark( name, size, args.repeat, not args.no_memory ) )
+			print( name + " @ " + str( results[-1]["verts"] ) + " verts: " + "%.4f" % results[-1]["seconds"] + "s" )
+
+	baseline = dict()
+	if os.path.isfile( args.baseline ):
+		with open( args.baseline ) as f:
+			baseline = json.load( f )
+	compareToBaseline( results, baseline, args.tolerance, args.memory_tolerance )
+
+	print( "" )
+	printTable( results )
+
+	if args.report:
+		with open( args.report, "w" ) as f:
+			json.dump( results, f, indent=2 )
+
+	if args.save_baseline:
+		for r in results:
+			baseline[ r["name"] + "@" + str( r["size"] ) ] = { "seconds": r["seconds"], "peak_mb": r.get( "peak_mb" ), "verts": r["verts"] }
+		with open( args.baseline, "w" ) as f:
+			json.dump( baseline, f, indent=2, sort_keys=True )
+		print( "Baseline written to " + args.baseline )
+
+	return 1 if any( r.get( "status" ) == "slower" or r.get( "memory_status" ) == "more" for r in results ) else 0
+
+if __name__ == "__main__":
+	sys.exit( main() )
@@ -1,9 +1,17 @@
 import maya.cmds as cmds
 import maya.mel as mel
+import functools
 import re
-import random as rand
 import math
-import maya.OpenMaya as om
+import time
+import bisect
+import collections
+import hashlib
+import numpy as np
+import maya.api.OpenMaya as om2
+
+import GameAssetWorkers as workers
+import GameAssetUndo as undo
 
 ################################################################################
 ## Functions
@@ -12,222 +20,797 @@ import maya.OpenMaya as om
 def takeSecond( elem ):
     return elem[1]
 
-def getShells( obj ):
+# Component Sets
+
+class ComponentSet( object ):
+	
+	# The components of one kind ( "vtx", "e", "f" or "map" ) on one object, stored as a
+	# sorted array of unique indices. Set algebra works on the integer arrays, and names
+	# are only made when Maya needs them, in compact ranges such as "|grp|mesh.e[0:999]".
+	
+	def __init__( self, obj, kind, indices=() ):
+		self.obj = obj
+		self.kind = kind
+		self.indices = np.unique( np.asarray( indices, dtype=np.int64 ).ravel() )
+	
+	@classmethod
+	def fromNames( cls, components, kind ):
+		
+		# make one component set per object from a list of flat or compact component names
+		return [ cls( obj, kind, indices ) for obj, indices in getComponentIndices( components, kind ).items() ]
+	
+	def toNames( self ):
+		
+		if len( self.indices ) == 0:
+			return list()
+		
+		# find the runs of consecutive indices
+		breaks = np.flatnonzero( np.diff( self.indices ) != 1 )
+		firsts = self.indices[ np.concatenate( ( [0], breaks + 1 ) ) ]
+		lasts = self.indices[ np.concatenate( ( breaks, [ len( self.indices ) - 1 ] ) ) ]
+		
+		names = list()
+		prefix = self.obj + "." + self.kind + "["
+		for first, last in zip( firsts.tolist(), lasts.tolist() ):
+			if first == last:
+				names.append( prefix + str( first ) + "]" )
+			else:
+				names.append( prefix + str( first ) + ":" + str( last ) + "]" )
+		
+		return names
+	
+	def checkCompatible( self, other ):
+		if self.obj != other.obj or self.kind != other.kind:
+			raise ValueError( "Component sets on " + self.obj + "." + self.kind + " and " + other.obj + "." + other.kind + " can not be combined." )
+	
+	def union( self, other ):
+		self.checkCompatible( other )
+		return ComponentSet( self.obj, self.kind, np.union1d( self.indices, other.indices ) )
+	
+	def difference( self, other ):
+		self.checkCompatible( other )
+		return ComponentSet( self.obj, self.kind, np.setdiff1d( self.indices, other.indices, assume_unique=True ) )
+	
+	def intersection( self, other ):
+		self.checkCompatible( other )
+		return ComponentSet( self.obj, self.kind, np.intersect1d( self.indices, other.indices, assume_unique=True ) )
+	
+	__or__ = union
+	__sub__ = difference
+	__and__ = intersection
+	
+	def __len__( self ):
+		return len( self.indices )
+	
+	def __iter__( self ):
+		return iter( self.indices.tolist() )
+	
+	def __getitem__( self, i ):
+		return int( self.indices[i] )
+	
+	def __contains__( self, index ):
+		i = np.searchsorted( self.indices, index )
+		return i < len( self.indices ) and self.indices[i] == index
+	
+	def __repr__( self ):
+		return "ComponentSet( " + repr( self.obj ) + ", " + repr( self.kind ) + ", " + str( len( self ) ) + " components )"
 
-	# convert to vertices
-	verts = cmds.polyListComponentConversion( obj, toVertex=True )
+# Mesh Topology
 
-	# flatten the list
-	verts = cmds.ls( verts, flatten=True )
+def buildCSR( keys, values, num_keys ):
+	
+	# Groups the values by key in a compressed sparse row layout.
+	# The values for key i are stored in sorted_values[ offsets[i]:offsets[i+1] ].
+	
+	order = np.argsort( keys, kind="stable" )
+	offsets = np.zeros( num_keys + 1, dtype=np.int64 )
+	np.cumsum( np.bincount( keys, minlength=num_keys ), out=offsets[1:] )
+	return offsets, values[order]
 
-	# define variables
-	remaining_verts = verts
-	shells = list()
+def labelComponents( num_items, a, b ):
+	
+	# Disjoint-set labelling of items joined by the pairs ( a[i], b[i] ).
+	# The forest is stored as a parent array: every pass hooks the root of the larger
+	# label onto the root of the smaller one, then compresses the paths until each item
+	# points straight at its root. Returns a label per item and the number of labels.
+	
+	parent = np.arange( num_items, dtype=np.int64 )
+	a = np.asarray( a, dtype=np.int64 )
+	b = np.asarray( b, dtype=np.int64 )
+	
+	# pairs joining an item to itself never change the forest
+	keep = a != b
+	a = a[keep]
+	b = b[keep]
+	
+	while len( a ) > 0:
+		
+		# hook the larger root onto the smaller root
+		root_a = parent[a]
+		root_b = parent[b]
+		low = np.minimum( root_a, root_b )
+		high = np.maximum( root_a, root_b )
+		joined = low != high
+		if not joined.any():
+			break
+		np.minimum.at( parent, high[joined], low[joined] )
+		
+		# compress the paths
+		while True:
+			grand_parent = parent[parent]
+			if np.array_equal( grand_parent, parent ):
+				break
+			parent = grand_parent
+		
+		# only the pairs that were not yet in the same set need another pass
+		a = a[joined]
+		b = b[joined]
+	
+	# number the roots from zero
+	roots, labels = np.unique( parent, return_inverse=True )
+	
+	return labels, len( roots )
 
-	while len( remaining_verts ) > 0:
+def getMeshFn( obj ):
+	
+	# get the dag path to the mesh shape
+	sel_list = om2.MSelectionList()
+	sel_list.add( obj )
+	dag_path = sel_list.getDagPath( 0 )
+	dag_path.extendToShape()
+	
+	return om2.MFnMesh( dag_path )
+
+class MeshTopology( object ):
+	
+	# A snapshot of the connectivity of a mesh, built once from bulk API reads.
+	# Adjacency is stored in integer arrays so that valence, boundary and neighbour
+	# queries never go through component name strings.
+	
+	def __init__( self, num_verts, face_counts, face_verts, edge_verts, obj=None ):
 		
-		# select the first shell
-		cmds.select( remaining_verts[0] )
+		self.obj = obj
+		self.num_verts = int( num_verts )
 		
-		# convert to shell
-		cmds.polySelectConstraint( shell=True, t=0x0001, m=2 )
+		# edge to vertex
+		self.edge_verts = np.asarray( edge_verts, dtype=np.int64 ).reshape( -1, 2 )
+		self.num_edges = len( self.edge_verts )
 		
-		# define the shell as the next shell
-		next_shell = cmds.ls( selection=True, flatten=True )
+		# face to vertex
+		face_counts = np.asarray( face_counts, dtype=np.int64 )
+		self.num_faces = len( face_counts )
+		self.face_counts = face_counts
+		self.face_verts = np.asarray( face_verts, dtype=np.int64 )
+		self.face_offsets = np.zeros( self.num_faces + 1, dtype=np.int64 )
+		np.cumsum( face_counts, out=self.face_offsets[1:] )
 		
-		# clear the selection
-		cmds.select( clear=True )
+		# the face of each face-vertex and the index of the next face-vertex around the face
+		self.face_vert_faces = np.repeat( np.arange( self.num_faces, dtype=np.int64 ), face_counts )
+		self.face_vert_next = np.arange( 1, len( self.face_verts ) + 1, dtype=np.int64 )
+		self.face_vert_next[ self.face_offsets[1:] - 1 ] = self.face_offsets[:-1]
 		
-		# add it to the list of shells
-		shells.append( next_shell )
+		# the edge from each face-vertex to the next one, found by matching sorted vertex pair keys
+		edge_keys = self.edgeKeys( self.edge_verts[:, 0], self.edge_verts[:, 1] )
+		edge_order = np.argsort( edge_keys )
+		face_keys = self.edgeKeys( self.face_verts, self.face_verts[ self.face_vert_next ] )
+		found = np.minimum( np.searchsorted( edge_keys[edge_order], face_keys ), max( self.num_edges - 1, 0 ) )
+		self.face_edges = edge_order[ found ] if self.num_edges else found
 		
-		# remove the shell from the list of remaining verts
-		remaining_verts = set( remaining_verts )
-		next_shell = set( next_shell )
-		remaining_verts = remaining_verts.difference( next_shell )
-		remaining_verts = list( remaining_verts )
+		# a side with no edge would hand the wrong edges to every later walk, so refuse the mesh
+		missing = np.flatnonzero( edge_keys[ self.face_edges ] != face_keys ) if self.num_edges else np.arange( len( face_keys ) )
+		if len( missing ):
+			raise ValueError( "The edges of " + str( obj ) + " do not match its faces: " + str( len( missing ) ) + " face sides have no edge, the first on face " + str( self.face_vert_faces[ missing[0] ] ) + "." )
 		
-	cmds.polySelectConstraint( shell=False )
-	return shells
-
-def getPoleVerts( obj ) :
-	# convert to vertices
-	verts = cmds.polyListComponentConversion( obj, toVertex=True )
-	# flatten the list
-	verts = cmds.ls( verts, flatten=True )
-	# create an empty list to store the poles
-	poles = list()
-	# for all vertices
-	for v in verts:
-		# get the edges connected to the vertex and store it in a list
-		edges = cmds.polyListComponentConversion( v, toEdge=True )
-		# flatten the list
-		edges = cmds.ls( edges, flatten=True )
-		# if there are more than 4 edges
-		if len( edges ) > 4 :
-			# add it to the list of poles
-			poles.append( v )
-	# return the list of poles
-	return poles
+		# vertex to edge
+		self.vert_edge_offsets, self.vert_edges = buildCSR(
+			self.edge_verts.T.ravel(),
+			np.tile( np.arange( self.num_edges, dtype=np.int64 ), 2 ),
+			self.num_verts
+		)
+		
+		# vertex to face
+		self.vert_face_offsets, self.vert_faces = buildCSR( self.face_verts, self.face_vert_faces, self.num_verts )
+		
+		# edge to face
+		self.edge_face_offsets, self.edge_faces = buildCSR( self.face_edges, self.face_vert_faces, self.num_edges )
+		
+		# shells are labelled on demand
+		self.vert_shell = None
+		self.face_shell = None
+		self.num_shells = 0
+	
+	@classmethod
+	def fromMesh( cls, obj ):
+		
+		# the snapshot from the session cache, which only reads the mesh again after it changed
+		if mesh_cache_max_mb > 0:
+			return mesh_cache.topology( obj )
+		
+		return cls.readMesh( obj )
+	
+	@classmethod
+	def readMesh( cls, obj, fn_mesh=None ):
+		
+		if fn_mesh is None:
+			fn_mesh = getMeshFn( obj )
+		
+		# read the face-vertex lists, and the end points of every edge ( by Maya's edge ids, which the
+		# component names need ) from one polyInfo call rather than one API call per edge
+		face_counts, face_verts = fn_mesh.getVertices()
+		edge_verts = np.zeros( ( 0, 2 ), dtype=np.int64 )
+		if fn_mesh.numEdges:
+			edge_info = cmds.polyInfo( fn_mesh.fullPathName() + ".e[*]", edgeToVertex=True )
+			edge_rows = np.array( re.findall( r"\d+", "".join( edge_info ) ), dtype=np.int64 ).reshape( -1, 3 )
+			edge_verts = edge_rows[ np.argsort( edge_rows[:, 0] ), 1: ]
+		
+		return cls( fn_mesh.numVertices, face_counts, face_verts, edge_verts, obj=obj )
+	
+	def edgeKeys( self, a, b ):
+		# a single integer key for an undirected vertex pair
+		return np.minimum( a, b ) * self.num_verts + np.maximum( a, b )
+	
+	def valence( self ):
+		# the number of edges connected to each vertex
+		return np.diff( self.vert_edge_offsets )
+	
+	def edgeFaceCount( self ):
+		# the number of faces connected to each edge
+		return np.diff( self.edge_face_offsets )
+	
+	def vertEdges( self, v ):
+		return self.vert_edges[ self.vert_edge_offsets[v]:self.vert_edge_offsets[v+1] ]
+	
+	def vertFaces( self, v ):
+		return self.vert_faces[ self.vert_face_offsets[v]:self.vert_face_offsets[v+1] ]
+	
+	def vertNeighbours( self, v ):
+		ends = self.edge_verts[ self.vertEdges( v ) ]
+		return np.where( ends[:, 0] == v, ends[:, 1], ends[:, 0] )
+	
+	def edgeFaces( self, e ):
+		return self.edge_faces[ self.edge_face_offsets[e]:self.edge_face_offsets[e+1] ]
+	
+	def faceVerts( self, f ):
+		return self.face_verts[ self.face_offsets[f]:self.face_offsets[f+1] ]
+	
+	def faceEdges( self, f ):
+		return self.face_edges[ self.face_offsets[f]:self.face_offsets[f+1] ]
+	
+	def boundaryEdges( self ):
+		# edges with only one connected face
+		return np.flatnonzero( self.edgeFaceCount() == 1 )
+	
+	def boundaryVertMask( self ):
+		mask = np.zeros( self.num_verts, dtype=bool )
+		mask[ self.edge_verts[ self.boundaryEdges() ].ravel() ] = True
+		return mask
+	
+	def vertsWithValence( self, valence ):
+		return np.flatnonzero( self.valence() == valence )
+	
+	def shells( self ):
+		
+		# label the shells once and keep the result with the snapshot
+		if self.vert_shell is None:
+			
+			# join every face-vertex to the first vertex of its face
+			first_verts = self.face_verts[ self.face_offsets[ self.face_vert_faces ] ]
+			self.vert_shell, self.num_shells = labelComponents( self.num_verts, self.face_verts, first_verts )
+			
+			# a face belongs to the shell of its first vertex
+			self.face_shell = self.vert_shell[ self.face_verts[ self.face_offsets[:-1] ] ]
+		
+		return self.vert_shell, self.face_shell, self.num_shells
+	
+	def vertSet( self, ids ):
+		return ComponentSet( self.obj, "vtx", ids )
+	
+	def edgeSet( self, ids ):
+		return ComponentSet( self.obj, "e", ids )
+	
+	def faceSet( self, ids ):
+		return ComponentSet( self.obj, "f", ids )
 
-def getSeamEdges( obj, poles ):
-	# create an empty set to store the edges
-	pole_edges = set()
-	# for each pole
-	for v in poles:
-		# convert the pole to edges
-		edges = cmds.polyListComponentConversion( v, toEdge=True )
-		# flatten the list
-		edges = cmds.ls( edges, flatten=True )
-		# convert to a set
-		edges = set( edges )
-		# merge the esges with the set of edges
-		pole_edges = pole_edges.union( edges )
-	
-	# get the first edge
-	edge = list( pole_edges )[0]
-	
-	# get the index of the edge
-	temp_string = edge.split( "[" )
-	temp_string = temp_string[1].split( "]" )[0]
-	edge_index = int( temp_string )
-	# convert the edge to an edge loop
-	cmds.polySelect( obj, edgeLoop=edge_index )
-	# list and flatten the selection
-	seam_edges = cmds.ls( selection=True, flatten=True )
-	# convert to a set
-	seam_edges = set( seam_edges )
+class HalfEdgeMesh( object ):
 	
-	# get the union of the seam and pole edges
-	result_edges = seam_edges.union( pole_edges )
-	# convert to a list
-	result_edges = list( result_edges )
-	# return
-	return result_edges
-
-def normalizePoleTriangles( obj, poles ):
-
-	# get all faces connected to the pole
-	pole_faces = cmds.polyListComponentConversion( poles, toFace=True )
-	# flatten the list
-	pole_faces = cmds.ls( pole_faces, flatten=True )
-	# get all the uvs for the pole
-	pole_uvs = cmds.polyListComponentConversion( poles, toUV=True )
-	# flatten the list
-	pole_uvs = cmds.ls( pole_uvs, flatten=True )
-	# convert to a set
-	pole_uvs = set( pole_uvs )
-	# define a threshold
-	threshold = 0.01
-	
-	for face in pole_faces:
-		face_uvs = cmds.polyListComponentConversion( face, toUV=True )
-		face_uvs = cmds.ls( face_uvs, flatten=True )
-		face_uvs = set( face_uvs )
-		
-		pole_uv = face_uvs.intersection( pole_uvs )
-		non_pole_uv = face_uvs.difference( pole_uv )
-		
-		non_pole_uv = list( non_pole_uv )
-		pole_uv = list( pole_uv )
-		
-		# get the pole coordinates
-		pole_coord = cmds.polyEditUV( pole_uv, query=True )
-		
-		case = 0
-		# check case
-		if pole_coord[0] > ( 1 - threshold ) and pole_coord[0] < ( 1 + threshold ):
-			if pole_coord[1] > ( 1 - threshold ) and pole_coord[1] < ( 1 + threshold ):
-			 	case = 1
-			else:
-			 	case = 2
-		else:
-			case = 3
+	# A half-edge view of a mesh topology snapshot used to walk edge loops and edge rings.
+	# Half-edge k runs from face-vertex k to the next face-vertex around the same face,
+	# so next, prev, face and edge are all plain index arrays.
+	
+	def __init__( self, topo ):
+		
+		self.topo = topo
+		num_half_edges = len( topo.face_verts )
 		
-		# move the pole uv
-		cmds.polyEditUV( pole_uv, u=0.5, v=1.0, r=False )
+		self.he_from = topo.face_verts
+		self.he_next = topo.face_vert_next
+		self.he_to = topo.face_verts[ self.he_next ]
+		self.he_face = topo.face_vert_faces
+		self.he_edge = topo.face_edges
+		self.he_prev = np.empty( num_half_edges, dtype=np.int64 )
+		self.he_prev[ self.he_next ] = np.arange( num_half_edges, dtype=np.int64 )
 		
-		uvc_red = cmds.polyEditUV( non_pole_uv[0], query=True )
-		uvc_blue = cmds.polyEditUV( non_pole_uv[1], query=True )
+		# the twin of a half-edge runs the other way along the same edge, or is -1 on a border
+		keys = self.he_from * topo.num_verts + self.he_to
+		order = np.argsort( keys )
+		sorted_keys = keys[order]
+		twin_keys = self.he_to * topo.num_verts + self.he_from
+		found = np.minimum( np.searchsorted( sorted_keys, twin_keys ), max( num_half_edges - 1, 0 ) )
+		self.he_twin = np.where( sorted_keys[found] == twin_keys, order[found], -1 )
 		
-		if case == 2:
-			if uvc_red[0] > uvc_blue[0]:
-				a_uv = non_pole_uv[0]
-				b_uv = non_pole_uv[1]
+		# one half-edge for every edge
+		self.edge_half_edge = np.full( topo.num_edges, -1, dtype=np.int64 )
+		self.edge_half_edge[ self.he_edge ] = np.arange( num_half_edges, dtype=np.int64 )
+		
+		self.valence = topo.valence()
+		self.boundary_verts = topo.boundaryVertMask()
+	
+	def continuesLoop( self, v, h ):
+		
+		# a loop passes straight through an inner vertex with four edges,
+		# and a border loop passes along the border through a vertex with three edges
+		if self.boundary_verts[v]:
+			return self.valence[v] == 3 and self.he_twin[h] < 0
+		return self.valence[v] == 4
+	
+	def walkLoop( self, h, forward ):
+		
+		# walk from the half-edge h across the vertex at its head ( forward ) or tail
+		edges = list()
+		start_edge = self.he_edge[h]
+		
+		while True:
+			
+			if forward:
+				v = self.he_to[h]
+				if not self.continuesLoop( v, h ):
+					break
+				twin = self.he_twin[ self.he_next[h] ]
+				if twin < 0:
+					break
+				h = self.he_next[twin]
 			else:
-				a_uv = non_pole_uv[1]
-				b_uv = non_pole_uv[0]
-			cmds.polyEditUV( a_uv, u=0.0, v=0.0, r=False )
-			cmds.polyEditUV( b_uv, u=1.0, v=0.0, r=False )
+				v = self.he_from[h]
+				if not self.continuesLoop( v, h ):
+					break
+				twin = self.he_twin[ self.he_prev[h] ]
+				if twin < 0:
+					break
+				h = self.he_prev[twin]
+			
+			# stop when the loop closes on itself
+			if self.he_edge[h] == start_edge:
+				return edges, True
+			
+			edges.append( int( self.he_edge[h] ) )
+		
+		return edges, False
+	
+	def edgeLoop( self, edge ):
+		
+		h = self.edge_half_edge[edge]
+		
+		# walk forward, then backward if the loop is open
+		forward_edges, closed = self.walkLoop( h, True )
+		if closed:
+			return [ int( edge ) ] + forward_edges
+		backward_edges, closed = self.walkLoop( h, False )
+		
+		return backward_edges[::-1] + [ int( edge ) ] + forward_edges
+	
+	def walkRing( self, h ):
+		
+		# step across quads to the opposite edge until a border or a non quad face is reached
+		edges = list()
+		start_edge = self.he_edge[h]
+		
+		while h >= 0 and self.topo.face_counts[ self.he_face[h] ] == 4:
+			
+			h = self.he_next[ self.he_next[h] ]
 			
-		if case == 3:
-			if uvc_red[1] > uvc_blue[1]:
-				a_uv = non_pole_uv[1]
-				b_uv = non_pole_uv[0]
+			# stop when the ring closes on itself
+			if self.he_edge[h] == start_edge:
+				return edges, True
+			
+			edges.append( int( self.he_edge[h] ) )
+			h = self.he_twin[h]
+		
+		return edges, False
+	
+	def edgeRing( self, edge ):
+		
+		h = self.edge_half_edge[edge]
+		
+		# walk through the face on one side, then through the face on the other side if the ring is open
+		first_edges, closed = self.walkRing( h )
+		if closed:
+			return [ int( edge ) ] + first_edges
+		second_edges, closed = self.walkRing( self.he_twin[h] )
+		
+		return second_edges[::-1] + [ int( edge ) ] + first_edges
+
+# Mesh Data Cache
+
+class MeshDataCache( object ):
+	
+	# Keeps the topology snapshot of every mesh the buttons worked on, with anything derived
+	# from it ( half-edges, poles, border loops ), so that running several buttons on the same
+	# mesh analyses it once. Entries are keyed by node UUID and marked stale by a node dirty
+	# callback. A stale entry is kept when the face-vertex lists read back unchanged, as after
+	# uv edits, and rebuilt otherwise. The least recently used entries are dropped once the
+	# cache holds more than mesh_cache_max_mb.
+	#
+	# A stale entry is only checked against the face-vertex lists, so moved points keep it.
+	# Only data that depends on the topology alone can be cached; anything computed from the
+	# point positions ( lengths, normals, bounding boxes ) has to be read from the mesh each time.
+	
+	def __init__( self ):
+		self.entries = collections.OrderedDict()
+		self.num_bytes = 0
+	
+	def entry( self, obj ):
+		
+		sel_list = om2.MSelectionList()
+		sel_list.add( obj )
+		dag_path = sel_list.getDagPath( 0 )
+		dag_path.extendToShape()
+		node = dag_path.node()
+		uuid = om2.MFnDependencyNode( node ).uuid().asString()
+		fn_mesh = om2.MFnMesh( dag_path )
+		
+		entry = self.entries.get( uuid )
+		
+		# a uuid can come back with another scene, so the node has to be the same one
+		if entry is not None and not entry["handle"].isValid():
+			self.remove( uuid )
+			entry = None
+		
+		if entry is not None and entry["stale"]:
+			face_counts, face_verts = fn_mesh.getVertices()
+			topo = entry["topology"]
+			if np.array_equal( topo.face_counts, face_counts ) and np.array_equal( topo.face_verts, face_verts ) and topo.num_verts == fn_mesh.numVertices:
+				entry["stale"] = False
 			else:
-				a_uv = non_pole_uv[0]
-				b_uv = non_pole_uv[1]
-			cmds.polyEditUV( a_uv, u=0.0, v=0.0, r=False )
-			cmds.polyEditUV( b_uv, u=1.0, v=0.0, r=False )
-
-def unitizeAndLayout( obj, seams, poles, uv_set ):
-	# convert the object to edges
-	edges = cmds.polyListComponentConversion( obj, toEdge=True )
-	# flatten the list
-	edges = cmds.ls( edges, flatten=True )
-	# convert to a set
-	edges = set( edges )
-	# convert to a set
-	seams = set( seams )
-	# get the difference between the two sets
-	sew_edges = edges.difference( seams )
-	# convert to a list
-	sew_edges = list( sew_edges )
-	# set the current uv set
-	cmds.polyUVSet( obj, currentUVSet=True, uvSet=uv_set )
-	# unitize the object
-	cmds.polyForceUV( obj, unitize=True )
-	# normalize the pole triangles
-	normalizePoleTriangles( obj, poles )
+				self.remove( uuid )
+				entry = None
+		
+		if entry is None:
+			entry = dict()
+			entry["topology"] = MeshTopology.readMesh( obj, fn_mesh )
+			entry["derived"] = dict()
+			entry["stale"] = False
+			entry["handle"] = om2.MObjectHandle( node )
+			entry["callback"] = om2.MNodeMessage.addNodeDirtyCallback( node, self.onNodeDirty, uuid )
+			entry["bytes"] = 0
+			self.entries[uuid] = entry
+			self.evict( entry )
+		
+		# the most recently used entries go to the end
+		self.entries.move_to_end( uuid )
+		
+		# components are named after the object as it is called now
+		entry["topology"].obj = obj
+		
+		return entry
+	
+	def topology( self, obj ):
+		return self.entry( obj )["topology"]
+	
+	def derived( self, obj, name, compute ):
+		
+		# the result of compute( topology ), computed once per topology
+		entry = self.entry( obj )
+		if name not in entry["derived"]:
+			entry["derived"][name] = compute( entry["topology"] )
+			self.evict( entry )
+		
+		return entry["derived"][name]
+	
+	def onNodeDirty( self, node, uuid ):
+		entry = self.entries.get( uuid )
+		if entry is not None:
+			entry["stale"] = True
+	
+	def remove( self, uuid ):
+		entry = self.entries.pop( uuid )
+		self.num_bytes -= entry["bytes"]
+		try:
+			om2.MMessage.removeCallback( entry["callback"] )
+		except RuntimeError:
+			pass
+	
+	def clear( self ):
+		for uuid in list( self.entries ):
+			self.remove( uuid )
+	
+	def evict( self, entry ):
+		
+		# recount the entry that grew, keeping a running total rather than summing every entry each time
+		entry_bytes = entryBytes( entry )
+		self.num_bytes += entry_bytes - entry["bytes"]
+		entry["bytes"] = entry_bytes
+		
+		# drop the least recently used entries until the cache fits, but keep the newest one
+		max_bytes = mesh_cache_max_mb * 1024 * 1024
+		while len( self.entries ) > 1 and self.num_bytes > max_bytes:
+			self.remove( next( iter( self.entries ) ) )
+	
+	def numBytes( self ):
+		return self.num_bytes
+
+def entryBytes( entry ):
+	
+	# the memory held by the arrays of a cache entry
+	values = list( vars( entry["topology"] ).values() )
+	for value in entry["derived"].values():
+		if hasattr( value, "__dict__" ):
+			values.extend( vars( value ).values() )
+		elif isinstance( value, ( list, tuple ) ):
+			values.extend( value )
+		else:
+			values.append( value )
+	
+	return sum( value.nbytes for value in values if isinstance( value, np.ndarray ) )
+
+mesh_cache = MeshDataCache()
+
+def getMeshDerived( obj, name, compute, topo=None ):
+	
+	# the result of compute( topology ), kept in the session cache when it is on; without the cache
+	# it is computed from the topology given, or from one fresh read of the mesh
+	if mesh_cache_max_mb > 0:
+		return mesh_cache.derived( obj, name, compute )
+	
+	return compute( topo if topo is not None else MeshTopology.readMesh( obj ) )
+
+def getHalfEdgeMesh( obj ):
+	return getMeshDerived( obj, "half_edges", HalfEdgeMesh )
+
+def topologySignature( num_verts, face_counts, face_verts ):
+	
+	# a hash of the vertex count and the face-vertex lists
+	signature = hashlib.sha1( np.int64( num_verts ).tobytes() )
+	signature.update( np.asarray( face_counts, dtype=np.int64 ).tobytes() )
+	signature.update( np.asarray( face_verts, dtype=np.int64 ).tobytes() )
+	
+	return signature.hexdigest()
+
+def getTopologySignature( obj ):
+	
+	# meshes with the same signature have the same faces on the same vertices in the same order,
+	# so their per-index data ( uvs, colors ) lines up one to one. The face-vertex lists are read
+	# straight from the mesh, as a full MeshTopology would also parse the edges, which the hash
+	# does not use.
+	fn_mesh = getMeshFn( obj )
+	face_counts, face_verts = fn_mesh.getVertices()
+	
+	return topologySignature( fn_mesh.numVertices, face_counts, face_verts )
+
+def getShells( obj ):
+
+	# get the mesh topology
+	topo = MeshTopology.fromMesh( obj )
+	
+	# label the shells
+	vert_shell, face_shell, num_shells = topo.shells()
+	
+	# group the vertex indices by shell
+	order = np.argsort( vert_shell, kind="stable" )
+	bounds = np.cumsum( np.bincount( vert_shell, minlength=num_shells ) )[:-1]
+	
+	shells = list()
+	for shell_verts in np.split( order, bounds ):
+		shells.append( topo.vertSet( shell_verts ) )
+	
+	return shells
+
+def getShellCount( obj ):
+	
+	# count the shells without building any component names
+	return MeshTopology.fromMesh( obj ).shells()[2]
+
+def poleIndices( topo ):
+	# the poles are the vertices with more than 4 edges
+	return np.flatnonzero( topo.valence() > 4 )
+
+def getPoleVerts( obj ) :
+	# get the mesh topology
+	topo = MeshTopology.fromMesh( obj )
+	# get the poles
+	poles = getMeshDerived( obj, "poles", poleIndices, topo )
+	# return the set of poles
+	return topo.vertSet( poles )
+
+def getSeamEdges( obj, poles ):
+	# get the mesh topology
+	topo = MeshTopology.fromMesh( obj )
+	# a mesh without poles has no seam to walk
+	if len( poles.indices ) == 0:
+		return topo.edgeSet( [] )
+	# get the edges connected to the poles
+	pole_edges = np.unique( np.concatenate( [ topo.vertEdges( v ) for v in poles ] ) )
+	
+	# walk the edge loop from the first pole edge
+	seam_edges = getHalfEdgeMesh( obj ).edgeLoop( pole_edges[0] )
+	
+	# get the union of the seam and pole edges
+	return topo.edgeSet( seam_edges ) | topo.edgeSet( pole_edges )
+
+def normalizePoleTriangles( obj_poles, uv_set=None ):
+
+	# Normalizes the pole triangles of many objects at once, given as ( obj, poles ) pairs.
+	# The uvs of all of the objects are computed in one batch, in worker processes when it is large.
+	
+	meshes = [ getUVMeshData( obj, uv_set, with_faces=True, vert_ids=poles.indices ) for obj, poles in obj_poles ]
+	results = workers.runKernel( "normalizePoleTriangles", meshes, (), uv_worker_processes, uv_worker_min_uvs )
+	
+	for ( obj, poles ), ( u, v ) in zip( obj_poles, results ):
+		if len( u ):
+			setMeshUVs( obj, u, v, uv_set )
+
+def sewAndLayout( obj, seams ):
+	# get the mesh topology
+	topo = MeshTopology.fromMesh( obj )
+	# get the difference between all edges and the seams
+	sew_edges = topo.edgeSet( np.arange( topo.num_edges ) ) - seams
 	# move and sew edges
-	cmds.polyMapSewMove( sew_edges, nf=10, lps=0, ch=1 )
+	cmds.polyMapSewMove( sew_edges.toNames(), nf=10, lps=0, ch=1 )
 	# layout
 	cmds.polyLayoutUV( obj, lm=1, sc=2, se=2, rbf=0, fr=1, ps=0, l=2, gu=1, gv=1, ch=1 )
-	# get the uv shell
-	uv_shell = cmds.polyListComponentConversion( obj, toUV=True )
-	# select the uv shell
-	cmds.select( uv_shell )
 	# rotate the uv shell
-	cmds.polyEditUVShell( rot=True, angle=180, pu=0.5, pv=0.5 )
-	# clear the selection
-	cmds.select( clear=True )
+	rotateMeshUVs( obj, 180 )
 
 def getVertsWithEdgeCount( obj, edge_count ):
 
-	verts = cmds.polyListComponentConversion( obj, toVertex=True )
-	verts = cmds.ls( verts, flatten=True )
+	topo = MeshTopology.fromMesh( obj )
+	
+	# get the verts with the specified edge count
+	edge_verts = topo.vertsWithValence( edge_count )
+	
+	return topo.vertSet( edge_verts )
+
+def getMeshPoints( obj, world_space=True ):
+	
+	# read all of the vertex positions of the mesh into an N x 3 array
+	fn_mesh = getMeshFn( obj )
+	space = om2.MSpace.kWorld if world_space else om2.MSpace.kObject
+	
+	return np.array( fn_mesh.getPoints( space ), dtype=np.float64 ).reshape( -1, 4 )[:, :3]
+
+def getMeshUVs( obj, uv_set=None ):
+	
+	# read all of the uvs in the uv set ( or the current uv set ) into two arrays
+	fn_mesh = getMeshFn( obj )
+	uv_set_args = [ uv_set ] if uv_set else []
+	u, v = fn_mesh.getUVs( *uv_set_args )
+	
+	return np.array( u, dtype=np.float64 ), np.array( v, dtype=np.float64 )
+
+def setMeshUVs( obj, u, v, uv_set=None ):
+	
+	# write all of the uvs in the uv set ( or the current uv set ) in one undoable call
+	fn_mesh = getMeshFn( obj )
+	uv_set_args = [ uv_set ] if uv_set else []
+	old_u, old_v = fn_mesh.getUVs( *uv_set_args )
+	new_u = np.asarray( u, dtype=np.float64 ).tolist()
+	new_v = np.asarray( v, dtype=np.float64 ).tolist()
+	
+	def writeUVs( u, v ):
+		fn_mesh.setUVs( u, v, *uv_set_args )
+		fn_mesh.updateSurface()
+	
+	undo.apiEdit( lambda: writeUVs( new_u, new_v ), lambda: writeUVs( old_u, old_v ) )
+
+def setMeshUVLayout( obj, u, v, uv_counts, uv_ids, uv_set ):
+	
+	# Replaces the uvs of the uv set and their assignment to the faces, creating the uv set when the
+	# mesh has none by that name, in one undoable call. Undo puts the old uvs back, or deletes the set.
+	fn_mesh = getMeshFn( obj )
+	
+	had_uv_set = uv_set in fn_mesh.getUVSetNames()
+	if had_uv_set:
+		old_uvs = fn_mesh.getUVs( uv_set )
+		old_assigned = fn_mesh.getAssignedUVs( uv_set )
+	
+	def writeLayout( u, v, uv_counts, uv_ids ):
+		if uv_set not in fn_mesh.getUVSetNames():
+			fn_mesh.createUVSet( uv_set )
+		fn_mesh.clearUVs( uv_set )
+		fn_mesh.setUVs( u, v, uv_set )
+		fn_mesh.assignUVs( uv_counts, uv_ids, uv_set )
+		fn_mesh.updateSurface()
+	
+	def restoreLayout():
+		if had_uv_set:
+			writeLayout( old_uvs[0], old_uvs[1], old_assigned[0], old_assigned[1] )
+		else:
+			fn_mesh.deleteUVSet( uv_set )
+			fn_mesh.updateSurface()
+	
+	undo.apiEdit( lambda: writeLayout( u, v, uv_counts, uv_ids ), restoreLayout )
+
+def getUVMeshData( obj, uv_set=None, with_faces=False, vert_ids=None ):
+	
+	# Reads the arrays a GameAssetWorkers kernel works on: the uvs in the uv set ( or the current
+	# uv set ) and, with_faces, the face-vertex lists, plus any vertex ids the kernel needs.
+	
+	mesh = dict()
+	mesh["u"], mesh["v"] = getMeshUVs( obj, uv_set )
+	
+	if with_faces:
+		mesh["face_counts"], mesh["face_verts"], mesh["face_vert_uvs"], num_uvs = getFaceVertexUVIds( obj, uv_set )
+	
+	if vert_ids is not None:
+		mesh["vert_ids"] = np.asarray( vert_ids, dtype=np.int64 )
+	
+	return mesh
+
+def rotateMeshUVs( obj, angle, pivot_u=0.5, pivot_v=0.5, uv_set=None ):
+
+	# rotate all of the uvs of the mesh without selecting them
+	u, v = getMeshUVs( obj, uv_set )
+
+	if len( u ) == 0:
+		return
+
+	u, v = workers.rotateUVs( u, v, angle, pivot_u, pivot_v )
+	setMeshUVs( obj, u, v, uv_set )
+
+def measureEdgeSets( edge_sets ):
+	
+	# Measures any number of edge sets on any number of meshes in one batch.
+	# edge_sets is a list of ( obj, [ edge index array, ... ] ) pairs.
+	# Returns, for every mesh, a list of ( edge lengths, length sum ) pairs, one per edge set.
+	
+	all_points = list()
+	all_ends = list()
+	set_sizes = list()
+	point_offset = 0
+	
+	# read every mesh once and gather the edge end points into one array
+	for obj, sets in edge_sets:
+		topo = MeshTopology.fromMesh( obj )
+		all_points.append( getMeshPoints( obj ) )
+		for edges in sets:
+			edges = np.asarray( edges, dtype=np.int64 )
+			all_ends.append( topo.edge_verts[edges] + point_offset )
+			set_sizes.append( len( edges ) )
+		point_offset += topo.num_verts
 	
-	# make a list to hold the verts with the specified edge count
-	edge_verts = list()
+	if not all_ends:
+		return [ list() for obj, sets in edge_sets ]
 	
-	# get the verts
-	for v in verts:
-		edges = cmds.polyListComponentConversion( v, toEdge=True )
-		edges = cmds.ls( edges, flatten=True )
-		if len( edges ) == edge_count:
-			edge_verts.append( v )
+	# measure every edge
+	points = np.concatenate( all_points )
+	ends = np.concatenate( all_ends )
+	lengths = np.linalg.norm( points[ ends[:, 1] ] - points[ ends[:, 0] ], axis=1 )
 	
-	return edge_verts
+	# sum the lengths of each set with a prefix sum
+	bounds = np.concatenate( ( [0], np.cumsum( set_sizes ) ) )
+	prefix = np.concatenate( ( [0.0], np.cumsum( lengths ) ) )
+	sums = prefix[ bounds[1:] ] - prefix[ bounds[:-1] ]
+	
+	# split the results back into meshes and sets
+	results = list()
+	k = 0
+	for obj, sets in edge_sets:
+		mesh_results = list()
+		for edges in sets:
+			mesh_results.append( ( lengths[ bounds[k]:bounds[k+1] ], float( sums[k] ) ) )
+			k += 1
+		results.append( mesh_results )
+	
+	return results
 
 def getEdgeLengthSum( edges ):
 	
+	# group the edges by object and measure them in one batch
+	edge_sets = [ ( edge_set.obj, [ edge_set.indices ] ) for edge_set in ComponentSet.fromNames( edges, "e" ) ]
+	
 	total_length = 0
 	
-	for edge in edges:
-		verts = cmds.polyListComponentConversion( edge, toVertex=True )
-		p = cmds.xform( verts, q=True, t=True, ws=True )
-		length = math.sqrt( math.pow( p[0] - p[3], 2 ) + math.pow( p[1] - p[4], 2 ) + math.pow( p[2] - p[5], 2 ) )
-		total_length = total_length + length
+	for mesh_results in measureEdgeSets( edge_sets ):
+		total_length = total_length + mesh_results[0][1]
 	
 	return total_length
 
@@ -260,108 +843,251 @@ def isGroup( obj ):
 	
 	return is_a_group
 
-def worldSpaceToScreenSpace(cam_obj, worldPoint):
+def getCameraMatrix( cam_obj ):
 
 	# get the dagPath to the camera shape node to get the world inverse matrix
-	selList = om.MSelectionList()
-	selList.add(cam_obj)
-	dagPath = om.MDagPath()
-	selList.getDagPath(0,dagPath)
-	dagPath.extendToShape()
-	camInvMtx = dagPath.inclusiveMatrix().inverse()
-
-	# use a camera function set to get projection matrix, convert the MFloatMatrix 
-	# into a MMatrix for multiplication compatibility
-	fnCam = om.MFnCamera(dagPath)
-	mFloatMtx = fnCam.projectionMatrix()
-	projMtx = om.MMatrix(mFloatMtx.matrix)
-
-	# multiply all together and do the normalisation
-	mPoint = om.MPoint(worldPoint[0],worldPoint[1],worldPoint[2]) * camInvMtx * projMtx;
-	x = (mPoint[0] / mPoint[3] / 2 + .5)
-	y = (mPoint[1] / mPoint[3] / 2 + .5)
-
-	return [x,y]
+	sel_list = om2.MSelectionList()
+	sel_list.add( cam_obj )
+	dag_path = sel_list.getDagPath( 0 )
+	dag_path.extendToShape()
+	cam_inv_mtx = dag_path.inclusiveMatrix().inverse()
 
-def getConnectedEdges( edge_list ):
+	# use a camera function set to get the projection matrix
+	proj_mtx = om2.MFnCamera( dag_path ).projectionMatrix()
+
+	# convert both to arrays and multiply them once for all points
+	cam_inv_mtx = np.array( [ [ cam_inv_mtx.getElement( r, c ) for c in range( 4 ) ] for r in range( 4 ) ] )
+	proj_mtx = np.array( [ [ proj_mtx.getElement( r, c ) for c in range( 4 ) ] for r in range( 4 ) ] )
+
+	return np.dot( cam_inv_mtx, proj_mtx )
+
+def projectPointsToScreen( points, cam_mtx ):
+
+	# transform the N x 4 homogeneous points in one multiplication and do the normalisation
+	points = np.asarray( points, dtype=np.float64 ).reshape( -1, 3 )
+	homogeneous = np.hstack( ( points, np.ones( ( len( points ), 1 ) ) ) )
+	clip = np.dot( homogeneous, cam_mtx )
+	x = clip[:, 0] / clip[:, 3] / 2 + .5
+	y = clip[:, 1] / clip[:, 3] / 2 + .5
+
+	return x, y
+
+def worldSpaceToScreenSpace(cam_obj, worldPoint):
+
+	x, y = projectPointsToScreen( [ worldPoint ], getCameraMatrix( cam_obj ) )
+
+	return [ float( x[0] ), float( y[0] ) ]
+
+def getFaceVertexUVIds( obj, uv_set=None ):
+
+	# Returns the face counts, the face-vertex list, the uv id of every face-vertex
+	# ( or -1 on faces without uvs ) and the number of uvs in the uv set ( or the current uv set ).
+
+	fn_mesh = getMeshFn( obj )
+	uv_set_args = [ uv_set ] if uv_set else []
+
+	# get the vertex and uv of every face-vertex
+	face_counts, face_verts = fn_mesh.getVertices()
+	uv_counts, uv_ids = fn_mesh.getAssignedUVs( *uv_set_args )
+	face_counts = np.array( face_counts, dtype=np.int64 )
+	face_verts = np.array( face_verts, dtype=np.int64 )
+	uv_counts = np.array( uv_counts, dtype=np.int64 )
+
+	# only the faces with uvs have entries in the uv id list
+	mapped = np.repeat( uv_counts > 0, face_counts )
+	face_vert_uvs = np.full( len( face_verts ), -1, dtype=np.int64 )
+	face_vert_uvs[mapped] = np.array( uv_ids, dtype=np.int64 )
+
+	return face_counts, face_verts, face_vert_uvs, fn_mesh.numUVs( *uv_set_args )
+
+def getUVVertices( obj, uv_set=None ):
+
+	# Returns the vertex index of every uv in the uv set ( or the current uv set ), or -1 for unused uvs.
+
+	face_counts, face_verts, face_vert_uvs, num_uvs = getFaceVertexUVIds( obj, uv_set )
+	mapped = face_vert_uvs >= 0
+	uv_verts = np.full( num_uvs, -1, dtype=np.int64 )
+	uv_verts[ face_vert_uvs[mapped] ] = face_verts[mapped]
+
+	return uv_verts
+
+def getUVShellIds( obj, uv_set=None ):
 	
-	# The function takes a list of edges and returns a list of edge groups.
-	# Each group contains edges that are connected.
+	# Returns the uv shell of every uv in the uv set ( or the current uv set ), numbered from zero,
+	# or -1 for uvs on no face.
 	
-	edge_groups = list()
-	initial_edges = set( edge_list )
-	max_iter = 100
-
-	j = 1
-	while j > 0 and j < max_iter:
-		
-		# make a set to hold the chosen edges
-		chosen_edges = set()
-		chosen_edges.add( next( iter( initial_edges ) ) )	
-		
-		i = 1
-		while i > 0 and i < max_iter:
-			
-			# expand the selection
-			expanded_verts = cmds.polyListComponentConversion( chosen_edges, toVertex=True )
-			expanded_edges = cmds.polyListComponentConversion( expanded_verts, toEdge=True )
-			
-			# flatten the list and convert to a set
-			expanded_edges = set( cmds.ls( expanded_edges, long=True, flatten=True ) )
-			
-			# remove the chosen edges from the set
-			expanded_edges = expanded_edges.difference( chosen_edges )
-			
-			# get the edges in the expansion contained in the initial list
-			found_edges = expanded_edges.intersection( initial_edges )
-			
-			# if: the expanded selection contains edges from the initial list
-			if ( found_edges ):
-				chosen_edges = chosen_edges.union( found_edges )
-				i += 1
-			else:
-				i = 0
+	face_counts, face_verts, face_vert_uvs, num_uvs = getFaceVertexUVIds( obj, uv_set )
 	
-		# add the chosen edges to the group list
-		edge_groups.append( list( chosen_edges ) )
-		
-		# remove the chosen edges from the initial edges
-		initial_edges = initial_edges.difference( chosen_edges )
-		
-		if ( initial_edges ):
-			j += 1
-		else:
-			j = 0
+	# join every mapped face-vertex to the first uv of its face
+	face_offsets = np.concatenate( ( [0], np.cumsum( face_counts )[:-1] ) )
+	first_uvs = np.repeat( face_vert_uvs[face_offsets], face_counts )
+	mapped = face_vert_uvs >= 0
+	labels, num_labels = labelComponents( num_uvs, face_vert_uvs[mapped], first_uvs[mapped] )
 	
-	return edge_groups
+	# number the shells of the used uvs from zero
+	used = np.zeros( num_uvs, dtype=bool )
+	used[ face_vert_uvs[mapped] ] = True
+	shells = np.full( num_uvs, -1, dtype=np.int64 )
+	shells[used] = np.unique( labels[used], return_inverse=True )[1]
+	
+	return shells
 
-# Sort Outliner
+def getMeshColors( obj, per_face_vertex ):
 
-def getParentChildList( objs ):
-	parent_child_list = list()
-	for obj in objs:
-		parent = cmds.listRelatives( obj, parent=True, fullPath=True )
-		child = cmds.ls( obj, long=True )[0]
-		if parent==None:
-			parent = "root"
-		else:
-			parent = parent[0]
-		parent_child_pair = list()
-		parent_child_pair.append( parent )
-		parent_child_pair.append( child )
-		parent_child_list.append( parent_child_pair )
-	return parent_child_list
+	# read the colors of the current color set per vertex or per face-vertex into an N x 4 array
+	fn_mesh = getMeshFn( obj )
+	unset_color = om2.MColor( ( 0.0, 0.0, 0.0, 1.0 ) )
 
-def getUniqueParents( objs ):
-	parents_set = set()
-	for obj in objs:
-		parent = cmds.listRelatives( obj, parent=True, fullPath=True )
-		if parent==None:
-			parent = "root"
-		else:
-			parent = parent[0]
-		parents_set.add( parent )
-	unique_parents = list( parents_set )
+	# meshes without a color set are black
+	if fn_mesh.numColorSets == 0:
+		count = fn_mesh.numFaceVertices if per_face_vertex else fn_mesh.numVertices
+		colors = np.zeros( ( count, 4 ) )
+		colors[:, 3] = 1.0
+		return colors
+
+	color_set = fn_mesh.currentColorSetName()
+	if per_face_vertex:
+		colors = fn_mesh.getFaceVertexColors( color_set, unset_color )
+	else:
+		colors = fn_mesh.getVertexColors( color_set, unset_color )
+
+	return np.array( colors, dtype=np.float64 ).reshape( -1, 4 )
+
+def setMeshColors( obj, colors, per_face_vertex ):
+
+	# write the colors of every vertex or face-vertex in one undoable call, without a history node per vertex
+	fn_mesh = getMeshFn( obj )
+
+	face_counts, face_verts = fn_mesh.getVertices()
+	face_ids = np.repeat( np.arange( len( face_counts ) ), np.array( face_counts, dtype=np.int64 ) )
+	face_verts = np.array( face_verts, dtype=np.int64 )
+
+	# the colors to put back on undo, with the face-vertices that had none marked by a negative alpha
+	new_color_set = fn_mesh.numColorSets == 0
+	if not new_color_set:
+		old_colors = fn_mesh.getFaceVertexColors( fn_mesh.currentColorSetName(), om2.MColor( ( -1.0, -1.0, -1.0, -1.0 ) ) )
+		old_colors = np.array( old_colors, dtype=np.float64 ).reshape( -1, 4 )
+		unset = old_colors[:, 3] < 0
+
+	# the array takes the rows of an N x 4 list directly, with no MColor made per element in Python
+	color_array = om2.MColorArray( np.asarray( colors, dtype=np.float64 ).reshape( -1, 4 ).tolist() )
+
+	def writeColors():
+
+		# make sure there is a color set to write to
+		if fn_mesh.numColorSets == 0:
+			color_set = fn_mesh.createColorSet( "colorSet1", True )
+			fn_mesh.setCurrentColorSetName( color_set )
+
+		if per_face_vertex:
+			fn_mesh.setFaceVertexColors( color_array, face_ids.tolist(), face_verts.tolist() )
+		else:
+			fn_mesh.setVertexColors( color_array, np.arange( fn_mesh.numVertices ).tolist() )
+
+	def restoreColors():
+		if new_color_set:
+			fn_mesh.deleteColorSet( fn_mesh.currentColorSetName() )
+			return
+		old_array = om2.MColorArray( old_colors[~unset].tolist() )
+		fn_mesh.setFaceVertexColors( old_array, face_ids[~unset].tolist(), face_verts[~unset].tolist() )
+		if unset.any():
+			fn_mesh.removeFaceVertexColors( face_ids[unset].tolist(), face_verts[unset].tolist() )
+
+	undo.apiEdit( writeColors, restoreColors )
+
+	# display the vertex colors
+	cmds.setAttr( fn_mesh.fullPathName() + ".displayColors", True )
+
+def getComponentIndices( components, kind ):
+	
+	# Groups component names such as "|grp|mesh.e[12]" or "mesh.e[3:7]" by object.
+	# Returns a dictionary of object name to an array of component indices.
+	
+	indices = dict()
+	pattern = re.compile( r"^(.*)\." + kind + r"\[(\d+)(?::(\d+))?\]$" )
+	
+	for comp in components:
+		match = pattern.match( comp )
+		if not match:
+			continue
+		first = int( match.group( 2 ) )
+		last = int( match.group( 3 ) ) if match.group( 3 ) else first
+		indices.setdefault( match.group( 1 ), list() ).append( np.arange( first, last + 1 ) )
+	
+	for obj in indices:
+		indices[obj] = np.unique( np.concatenate( indices[obj] ) )
+	
+	return indices
+
+def groupConnectedEdges( topo, edges ):
+	
+	# Labels the groups of edges that share vertices in one pass over the edge-vertex pairs.
+	# Returns a list of edge index arrays, one per group.
+	
+	edges = np.asarray( edges, dtype=np.int64 )
+	if len( edges ) == 0:
+		return list()
+	
+	# join the two end points of every edge
+	ends = topo.edge_verts[edges]
+	vert_labels, num_labels = labelComponents( topo.num_verts, ends[:, 0], ends[:, 1] )
+	
+	# an edge belongs to the group of its first vertex
+	edge_labels = np.unique( vert_labels[ ends[:, 0] ], return_inverse=True )[1]
+	order = np.argsort( edge_labels, kind="stable" )
+	bounds = np.cumsum( np.bincount( edge_labels ) )[:-1]
+	
+	return np.split( edges[order], bounds )
+
+def getConnectedEdges( edge_list ):
+	
+	# The function takes a list of edges and returns a list of edge groups.
+	# Each group contains edges that are connected.
+	
+	edge_groups = list()
+	
+	for edge_set in ComponentSet.fromNames( edge_list, "e" ):
+		topo = MeshTopology.fromMesh( edge_set.obj )
+		for group in groupConnectedEdges( topo, edge_set.indices ):
+			edge_groups.append( topo.edgeSet( group ) )
+	
+	return edge_groups
+
+def getBorderEdgeGroups( obj ):
+	
+	# get the open edges of the object, grouped by hole
+	topo = MeshTopology.fromMesh( obj )
+	border_groups = getMeshDerived( obj, "border_groups", lambda topo: groupConnectedEdges( topo, topo.boundaryEdges() ), topo )
+	
+	return [ topo.edgeSet( group ) for group in border_groups ]
+
+# Sort Outliner
+
+def getParentChildList( objs ):
+	parent_child_list = list()
+	for obj in objs:
+		parent = cmds.listRelatives( obj, parent=True, fullPath=True )
+		child = cmds.ls( obj, long=True )[0]
+		if parent==None:
+			parent = "root"
+		else:
+			parent = parent[0]
+		parent_child_pair = list()
+		parent_child_pair.append( parent )
+		parent_child_pair.append( child )
+		parent_child_list.append( parent_child_pair )
+	return parent_child_list
+
+def getUniqueParents( objs ):
+	parents_set = set()
+	for obj in objs:
+		parent = cmds.listRelatives( obj, parent=True, fullPath=True )
+		if parent==None:
+			parent = "root"
+		else:
+			parent = parent[0]
+		parents_set.add( parent )
+	unique_parents = list( parents_set )
 	return unique_parents
 
 def groupParentChildren( parent_child_list, unique_parents):
@@ -408,50 +1134,1728 @@ def getObjsAboveSelected( unique_parents, sel_children, all_children ):
 				break				
 	return above_selected
 
-def getChildTransforms( objs ):
-	child_transforms = list()
+def getChildTransforms( objs ):
+	child_transforms = list()
+	for obj in objs:
+		children = cmds.listRelatives( obj, fullPath=True, children=True )
+		transforms = cmds.ls( children, long=True, type="transform" )
+		for t in transforms:
+			child_transforms.append( t )
+	return child_transforms
+
+def sortOutliner( objs, recursive, reverse ):
+
+	parent_child_list = getParentChildList( objs )	
+	unique_parents = getUniqueParents( objs )
+	grouped_children = groupParentChildren( parent_child_list, unique_parents )
+	all_children = getAllChildrenFromParents( unique_parents )
+	above_selected = getObjsAboveSelected( unique_parents, grouped_children, all_children )
+	
+	for i in range( len( grouped_children ) ):
+		grouped_children[i].sort()
+		if not reverse:
+			grouped_children[i].reverse()
+	
+	for i in range( len( above_selected ) ):
+		above_selected[i].reverse()
+
+	for ls in grouped_children:
+		for child in ls:
+			cmds.reorder( child, front=True )
+
+	for ls in above_selected:
+		for child in ls:
+			cmds.reorder( child, front=True )
+	
+	if recursive:
+		child_transforms = getChildTransforms( objs )
+		if child_transforms:
+			sortOutliner( child_transforms, True, reverse )
+
+# Bulk Transforms
+
+def getMeshTransforms( objs ):
+	
+	# the transforms of all of the meshes at or below the objects, sorted by full path
+	shapes = cmds.listRelatives( objs, allDescendents=True, type="mesh", fullPath=True, noIntermediate=True ) or []
+	
+	return sorted( set( shape.rsplit( "|", 1 )[0] for shape in shapes ) )
+
+def getDagTransforms( objs, node_type="transform" ):
+	
+	# Returns the transforms at or below the objects whose node type is node_type ( None for any
+	# transform, joints included ) by full path, from one DAG iterator pass under each object.
+	
+	sel_list = om2.MSelectionList()
+	for obj in objs:
+		sel_list.add( obj )
+	
+	transforms = collections.OrderedDict()
+	dag_it = om2.MItDag( om2.MItDag.kDepthFirst, om2.MFn.kTransform )
+	for i in range( len( objs ) ):
+		dag_it.reset( sel_list.getDagPath( i ), om2.MItDag.kDepthFirst, om2.MFn.kTransform )
+		while not dag_it.isDone():
+			if node_type is None or om2.MFnDependencyNode( dag_it.currentItem() ).typeName == node_type:
+				transforms[ dag_it.fullPathName() ] = True
+			dag_it.next()
+	
+	return list( transforms )
+
+# the vertex count from which a mesh's box is cheaper from exactWorldBoundingBox than from its points
+BOUNDING_BOX_QUERY_VERTS = 5000
+
+def getWorldBoundingBoxes( objs ):
+	
+	# Returns the exact world bounding box of the meshes at or below each object ( given by full path )
+	# as an N x 6 array of x min, y min, z min, x max, y max, z max, with NaNs for objects without meshes.
+	# All of the meshes are read in one pass over the API instead of one exactWorldBoundingBox call each.
+	# Like exactWorldBoundingBox -ignoreInvisible, hidden meshes and meshes under hidden transforms
+	# are left out, so an object with only hidden meshes counts as one without meshes.
+	
+	shapes = sorted( cmds.listRelatives( objs, allDescendents=True, type="mesh", fullPath=True, noIntermediate=True ) or [] )
+	
+	sel_list = om2.MSelectionList()
+	for shape in shapes:
+		sel_list.add( shape )
+	
+	# the bounding box of every mesh, plus an empty one at the end
+	shape_boxes = np.full( ( len( shapes ) + 1, 6 ), np.nan )
+	for i in range( len( shapes ) ):
+		dag_path = sel_list.getDagPath( i )
+		if not dag_path.isVisible():
+			continue
+		fn_mesh = om2.MFnMesh( dag_path )
+		if fn_mesh.numVertices >= BOUNDING_BOX_QUERY_VERTS:
+			shape_boxes[i] = cmds.exactWorldBoundingBox( shapes[i] )
+			continue
+		points = np.array( fn_mesh.getPoints( om2.MSpace.kWorld ), dtype=np.float64 ).reshape( -1, 4 )[:, :3]
+		if len( points ):
+			shape_boxes[i, :3] = points.min( axis=0 )
+			shape_boxes[i, 3:] = points.max( axis=0 )
+	
+	# the meshes below an object are the run of sorted paths that start with its path
+	first = np.array( [ bisect.bisect_left( shapes, obj + "|" ) for obj in objs ], dtype=np.int64 )
+	last = np.array( [ bisect.bisect_left( shapes, obj + "}" ) for obj in objs ], dtype=np.int64 )
+	bounds = np.stack( ( first, last ), axis=1 ).ravel()
+	
+	with np.errstate( invalid="ignore" ):
+		low = np.fmin.reduceat( shape_boxes[:, :3], bounds )[::2]
+		high = np.fmax.reduceat( shape_boxes[:, 3:], bounds )[::2]
+	
+	boxes = np.hstack( ( low, high ) )
+	boxes[ first == last ] = np.nan
+	
+	return boxes
+
+def getTranslations( objs ):
+	
+	# Returns the translate values of the transforms and the world matrix of their parents
+	# ( an N x 3 and an N x 4 x 4 array ), read in one pass over the API.
+	
+	sel_list = om2.MSelectionList()
+	for obj in objs:
+		sel_list.add( obj )
+	
+	translations = np.zeros( ( len( objs ), 3 ) )
+	parent_matrices = np.zeros( ( len( objs ), 4, 4 ) )
+	for i in range( len( objs ) ):
+		dag_path = sel_list.getDagPath( i )
+		translations[i] = list( om2.MFnTransform( dag_path ).translation( om2.MSpace.kTransform ) )
+		parent_matrices[i] = np.array( list( dag_path.exclusiveMatrix() ), dtype=np.float64 ).reshape( 4, 4 )
+	
+	return translations, parent_matrices
+
+# the axes of every rotateOrder, in the order they are rotated about
+ROTATE_ORDER_AXES = ( ( 0, 1, 2 ), ( 1, 2, 0 ), ( 2, 0, 1 ), ( 0, 2, 1 ), ( 1, 0, 2 ), ( 2, 1, 0 ) )
+
+def getRotateOrders( objs ):
+	
+	# the rotateOrder of the transforms ( 0=xyz, 1=yzx, 2=zxy, 3=xzy, 4=yxz, 5=zyx ), read in one pass over the API
+	sel_list = om2.MSelectionList()
+	for obj in objs:
+		sel_list.add( obj )
+	
+	# the API counts the orders from kXYZ=1
+	return np.array( [ om2.MFnTransform( sel_list.getDagPath( i ) ).rotationOrder() - 1 for i in range( len( objs ) ) ], dtype=np.int64 )
+
+def eulerFromMatrices( rotations, orders ):
+	
+	# Returns the rotate values in degrees ( N x 3, x y z ) of N x 3 x 3 rotation matrices for row vectors,
+	# each in its rotate order. Each order is solved as xyz on the matrix with its axes relabelled in
+	# rotation order, where relabelling by an odd permutation turns every angle the other way.
+	rotations = np.asarray( rotations, dtype=np.float64 ).reshape( -1, 3, 3 )
+	angles = np.zeros( ( len( rotations ), 3 ) )
+	
+	for order in np.unique( orders ):
+		axes = np.array( ROTATE_ORDER_AXES[order] )
+		picked = np.asarray( orders ) == order
+		r = rotations[ picked ][:, axes][:, :, axes]
+		first = np.arctan2( r[:, 1, 2], r[:, 2, 2] )
+		second = np.arcsin( np.clip( -r[:, 0, 2], -1.0, 1.0 ) )
+		third = np.arctan2( r[:, 0, 1], r[:, 0, 0] )
+		solved = np.degrees( np.stack( ( first, second, third ), axis=1 ) )
+		if order in ( 3, 4, 5 ):
+			solved = -solved
+		angles[ np.ix_( np.flatnonzero( picked ), axes ) ] = solved
+	
+	return angles
+
+def checkFiniteValues( objs, values ):
+	
+	# the bulk writes build mel from repr( float ), and mel cannot read nan or inf, so refuse
+	# them before anything is written rather than fail halfway through the script
+	finite = np.isfinite( values ).all( axis=1 )
+	if not finite.all():
+		raise ValueError( "Values are not finite on: " + ", ".join( obj for obj, keep in zip( objs, finite ) if not keep ) )
+
+def setTransformAttrs( objs, attr, values ):
+	
+	# Sets a numeric attribute ( translate, or a single channel like rotateY with one value per object )
+	# on many transforms in one undoable mel call, rather than one python command per transform.
+	
+	if not len( objs ):
+		return
+	
+	values = np.asarray( values, dtype=np.float64 ).reshape( len( objs ), -1 )
+	checkFiniteValues( objs, values )
+	values = values.tolist()
+	
+	script = "".join( 'setAttr "' + obj + "." + attr + '" ' + " ".join( repr( x ) for x in value ) + ";\n" for obj, value in zip( objs, values ) )
+	if script:
+		mel.eval( script )
+
+def setWorldTranslations( objs, positions, parent_matrices ):
+	
+	# moves the transforms to the world positions, like xform -t -ws, through the inverse of their parents
+	positions = np.asarray( positions, dtype=np.float64 ).reshape( -1, 3 )
+	points = np.concatenate( ( positions, np.ones( ( len( positions ), 1 ) ) ), axis=1 )
+	local = np.einsum( "ni,nij->nj", points, np.linalg.inv( parent_matrices ) )[:, :3]
+	
+	setTransformAttrs( objs, "translate", local )
+
+def getTransformMatrices( objs, world_space ):
+	
+	# Returns the world matrices of the transforms, or their matrices relative to their parents,
+	# as an N x 4 x 4 array read in one pass over the API.
+	
+	sel_list = om2.MSelectionList()
+	for obj in objs:
+		sel_list.add( obj )
+	
+	matrices = np.zeros( ( len( objs ), 4, 4 ) )
+	for i in range( len( objs ) ):
+		dag_path = sel_list.getDagPath( i )
+		matrices[i] = np.array( list( dag_path.inclusiveMatrix() ), dtype=np.float64 ).reshape( 4, 4 )
+		if not world_space:
+			parent_matrix = np.array( list( dag_path.exclusiveMatrix() ), dtype=np.float64 ).reshape( 4, 4 )
+			matrices[i] = np.dot( matrices[i], np.linalg.inv( parent_matrix ) )
+	
+	return matrices
+
+def setTransformMatrices( objs, matrices, world_space ):
+	
+	# Sets the matrices on many transforms in one undoable mel call, like xform -m. World matrices are
+	# set on the parents before their children, since a child's local values depend on its parent.
+	
+	matrices = np.asarray( matrices, dtype=np.float64 ).reshape( len( objs ), 16 )
+	checkFiniteValues( objs, matrices )
+	matrices = matrices.tolist()
+	order = sorted( range( len( objs ) ), key=lambda i: objs[i].count( "|" ) ) if world_space else range( len( objs ) )
+	
+	flags = "xform -ws -m " if world_space else "xform -m "
+	script = "".join( flags + " ".join( repr( x ) for x in matrices[i] ) + ' "' + objs[i] + '";\n' for i in order )
+	if script:
+		mel.eval( script )
+
+def setWorldPivots( objs, positions ):
+	
+	# moves the rotate and scale pivots of the transforms to the world positions in one undoable mel call, like xform -piv -ws
+	positions = np.asarray( positions, dtype=np.float64 ).reshape( len( objs ), 3 )
+	checkFiniteValues( objs, positions )
+	positions = positions.tolist()
+	
+	script = "".join( "xform -ws -piv " + " ".join( repr( x ) for x in position ) + ' "' + obj + '";\n' for obj, position in zip( objs, positions ) )
+	if script:
+		mel.eval( script )
+
+# Random Streams
+
+def splitMix64( x ):
+	
+	# the splitmix64 mixing function, on an array of uint64
+	x = ( x ^ ( x >> np.uint64( 30 ) ) ) * np.uint64( 0xBF58476D1CE4E5B9 )
+	x = ( x ^ ( x >> np.uint64( 27 ) ) ) * np.uint64( 0x94D049BB133111EB )
+	
+	return x ^ ( x >> np.uint64( 31 ) )
+
+def getObjectRandoms( keys, seed, count ):
+	
+	# Returns count uniform numbers in [0, 1) for every key as an N x count array. Each key has its
+	# own stream, from the seed and a hash of the key, so an object draws the same numbers whatever
+	# else is in the list, in whatever order, and in whichever process.
+	
+	key_hashes = np.array( [ int.from_bytes( hashlib.blake2b( key.encode( "utf-8" ), digest_size=8 ).digest(), "little" ) for key in keys ], dtype=np.uint64 )
+	streams = splitMix64( key_hashes ^ splitMix64( np.array( [ seed & 0xFFFFFFFFFFFFFFFF ], dtype=np.uint64 ) ) )
+	
+	# the n-th number of a stream is the mix of its n-th step
+	steps = streams[:, np.newaxis] + np.uint64( 0x9E3779B97F4A7C15 ) * np.arange( 1, count + 1, dtype=np.uint64 )
+	
+	return ( splitMix64( steps ) >> np.uint64( 11 ) ).astype( np.float64 ) / float( 1 << 53 )
+
+# Progress
+
+class OperationCancelled( Exception ):
+	pass
+
+class ProgressReporter( object ):
+	
+	# Reports the progress of a long loop without slowing it down: the progress is shown at
+	# most every progress_interval seconds, in a progressWindow or, in batch mode, as printed
+	# lines. The window only opens once a loop has run for one interval. Pressing Esc in the
+	# window raises OperationCancelled from step(), which the buttons answer by undoing the
+	# whole operation. A reporter started inside another one only checks for cancellation.
+	
+	active = None
+	
+	def __init__( self, title, total ):
+		self.title = title
+		self.total = max( total, 1 )
+		self.count = 0
+		self.window = False
+		self.batch = cmds.about( batch=True )
+		self.last_update = time.time()
+		self.outer = ProgressReporter.active
+		ProgressReporter.active = self
+	
+	def step( self, amount=1 ):
+		
+		self.count += amount
+		
+		now = time.time()
+		if now - self.last_update < progress_interval:
+			return
+		self.last_update = now
+		
+		if self.outer is not None:
+			self.outer.checkCancelled()
+			return
+		
+		percent = min( int( 100.0 * self.count / self.total ), 100 )
+		status = self.title + ": " + str( percent ) + "%"
+		
+		if self.batch:
+			print( status )
+		elif not self.window:
+			cmds.progressWindow( title=self.title, status=status, progress=percent, maxValue=100, isInterruptable=True )
+			self.window = True
+		else:
+			cmds.progressWindow( edit=True, status=status, progress=percent )
+		
+		self.checkCancelled()
+	
+	def checkCancelled( self ):
+		if self.window and cmds.progressWindow( query=True, isCancelled=True ):
+			raise OperationCancelled( self.title )
+	
+	def close( self ):
+		if self.window:
+			cmds.progressWindow( endProgress=True )
+			self.window = False
+		if ProgressReporter.active is self:
+			ProgressReporter.active = self.outer
+	
+	@classmethod
+	def closeAll( cls ):
+		
+		# close the reporters left open by a loop that raised
+		while cls.active is not None:
+			cls.active.close()
+
+def progress( items, title ):
+	
+	# iterate over the items, reporting the progress through a ProgressReporter
+	items = list( items )
+	reporter = ProgressReporter( title, len( items ) )
+	try:
+		for item in items:
+			yield item
+			reporter.step()
+	finally:
+		reporter.close()
+
+################################################################################
+## Operations
+################################################################################
+
+# The operations take explicit lists of nodes and never read or change the selection,
+# so that they can be called from scripts and batch jobs. The buttons are thin wrappers.
+
+def keepSelection( operation ):
+	
+	# for the operations whose commands select as a side effect ( creating nodes, or the
+	# mel scripts that only work on the selection ): put the caller's selection back
+	@functools.wraps( operation )
+	def keepSelectionWrapper( *args, **kwargs ):
+		selection = cmds.ls( selection=True, long=True )
+		try:
+			return operation( *args, **kwargs )
+		finally:
+			# only what survived the operation ( combining deletes its sources ), and ls of an empty
+			# list would list every node
+			selection = cmds.ls( selection, long=True ) if selection else []
+			if selection:
+				cmds.select( selection, replace=True )
+			else:
+				cmds.select( clear=True )
+	
+	return keepSelectionWrapper
+
+# Combine, Separate & History
+
+@keepSelection
+def separateMeshes( objs ):
+	
+	separated = list()
+	
+	for obj in progress( objs, "Separate" ):
+	
+		if getShellCount( obj ) > 1:
+			# separate objects and store in a list
+			separated_objects = cmds.polySeparate( obj )
+			# delete history
+			cmds.delete( separated_objects, constructionHistory=True )
+			# remove non transforms from list
+			separated_objects = cmds.ls( separated_objects, type="transform", long=True )
+			# center pivots and rename
+			for mesh in separated_objects:
+				short_name = obj.split('|')[-1]
+				cmds.xform( mesh, cp=True )
+				separated.append( cmds.rename( mesh, short_name ) )
+	
+	return separated
+
+@keepSelection
+def combineMeshes( objs ):
+	
+	parents = set()
+	
+	# get the parents
+	for obj in objs:
+		obj_parent = cmds.listRelatives( obj, parent=True, fullPath=True )
+		if obj_parent == None:
+			obj_parent = "root"
+		else:
+			obj_parent = obj_parent[0]
+		parents.add( obj_parent )
+	
+	# combine the objects
+	combined = cmds.polyUnite( objs, ch=True, mergeUVSets=True, centerPivot=True )[0]
+	
+	# if the objects share a common parent, parent the combined object to the parent
+	if len( parents ) <= 1:
+		parents = list( parents )
+		if parents[0] != "root":
+			combined = cmds.parent( combined, parents[0] )[0]
+	
+	# delete history
+	cmds.delete( combined, constructionHistory=True )
+	
+	# rename the combined object to the first object
+	short_name = objs[0].split('|')[-1]
+	
+	return cmds.rename( combined, short_name )
+
+@keepSelection
+def combineGroups( grps ):
+	
+	combined_objs = list()
+	
+	for grp in progress( grps, "Combine Groups" ):
+	
+		# get the number of objects in the group
+		num_children = len( cmds.listRelatives( grp ) )
+		
+		# combine only if there is more than one object in the group
+		if num_children > 1:
+			# get the parent group
+			parent_grp = cmds.listRelatives( grp, parent=True, fullPath=True )
+			# combine the objects in the group
+			combined = cmds.polyUnite( grp, ch=True, mergeUVSets=True, centerPivot=True )[0]
+			# delete construction history
+			cmds.delete( combined, constructionHistory=True )
+			# get the group short names
+			short_name = grp.split('|')[-1]
+			# rename the new object
+			combined_obj = cmds.rename( combined, short_name )
+			
+			if parent_grp:
+				# parent the new object to the parent group
+				combined_obj = cmds.parent( combined_obj, parent_grp )[0]
+			
+			combined_objs.append( combined_obj )
+	
+	return combined_objs
+
+def deleteHistory( objs ):
+	
+	for obj in progress( objs, "Delete History" ):
+	
+		cmds.delete( obj, constructionHistory=True )
+
+# Normals
+
+def fixNormals( objs ):
+	
+	for obj in progress( objs, "Fix Normals" ):
+	
+		cmds.polySetToFaceNormal( obj )
+		#cmds.polySoftEdge( obj, a=60, ch=0 )
+		cmds.polySoftEdge( obj, a=180 )
+
+# Topology
+
+def deleteExtruded( objs ):
+	
+	for obj in progress( objs, "Delete Back Face Extruded" ):
+	
+		topo = MeshTopology.fromMesh( obj )
+		valence = topo.valence()
+		
+		# get the corner verts
+		corner_verts = topo.vertSet( np.flatnonzero( valence <= 3 ) )
+		# get the two edge verts
+		two_edge_verts = topo.vertSet( np.flatnonzero( valence == 2 ) )
+		
+		if len( corner_verts ) >= 8 and len( two_edge_verts ) < 1:
+		
+			# count the corner verts at the ends of every edge
+			corner_mask = np.zeros( topo.num_verts, dtype=bool )
+			corner_mask[ corner_verts.indices ] = True
+			corner_ends = corner_mask[ topo.edge_verts ].sum( axis=1 )
+			
+			# get the corner internal edges
+			corner_internal_edges = topo.edgeSet( np.flatnonzero( corner_ends == 2 ) )
+			
+			# get the corner edges
+			corner_edges = topo.edgeSet( np.flatnonzero( corner_ends > 0 ) )
+			
+			# get the corner seam edges
+			corner_seam_edges = corner_edges - corner_internal_edges
+			
+			# get the seam edges
+			half_edges = getHalfEdgeMesh( obj )
+			seam_loops = [ half_edges.edgeLoop( e ) for e in corner_seam_edges ]
+			seam_edges = topo.edgeSet( np.concatenate( [ list() ] + seam_loops ) )
+			
+			# get the seam faces: the faces with all of their verts on the seam
+			seam_vert_mask = np.zeros( topo.num_verts, dtype=bool )
+			seam_vert_mask[ topo.edge_verts[ seam_edges.indices ].ravel() ] = True
+			off_seam = np.bincount( topo.face_vert_faces, weights=~seam_vert_mask[ topo.face_verts ], minlength=topo.num_faces )
+			seam_faces = topo.faceSet( np.flatnonzero( off_seam == 0 ) )
+			
+			cmds.delete( seam_faces.toNames() )
+			
+			# get the back faces: the shell of the first vertex
+			topo = MeshTopology.fromMesh( obj )
+			vert_shell, face_shell, num_shells = topo.shells()
+			back_faces = topo.faceSet( np.flatnonzero( face_shell == vert_shell[0] ) )
+			
+			cmds.delete( back_faces.toNames() )
+
+def retopologize( objs, face_count ):
+	
+	for obj in progress( objs, "Retopologize" ):
+	
+		cmds.polyRetopo( obj, targetFaceCount=face_count )
+
+# UV
+
+def resetUVSets( obj ):
+	
+	# get the names of all uv sets
+	uv_sets = cmds.polyUVSet( obj, auv=True, query=True )
+	
+	# if there are no uv sets, create one
+	if len( uv_sets ) == 0:
+		cmds.polyUVSet( obj, create=True, uvSet="map1" )
+	
+	# otherwise, delete all uv sets except for the first and name it to map1
+	else:
+	
+		# get the first uv set
+		first_uv_set = uv_sets[0]
+		
+		# if there are additional uv sets, delete them
+		if len( uv_sets ) > 1:
+			uv_sets.pop( 0 )
+			for uv_set in uv_sets:
+				# delete the uv set
+				cmds.polyUVSet( obj, delete=True, uvSet=uv_set )
+		
+		# check if map1 exists
+		if first_uv_set != "map1":
+			# rename the first uv set to map1
+			cmds.polyUVSet( obj, rename=True, uvSet=first_uv_set, newUVSet="map1" )
+
+def deleteUVs( objs ):
+	
+	for obj in progress( objs, "Delete UVs" ):
+	
+		# keep only map1
+		resetUVSets( obj )
+		
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet="map1" )
+		
+		# delete the contents of map1
+		cmds.polyMapDel( obj )
+		
+		# delete construction history
+		cmds.delete( obj, constructionHistory=True )
+
+def scaleUVQuad( objs, uv_set ):
+	
+	edge_sets = list()
+	
+	for obj in objs:
+		topo = MeshTopology.fromMesh( obj )
+		half_edges = getHalfEdgeMesh( obj )
+		corner_vert = topo.vertsWithValence( 2 )[0]
+		corner_edges = topo.vertEdges( corner_vert )
+		
+		# get a list for the edges in both dimensions from the corner
+		dimension_edges = list()
+		for e in corner_edges:
+			dimension_edges.append( half_edges.edgeLoop( e ) )
+		
+		'''
+		# determine the dimension with more edges
+		edges_for_length = list()
+		if len( dimension_edges[0] ) >= len( dimension_edges[1] ):
+			edges_for_length = dimension_edges[0]
+		else:
+			edges_for_length = dimension_edges[1]
+		'''
+		
+		edge_sets.append( ( obj, dimension_edges ) )
+	
+	# get the length of the edges on all of the objects in one batch
+	all_edge_lengths = measureEdgeSets( edge_sets )
+	
+	# unitize the UVs
+	unitizeUVPlanar( objs, uv_set )
+	
+	for i in progress( range( len( objs ) ), "Scale UV Quad" ):
+		obj = objs[i]
+		edge_lengths = [ total for lengths, total in all_edge_lengths[i] ]
+		
+		#print( edge_lengths[0] )
+		#print( edge_lengths[1] )
+		
+		a = edge_lengths[0] / edge_lengths[1]
+		b = edge_lengths[1] / edge_lengths[0]
+		
+		length_ratio = a
+		
+		# scale the uvs in u from the origin
+		cmds.polyUVSet( obj, uvs=uv_set, cuv=True )
+		u, v = getMeshUVs( obj, uv_set )
+		setMeshUVs( obj, u * length_ratio, v, uv_set )
+
+def cameraProjectUVs( objs, cam, uv_set, projection_fill ):
+	
+	#projection_fill = 1 # 0=fill, 1=horizontal, 2=vertical
+	#uv_set = "map1"
+	
+	res_width = float( cmds.getAttr('defaultResolution.width') )
+	res_height = float( cmds.getAttr('defaultResolution.height') )
+	
+	# set the current uv set to work on
+	cmds.polyUVSet( objs, cuv=True, uvs=uv_set )
+	
+	# make some basic uvs
+	for obj in objs:
+		cmds.polyPlanarProjection( obj, ch=True, ibd=True, md="z" )
+	
+	# set scale values depending on fill method
+	
+	# horizontal
+	if projection_fill == 1:
+		scale_u = 1
+		scale_v = res_height / res_width
+	# vertical
+	elif projection_fill ==2:
+		scale_u = res_width / res_height
+		scale_v = 1
+	# fill
+	else:
+		scale_u = 1
+		scale_v = 1
+	
+	# get the camera matrix once
+	cam_mtx = getCameraMatrix( cam )
+	
+	for obj in progress( objs, "Camera Project UVs" ):
+		# get the world position of every uv
+		uv_verts = getUVVertices( obj, uv_set )
+		points = getMeshPoints( obj )
+		u, v = getMeshUVs( obj, uv_set )
+		mapped = uv_verts >= 0
+		# convert to screenspace
+		u[mapped], v[mapped] = projectPointsToScreen( points[ uv_verts[mapped] ], cam_mtx )
+		# adjust the overall scale of the uvs
+		u = ( u - 0.5 ) * scale_u + 0.5
+		v = ( v - 0.5 ) * scale_v + 0.5
+		# write all of the uvs at once
+		setMeshUVs( obj, u, v, uv_set )
+
+def fitMeshUVsToDimension( objs, scale_dimension ):
+	
+	# Scales and lays out the uvs on the objects to fit the zero to one uv space in the given dimension.
+	
+	#scale_dimension = "u"
+	
+	# read all of the uvs at once
+	meshes = [ getUVMeshData( obj ) for obj in objs ]
+	
+	# leave the meshes whose uvs are flat in the dimension alone, there is no scale that fits them
+	is_flat = [ len( mesh["u"] ) > 0 and workers.uvExtent( mesh, scale_dimension ) == 0 for mesh in meshes ]
+	if any( is_flat ):
+		flat = [ obj for obj, skip in zip( objs, is_flat ) if skip ]
+		print( "Fit UVs: no extent in " + scale_dimension + " on " + str( len( flat ) ) + " meshes: " + ", ".join( flat ) )
+		objs = [ obj for obj, skip in zip( objs, is_flat ) if not skip ]
+		meshes = [ mesh for mesh, skip in zip( meshes, is_flat ) if not skip ]
+	
+	# scale and reposition the uvs of all of the objects in one batch
+	results = workers.runKernel( "fitMeshUVs", meshes, ( scale_dimension, ), uv_worker_processes, uv_worker_min_uvs )
+	
+	# write all of the uvs at once
+	for obj, ( u, v ) in progress( list( zip( objs, results ) ), "Fit UVs" ):
+		if len( u ):
+			setMeshUVs( obj, u, v )
+
+# Multi UV Set Workflow
+
+def initializeUVs( objs ):
+	
+	for obj in objs:
+	
+		# keep only map1
+		resetUVSets( obj )
+	
+	# get the faces of the objects
+	faces = cmds.polyListComponentConversion( objs, toFace=True )
+	
+	# planar map the uvs
+	cmds.polyProjection( faces, type="Planar", ibd=True, kir=True, md="z", ch=True, uvSetName="map1" )
+	
+	# create two new uv sets
+	for obj in objs:
+	
+		# create new uv sets
+		cmds.polyCopyUV( obj, uvSetNameInput="map1", uvSetName="UnitizeUV", createNewMap=True, ch=True )
+		cmds.polyCopyUV( obj, uvSetNameInput="map1", uvSetName="StackedUV", createNewMap=True, ch=True )
+		
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet="map1" )
+
+def packUVs( objs, uv_set=None, atlas=None ):
+	
+	# Packs the uv shells of the objects into the zero to one uv space with the built-in packer,
+	# all of the objects into one atlas or each object on its own.
+	
+	if atlas is None:
+		atlas = uv_pack_atlas
+	
+	meshes = list()
+	for obj in progress( objs, "Pack UVs" ):
+		mesh = dict()
+		mesh["u"], mesh["v"] = getMeshUVs( obj, uv_set )
+		mesh["shells"] = getUVShellIds( obj, uv_set )
+		meshes.append( mesh )
+	
+	groups = [ meshes ] if atlas else [ [ mesh ] for mesh in meshes ]
+	results = list()
+	for group in groups:
+		results.extend( workers.packUVShells( group, uv_pack_padding, uv_pack_resolution, uv_pack_rotate ) )
+	
+	for obj, ( u, v ) in zip( objs, results ):
+		if len( u ):
+			setMeshUVs( obj, u, v, uv_set )
+
+def unfoldLayout( objs, engine=None ):
+	
+	# the layout engine ( None=uv_layout_engine, "unfold3d"=u3dLayout, "native"=packUVs )
+	if engine is None:
+		engine = uv_layout_engine
+	
+	for obj in progress( objs, "Unfold Layout" ):
+	
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet="StackedUV" )
+		
+		# unfold and layout
+		cmds.u3dUnfold( obj, ite=10, p=0, bi=1, tf=1, ms=1024, rs=0 )
+		if engine == "unfold3d":
+			cmds.u3dLayout( obj, res=256, scl=1 )
+	
+	if engine == "native":
+		packUVs( objs, "StackedUV" )
+
+@keepSelection
+def orientShells( components ):
+	
+	# texOrientEdge only works on the selection
+	cmds.select( components )
+	mel.eval("texOrientEdge;")
+	objs = cmds.ls( components, o=True )
+	cmds.u3dLayout( objs, res=256, scl=1 )
+	
+	return objs
+
+def transferUVSet( source_obj, dest_objs, uv_set, mode=None ):
+	
+	# Transfers the uv set from the source to the destinations. In "signature" mode the destinations
+	# with the same topology as the source get its uvs copied by index, and only the others go
+	# through transferAttributes. In "sample" mode they all do. Returns the number of objects
+	# that took each path.
+	
+	if mode is None:
+		mode = uv_transfer_mode
+	
+	counts = collections.OrderedDict( [ ( "copied", 0 ), ( "transferred", 0 ) ] )
+	
+	if mode == "signature":
+		
+		# read the source uvs once
+		fn_source = getMeshFn( source_obj )
+		source_signature = getTopologySignature( source_obj )
+		u, v = fn_source.getUVs( uv_set )
+		uv_counts, uv_ids = fn_source.getAssignedUVs( uv_set )
+	
+	for dest_obj in progress( dest_objs, "Transfer UVs" ):
+	
+		if mode == "signature" and getTopologySignature( dest_obj ) == source_signature:
+			
+			# write the uvs and their assignment to the faces straight into the destination
+			setMeshUVLayout( dest_obj, u, v, uv_counts, uv_ids, uv_set )
+			counts["copied"] += 1
+			
+		else:
+			
+			cmds.transferAttributes( source_obj, dest_obj, transferUVs=True, sampleSpace=4, sourceUvSet=uv_set, targetUvSet=uv_set  )
+			counts["transferred"] += 1
+	
+	for obj in list( dest_objs ) + [ source_obj ]:
+	
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet=uv_set )
+	
+	print( "Transfer UVs: " + str( counts["copied"] ) + " copied by topology signature, " + str( counts["transferred"] ) + " transferred" )
+	
+	return counts
+
+def copyUVSet( objs, uv_set ):
+	
+	for obj in progress( objs, "Copy UV Set" ):
+	
+		cmds.polyCopyUV( obj, uvSetName=uv_set, ch=1 )
+
+def unitizeUVPlanar( objs, uvset_name ):
+	
+	meshes = list()
+	
+	for obj in progress( objs, "Unitize Planar" ):
+	
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet=uvset_name )
+		
+		cmds.polyForceUV( obj, unitize=True )
+		cmds.polyMapSewMove( obj ) # nf=10, lps=0, ch=1
+		cmds.polyMultiLayoutUV( obj, lm=1, sc=2, rbf=0, fr=1, ps=0, l=2, gu=1, gv=1, psc=0, su=1, sv=1, ou=0, ov=0 )
+		
+		topo = MeshTopology.fromMesh( obj )
+		
+		# get the corner verts, the first uv of the second one decides the orientation
+		corner_verts = np.flatnonzero( topo.valence() <= 2 )
+		meshes.append( getUVMeshData( obj, uvset_name, with_faces=True, vert_ids=corner_verts ) )
+	
+	# rotate the uv shells of all of the objects in one batch
+	results = workers.runKernel( "orientUnitizedUVs", meshes, (), uv_worker_processes, uv_worker_min_uvs )
+	
+	# only write the uvs that were rotated
+	for obj, mesh, ( u, v ) in zip( objs, meshes, results ):
+		if not np.array_equal( u, mesh["u"] ) or not np.array_equal( v, mesh["v"] ):
+			setMeshUVs( obj, u, v, uvset_name )
+
+def unitizeUVPolar( objs, uvset_name ):
+	
+	obj_seams = list()
+	obj_poles = list()
+	
+	for obj in progress( objs, "Unitize Polar" ):
+		# get the poles
+		poles = getPoleVerts( obj )
+		# get seam edges
+		obj_seams.append( getSeamEdges( obj, poles ) )
+		obj_poles.append( ( obj, poles ) )
+		# set the current uv set
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet=uvset_name )
+		# unitize the object
+		cmds.polyForceUV( obj, unitize=True )
+	
+	# normalize the pole triangles of all of the objects in one batch
+	normalizePoleTriangles( obj_poles )
+	
+	# do uv layout
+	for obj, seams in progress( list( zip( objs, obj_seams ) ), "Unitize Polar Layout" ):
+		sewAndLayout( obj, seams )
+
+# PaintFX
+
+def closeHolesAndBevel( objs ):
+	
+	# The function finds open holes on the mesh, fills them, and bevels the edge around the hole
+	# It then tries to merge the vertices on the filled hole.
+	# Note: the merge vertex operation uses ngons to detect the filled hole.
+	# This may lead it issues if the mesh already contains ngons.
+	
+	bevel_fraction = 0.7
+	bevel_segments = 3
+	bevel_merge = 0.0001
+	
+	for obj in progress( objs, "Close Holes and Bevel" ):
+	
+		# get all of the hole borders at once
+		border_groups = getBorderEdgeGroups( obj )
+		
+		if not border_groups:
+			continue
+		
+		border_edges = list()
+		for group in border_groups:
+			border_edges.extend( group.toNames() )
+		
+		# fill holes
+		cmds.polyCloseBorder( border_edges, ch=1 )
+		
+		# bevel
+		cmds.polyBevel3(
+			border_edges,
+			fraction=bevel_fraction,
+			offsetAsFraction=1,
+			autoFit=1,
+			depth=1,
+			mitering=0,
+			miterAlong=0,
+			chamfer=1,
+			segments=bevel_segments,
+			worldSpace=0,
+			smoothingAngle=60,
+			subdivideNgons=1,
+			mergeVertices=1,
+			mergeVertexTolerance=bevel_merge, #0.0001,
+			miteringAngle=180,
+			angleTolerance=180,
+			ch=1
+		)
+		
+		# merge verts on ngons, one filled hole at a time
+		for group in border_groups:
+			face_counts = np.array( getMeshFn( obj ).getVertices()[0], dtype=np.int64 )
+			ngon_faces = np.flatnonzero( face_counts > 4 )
+			if len( ngon_faces ) == 0:
+				break
+			cmds.polyMergeVertex( ComponentSet( obj, "f", ngon_faces[:1] ).toNames(), d=100 )
+
+@keepSelection
+def paintFXToPoly( objs ):
+	
+	strokes = list()
+	
+	for obj in objs:
+		children = cmds.listRelatives( obj, c=True, f=True ) or []
+		for child in children:
+			if cmds.nodeType( child ) == "stroke":
+				strokes.append( child )
+				break
+	
+	strokes_groups = list()
+	strokes_geo = list()
+	
+	for st in progress( strokes, "Paint Effects to Polygons" ):
+		# doPaintEffectsToPoly converts the selected stroke and selects the new mesh
+		cmds.select( st )
+		mel.eval("doPaintEffectsToPoly( 1,0,1,0,100000);")
+		geo = cmds.listRelatives( p=True )
+		strokes_geo.append( geo )
+		grp = cmds.listRelatives( geo, p=True )
+		strokes_groups.append( grp )
+	
+	geo_group = cmds.group( n="StrokeMeshes", em=True )
+	
+	for geo in strokes_geo:
+		cmds.parent( geo, geo_group )
+	
+	for grp in strokes_groups:
+		cmds.delete( grp )
+	
+	return geo_group
+
+# Transforms
+
+def centerAtWorldOrigin( objs, points ):
+	
+	# Moves each object so that its point ( a world position ) lands on the world origin, puts its
+	# pivot there and freezes it. All of the objects are moved and pivoted in one mel call each and
+	# frozen in one makeIdentity, instead of a freeze, two xforms and a freeze per object.
+	
+	if not len( objs ):
+		return
+	
+	# move by the offset to the origin, taken into the space of each parent
+	translations, parent_matrices = getTranslations( objs )
+	offsets = np.einsum( "ni,nij->nj", -np.asarray( points, dtype=np.float64 ), np.linalg.inv( parent_matrices )[:, :3, :3] )
+	setTransformAttrs( objs, "translate", translations + offsets )
+	
+	# move pivot
+	setWorldPivots( objs, np.zeros( ( len( objs ), 3 ) ) )
+	# freeze transformations
+	cmds.makeIdentity( objs, apply=True, t=True, r=True, s=True, n=False, pn=True )
+
+def getLowestPoles( objs ):
+	
+	# The world position of the lowest pole of each mesh, NaNs for meshes without poles. The
+	# poles come from the mesh cache, the points of all of the meshes are read through one
+	# selection list with no cmds calls, and the lowest pole of every mesh is found in one sort.
+	
+	sel_list = om2.MSelectionList()
+	for obj in objs:
+		sel_list.add( obj )
+	
+	pole_points = list()
+	pole_meshes = list()
+	for i, obj in enumerate( progress( objs, "Find Poles" ) ):
+		poles = getMeshDerived( obj, "poles", poleIndices )
+		if len( poles ):
+			dag_path = sel_list.getDagPath( i )
+			dag_path.extendToShape()
+			points = np.array( om2.MFnMesh( dag_path ).getPoints( om2.MSpace.kWorld ), dtype=np.float64 ).reshape( -1, 4 )
+			pole_points.append( points[ poles, :3 ] )
+			pole_meshes.append( np.full( len( poles ), i, dtype=np.int64 ) )
+	
+	positions = np.full( ( len( objs ), 3 ), np.nan )
+	if not pole_points:
+		return positions
+	
+	# sort the poles by mesh, then height, and take the first of every mesh
+	points = np.concatenate( pole_points )
+	meshes = np.concatenate( pole_meshes )
+	order = np.lexsort( ( points[:, 1], meshes ) )
+	meshes, first = np.unique( meshes[order], return_index=True )
+	positions[meshes] = points[ order[first] ]
+	
+	return positions
+
+def centerYMin( objs ):
+	
+	# get the center point at Y min of the bounding boxes ( the origin for objects without meshes )
+	bboxes = np.nan_to_num( getWorldBoundingBoxes( objs ) )
+	points = np.stack( ( ( bboxes[:, 0] + bboxes[:, 3] ) / 2, bboxes[:, 1], ( bboxes[:, 2] + bboxes[:, 5] ) / 2 ), axis=1 )
+	
+	centerAtWorldOrigin( objs, points )
+
+def centerPole( objs ):
+	
+	points = getLowestPoles( objs )
+	
+	# leave the meshes without poles where they are, and name them all on one line
+	has_poles = ~np.isnan( points[:, 0] )
+	no_poles = [ obj for obj, keep in zip( objs, has_poles ) if not keep ]
+	if no_poles:
+		print( "Center Pole: no poles on " + str( len( no_poles ) ) + " meshes: " + ", ".join( no_poles ) )
+	
+	centerAtWorldOrigin( [ obj for obj, keep in zip( objs, has_poles ) if keep ], points[ has_poles ] )
+
+def setPivot( objs, mode ):
+	
+	# get bounding box ( leaving the objects without meshes as they are )
+	bboxes = getWorldBoundingBoxes( objs )
+	has_bbox = ~np.isnan( bboxes[:, 0] )
+	objs = [ obj for obj, keep in zip( objs, has_bbox ) if keep ]
+	bboxes = bboxes[ has_bbox ]
+	
+	# the center, with the min or max side along the axis of the mode
+	pivots = ( bboxes[:, :3] + bboxes[:, 3:] ) / 2
+	if mode[1:] in ( "min", "max" ) and mode[0] in "xyz":
+		axis = "xyz".index( mode[0] )
+		pivots[:, axis] = bboxes[:, axis + ( 3 if mode[1:] == "max" else 0 )]
+	
+	# move pivot
+	setWorldPivots( objs, pivots )
+
+def pivotToWorldOrigin( objs ):
+	
+	if not objs:
+		return
+	
+	# move pivot to world origin
+	setWorldPivots( objs, np.zeros( ( len( objs ), 3 ) ) )
+	# freeze transformations
+	cmds.makeIdentity( objs, apply=True, t=True, r=True, s=True, n=False, pn=True )
+
+def randomizeRotation( objs, mode, rot_min=0, rot_max=360, seed=None ):
+	
+	# Sets the rotation of the objects ( given by full path ) around the axes in mode, any of "x", "y"
+	# and "z", to random angles between rot_min and rot_max. The angles come from the seed and the
+	# path of each object, so the same seed gives the same scatter on every run. Without a seed a
+	# new one is drawn and printed, never 0, so that it can be typed into the seed field.
+	
+	if seed is None:
+		seed = np.random.SeedSequence().entropy % 0xFFFFFFFF + 1
+		print( "Randomize Rotation: seed " + str( seed ) )
+	
+	# one number per axis and object, the same for an axis whichever other axes are randomized
+	randoms = getObjectRandoms( objs, seed, 3 )
+	
+	for axis in "xyz":
+		if axis in mode:
+			angles = rot_min + ( rot_max - rot_min ) * randoms[:, "xyz".index( axis )]
+			setTransformAttrs( objs, "rotate" + axis.upper(), angles )
+
+def distribute( objs, mode, value ):
+	
+	# Lays out the meshes at or below the objects, sorted by name. In the "x", "y" and "z" modes
+	# they go in a line along the axis, value apart ( a negative value lines them up backwards ).
+	# In the "grid" mode they go in a square grid of equal cells and in the "shelf" mode in rows
+	# of about equal width, deepest first, both on the ground plane and value apart.
+	
+	geo_nodes = getMeshTransforms( objs )
+	
+	# read all of the bounding boxes at once ( leaving the objects with only hidden meshes where they are )
+	bboxes = getWorldBoundingBoxes( geo_nodes )
+	has_bbox = ~np.isnan( bboxes[:, 0] )
+	geo_nodes = [ obj for obj, keep in zip( geo_nodes, has_bbox ) if keep ]
+	bboxes = bboxes[ has_bbox ]
+	
+	if not geo_nodes:
+		return
+	
+	translations, parent_matrices = getTranslations( geo_nodes )
+	
+	if mode in ( "x", "y", "z" ):
+		positions = distributeAlongAxis( bboxes, "xyz".index( mode ), value )
+	elif mode == "grid":
+		positions = distributeGrid( bboxes, translations, parent_matrices, value )
+	elif mode == "shelf":
+		positions = distributeShelves( bboxes, translations, parent_matrices, value )
+	else:
+		raise ValueError( "Unknown distribute mode: " + str( mode ) )
+	
+	# move all of the objects at once
+	setWorldTranslations( geo_nodes, positions, parent_matrices )
+
+def distributeAlongAxis( bboxes, axis, value ):
+	
+	# the first object stays at the origin, every next one is half its width past the end of the
+	# previous one plus the spacing
+	sign = -1 if value < 0 else 1
+	widths = np.abs( bboxes[:, axis + 3] - bboxes[:, axis] )
+	ends = np.cumsum( widths )
+	
+	positions = np.zeros( ( len( bboxes ), 3 ) )
+	positions[:, axis] = sign * ( ends - widths / 2 - widths[0] / 2 ) + value * np.arange( len( bboxes ) )
+	
+	return positions
+
+def worldPositionsForCenters( bboxes, translations, parent_matrices, centers ):
+	
+	# the world positions that move the x and z center of each bounding box to the given centers
+	points = np.concatenate( ( translations, np.ones( ( len( translations ), 1 ) ) ), axis=1 )
+	positions = np.einsum( "ni,nij->nj", points, parent_matrices )[:, :3]
+	positions[:, 0] += centers[:, 0] - ( bboxes[:, 0] + bboxes[:, 3] ) / 2
+	positions[:, 2] += centers[:, 1] - ( bboxes[:, 2] + bboxes[:, 5] ) / 2
+	
+	return positions
+
+def distributeGrid( bboxes, translations, parent_matrices, value ):
+	
+	# equal cells as large as the largest object, in a square grid from the origin
+	num_objs = len( bboxes )
+	columns = int( math.ceil( math.sqrt( num_objs ) ) )
+	cell_width = np.max( bboxes[:, 3] - bboxes[:, 0] ) + value
+	cell_depth = np.max( bboxes[:, 5] - bboxes[:, 2] ) + value
+	
+	index = np.arange( num_objs )
+	centers = np.stack( ( ( index % columns ) * cell_width, ( index // columns ) * cell_depth ), axis=1 )
+	
+	return worldPositionsForCenters( bboxes, translations, parent_matrices, centers )
+
+def distributeShelves( bboxes, translations, parent_matrices, value ):
+	
+	# Shelf packing: the objects go deepest first into rows along x until a row is as wide as the
+	# side of a square with the area of all of them, and each row is as deep as its first object.
+	
+	widths = bboxes[:, 3] - bboxes[:, 0] + value
+	depths = bboxes[:, 5] - bboxes[:, 2] + value
+	order = np.lexsort( ( np.arange( len( bboxes ) ), -depths ) )
+	row_width = max( math.sqrt( np.sum( widths * depths ) ), np.max( widths ) )
+	
+	# the end of every object along its row, from a running total over all of them
+	ends = np.cumsum( widths[order] )
+	
+	# split the running total into rows, each starting with the first object that does not fit the one before
+	row_starts = [ 0 ]
+	while True:
+		row_end = np.searchsorted( ends, ( ends[ row_starts[-1] - 1 ] if row_starts[-1] else 0.0 ) + row_width + 1e-9, side="right" )
+		row_end = max( row_end, row_starts[-1] + 1 )
+		if row_end >= len( order ):
+			break
+		row_starts.append( row_end )
+	
+	row_starts = np.array( row_starts, dtype=np.int64 )
+	row_of = np.repeat( np.arange( len( row_starts ) ), np.diff( np.append( row_starts, len( order ) ) ) )
+	row_offsets = np.concatenate( ( [0.0], ends ) )[ row_starts ]
+	row_depths = depths[order][ row_starts ]
+	row_z = np.cumsum( row_depths ) - row_depths
+	
+	centers = np.zeros( ( len( bboxes ), 2 ) )
+	centers[order, 0] = ends - row_offsets[row_of] - widths[order] / 2
+	centers[order, 1] = row_z[row_of] + depths[order] / 2
+	
+	return worldPositionsForCenters( bboxes, translations, parent_matrices, centers )
+
+def resetTransforms( objs, mode, node_type="transform" ):
+	
+	# Resets the channels in mode ( "trans", "rot", "scale", or a list of them ) on the transforms
+	# at or below the objects. The topmost ones are reset in world space, like xform -ws, and
+	# everything below them in local space, one bulk write per channel.
+	
+	modes = [ mode ] if isinstance( mode, str ) else list( mode )
+	
+	transforms = getDagTransforms( objs, node_type )
+	
+	if not transforms:
+		return
+	
+	# the transforms under a parent that is not reset itself
+	found = set( transforms )
+	parents = [ t.rsplit( "|", 1 )[0] for t in transforms ]
+	is_top = np.array( [ bool( p ) and p not in found for p in parents ], dtype=bool )
+	tops = [ t for t, top in zip( transforms, is_top ) if top ]
+	inner = [ t for t, top in zip( transforms, is_top ) if not top ]
+	
+	# the world matrices of their parents, split into the scale and the rotation of each
+	parent_matrices = getTranslations( tops )[1]
+	parent_scales = np.linalg.norm( parent_matrices[:, :3, :3], axis=2 )
+	parent_rotations = parent_matrices[:, :3, :3] / np.maximum( parent_scales, 1e-12 )[:, :, np.newaxis]
+	mirrored = np.linalg.det( parent_rotations ) < 0
+	parent_rotations[ mirrored, 2 ] *= -1
+	
+	for channel in modes:
+		
+		if channel == "trans":
+			setTransformAttrs( inner, "translate", np.zeros( ( len( inner ), 3 ) ) )
+			setWorldTranslations( tops, np.zeros( ( len( tops ), 3 ) ), parent_matrices )
+		
+		elif channel == "rot":
+			setTransformAttrs( inner, "rotate", np.zeros( ( len( inner ), 3 ) ) )
+			# the rotation that undoes the rotation of the parent, like xform -ro 0 0 0 -ws
+			setTransformAttrs( tops, "rotate", eulerFromMatrices( np.transpose( parent_rotations, ( 0, 2, 1 ) ), getRotateOrders( tops ) ) )
+		
+		elif channel == "scale":
+			setTransformAttrs( inner, "scale", np.ones( ( len( inner ), 3 ) ) )
+			
+			# a parent scaled to zero on an axis cannot be undone, so the transforms under one keep their scale
+			invertible = np.all( parent_scales > 1e-12, axis=1 )
+			if not invertible.all():
+				print( "Reset Transforms: kept the scale under a zero scaled parent on " + ", ".join( t for t, ok in zip( tops, invertible ) if not ok ) )
+			scaled = [ t for t, ok in zip( tops, invertible ) if ok ]
+			
+			# the scale that gives every world axis a length of one, like xform -s 1 1 1 -ws: the local
+			# rotation ( the local matrix without its scale ) is kept, and each scale divides out the length
+			# of its axis through the rotation and the parent, negated on z under a mirror as for "rot"
+			parent_axes = parent_matrices[ invertible, :3, :3 ]
+			local = np.einsum( "nij,njk->nik", getTransformMatrices( scaled, True )[:, :3, :3], np.linalg.inv( parent_axes ) )
+			local_scales = np.linalg.norm( local, axis=2 )
+			rotations = local / np.maximum( local_scales, 1e-12 )[:, :, np.newaxis]
+			axes = np.einsum( "nij,njk->nik", rotations, parent_axes )
+			scales = 1.0 / np.linalg.norm( axes, axis=2 )
+			scales[ np.linalg.det( axes ) < 0, 2 ] *= -1
+			
+			# a local matrix with a zero or negative scale, or with shear, has no rotation to read back,
+			# so those go through xform one by one
+			solved = np.all( local_scales > 1e-12, axis=1 ) & ( np.linalg.det( rotations ) > 0 )
+			solved &= np.all( np.abs( np.einsum( "nij,nkj->nik", rotations, rotations ) - np.identity( 3 ) ) < 1e-9, axis=( 1, 2 ) )
+			setTransformAttrs( [ t for t, ok in zip( scaled, solved ) if ok ], "scale", scales[ solved ] )
+			for top in [ t for t, ok in zip( scaled, solved ) if not ok ]:
+				cmds.xform( top, s=[ 1, 1, 1 ], ws=True )
+		
+		else:
+			raise ValueError( "Unknown reset mode: " + str( channel ) )
+
+def matchTransforms( objs, target, world_space ):
+	
+	# obj > obj: give every object the transform of the target
+	matrix = cmds.xform( target, m=True, query=True, worldSpace=world_space )
+	for obj in objs:
+		cmds.xform( obj, m=matrix, worldSpace=world_space )
+
+def groupMatchKey( obj, index, key_mode, pattern ):
+	
+	# the key a child is matched on: its position, its short name, its short name with the pattern
+	# taken out, or the topology signature of its mesh ( the short name for transforms without one )
+	short_name = obj.rsplit( "|", 1 )[-1]
+	
+	if key_mode == "index":
+		return index
+	if key_mode == "regex":
+		return re.sub( pattern, "", short_name )
+	if key_mode == "topology" and cmds.listRelatives( obj, s=True, ni=True, type="mesh" ):
+		return getTopologySignature( obj )
+	
+	return short_name
+
+def matchGroupChildren( grp, target_grp, key_mode=None, pattern=None ):
+	
+	# Pairs the transforms under grp with those under target_grp, level by level down through the
+	# matched groups, through an index of the target children by key. Children sharing a key pair in
+	# outliner order. Returns the pairs, the children left unmatched and the target children left unused.
+	
+	if key_mode is None:
+		key_mode = group_match_key
+	if pattern is None:
+		pattern = group_match_pattern
+	
+	pairs = []
+	unmatched = []
+	unused = []
+	
+	groups = collections.deque( [ ( grp, target_grp ) ] )
+	while groups:
+		
+		src, target = groups.popleft()
+		src_children = cmds.listRelatives( src, c=True, f=True, type="transform" ) or []
+		target_children = cmds.listRelatives( target, c=True, f=True, type="transform" ) or []
+		
+		# the target children by key
+		index = collections.OrderedDict()
+		for i, child in enumerate( target_children ):
+			index.setdefault( groupMatchKey( child, i, key_mode, pattern ), collections.deque() ).append( child )
+		
+		for i, child in enumerate( src_children ):
+			candidates = index.get( groupMatchKey( child, i, key_mode, pattern ) )
+			if candidates:
+				target_child = candidates.popleft()
+				pairs.append( ( child, target_child ) )
+				groups.append( ( child, target_child ) )
+			else:
+				unmatched.append( child )
+		
+		unused.extend( child for candidates in index.values() for child in candidates )
+	
+	return pairs, unmatched, unused
+
+def matchGroupTransforms( grp, target_grp, world_space, key_mode=None, pattern=None ):
+	
+	# grp > grp: give every transform under the group the transform of the matching one under the target group
+	pairs, unmatched, unused = matchGroupChildren( grp, target_grp, key_mode, pattern )
+	
+	if pairs:
+		objs, targets = zip( *pairs )
+		setTransformMatrices( objs, getTransformMatrices( targets, world_space ), world_space )
+	
+	print( "Match Group Transforms: " + str( len( pairs ) ) + " matched, " + str( len( unmatched ) ) + " unmatched, " + str( len( unused ) ) + " unused in the target" )
+	for obj in unmatched:
+		print( "  unmatched: " + obj )
+	for obj in unused:
+		print( "  unused: " + obj )
+	
+	return collections.OrderedDict( [ ( "matched", pairs ), ( "unmatched", unmatched ), ( "unused", unused ) ] )
+
+# Outliner
+
+@keepSelection
+def makeNullAbove( obj ):
+	
+	# get the parent and get the children at the same level
+	obj_short_name = obj.split('|')[-1]
+	obj_parent = cmds.listRelatives( obj, parent=True, f=True )
+	sort_group = cmds.listRelatives( obj_parent, c=True )
+	
+	# get the index of the object in the hierarchy
+	obj_index = 0
+	for c in sort_group:
+		if c == obj_short_name:
+			obj_index = sort_group.index(c)
+	
+	# make a new group and parent it to the object's group
+	new_group = cmds.group( em=True )
+	new_group = cmds.parent( new_group, obj_parent )[0]
+	
+	# move the group to the top of the list
+	cmds.reorder( new_group, front=True )
+	
+	# move all of the other objects above the group
+	for i in range( obj_index ):
+		k = obj_index - 1 - i
+		cmds.reorder( sort_group[k], front=True )
+	
+	return new_group
+
+# Materials
+
+def assignRampMaterial( objs ):
+	
+	# create shader nodes
+	lambert = cmds.shadingNode( "lambert", asShader=True, n="Gradient_mat" )
+	lambert_sg = cmds.sets( name=( lambert + "SG" ), renderable=True, noSurfaceShader=True, empty=True )
+	cmds.connectAttr( lambert + ".outColor", lambert_sg + ".surfaceShader" )
+	ramp = cmds.shadingNode( "ramp", asTexture=True )
+	place_2d = cmds.shadingNode( "place2dTexture", asUtility=True )
+	cmds.connectAttr( place_2d + ".outUV", ramp + ".uv" )
+	cmds.connectAttr( place_2d + ".outUvFilterSize", ramp + ".uvFilterSize" )
+	cmds.connectAttr( ramp + ".outColor", lambert + ".color" )
+	cmds.setAttr( ramp + ".colorEntryList[0].color", 1, 0, 0, type="double3" )
+	cmds.setAttr( ramp + ".colorEntryList[1].color", 1, 1, 0, type="double3" )
+	cmds.setAttr( ramp + ".colorEntryList[1].position", 1 )
+	cmds.setAttr( lambert + ".diffuse", 0 )
+	cmds.setAttr( lambert + ".ambientColor", 1, 1, 1, type="double3" )
+	
+	for obj in objs:
+	
+		# assign the material
+		cmds.sets( obj, forceElement=lambert_sg )
+		# link the uv set
+		cmds.uvLink( make=True, uvSet=( obj + ".uvSet[1].uvSetName" ), texture=ramp )
+	
+	return lambert
+
+def addGammaNodes( lamberts, gamma_val ):
+	
+	#gamma_val = 1 / 2.2
+	
+	for obj in lamberts:
+	
+		col = cmds.getAttr( obj + ".color" )[0]
+		gamma_node = cmds.shadingNode( "gammaCorrect", asUtility=True )
+		
+		cmds.setAttr( gamma_node + ".valueX", col[0] )
+		cmds.setAttr( gamma_node + ".valueY", col[1] )
+		cmds.setAttr( gamma_node + ".valueZ", col[2] )
+		
+		cmds.setAttr( gamma_node + ".gammaX", gamma_val )
+		cmds.setAttr( gamma_node + ".gammaY", gamma_val )
+		cmds.setAttr( gamma_node + ".gammaZ", gamma_val )
+		
+		cmds.connectAttr( gamma_node + ".outValue", obj + ".color" )
+
+def gammaCorrectLamberts( lamberts, gamma ):
+	
+	for lamb in lamberts:
+	
+		new_color = list()
+		original_color = cmds.getAttr( lamb + ".color" )[0]
+		
+		for channel in original_color:
+			new_color.append( pow( channel, gamma ) )
+		
+		cmds.setAttr( lamb + ".colorR", new_color[0] )
+		cmds.setAttr( lamb + ".colorG", new_color[1] )
+		cmds.setAttr( lamb + ".colorB", new_color[2] )
+
+def assignMaterialFromShape( obj_mat, objs ):
+	
+	shading_engine = cmds.listConnections( obj_mat, type="shadingEngine" )[0]
+	#materials = cmds.ls( cmds.listConnections( shading_engine ), materials=True)
+	
+	for obj in objs:
+		cmds.sets( obj, e=True, forceElement=shading_engine )
+
+# Vertex Color
+
+def applyVertexColor( objs, mode, channel ):
+	
+	for obj in progress( objs, "Vertex Color" ):
+	
+		vertex_color = (0.0, 0.0, 0.0)
+		
+		# define colors
+		if channel == "r":
+			vertex_color = (1.0, 0.0, 0.0)
+		elif channel == "g":
+			vertex_color = (0.0, 1.0, 0.0)
+		elif channel == "b":
+			vertex_color = (0.0, 0.0, 1.0)
+		
+		# define modes
+		if mode == "uv_v":
+			# get the v coordinate of every face-vertex so that each side of a uv seam keeps its own value
+			face_counts, face_verts, face_vert_uvs, num_uvs = getFaceVertexUVIds( obj )
+			u, v = getMeshUVs( obj )
+			values = np.zeros( len( face_verts ) )
+			mapped = face_vert_uvs >= 0
+			values[mapped] = v[ face_vert_uvs[mapped] ]
+			# add the color to the existing colors
+			colors = getMeshColors( obj, True )
+			colors[:, :3] += values[:, np.newaxis] * np.array( vertex_color )
+			per_face_vertex = True
+		
+		elif mode == "clear":
+			colors = getMeshColors( obj, False )
+			colors[:, :3] = 0.0
+			per_face_vertex = False
+		
+		else:
+			continue
+		
+		# apply vertex colors
+		setMeshColors( obj, colors, per_face_vertex )
+
+def applyVertexColorFromLambert( shapes ):
+	
+	for obj in progress( shapes, "Vertex Color from Lambert" ):
+	
+		# get the shading engine on the object
+		shading_engine = cmds.listConnections( obj, type="shadingEngine" )[0]
+		# get the lambert
+		material = cmds.ls( cmds.listConnections( shading_engine ), type="lambert" )[0]
+		# get the color
+		mat_color = cmds.getAttr( material + ".color" )[0]
+		# apply vertex color
+		cmds.polyColorPerVertex( obj, r=mat_color[0], g=mat_color[1], b=mat_color[2], a=1.0, cdo=True )
+
+# Rename
+
+def renameObjects( objs, name_mode, selection_mode, num_mode, new_name ):
+	
+	'''
+	name_mode = 1		# 1=selection, 2=string
+	selection_mode = 1	# 1=parent, 2=object
+	num_mode = 1		# 1=numerically, 2=alphabetically
+	'''
+	
+	objs = list( objs )
+	sep = "_"
+	name_base = new_name
+	padding = 2
+	first_index = 1
+	
+	if selection_mode==1:
+		children_list = list()
+		for grp in objs:
+			name_base = grp.split("|")[-1]
+			children = cmds.listRelatives( grp, ad=True, f=True, type="transform" )
+			children.sort()
+			for i in range( len( children ) ):
+				customRename( children[i], name_base, sep, padding, i, first_index, num_mode )
+	
+	if selection_mode==2:
+	
+		if name_mode==2:
+			objs.sort()
+			for i in range( len( objs ) ):
+				customRename( objs[i], name_base, sep, padding, i, first_index, num_mode )
+		
+		if name_mode==1:
+			name_base = objs[-1].split("|")[-1]
+			objs.pop()
+			objs.sort()
+			for i in range( len( objs ) ):
+				customRename( objs[i], name_base, sep, padding, i, first_index, num_mode )
+
+def customRenameObjects( objs, input_str, mode ):
+	
 	for obj in objs:
-		children = cmds.listRelatives( obj, fullPath=True, children=True )
-		transforms = cmds.ls( children, long=True, type="transform" )
-		for t in transforms:
-			child_transforms.append( t )
-	return child_transforms
+	
+		obj_name = obj.split("|")[-1]
+		
+		if mode=="Add Suffix":
+			cmds.rename( obj, obj_name + input_str )
+		if mode=="Add Prefix":
+			cmds.rename( obj, input_str + obj_name )
+		if mode=="Remove String":
+			name_split = obj_name.split( input_str )
+			new_name = ""
+			for s in name_split:
+				new_name = new_name + s
+			cmds.rename( obj, new_name )
+		if mode=="Remove Last 'n' Chars":
+			index = int( input_str )
+			cmds.rename( obj, obj_name[:-index] )
+		if mode=="Remove First 'n' Chars":
+			index = int( input_str )
+			cmds.rename( obj, obj_name[index:] )
+		# number alphabetically
+		if mode=='Numbering (A)':
+			index = objs.index( obj ) + 1
+			letter = chr( ord( '@' ) + index )
+			new_name = input_str + letter
+			cmds.rename( obj, new_name )
+		if mode=='Numbering (01)' or mode=='Numbering (001)' or mode=='Numbering (0001)':
+			if mode=='Numbering (01)':
+				padding = 2
+			if mode=='Numbering (001)':
+				padding = 3
+			if mode=='Numbering (0001)':
+				padding = 4
+			index = objs.index( obj ) + 1
+			new_name = input_str + str( index ).zfill( padding )
+			cmds.rename( obj, new_name )
 
-def sortOutliner( objs, recursive, reverse ):
+# Utility
 
-	parent_child_list = getParentChildList( objs )	
-	unique_parents = getUniqueParents( objs )
-	grouped_children = groupParentChildren( parent_child_list, unique_parents )
-	all_children = getAllChildrenFromParents( unique_parents )
-	above_selected = getObjsAboveSelected( unique_parents, grouped_children, all_children )
+@keepSelection
+def locatorsFromTransforms( objs ):
 	
-	for i in range( len( grouped_children ) ):
-		grouped_children[i].sort()
-		if not reverse:
-			grouped_children[i].reverse()
+	short_name = cmds.ls( objs[0], long=False )[0]
+	new_group = cmds.group( em=True, name=( short_name + "_Locators" ) )
 	
-	for i in range( len( above_selected ) ):
-		above_selected[i].reverse()
-
-	for ls in grouped_children:
-		for child in ls:
-			cmds.reorder( child, front=True )
+	for obj in objs:
+	
+		# get the object name
+		short_name = cmds.ls( obj, long=False )[0]
+		# get the transform
+		obj_transform = cmds.xform( obj, matrix=True, query=True )
+		# make a new locator
+		new_locator = cmds.spaceLocator()
+		# get the shape node
+		locator_shape = cmds.listRelatives( new_locator )[0]
+		
+		# set the local scale of the shape node
+		cmds.setAttr( locator_shape + ".localScaleX", 10 )
+		cmds.setAttr( locator_shape + ".localScaleY", 10 )
+		cmds.setAttr( locator_shape + ".localScaleZ", 10 )
+		
+		# set the locator transform
+		cmds.xform( new_locator, matrix=obj_transform )
+		# rename the locator
+		obj_rename = cmds.rename( new_locator, short_name + "_lctr" )
+		# parent it to the new group
+		cmds.parent( obj_rename, new_group)
+	
+	return new_group
 
-	for ls in above_selected:
-		for child in ls:
-			cmds.reorder( child, front=True )
+@keepSelection
+def copyAlembicWithDelay( obj, num_instances ):
 	
-	if recursive:
-		child_transforms = getChildTransforms( objs )
-		if child_transforms:
-			sortOutliner( child_transforms, True, reverse )
+	# get nodes
+	obj_name = cmds.ls( obj, long=False )[0]
+	shape = cmds.listRelatives( obj, type="mesh", f=True )
+	alembic_node = cmds.listConnections( shape, type="AlembicNode" )
+	
+	# make master alembic
+	master_alembic = cmds.duplicate( alembic_node, n=( obj_name + "_AlembicNode" + "_Master" ) )
+	
+	# make frame offset float
+	float_constant = cmds.shadingNode( "floatConstant", asUtility=True, n=( obj_name + "_FrameOffset") )
+	cmds.setAttr( float_constant + ".inFloat", 10 )
+	
+	# define the list to hold the expression
+	expression_text = list()
+	new_line = "float $offset = " + obj_name + "_FrameOffset.outFloat;"
+	expression_text.append( new_line )
+	expression_text.append( "" )
+	
+	# make a new group
+	new_grp = cmds.group( em=True, n=( obj_name + "_Alembic_grp" ) )
+	
+	# duplicate the object and alembic, connect them, add a new line to the expression, parent the object to the group
+	for i in range( num_instances ):
+		new_obj = cmds.duplicate( obj, n=( obj_name + "_" + str(i) ) )
+		shape = cmds.listRelatives( new_obj, type="mesh", f=True )
+		alembic_node = cmds.duplicate( alembic_node, n=( obj_name + "_AlembicNode" + "_" + str(i) ) )
+		cmds.connectAttr( master_alembic[0] + ".abc_File", alembic_node[0] + ".abc_File" )
+		cmds.connectAttr( alembic_node[0] + ".outPolyMesh[0]", shape[0] + ".inMesh" )
+		new_line = obj_name + "_AlembicNode_" + str(i) + ".time = frame - ( $offset * " + str(i) + " );"
+		expression_text.append( new_line )
+		cmds.parent( new_obj, new_grp )
+	
+	# convert the expression list to a usable string
+	expression_string = ""
+	for line in expression_text:
+		expression_string = expression_string + "\n" + line
+	
+	# make the expression
+	cmds.expression( s=expression_string, n=( obj_name + "_Expression" ), ae=1, uc="all" )
+	
+	return new_grp
 
 ################################################################################
 ## Buttons
 ################################################################################
 
+# Fast Execution
+
+def fastExecution( func ):
+
+	# Runs a button callback as a single undo step with the viewport refresh suspended and,
+	# optionally, the evaluation manager switched to another mode. Everything is restored
+	# even when the callback raises, and the elapsed wall time is printed unless
+	# fast_exec_verbose is off. A cancelled operation is undone, so the scene is left as it
+	# was before the button was pressed, unless undo is off, in which case its edits so far
+	# are kept. The OpenMaya writes are part of the undo step because they go through
+	# GameAssetUndo.apiEdit.
+
+	@functools.wraps( func )
+	def wrapper( *args, **kwargs ):
+
+		start_time = time.perf_counter()
+		evaluation_mode = None
+		cancelled = False
+
+		# what was opened so far, so that only that is closed when opening the rest fails
+		profiling = False
+		chunk_open = False
+		undo_enabled = False
+		refresh_suspended = False
+
+		try:
+			# record the operation when GameAssetProfiler is enabled
+			if profiler:
+				profiler.beginOperation( func.__name__ )
+				profiling = True
+
+			undo_enabled = cmds.undoInfo( query=True, state=True )
+			cmds.undoInfo( openChunk=True, chunkName=func.__name__ )
+			chunk_open = True
+			cmds.refresh( suspend=True )
+			refresh_suspended = True
+
+			if fast_exec_evaluation_mode:
+				evaluation_mode = cmds.evaluationManager( query=True, mode=True )[0]
+				cmds.evaluationManager( mode=fast_exec_evaluation_mode )
+
+			return func( *args, **kwargs )
+
+		except OperationCancelled:
+			cancelled = True
+
+		finally:
+			ProgressReporter.closeAll()
+			if evaluation_mode:
+				cmds.evaluationManager( mode=evaluation_mode )
+			if refresh_suspended:
+				cmds.refresh( suspend=False )
+			if chunk_open:
+				cmds.undoInfo( closeChunk=True )
+			if cancelled:
+				# with undo off the chunk recorded nothing, and undo would take back an earlier action
+				if chunk_open and undo_enabled:
+					cmds.undo()
+					print( func.__name__ + ": cancelled" )
+				else:
+					print( func.__name__ + ": cancelled, undo is off so the edits made so far are kept" )
+			elif fast_exec_verbose:
+				print( func.__name__ + ": " + "%.3f" % ( time.perf_counter() - start_time ) + "s" )
+			if profiling:
+				profiler.endOperation()
+
+	return wrapper
+
 # Combine, Separate & History
 
+@fastExecution
 def OnBtnSeparate( isChecked ):
 	
 	# get the selected objects
@@ -462,25 +2866,11 @@ def OnBtnSeparate( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		shells = getShells( obj )
-		
-		if len( shells ) > 1:
-			# separate objects and store in a list
-			separated_objects = cmds.polySeparate( obj )
-			# delete history
-			cmds.delete( separated_objects, constructionHistory=True )
-			# remove non transforms from list
-			separated_objects = cmds.ls( separated_objects, type="transform", long=True )
-			# center pivots and rename
-			for mesh in separated_objects:
-				short_name = obj.split('|')[-1]
-				cmds.xform( mesh, cp=True )
-				cmds.rename( mesh, short_name )
+	separateMeshes( sel )
 	
-	cmds.select( sel ) 
+	cmds.select( sel )
 
+@fastExecution
 def OnBtnCombine( isChecked, mode ):
 	
 	# get the selected objects
@@ -492,62 +2882,14 @@ def OnBtnCombine( isChecked, mode ):
 		return -1
 	
 	if mode == 1:
-		
-		parents = set()
-		
-		# get the parents
-		for obj in sel:
-			obj_parent = cmds.listRelatives( obj, parent=True, fullPath=True )
-			if obj_parent == None:
-				obj_parent = "root"
-			else:
-				obj_parent = obj_parent[0]
-			parents.add( obj_parent )
-
-		# combine the objects
-		combined = cmds.polyUnite( sel, ch=True, mergeUVSets=True, centerPivot=True )[0]
-
-		# if the objects share a common parent, parent the combined object to the parent
-		if len( parents ) <= 1:
-			parents = list( parents )
-			if parents[0] != "root":
-				cmds.parent( combined, parents[0] )
-
-		# delete history
-		cmds.delete( combined, constructionHistory=True )
-
-		# rename the combined object to the first selection
-		short_name = sel[0].split('|')[-1]
-		cmds.rename( combined, short_name )
+		combined = combineMeshes( sel )
+		cmds.select( combined )
 	
 	if mode == 2:
-	
-		for grp in sel:
-			
-			# get the number of objects in the group
-			num_children = len( cmds.listRelatives( grp ) )
-			
-			# combine only if there is more than one object in the group
-			if num_children > 1:
-				# get the parent group	
-				parent_grp = cmds.listRelatives( grp, parent=True, fullPath=True )
-				# combine the objects in the group
-				combined = cmds.polyUnite( grp, ch=True, mergeUVSets=True, centerPivot=True )[0]
-				# delete construction history
-				cmds.delete( combined, constructionHistory=True )
-				# get the group short names
-				short_name = grp.split('|')[-1]	
-				# rename the new object
-				cmds.rename( short_name )
-				# store the new object
-				combined_obj = cmds.ls( selection=True )
-				# clear the selection
-				cmds.select( clear=True )
-				
-				if parent_grp:
-					# parent the new object to the parent group
-					cmds.parent( combined_obj, parent_grp )
+		combineGroups( sel )
+		cmds.select( clear=True )
 
+@fastExecution
 def OnBtnDeleteHistory( isChecked ):
 	
 	# get the selected objects
@@ -557,13 +2899,12 @@ def OnBtnDeleteHistory( isChecked ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-		
-	for obj in sel:
 	
-		cmds.delete( obj, constructionHistory=True )
+	deleteHistory( sel )
 
 # Normals
 
+@fastExecution
 def OnBtnFixNormals( isChecked ):
 	
 	# get the selected objects
@@ -574,17 +2915,13 @@ def OnBtnFixNormals( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		cmds.polySetToFaceNormal( obj )
-		#cmds.polySoftEdge( obj, a=60, ch=0 )
-		cmds.polySoftEdge( obj, a=180 )
-		cmds.select( clear=True )
+	fixNormals( sel )
 	
 	cmds.select( sel )
 
 # Topology
 
+@fastExecution
 def OnBtnDeleteExtruded( isChecked ):
 	
 	# get the selected objects
@@ -595,67 +2932,13 @@ def OnBtnDeleteExtruded( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		verts = cmds.polyListComponentConversion( obj, toVertex=True )
-		verts = cmds.ls( verts, flatten=True )
-		
-		# make a list to hold the corner verts
-		corner_verts = list()
-		# make a list to hold two edge verts
-		two_edge_verts = list()
-		
-		# get the corner verts
-		for v in verts:
-			edges = cmds.polyListComponentConversion( v, toEdge=True )
-			edges = cmds.ls( edges, flatten=True )
-			if len( edges ) <= 3:
-				corner_verts.append( v )
-			if len( edges ) == 2:
-				two_edge_verts.append( v )
-		
-		if len( corner_verts ) >= 8 and len( two_edge_verts ) < 1:
-		
-			# get the corner internal edges
-			corner_internal_edges = cmds.polyListComponentConversion( corner_verts, toEdge=True, internal=True )
-			corner_internal_edges = cmds.ls( corner_internal_edges, flatten=True )
-			corner_internal_edges = set( corner_internal_edges )
-			
-			# get the corner edges
-			corner_edges = cmds.polyListComponentConversion( corner_verts, toEdge=True )
-			corner_edges = cmds.ls( corner_edges, flatten=True )
-			corner_edges = set( corner_edges )
-			
-			# get the corner seam edges
-			corner_seam_edges = corner_edges.difference( corner_internal_edges )
-			corner_seam_edges = list( corner_seam_edges )
-			
-			# get the seam edges
-			cmds.select( corner_seam_edges )
-			cmds.polySelectConstraint( pp=4, t=0x8000, m=2 )
-			seam_edges = cmds.ls( selection=True, flatten=True )
-			
-			# get the seam faces
-			seam_verts = cmds.polyListComponentConversion( seam_edges, toVertex=True )
-			seam_faces = cmds.polyListComponentConversion( seam_verts, toFace=True, internal=True )
-			
-			cmds.select( seam_faces )
-			
-			cmds.delete( seam_faces )
-			
-			cmds.select( verts[0] )
-			cmds.polySelectConstraint( shell=True, t=0x0001, m=2 )
-			back_faces = cmds.ls( selection=True, flatten=True )
-			back_faces = cmds.polyListComponentConversion( back_faces, toFace=True )
-			cmds.select( clear=True )
-			cmds.polySelectConstraint( shell=False )
-			
-			cmds.delete( back_faces )
+	deleteExtruded( sel )
 	
 	cmds.select( sel )
 
+@fastExecution
 def OnBtnPolyRetopo( isChecked, face_count ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -664,12 +2947,11 @@ def OnBtnPolyRetopo( isChecked, face_count ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		cmds.polyRetopo( obj, targetFaceCount=face_count )
+	retopologize( sel, face_count )
 
 # UV
 
+@fastExecution
 def OnBtnDeleteUV( isChecked ):
 	
 	# get the selected objects
@@ -680,101 +2962,12 @@ def OnBtnDeleteUV( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		# get the names of all uv sets
-		uv_sets = cmds.polyUVSet( obj, auv=True, query=True )
-		
-		# if there are no uv sets, create one
-		if len( uv_sets ) == 0:
-			cmds.polyUVSet( obj, create=True, uvSet="map1" )
-		
-		# otherwise, delete all uv sets except for the first and name it to map1
-		else:
-			
-			# get the first uv set
-			first_uv_set = uv_sets[0]
-			
-			# if there are additional uv sets, delete them
-			if len( uv_sets ) > 1:
-				uv_sets.pop( 0 )
-				for uv_set in uv_sets:
-					# delete the uv set
-					cmds.polyUVSet( obj, delete=True, uvSet=uv_set )
-			
-			# check if map1 exists
-			if first_uv_set != "map1":
-				# rename the first uv set to map1
-				cmds.polyUVSet( obj, rename=True, uvSet=first_uv_set, newUVSet="map1" )
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="map1" )
-		
-		# delete the contents of map1
-		cmds.polyMapDel( obj )
-		
-		# delete construction history
-		cmds.delete( constructionHistory=True )
-
-	cmds.select( clear=True )
-
-def onBtnScaleUvQuad( isChecked, uv_set ):
-	
-	# get the selected objects
-	sel = cmds.ls( selection=True, long=True )
-	
-	# throw an error if nothing is selected
-	if (not sel):
-		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
-		return -1
-	
-	for obj in sel:
-		corner_verts = getVertsWithEdgeCount( obj, 2 )
-		corner_edges = cmds.polyListComponentConversion( corner_verts[0], toEdge=True )
-		corner_edges = cmds.ls( corner_edges, long=True, flatten=True )
-		
-		# get a list for the edges in both dimensions from the corner
-		dimension_edges = list()
-		for e in corner_edges:
-			cmds.select( e )
-			cmds.polySelectConstraint( m2a=45, m3a=180, m=2, t=0x8000, pp=4 )
-			edge_list = cmds.ls( selection=True, flatten=True, long=True )
-			cmds.select( clear=True )
-			dimension_edges.append( edge_list )
-		
-		'''
-		# determine the dimension with more edges
-		edges_for_length = list()
-		if len( dimension_edges[0] ) >= len( dimension_edges[1] ):
-			edges_for_length = dimension_edges[0]
-		else:
-			edges_for_length = dimension_edges[1]
-		'''
-		
-		# get the length of the edges
-		edge_lengths = list()
-		for e_list in dimension_edges:
-			edge_lengths.append( getEdgeLengthSum( e_list ) )
-			
-		#print( edge_lengths[0] )
-		#print( edge_lengths[1] )
-		
-		# unitize the UVs
-		cmds.select( obj )
-		OnBtnUnitizeUVPlanar( True, uv_set )
-		
-		a = edge_lengths[0] / edge_lengths[1]
-		b = edge_lengths[1] / edge_lengths[0]
-		
-		length_ratio = a
-		
-		cmds.polyUVSet( obj, uvs=uv_set, cuv=True )
-		uvs = cmds.polyListComponentConversion( obj, toUV=True )
-		cmds.polyEditUV( uvs, pu=0, pv=0, su=length_ratio )
-		
-	cmds.select( sel )
+	deleteUVs( sel )
+	
+	cmds.select( clear=True )
 
-def OnBtnDeleteUV( isChecked ):
+@fastExecution
+def onBtnScaleUvQuad( isChecked, uv_set ):
 	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
@@ -784,44 +2977,11 @@ def OnBtnDeleteUV( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		# get the names of all uv sets
-		uv_sets = cmds.polyUVSet( obj, auv=True, query=True )
-		
-		# if there are no uv sets, create one
-		if len( uv_sets ) == 0:
-			cmds.polyUVSet( obj, create=True, uvSet="map1" )
-		
-		# otherwise, delete all uv sets except for the first and name it to map1
-		else:
-			
-			# get the first uv set
-			first_uv_set = uv_sets[0]
-			
-			# if there are additional uv sets, delete them
-			if len( uv_sets ) > 1:
-				uv_sets.pop( 0 )
-				for uv_set in uv_sets:
-					# delete the uv set
-					cmds.polyUVSet( obj, delete=True, uvSet=uv_set )
-			
-			# check if map1 exists
-			if first_uv_set != "map1":
-				# rename the first uv set to map1
-				cmds.polyUVSet( obj, rename=True, uvSet=first_uv_set, newUVSet="map1" )
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="map1" )
-		
-		# delete the contents of map1
-		cmds.polyMapDel( obj )
-		
-		# delete construction history
-		cmds.delete( constructionHistory=True )
-
-	cmds.select( clear=True )
+	scaleUVQuad( sel, uv_set )
+	
+	cmds.select( sel )
 
+@fastExecution
 def onBtnCameraProjectUV( isChecked, uv_set, projection_fill ):
 	
 	# get the selected objects
@@ -832,124 +2992,29 @@ def onBtnCameraProjectUV( isChecked, uv_set, projection_fill ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	cam = sel[-1]
-	objs = sel[:-1]
-
-	#projection_fill = 1 # 0=fill, 1=horizontal, 2=vertical
-	#uv_set = "map1"
-
-	res_width = float( cmds.getAttr('defaultResolution.width') )
-	res_height = float( cmds.getAttr('defaultResolution.height') )
-
-	# set the current uv set to work on
-	cmds.polyUVSet( objs, cuv=True, uvs=uv_set )
-
-	# make some basic uvs
-	for obj in objs:
-		cmds.polyPlanarProjection( obj, ch=True, ibd=True, md="z" )
-
-	# convert the objs to vertex
-	uvs = cmds.polyListComponentConversion( objs, toUV=True )
-	uvs = cmds.ls( uvs, flatten=True, l=True )
-
-	# move each uv
-	for uv in uvs:
-		# convert to vertex
-		vertex = cmds.polyListComponentConversion( uv, toVertex=True )
-		vertex = cmds.ls( vertex, flatten=True, l=True )[0]
-		# get world position
-		world_pos = cmds.xform( vertex, t=True, ws=True, query=True )
-		# convert to screenspace
-		uv_coord = worldSpaceToScreenSpace( cam, world_pos )
-		# edit the uv
-		cmds.polyEditUV( uv, r=False, uValue=uv_coord[0], vValue=uv_coord[1], uvs=uv_set )
-		# print progress
-		complete = round( ( float( uvs.index( uv ) ) + 1 ) / len( uvs ) * 100 )
-		print( "calculating: " + str( complete ) + "%..." )
-
-	# set scale values depending on fill method
-
-	# horizontal
-	if projection_fill == 1:
-		scale_u = 1
-		scale_v = res_height / res_width
-	# vertical
-	elif projection_fill ==2:
-		scale_u = res_width / res_height
-		scale_v = 1
-	# fill
-	else:
-		scale_u = 1
-		scale_v = 1
-
-	# adjust the overall scale of the uvs
-	cmds.polyEditUV( uvs, scaleU=scale_u, scaleV=scale_v, pivotU=0.5, pivotV=0.5, uvs=uv_set )
-
+	# the camera is selected last
+	cameraProjectUVs( sel[:-1], sel[-1], uv_set, projection_fill )
+	
 	# reset the selection
 	cmds.select( sel )
 
+@fastExecution
 def onBtnFitUVsToDimension( isChecked, scale_dimension ):
-
+	
 	# Scales and lays out the uvs on the selected objects to fit the zero to one uv space in the given dimension.
-
+	
 	sel = cmds.ls( selection=True, long=True )
 	
 	# throw an error if nothing is selected
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-
-	#scale_dimension = "u"
-
-	for obj in sel:
-
-		# convert the selection to uvs
-		sel_uv = cmds.polyListComponentConversion( obj, toUV=True )
-		sel_uv = cmds.ls( sel_uv, long=True, flatten=True )
-
-		# make a list to store the uv name and values
-		uv_name_val = list()
-		for uv in sel_uv:
-			new_entry = list()
-			uv_value = cmds.polyEditUV( uv, query=True )
-			new_entry.append( uv )
-			new_entry.append( uv_value[0] )
-			new_entry.append( uv_value[1] )
-			uv_name_val.append( new_entry )
-		
-		for elem in uv_name_val:
-			print( elem )
-		
-		# from the user input, get the array element
-		if scale_dimension == "u":
-			elem_for_scale = 1
-		else:
-			elem_for_scale = 2
-
-		# get the dimension
-		uv_name_val.sort( key=lambda x: float(x[elem_for_scale]) )
-		dimension = abs( uv_name_val[-1][elem_for_scale] - uv_name_val[0][elem_for_scale] )
-
-		# get the min uv
-		uv_name_val.sort( key=lambda x: float(x[1]) )
-		min_u_val = uv_name_val[0][1]
-		uv_name_min_u = list()
-		for elem in uv_name_val:
-			if elem[1] <= min_u_val:
-				uv_name_min_u.append( elem )
-		uv_name_min_u.sort( key=lambda x: float(x[2]) )
-		min_uv_name = uv_name_min_u[0][0]
-
-		# scale the uvs
-		v_scale = 1 / dimension
-		cmds.polyEditUV( sel_uv, su=v_scale, sv=v_scale )
-
-		# reposition the uvs at the origin
-		min_uv_val = cmds.polyEditUV( min_uv_name, query=True )
-		cmds.polyEditUV( sel_uv, u=0-min_uv_val[0], v=0-min_uv_val[1] )
+	
+	fitMeshUVsToDimension( sel, scale_dimension )
 
 # Multi UV Set Workflow
 
+@fastExecution
 def OnBtnInitializeUV( isChecked ):
 	
 	# get the selected objects
@@ -960,52 +3025,12 @@ def OnBtnInitializeUV( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		# get the names of all uv sets
-		uv_sets = cmds.polyUVSet( obj, auv=True, query=True )
-		
-		# if there are no uv sets, create one
-		if len( uv_sets ) == 0:
-			cmds.polyUVSet( obj, create=True, uvSet="map1" )
-		
-		# otherwise, delete all uv sets except for the first and name it to map1
-		else:
-			
-			# get the first uv set
-			first_uv_set = uv_sets[0]
-			
-			# if there are additional uv sets, delete them
-			if len( uv_sets ) > 1:
-				uv_sets.pop( 0 )
-				for uv_set in uv_sets:
-					# delete the uv set
-					cmds.polyUVSet( obj, delete=True, uvSet=uv_set )
-			
-			# check if map1 exists
-			if first_uv_set != "map1":
-				# rename the first uv set to map1
-				cmds.polyUVSet( obj, rename=True, uvSet=first_uv_set, newUVSet="map1" )
-
-	# get the faces of the selected objects
-	faces = cmds.polyListComponentConversion( sel, toFace=True )
-		
-	# planar map the uvs
-	cmds.polyProjection( faces, type="Planar", ibd=True, kir=True, md="z", ch=True, uvSetName="map1" )
-	
-	# create two new uv sets
-	for obj in sel:
-		
-		# create new uv sets
-		cmds.polyCopyUV( obj, uvSetNameInput="map1", uvSetName="UnitizeUV", createNewMap=True, ch=True )
-		cmds.polyCopyUV( obj, uvSetNameInput="map1", uvSetName="StackedUV", createNewMap=True, ch=True )
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="map1" )
+	initializeUVs( sel )
 	
 	cmds.select( clear=True )
 
-def OnBtnUnfoldLayout( isChecked ):
+@fastExecution
+def OnBtnUnfoldLayout( isChecked, engine_label ):
 	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
@@ -1015,17 +3040,11 @@ def OnBtnUnfoldLayout( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="StackedUV" )
-		
-		# unfold and layout
-		cmds.u3dUnfold( obj, ite=10, p=0, bi=1, tf=1, ms=1024, rs=0 )
-		cmds.u3dLayout( obj, res=256, scl=1 )
+	unfoldLayout( sel, LAYOUT_ENGINES[engine_label] )
 
+@fastExecution
 def OnBtnOrientShell( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1034,11 +3053,10 @@ def OnBtnOrientShell( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	mel.eval("texOrientEdge;")
-	obj = cmds.ls( selection=True, o=True )
-	cmds.u3dLayout( obj, res=256, scl=1 )
+	obj = orientShells( sel )
 	cmds.select( obj )
 
+@fastExecution
 def OnBtnTransferUVUnitize( isChecked ):
 	
 	# get the selected objects
@@ -1049,18 +3067,10 @@ def OnBtnTransferUVUnitize( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	source_obj = sel[ len( sel ) - 1 ]
-	
-	for i in range( len( sel ) - 1 ):
-		
-		dest_obj = sel[ i ]
-		cmds.transferAttributes( source_obj, dest_obj, transferUVs=True, sampleSpace=4, sourceUvSet="UnitizeUV", targetUvSet="UnitizeUV"  )
-	
-	for obj in sel:
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="UnitizeUV" )
+	# the source object is selected last
+	transferUVSet( sel[-1], sel[:-1], "UnitizeUV" )
 
+@fastExecution
 def OnBtnTransferUVStacked( isChecked ):
 	
 	# get the selected objects
@@ -1071,20 +3081,12 @@ def OnBtnTransferUVStacked( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	source_obj = sel[ len( sel ) - 1 ]
-	
-	for i in range( len( sel ) - 1 ):
-		
-		dest_obj = sel[ i ]
-		cmds.transferAttributes( source_obj, dest_obj, transferUVs=True, sampleSpace=4, sourceUvSet="StackedUV", targetUvSet="StackedUV"  )
-	
-	for obj in sel:
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet="StackedUV" )
+	# the source object is selected last
+	transferUVSet( sel[-1], sel[:-1], "StackedUV" )
 
+@fastExecution
 def OnBtnCopyUVSetToUVmap1( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1093,14 +3095,13 @@ def OnBtnCopyUVSetToUVmap1( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		cmds.polyCopyUV( obj, uvSetName="map1", ch=1 )
+	copyUVSet( sel, "map1" )
 	
 	cmds.select( sel )
 
+@fastExecution
 def OnBtnCopyUVSetToUVUnitize( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1109,14 +3110,13 @@ def OnBtnCopyUVSetToUVUnitize( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		cmds.polyCopyUV( obj, uvSetName="UnitizeUV", ch=1 )
+	copyUVSet( sel, "UnitizeUV" )
 	
 	cmds.select( sel )
 
+@fastExecution
 def OnBtnCopyUVSetToStacked( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1125,12 +3125,11 @@ def OnBtnCopyUVSetToStacked( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		cmds.polyCopyUV( obj, uvSetName="StackedUV", ch=1 )
+	copyUVSet( sel, "StackedUV" )
 	
 	cmds.select( sel )
 
+@fastExecution
 def OnBtnUnitizeUVPlanar( isChecked, uvset_name ):
 	
 	# get the selected objects
@@ -1141,69 +3140,11 @@ def OnBtnUnitizeUVPlanar( isChecked, uvset_name ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		# set the current uv set
-		cmds.polyUVSet( obj, currentUVSet=True, uvSet=uvset_name )
-		
-		cmds.polyForceUV( obj, unitize=True )
-		cmds.polyMapSewMove( obj ) # nf=10, lps=0, ch=1
-		cmds.polyMultiLayoutUV( obj, lm=1, sc=2, rbf=0, fr=1, ps=0, l=2, gu=1, gv=1, psc=0, su=1, sv=1, ou=0, ov=0 )
-		
-		verts = cmds.polyListComponentConversion( obj, toVertex=True )
-		verts = cmds.ls( verts, flatten=True )
-		
-		corner_vert = list()
-		
-		for v in verts:
-			
-			edges = cmds.polyListComponentConversion( v, toEdge=True )
-			edges = cmds.ls( edges, flatten=True )
-			
-			if len( edges ) <= 2:
-				corner_vert.append( v )
-		
-		a_uv = cmds.polyListComponentConversion( corner_vert[0], toUV=True )
-		b_uv = cmds.polyListComponentConversion( corner_vert[1], toUV=True )
-		
-		a_coord = cmds.polyEditUV( a_uv, query=True )
-		b_coord = cmds.polyEditUV( b_uv, query=True )
-		
-		#print( a_coord )
-		#print( b_coord )
-		
-		uv_shell = cmds.polyListComponentConversion( obj, toUV=True )
-		uv_shell = cmds.ls( uv_shell, flatten=True )
-		
-		threshold = 0.1
-		case = 0
-		
-		if b_coord[0] > 1 - threshold and b_coord[0] < 1 + threshold:
-			if b_coord[1] > 1 - threshold and b_coord[1] < 1 + threshold:
-				case = 2 # rotate clockwise 90 deg
-			else:
-				case = 1 # leave as is
-		else:
-			if b_coord[1] > 1 - threshold and b_coord[1] < 1 + threshold:
-				case = 3 # rotate 180 deg
-			else:
-				case = 4 # rotate counter clockwise 90 deg
-		
-		#print( case )
-		
-		cmds.select( uv_shell )
-		
-		if case == 2:
-			cmds.polyEditUVShell( rot=True, angle=-90, pu=0.5, pv=0.5 )
-		if case == 3:
-			cmds.polyEditUVShell( rot=True, angle=180, pu=0.5, pv=0.5 )
-		if case == 4:
-			cmds.polyEditUVShell( rot=True, angle=90, pu=0.5, pv=0.5 )
-			
-		cmds.select( clear=True )
-		
+	unitizeUVPlanar( sel, uvset_name )
+	
 	cmds.select( sel )
 
+@fastExecution
 def OnBtnUnitizeUVPolar( isChecked, uvset_name ):
 	
 	# get the selected objects
@@ -1214,25 +3155,15 @@ def OnBtnUnitizeUVPolar( isChecked, uvset_name ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		# get the poles
-		obj_poles = getPoleVerts( obj )
-		# get seam edges
-		obj_seams = getSeamEdges( obj, obj_poles )
-		# do uv layout
-		unitizeAndLayout( obj, obj_seams, obj_poles, uvset_name )
+	unitizeUVPolar( sel, uvset_name )
 	
 	cmds.select( sel )
 
 # PaintFX
 
+@fastExecution
 def onBtnPaintFXCloseHolesAndBevel( isChecked ):
 	
-	# The function finds open holes on the mesh, fills them, and bevels the edge around the hole
-	# It then tries to merge the vertices on the filled hole.
-	# Note: the merge vertex operation uses ngons to detect the filled hole.
-	# This may lead it issues if the mesh already contains ngons.
-	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1240,74 +3171,12 @@ def onBtnPaintFXCloseHolesAndBevel( isChecked ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-
-	bevel_fraction = 0.7
-	bevel_segments = 3
-	bevel_merge = 0.0001
-
-	for obj in sel:
-
-		# convert object to edges
-		edges = cmds.polyListComponentConversion( obj, toEdge=True )
-		edges = cmds.ls( edges, long=True, flatten=True )
-		
-		# get the open edges
-		cmds.select( edges )
-		cmds.polySelectConstraint( pp=3, type=0x8000 )
-		border_edges = cmds.ls( selection=True, long=True, flatten=True )
-		
-		k = 1
-		while k > 0 and border_edges and k < 10:
-			
-			connected_edges = getConnectedEdges( border_edges )
-			
-			# fill holes
-			cmds.polyCloseBorder( connected_edges[0], ch=1 )
-			
-			# bevel
-			cmds.polyBevel3(
-				connected_edges[0],
-				fraction=bevel_fraction,
-				offsetAsFraction=1,
-				autoFit=1,
-				depth=1,
-				mitering=0,
-				miterAlong=0,
-				chamfer=1,
-				segments=bevel_segments,
-				worldSpace=0,
-				smoothingAngle=60,
-				subdivideNgons=1,
-				mergeVertices=1,
-				mergeVertexTolerance=bevel_merge, #0.0001,
-				miteringAngle=180,
-				angleTolerance=180,
-				ch=1
-			)
-			
-			# merge verts on ngons
-			cmds.select( obj )
-			mel.eval('polyCleanupArgList 4 { "0","2","1","0","1","0","0","0","0","1e-05","0","1e-05","0","1e-05","0","-1","0","0" };')
-			ngon_faces = cmds.ls( selection=True, long=True, flatten=True )
-			if ngon_faces:
-				cmds.polyMergeVertex( ngon_faces[0], d=100 )
-			
-			# convert object to edges
-			edges = cmds.polyListComponentConversion( obj, toEdge=True )
-			edges = cmds.ls( edges, long=True, flatten=True )
-			
-			# get the open edges
-			cmds.select( edges )
-			cmds.polySelectConstraint( pp=3, type=0x8000 )
-			border_edges = cmds.ls( selection=True, long=True, flatten=True )
-			
-			if border_edges:
-				k += 1
-			else:
-				k = 0
+	
+	closeHolesAndBevel( sel )
 	
 	cmds.select( sel )
 
+@fastExecution
 def onBtnPaintFXToPoly( isChecked ):
 	
 	# get the selected objects
@@ -1318,39 +3187,11 @@ def onBtnPaintFXToPoly( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	strokes = list()
-
-	for obj in sel:
-		children = cmds.listRelatives( obj, c=True, f=True )
-		for child in children:
-			if cmds.nodeType( child ) == "stroke":
-				print( "is a stroke" )
-				strokes.append( child )
-				break
-			else:
-				print( "no" )
-
-	strokes_groups = list()
-	strokes_geo = list()
-
-	for st in strokes:
-		cmds.select( st )
-		mel.eval("doPaintEffectsToPoly( 1,0,1,0,100000);")
-		geo = cmds.listRelatives( p=True )
-		strokes_geo.append( geo )
-		grp = cmds.listRelatives( geo, p=True )
-		strokes_groups.append( grp )
-
-	geo_group = cmds.group( n="StrokeMeshes", em=True )
-
-	for geo in strokes_geo:
-		cmds.parent( geo, geo_group )
-
-	for grp in strokes_groups:
-		cmds.delete( grp )
+	paintFXToPoly( sel )
 
 # Transforms
 
+@fastExecution
 def OnBtnCenterYMin( isChecked ):
 	
 	# get the selected objects
@@ -1360,28 +3201,10 @@ def OnBtnCenterYMin( isChecked ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
+	
+	centerYMin( sel )
 
-	for obj in sel:
-		
-		# get bounding box
-		bbox = cmds.exactWorldBoundingBox( obj, ii=True )
-		
-		# get center point at Y min
-		x_pos = ( bbox[0] + bbox[3] ) / 2
-		y_pos = bbox[1]
-		z_pos = ( bbox[2] + bbox[5] ) / 2
-		new_pivot = [ x_pos, y_pos, z_pos ]
-		offset = [ x_pos * -1, y_pos * -1, z_pos * -1 ]
-		
-		# freeze transformations
-		cmds.makeIdentity( obj, apply=True, t=True, r=True, s=True, n=False, pn=True )
-		# move object to world origin
-		cmds.xform( obj, t=offset, ws=True )
-		# move pivot
-		cmds.xform( obj, piv=[ 0, 0, 0 ], ws=True )
-		# freeze transformations
-		cmds.makeIdentity( obj, apply=True, t=True, r=True, s=True, n=False, pn=True )
-
+@fastExecution
 def OnBtnCenterPole( isChecked ):
 	
 	# get the selected objects
@@ -1391,36 +3214,10 @@ def OnBtnCenterPole( isChecked ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
+	
+	centerPole( sel )
 
-	for obj in sel:
-		
-		poles = getPoleVerts( obj )
-		
-		pole_pos = list()
-		
-		for p in poles:
-			position = cmds.xform( p, query=True, translation=True, worldSpace=True )
-			pole_pos.append( position )
-		
-		pole_pos.sort( key=takeSecond )
-		
-		x_pos = pole_pos[0][0]
-		y_pos = pole_pos[0][1]
-		z_pos = pole_pos[0][2]
-		
-		# get center point at Y min
-		new_pivot = [ x_pos, y_pos, z_pos ]
-		offset = [ x_pos * -1, y_pos * -1, z_pos * -1 ]
-		
-		# freeze transformations
-		cmds.makeIdentity( obj, apply=True, t=True, r=True, s=True, n=False, pn=True )
-		# move object to world origin
-		cmds.xform( obj, t=offset, ws=True )
-		# move pivot
-		cmds.xform( obj, piv=[ 0, 0, 0 ], ws=True )
-		# freeze transformations
-		cmds.makeIdentity( obj, apply=True, t=True, r=True, s=True, n=False, pn=True )
-		
+@fastExecution
 def OnBtnSetPivot( isChecked, mode ):
 	
 	# get the selected objects
@@ -1431,33 +3228,9 @@ def OnBtnSetPivot( isChecked, mode ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		# get bounding box
-		bbox = cmds.exactWorldBoundingBox( obj, ii=True )
-		
-		x_pos = ( bbox[0] + bbox[3] ) / 2
-		y_pos = ( bbox[1] + bbox[4] ) / 2
-		z_pos = ( bbox[2] + bbox[5] ) / 2
-		
-		if mode == "xmax":
-			x_pos = bbox[3]
-		if mode == "xmin":
-			x_pos = bbox[0]		
-		if mode == "ymax":
-			y_pos = bbox[4]
-		if mode == "ymin":
-			y_pos = bbox[1]
-		if mode == "zmax":
-			z_pos = bbox[5]
-		if mode == "zmin":
-			z_pos = bbox[2]
-
-		new_pivot = [ x_pos, y_pos, z_pos ]
-		
-		# move pivot
-		cmds.xform( obj, piv=new_pivot, ws=True )
+	setPivot( sel, mode )
 
+@fastExecution
 def OnBtnPivotToWorldOrigin( isChecked ):
 	
 	# get the selected objects
@@ -1468,14 +3241,11 @@ def OnBtnPivotToWorldOrigin( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		# move pivot to world origin
-		cmds.xform( obj, piv=[ 0, 0, 0 ], ws=True )
-		# freeze transformations
-		cmds.makeIdentity( obj, apply=True, t=True, r=True, s=True, n=False, pn=True )
-
-def OnBtnRandRot( isChecked, mode ):
+	pivotToWorldOrigin( sel )
 
+@fastExecution
+def OnBtnRandRot( isChecked, mode, rot_min=0, rot_max=360, seed=None ):
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1484,28 +3254,12 @@ def OnBtnRandRot( isChecked, mode ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	rot_min = 0
-	rot_max = 360
-	
-	for obj in sel:
-	
-		rand_float = rand.random()
-		rand_deg = ( rot_max - rot_min ) * rand_float
-		current_rot = cmds.xform( obj, ro=True, query=True )
-		new_rot = current_rot
-		
-		if( mode == "x" ):
-			new_rot = [ rand_deg, current_rot[1], current_rot[2] ]
-		elif( mode == "y" ):
-			new_rot = [ current_rot[0], rand_deg, current_rot[2] ]
-		elif( mode == "z" ):
-			new_rot = [ current_rot[0], current_rot[1], rand_deg ]
-		
-		
-		cmds.xform( obj, ro=new_rot )
-	
-def OnBtnDistribute( isChecked, mode, value ):
+	# a seed of 0 ( the empty field ) draws new rotations on every click
+	randomizeRotation( sel, mode, rot_min, rot_max, seed or None )
 
+@fastExecution
+def OnBtnDistribute( isChecked, mode, value ):
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1513,69 +3267,12 @@ def OnBtnDistribute( isChecked, mode, value ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-
-	running_total = 0
-	sign = value / abs( value )
-	spacing = value
 	
-	all_children = set()
-
-	for obj in sel:
-		children = cmds.listRelatives( obj, c=True, ad=True, f=True )
-		children = set( children )
-		all_children = all_children.union( children )
-
-	all_children = list( all_children )
-
-	geo_nodes = list()
-
-	for child in all_children:
-		if cmds.nodeType( child ) == "mesh":
-			geo = cmds.listRelatives( child, p=True, f=True )
-			geo_nodes.append( geo )
-
-	geo_nodes.sort()
-
-	for i in range( len( geo_nodes ) ):
-		
-		# get bounding box
-		bbox = cmds.exactWorldBoundingBox( geo_nodes[i], ii=True )
-		
-		if( mode == "x" ):
-			width = abs( bbox[3] - bbox[0] )
-			if i==0:
-				pos = 0
-				running_total = sign * width / 2 + spacing
-			else:
-				pos = running_total + ( sign * width / 2 )
-				running_total = running_total + sign * width + spacing
-			new_trans = [ pos, 0, 0 ]
-			
-		elif( mode == "y" ):
-			width = abs( bbox[4] - bbox[1] )
-			if i==0:
-				pos = 0
-				running_total = sign * width / 2 + spacing
-			else:
-				pos = running_total + ( sign * width / 2 )
-				running_total = running_total + sign * width + spacing
-			new_trans = [ 0, pos, 0 ]
-			
-		elif( mode == "z" ):
-			width = abs( bbox[5] - bbox[2] )
-			if i==0:
-				pos = 0
-				running_total = sign * width / 2 + spacing
-			else:
-				pos = running_total + ( sign * width / 2 )
-				running_total = running_total + sign * width + spacing
-			new_trans = [ 0, 0, pos ]
-		
-		# move the object to the new position
-		cmds.xform( geo_nodes[i], t=new_trans, ws=True )
+	distribute( sel, mode, value )
 
+@fastExecution
 def OnBtnResetTransform( isChecked, mode ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1584,29 +3281,11 @@ def OnBtnResetTransform( isChecked, mode ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	sel_and_children = set()
-
-	for obj in sel:
-		children = cmds.listRelatives( obj, c=True, ad=True, f=True )
-		children = set( children )
-		sel_and_children = sel_and_children.union( children )
-		sel_and_children = sel_and_children.union( set( [obj] ) )
-
-	sel_and_children = list( sel_and_children )
-
-	for obj in sel_and_children:
-		
-		if cmds.nodeType( obj ) == "transform":
-		
-			if mode == "trans":
-				cmds.xform( obj, t=[ 0, 0, 0 ], ws=True )
-			if mode == "rot":
-				cmds.xform( obj, ro=[ 0, 0, 0 ], ws=True )
-			if mode == "scale":
-				cmds.xform( obj, s=[ 1, 1, 1 ], ws=True )
+	resetTransforms( sel, mode )
 
+@fastExecution
 def OnBtnCopyTransforms( isChecked, world_space, mode ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True, type="transform" )
 	
@@ -1615,22 +3294,17 @@ def OnBtnCopyTransforms( isChecked, world_space, mode ):
 	
 	# obj > obj
 	if mode == 1:
-		
+	
 		# check if at least two transforms are selected
 		if (not sel) or ( len( sel ) < 2 ):
 			cmds.confirmDialog( title='ERROR', message=('ERROR: Please select two or more transforms.'), button=['OK'], defaultButton='OK' )
 			return -1
 		
-		src = sel[:-1]
-		dest = [ sel[-1] ]
-		
-		matrix = cmds.xform( dest, m=True, query=True, worldSpace=world_space )
-		for obj in src:
-			cmds.xform( obj, m=matrix, worldSpace=world_space )
+		matchTransforms( sel[:-1], sel[-1], world_space )
 	
 	# grp > grp
 	if mode == 2:
-
+	
 		# check if two transforms are selected
 		if (not sel) or ( len( sel ) != 2 ):
 			cmds.confirmDialog( title='ERROR', message=('ERROR: Please select two groups.'), button=['OK'], defaultButton='OK' )
@@ -1644,18 +3318,13 @@ def OnBtnCopyTransforms( isChecked, world_space, mode ):
 			cmds.confirmDialog( title='ERROR', message=('ERROR: Please select two groups.'), button=['OK'], defaultButton='OK' )
 			return -1
 		
-		src_children = cmds.listRelatives( src, f=True, type="transform" )
-		dest_children = cmds.listRelatives( dest, f=True, type="transform" )
-		min_children = min( len( src_children ), len( dest_children ) )
-		
-		for i in range( min_children ):
-			matrix = cmds.xform( dest_children[i], m=True, query=True, worldSpace=world_space )
-			cmds.xform( src_children[i], m=matrix, worldSpace=world_space )
+		matchGroupTransforms( src, dest, world_space )
 
 # Outliner
 
+@fastExecution
 def OnBtnSortOutliner( isChecked, recursive, reverse ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1666,8 +3335,9 @@ def OnBtnSortOutliner( isChecked, recursive, reverse ):
 	
 	sortOutliner( sel, recursive, reverse )
 
+@fastExecution
 def OnBtnMakeNullAboveSelected( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1676,36 +3346,14 @@ def OnBtnMakeNullAboveSelected( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	# get the object
-	obj = sel[0]
-	
-	# get the parent and get the children at the same level
-	obj_short_name = obj.split('|')[-1]
-	obj_parent = cmds.listRelatives( obj, parent=True, f=True )
-	sort_group = cmds.listRelatives( obj_parent, c=True )
-
-	# get the index of the selected object in the hierarchy
-	obj_index = 0
-	for c in sort_group:
-		if c == obj_short_name:
-			obj_index = sort_group.index(c)
-
-	# make a new group and parent it to the object's group
-	new_group = cmds.group( em=True )
-	cmds.parent( new_group, obj_parent )
-
-	# move the group to the top of the list
-	cmds.reorder( new_group, front=True )
-
-	# move all of the other objects above the group
-	for i in range( obj_index ):
-		k = obj_index - 1 - i
-		cmds.reorder( sort_group[k], front=True )
+	new_group = makeNullAbove( sel[0] )
+	cmds.select( new_group )
 
 # Materials
 
+@fastExecution
 def OnBtnAssignRampMat( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1714,30 +3362,11 @@ def OnBtnAssignRampMat( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	# create shader nodes
-	lambert = cmds.shadingNode( "lambert", asShader=True, n="Gradient_mat" )
-	lambert_sg = cmds.sets( name=( lambert + "SG" ), renderable=True, noSurfaceShader=True, empty=True )
-	cmds.connectAttr( lambert + ".outColor", lambert_sg + ".surfaceShader" )
-	ramp = cmds.shadingNode( "ramp", asTexture=True )
-	place_2d = cmds.shadingNode( "place2dTexture", asUtility=True )
-	cmds.connectAttr( place_2d + ".outUV", ramp + ".uv" )
-	cmds.connectAttr( place_2d + ".outUvFilterSize", ramp + ".uvFilterSize" )
-	cmds.connectAttr( ramp + ".outColor", lambert + ".color" )
-	cmds.setAttr( ramp + ".colorEntryList[0].color", 1, 0, 0, type="double3" )
-	cmds.setAttr( ramp + ".colorEntryList[1].color", 1, 1, 0, type="double3" )
-	cmds.setAttr( ramp + ".colorEntryList[1].position", 1 )
-	cmds.setAttr( lambert + ".diffuse", 0 )
-	cmds.setAttr( lambert + ".ambientColor", 1, 1, 1, type="double3" )
-	
-	for obj in sel:
-	
-		# assign the material
-		cmds.sets( obj, forceElement=lambert_sg )
-		# link the uv set
-		cmds.uvLink( make=True, uvSet=( obj + ".uvSet[1].uvSetName" ), texture=ramp )
+	assignRampMaterial( sel )
 
+@fastExecution
 def OnBtnAddGammaNode( isChecked, gamma_val ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True, type="lambert" )
 	
@@ -1746,25 +3375,11 @@ def OnBtnAddGammaNode( isChecked, gamma_val ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	#gamma_val = 1 / 2.2
-
-	for obj in sel:
-		
-		col = cmds.getAttr( obj + ".color" )[0]
-		gamma_node = cmds.shadingNode( "gammaCorrect", asUtility=True )
-
-		cmds.setAttr( gamma_node + ".valueX", col[0] )
-		cmds.setAttr( gamma_node + ".valueY", col[1] )
-		cmds.setAttr( gamma_node + ".valueZ", col[2] )
-		
-		cmds.setAttr( gamma_node + ".gammaX", gamma_val )
-		cmds.setAttr( gamma_node + ".gammaY", gamma_val )
-		cmds.setAttr( gamma_node + ".gammaZ", gamma_val )
-		
-		cmds.connectAttr( gamma_node + ".outValue", obj + ".color" )
+	addGammaNodes( sel, gamma_val )
 
+@fastExecution
 def OnBtnGammaCorrectLambert( isChecked, gamma ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True, type="lambert" )
 	
@@ -1772,21 +3387,12 @@ def OnBtnGammaCorrectLambert( isChecked, gamma ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
+	
+	gammaCorrectLamberts( sel, gamma )
 
-	for lamb in sel:
-
-		new_color = list()
-		original_color = cmds.getAttr( lamb + ".color" )[0]
-
-		for channel in original_color:
-			new_color.append( pow( channel, gamma ) )
-		
-		cmds.setAttr( lamb + ".colorR", new_color[0] )
-		cmds.setAttr( lamb + ".colorG", new_color[1] )
-		cmds.setAttr( lamb + ".colorB", new_color[2] )
-
+@fastExecution
 def OnBtnAssignMatFromSel( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, dag=True, s=True, long=True )
 	
@@ -1795,17 +3401,11 @@ def OnBtnAssignMatFromSel( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	obj_mat = sel[0]
-	objs = sel[1:]
-	
-	shading_engine = cmds.listConnections( obj_mat, type="shadingEngine" )[0]
-	#materials = cmds.ls( cmds.listConnections( shading_engine ), materials=True)
-
-	for obj in objs:
-		cmds.sets( obj, e=True, forceElement=shading_engine )
+	assignMaterialFromShape( sel[0], sel[1:] )
 
 # Vertex Color
 
+@fastExecution
 def OnBtnApplyVertColor( isChecked, mode, channel ):
 	
 	# get the selected objects
@@ -1816,48 +3416,9 @@ def OnBtnApplyVertColor( isChecked, mode, channel ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-		
-		verts = cmds.polyListComponentConversion( obj, toVertex=True )
-		verts = cmds.ls( verts, flatten=True )
-		
-		uvs = list()
-		
-		for v in verts:
-			uv = cmds.polyListComponentConversion( v, toUV=True )
-			uv = cmds.ls( uv, flatten=True )[0]
-			uvs.append( uv )
-		
-		additive = True
-		vertex_color = (0.0, 0.0, 0.0)
-		values = list()
-		
-		# define colors
-		if channel == "r":
-			vertex_color = (1.0, 0.0, 0.0)
-		elif channel == "g":
-			vertex_color = (0.0, 1.0, 0.0)
-		elif channel == "b":
-			vertex_color = (0.0, 0.0, 1.0)
-		
-		# define modes
-		if mode == "uv_v":
-			for uv in uvs:
-				val = cmds.polyEditUV( uv, query=True )[1]
-				values.append( val )
-		
-		elif mode == "clear":
-			additive = False
-			vertex_color = (0.0, 0.0, 0.0)
-			for uv in uvs:
-				values.append( 0.0 )
-		
-		# apply vertex colors
-		for i in range( len( verts ) ):
-			result_color = multVectorByScalar( values[i], vertex_color )
-			#print( result_color )
-			cmds.polyColorPerVertex( verts[i], rgb=result_color, rel=additive, cdo=True )
+	applyVertexColor( sel, mode, channel )
 
+@fastExecution
 def OnBtnApplyVertColorFromLambert( isChecked ):
 	
 	# get the selected objects
@@ -1867,25 +3428,14 @@ def OnBtnApplyVertColorFromLambert( isChecked ):
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-		
-	for obj in sel:
-		
-		# get the shading engine on the object
-		shading_engine = cmds.listConnections( obj, type="shadingEngine" )[0]
-		# get the lambert
-		material = cmds.ls( cmds.listConnections( shading_engine ), type="lambert" )[0]
-		# get the color
-		mat_color = cmds.getAttr( material + ".color" )[0]
-		# apply vertex color
-		cmds.polyColorPerVertex( obj, r=mat_color[0], g=mat_color[1], b=mat_color[2], a=1.0, cdo=True )
-		# print progress
-		complete = round( ( float( sel.index( obj ) ) + 1 ) / len( sel ) * 100 )
-		print( "calculating: " + str( complete ) + "%..." )
+	
+	applyVertexColorFromLambert( sel )
 
 # Rename
 
+@fastExecution
 def OnBtnRenameFromSel( isChecked, name_mode, selection_mode, num_mode, new_name ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1893,43 +3443,12 @@ def OnBtnRenameFromSel( isChecked, name_mode, selection_mode, num_mode, new_name
 	if (not sel):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
-
-	'''
-	name_mode = 1		# 1=selection, 2=string
-	selection_mode = 1	# 1=parent, 2=object
-	num_mode = 1		# 1=numerically, 2=alphabetically
-	'''
-	
-	sep = "_"
-	name_base = new_name
-	padding = 2
-	first_index = 1
-	
-	if selection_mode==1:
-		children_list = list()
-		for grp in sel:
-			name_base = grp.split("|")[-1]
-			children = cmds.listRelatives( grp, ad=True, f=True, type="transform" )		
-			children.sort()
-			for i in range( len( children ) ):
-				customRename( children[i], name_base, sep, padding, i, first_index, num_mode )
 	
-	if selection_mode==2:
-		 
-		if name_mode==2:
-			sel.sort()
-			for i in range( len( sel ) ):
-				customRename( sel[i], name_base, sep, padding, i, first_index, num_mode )
-		 
-		if name_mode==1:
-			name_base = sel[-1].split("|")[-1]
-			sel.pop()
-			sel.sort()
-			for i in range( len( sel ) ):
-				customRename( sel[i], name_base, sep, padding, i, first_index, num_mode )
+	renameObjects( sel, name_mode, selection_mode, num_mode, new_name )
 
+@fastExecution
 def OnBtnCustomRename( isChecked, input_str, mode ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1938,55 +3457,21 @@ def OnBtnCustomRename( isChecked, input_str, mode ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	for obj in sel:
-	
-		obj_name = obj.split("|")[-1]
+	# throw an error if the number of characters is not an integer
+	if mode=="Remove Last 'n' Chars" or mode=="Remove First 'n' Chars":
+		try:
+			int( input_str )
+		except:
+			cmds.confirmDialog( title='ERROR', message=('ERROR: Please enter an integer.'), button=['OK'], defaultButton='OK' )
+			return -1
 	
-		if mode=="Add Suffix":
-			cmds.rename( obj, obj_name + input_str )
-		if mode=="Add Prefix":
-			cmds.rename( obj, input_str + obj_name )
-		if mode=="Remove String":
-			name_split = obj_name.split( input_str )
-			new_name = ""
-			for s in name_split:
-				new_name = new_name + s
-			cmds.rename( obj, new_name )
-		if mode=="Remove Last 'n' Chars":
-			try:
-				index = int( input_str )
-			except:
-				cmds.confirmDialog( title='ERROR', message=('ERROR: Please enter an integer.'), button=['OK'], defaultButton='OK' )
-				return -1
-			cmds.rename( obj, obj_name[:-index] )
-		if mode=="Remove First 'n' Chars":
-			try:
-				index = int( input_str )
-			except:
-				cmds.confirmDialog( title='ERROR', message=('ERROR: Please enter an integer.'), button=['OK'], defaultButton='OK' )
-				return -1
-			cmds.rename( obj, obj_name[index:] )
-		# number alphabetically
-		if mode=='Numbering (A)':
-			index = sel.index( obj ) + 1
-			letter = chr( ord( '@' ) + index )
-			new_name = input_str + letter
-			cmds.rename( obj, new_name )
-		if mode=='Numbering (01)' or mode=='Numbering (001)' or mode=='Numbering (0001)':
-			if mode=='Numbering (01)':
-				padding = 2
-			if mode=='Numbering (001)':
-				padding = 3
-			if mode=='Numbering (0001)':
-				padding = 4
-			index = sel.index( obj ) + 1
-			new_name = input_str + str( index ).zfill( padding )
-			cmds.rename( obj, new_name )	
+	customRenameObjects( sel, input_str, mode )
 
 # Utility
 
+@fastExecution
 def OnBtnLocatorsFromTransforms( isChecked ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -1995,34 +3480,11 @@ def OnBtnLocatorsFromTransforms( isChecked ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	short_name = cmds.ls( sel[0], long=False )[0]
-	new_group = cmds.group( em=True, name=( short_name + "_Locators" ) )
-	
-	for obj in sel:
-		
-		# get the object name
-		short_name = cmds.ls( obj, long=False )[0]
-		# get the transform
-		obj_transform = cmds.xform( obj, matrix=True, query=True )
-		# make a new locator
-		new_locator = cmds.spaceLocator()
-		# get the shape node
-		locator_shape = cmds.listRelatives( new_locator )[0]
-		
-		# set the local scale of the shape node
-		cmds.setAttr( locator_shape + ".localScaleX", 10 )
-		cmds.setAttr( locator_shape + ".localScaleY", 10 )
-		cmds.setAttr( locator_shape + ".localScaleZ", 10 )
-		
-		# set the locator transform
-		cmds.xform( new_locator, matrix=obj_transform )
-		# rename the locator
-		obj_rename = cmds.rename( new_locator, short_name + "_lctr" )
-		# parent it to the new group
-		cmds.parent( obj_rename, new_group)
+	locatorsFromTransforms( sel )
 
+@fastExecution
 def OnBtnCopyAlembicWithDelay( isChecked, num_instances ):
-
+	
 	# get the selected objects
 	sel = cmds.ls( selection=True, long=True )
 	
@@ -2031,46 +3493,7 @@ def OnBtnCopyAlembicWithDelay( isChecked, num_instances ):
 		cmds.confirmDialog( title='ERROR', message=('ERROR: Nothing selected.'), button=['OK'], defaultButton='OK' )
 		return -1
 	
-	# get nodes
-	obj_name = cmds.ls( sel, long=False )[0]
-	obj = sel[0]
-	shape = cmds.listRelatives( sel, type="mesh", f=True )
-	alembic_node = cmds.listConnections( shape, type="AlembicNode" )
-
-	# make master alembic
-	master_alembic = cmds.duplicate( alembic_node, n=( obj_name + "_AlembicNode" + "_Master" ) )
-
-	# make frame offset float
-	float_constant = cmds.shadingNode( "floatConstant", asUtility=True, n=( obj_name + "_FrameOffset") )
-	cmds.setAttr( float_constant + ".inFloat", 10 )
-
-	# define the list to hold the expression
-	expression_text = list()
-	new_line = "float $offset = " + obj_name + "_FrameOffset.outFloat;"
-	expression_text.append( new_line )
-	expression_text.append( "" )
-
-	# make a new group
-	new_grp = cmds.group( em=True, n=( obj_name + "_Alembic_grp" ) )
-
-	# duplicate the object and alembic, connect them, add a new line to the expression, parent the object to the group
-	for i in range( num_instances ):
-		new_obj = cmds.duplicate( obj, n=( obj_name + "_" + str(i) ) )
-		shape = cmds.listRelatives( new_obj, type="mesh", f=True )
-		alembic_node = cmds.duplicate( alembic_node, n=( obj_name + "_AlembicNode" + "_" + str(i) ) )
-		cmds.connectAttr( master_alembic[0] + ".abc_File", alembic_node[0] + ".abc_File" )
-		cmds.connectAttr( alembic_node[0] + ".outPolyMesh[0]", shape[0] + ".inMesh" )
-		new_line = obj_name + "_AlembicNode_" + str(i) + ".time = frame - ( $offset * " + str(i) + " );"
-		expression_text.append( new_line )
-		cmds.parent( new_obj, new_grp )
-
-	# convert the expression list to a usable string
-	expression_string = ""
-	for line in expression_text:
-		expression_string = expression_string + "\n" + line
-
-	# make the expression
-	cmds.expression( s=expression_string, n=( obj_name + "_Expression" ), ae=1, uc="all" )
+	copyAlembicWithDelay( sel[0], num_instances )
 
 ################################################################################
 ## User Interface
@@ -2274,10 +3697,14 @@ def makeUI():
 	cmds.button( label='Initialize UVs', command=OnBtnInitializeUV, annotation="Deletes all existing UV sets and creates new ones."  )
 	cmds.setParent( '..' )
 	# Buttons
-	btns_mode = [ 1, 1 ]
+	btns_mode = [ 2, 1 ]
 	cmds.rowLayout( numberOfColumns=btns_mode[0]+1, adj=1, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
 	cmds.text( '' )
-	cmds.button( label='Unfold and Layout ( StackedUV )', command=OnBtnUnfoldLayout, annotation="Unfold and layout the selected objects in the StackedUV set."  )
+	cmds.optionMenu( 'layout_engine', annotation="The packer that lays out the unfolded shells." )
+	for label, engine in LAYOUT_ENGINES.items():
+		cmds.menuItem( label=label )
+	cmds.optionMenu( 'layout_engine', edit=True, value=[ label for label, engine in LAYOUT_ENGINES.items() if engine == uv_layout_engine ][0] )
+	cmds.button( label='Unfold and Layout ( StackedUV )', command='OnBtnUnfoldLayout( "True", cmds.optionMenu( "layout_engine", query=True, value=True ) )', annotation="Unfold and layout the selected objects in the StackedUV set."  )
 	cmds.setParent( '..' )
 	# Buttons
 	btns_mode = [ 1, 1 ]
@@ -2325,21 +3752,36 @@ def makeUI():
 	cmds.button( label='Y', command='OnBtnDistribute( "True", "y", cmds.floatSliderGrp( "dist_val", q=True, v=True) )', annotation="Distribute the selected objects along the Y axis."  )
 	cmds.button( label='Z', command='OnBtnDistribute( "True", "z", cmds.floatSliderGrp( "dist_val", q=True, v=True) )', annotation="Distribute the selected objects along the Z axis."  )
 	cmds.setParent( '..' )
+	# Buttons
+	btns_mode = [ 2, 1 ]
+	cmds.rowLayout( numberOfColumns=btns_mode[0]+1, adj=1, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
+	cmds.text( 'Distribute Layout' )
+	cmds.button( label='Grid', command='OnBtnDistribute( "True", "grid", cmds.floatSliderGrp( "dist_val", q=True, v=True) )', annotation="Lay out the selected objects in a square grid on the ground plane, spaced by the distribute value."  )
+	cmds.button( label='Shelves', command='OnBtnDistribute( "True", "shelf", cmds.floatSliderGrp( "dist_val", q=True, v=True) )', annotation="Pack the selected objects in rows on the ground plane, deepest first, spaced by the distribute value."  )
+	cmds.setParent( '..' )
 	# Button
 	btns_mode = [ 3, 1 ]
 	cmds.rowLayout( numberOfColumns=btns_mode[0]+2, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, adj=1, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
+	cmds.text( 'Rotation Min, Max, Seed' )
+	cmds.floatField( 'rand_rot_min', value=0, annotation="The smallest random angle." )
+	cmds.floatField( 'rand_rot_max', value=360, annotation="The largest random angle." )
+	cmds.intField( 'rand_rot_seed', value=0, annotation="0 gives new rotations on every click. Any other seed gives the same rotations on the same objects." )
+	cmds.setParent( '..' )
+	# Button
+	btns_mode = [ 4, 1 ]
+	cmds.rowLayout( numberOfColumns=btns_mode[0]+2, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, adj=1, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
 	cmds.text( 'Randomize Rotation' )
-	cmds.button( label='X', command='OnBtnRandRot( "True", "x" )', annotation="Randomize the rotation of the selected objects."  )
-	cmds.button( label='Y', command='OnBtnRandRot( "True", "y" )', annotation="Randomize the rotation of the selected objects."  )
-	cmds.button( label='Z', command='OnBtnRandRot( "True", "z" )', annotation="Randomize the rotation of the selected objects."  )
+	for axes in ( "x", "y", "z", "xyz" ):
+		cmds.button( label=axes.upper(), command='OnBtnRandRot( "True", "' + axes + '", cmds.floatField( "rand_rot_min", q=True, v=True ), cmds.floatField( "rand_rot_max", q=True, v=True ), cmds.intField( "rand_rot_seed", q=True, v=True ) )', annotation="Randomize the rotation of the selected objects."  )
 	cmds.setParent( '..' )
 	# Button
-	btns_mode = [ 3, 1 ]
+	btns_mode = [ 4, 1 ]
 	cmds.rowLayout( numberOfColumns=btns_mode[0]+2, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, adj=1, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
 	cmds.text( 'Reset Transforms' )
 	cmds.button( label='Translation', command='OnBtnResetTransform( "True", "trans" )', annotation="Sets translation to zero on the selected transforms."  )
 	cmds.button( label='Rotation', command='OnBtnResetTransform( "True", "rot" )', annotation="Sets rotation to zero on the selected transforms."  )
 	cmds.button( label='Scale', command='OnBtnResetTransform( "True", "scale" )', annotation="Sets scale to one on the selected transforms."  )
+	cmds.button( label='All', command='OnBtnResetTransform( "True", ( "trans", "rot", "scale" ) )', annotation="Resets translation, rotation and scale on the selected transforms."  )
 	cmds.setParent( '..' )
 	# Buttons
 	btns_mode = [ 6, 1 ]
@@ -2376,8 +3818,8 @@ def makeUI():
 	btns_mode = [ 2, 1 ]
 	cmds.rowLayout( numberOfColumns=btns_mode[0]+1, adj=1, columnWidth=makeColWidth( btns_mode[0], btns_mode[1] ), columnAlign=col_align, columnAttach=makeColAttach( btns_mode[0], btns_mode[1] ) )
 	cmds.text( 'Copy Transforms (Groups)' )
-	cmds.button( label='World Space', command='OnBtnCopyTransforms( True, True, 2 )', annotation="The user selects two groups. The script sets the transforms on the objects in the first group based on the second."  )
-	cmds.button( label='Local Space', command='OnBtnCopyTransforms( True, False, 2 )', annotation="The user selects two groups. The script sets the transforms on the objects in the first group based on the second."  )
+	cmds.button( label='World Space', command='OnBtnCopyTransforms( True, True, 2 )', annotation="The user selects two groups. The script sets the transforms on the objects in the first group based on the matching objects in the second."  )
+	cmds.button( label='Local Space', command='OnBtnCopyTransforms( True, False, 2 )', annotation="The user selects two groups. The script sets the transforms on the objects in the first group based on the matching objects in the second."  )
 	cmds.setParent( '..' )
 	# Frame End
 	cmds.text( label='', height=win_padding )
@@ -2575,5 +4017,49 @@ win_frame_is_collapsed = True
 win_border_vis = False
 win_first_column_width = 140
 
-# Make the window UI
-makeUI()
+# Fast execution settings: the evaluation manager mode used while a button runs
+# ( None=leave as is, "off"=DG, "serial", "parallel" )
+fast_exec_evaluation_mode = None
+
+# print the time every button took to the script editor
+fast_exec_verbose = True
+
+# Group match settings: how grp > grp pairs the transforms under the two groups ( "name"=by short name,
+# "regex"=by short name with group_match_pattern taken out, "topology"=by mesh topology signature, "index"=by position ),
+# the default pattern takes out namespaces and numbered suffixes, so "ns:crate_01" matches "crate"
+group_match_key = "name"
+group_match_pattern = r"^.*:|_\d+$"
+
+# Mesh cache settings: the memory kept for mesh topology between buttons ( 0=no cache )
+mesh_cache_max_mb = 256
+
+# UV worker settings: the worker processes heavy uv computations are spread over ( None=one per core,
+# 0=always in Maya ) and the least number of uvs in a batch before it is worth starting them
+uv_worker_processes = None
+uv_worker_min_uvs = 200000
+
+# UV transfer settings: how the transfer buttons match the destinations to the source ( "signature"=copy by
+# index to the meshes with the same topology and transferAttributes for the rest, "sample"=transferAttributes for all )
+uv_transfer_mode = "signature"
+
+# UV layout settings: the packer used by Unfold and Layout ( "unfold3d"=u3dLayout, "native"=packUVs ),
+# and the padding in texels at the given texture resolution, whether shells may be turned a quarter
+# and whether all of the objects share one atlas when packed with the built-in packer
+uv_layout_engine = "unfold3d"
+uv_pack_padding = 2
+uv_pack_resolution = 1024
+uv_pack_rotate = True
+uv_pack_atlas = False
+
+# the layout engines by their label in the ui
+LAYOUT_ENGINES = collections.OrderedDict( [ ( "Unfold3D", "unfold3d" ), ( "Native Packer", "native" ) ] )
+
+# Progress settings: the least number of seconds between two progress updates
+progress_interval = 0.5
+
+# The active GameAssetProfiler.Profiler, set by GameAssetProfiler.enable()
+profiler = None
+
+# Make the window UI ( not in batch mode, where the scripts are driven by GameAssetBatch.py )
+if not cmds.about( batch=True ):
+	makeUI()
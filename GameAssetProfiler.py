@@ -0,0 +1,249 @@
+################################################################################
+## Game Asset Profiler
+##
+## Opt-in instrumentation for Game Asset Helper Scripts. While enabled, the cmds,
+## mel and OpenMaya modules used by the scripts ( and by the script editor, or
+## the mayapy script running them ) are replaced with proxies that count and
+## time every call, and every button invocation is recorded as one
+## operation with its time split between Maya calls and Python.
+##
+## Usage ( in the Maya script editor ):
+##   import GameAssetProfiler
+##   GameAssetProfiler.enable()
+##   ... click some buttons ...
+##   GameAssetProfiler.printSummary()
+##   GameAssetProfiler.writeReport( "C:/temp/gahs_profile.json" )
+##   GameAssetProfiler.disable()
+##
+## Scripted calls to the operations can be recorded with:
+##   with GameAssetProfiler.enable().operation( "unitizeUVPolar" ):
+##       GameAssetHelperScripts.unitizeUVPolar( objs, "map1" )
+################################################################################
+
+import contextlib
+import json
+import sys
+import time
+
+import GameAssetHelperScripts as helpers
+
+# OpenMaya objects that are handed back wrapped, so that their methods are timed too. Besides these,
+# the function sets ( MFn* ) and iterators ( MIt* ) are wrapped, so that every OpenMaya object the scripts
+# hold is a proxy, and the proxies they pass back to OpenMaya are unwrapped before the real call.
+WRAPPED_RESULT_TYPES = ( "MSelectionList", "MDagPath", "MObject" )
+
+# modules whose references to cmds, mel and OpenMaya are swapped for proxies, when they are loaded.
+# __main__ is the script editor, or the mayapy script that runs the operations.
+PROFILED_MODULES = ( "__main__", "GameAssetHelperScripts", "GameAssetUndo" )
+
+################################################################################
+## Proxies
+################################################################################
+
+class ProfiledObject( object ):
+
+	# Stands in for a module, class or object and times every call made through it.
+	# Arguments that are themselves proxies are unwrapped before the real call.
+
+	def __init__( self, target, name, profiler, wrap_results=False ):
+		self._target = target
+		self._name = name
+		self._profiler = profiler
+		self._wrap_results = wrap_results
+
+	def __getattr__( self, attr ):
+		value = getattr( self._target, attr )
+		if callable( value ):
+			return ProfiledObject( value, self._name + "." + attr, self._profiler, self._wrap_results )
+		return value
+
+	def __call__( self, *args, **kwargs ):
+		args = [ unwrap( a ) for a in args ]
+		kwargs = dict( ( k, unwrap( v ) ) for k, v in kwargs.items() )
+
+		start_time = time.perf_counter()
+		try:
+			result = self._target( *args, **kwargs )
+		finally:
+			self._profiler.recordCall( self._name, time.perf_counter() - start_time )
+
+		if self._wrap_results and shouldWrap( result ):
+			return ProfiledObject( result, type( result ).__name__, self._profiler, True )
+
+		return result
+
+	def __repr__( self ):
+		return "ProfiledObject( " + self._name + " )"
+
+def unwrap( value ):
+	if isinstance( value, ProfiledObject ):
+		return value._target
+	return value
+
+def shouldWrap( value ):
+	type_name = type( value ).__name__
+	return type_name.startswith( ( "MFn", "MIt" ) ) or type_name in WRAPPED_RESULT_TYPES
+
+################################################################################
+## Profiler
+################################################################################
+
+class Profiler( object ):
+
+	def __init__( self ):
+		self.operations = list()
+		self.current = None
+		self.originals = None
+
+	def install( self ):
+
+		# swap the modules used by the scripts for profiled proxies, under whatever name each module imported them
+		proxies = dict()
+		proxies[id( helpers.cmds )] = ProfiledObject( helpers.cmds, "cmds", self )
+		proxies[id( helpers.mel )] = ProfiledObject( helpers.mel, "mel", self )
+		proxies[id( helpers.om2 )] = ProfiledObject( helpers.om2, "om2", self, True )
+
+		self.originals = list()
+		for module_name in PROFILED_MODULES:
+			module = sys.modules.get( module_name )
+			if module is None:
+				continue
+			for attr, value in list( vars( module ).items() ):
+				if id( value ) in proxies:
+					self.originals.append( ( module, attr, value ) )
+					setattr( module, attr, proxies[id( value )] )
+
+		helpers.profiler = self
+
+	def uninstall( self ):
+
+		if self.originals:
+			for module, attr, value in self.originals:
+				setattr( module, attr, value )
+			self.originals = None
+		helpers.profiler = None
+
+	def beginOperation( self, name ):
+
+		# operations do not nest: calls made by an inner operation count towards the outer one
+		if self.current is not None:
+			self.current["depth"] += 1
+			return
+
+		self.current = dict()
+		self.current["operation"] = name
+		self.current["commands"] = dict()
+		self.current["depth"] = 0
+		self.current["start_time"] = time.perf_counter()
+
+	def endOperation( self ):
+
+		if self.current is None:
+			return
+
+		if self.current["depth"] > 0:
+			self.current["depth"] -= 1
+			return
+
+		operation = self.current
+		self.current = None
+
+		total_time = time.perf_counter() - operation.pop( "start_time" )
+		operation.pop( "depth" )
+		maya_time = sum( command["seconds"] for command in operation["commands"].values() )
+		operation["seconds"] = total_time
+		operation["maya_seconds"] = maya_time
+		operation["python_seconds"] = max( total_time - maya_time, 0.0 )
+		operation["calls"] = sum( command["calls"] for command in operation["commands"].values() )
+
+		self.operations.append( operation )
+
+	@contextlib.contextmanager
+	def operation( self, name ):
+
+		# record a scripted call to an operation the same way as a button
+		self.beginOperation( name )
+		try:
+			yield self
+		finally:
+			self.endOperation()
+
+	def recordCall( self, name, seconds ):
+
+		# calls outside of an operation ( the ui, the script editor ) are not recorded
+		if self.current is None:
+			return
+
+		command = self.current["commands"].get( name )
+		if command is None:
+			command = { "calls": 0, "seconds": 0.0 }
+			self.current["commands"][name] = command
+
+		command["calls"] += 1
+		command["seconds"] += seconds
+
+	def report( self ):
+
+		report = dict()
+		report["operations"] = self.operations
+		report["seconds"] = sum( op["seconds"] for op in self.operations )
+
+		return report
+
+	def summary( self, top=10 ):
+
+		lines = list()
+
+		for op in self.operations:
+			total_time = op["seconds"] or 1e-12
+			lines.append( op["operation"] + ": " + "%.3f" % op["seconds"] + "s, " + str( op["calls"] ) + " calls, " + "%.1f" % ( 100 * op["python_seconds"] / total_time ) + "% python" )
+
+			commands = sorted( op["commands"].items(), key=lambda item: item[1]["seconds"], reverse=True )
+			for name, command in commands[:top]:
+				lines.append( "  " + name.ljust( 40 ) + str( command["calls"] ).rjust( 10 ) + "%10.3f" % command["seconds"] + "s" + "%7.1f" % ( 100 * command["seconds"] / total_time ) + "%" )
+
+		return "\n".join( lines )
+
+################################################################################
+## Module Interface
+################################################################################
+
+active_profiler = None
+
+def enable():
+
+	global active_profiler
+
+	if active_profiler is None:
+		active_profiler = Profiler()
+		active_profiler.install()
+
+	return active_profiler
+
+def disable():
+
+	global active_profiler
+
+	if active_profiler is not None:
+		active_profiler.uninstall()
+
+	profiler = active_profiler
+	active_profiler = None
+
+	return profiler
+
+def reset():
+
+	if active_profiler is not None:
+		active_profiler.operations = list()
+
+def printSummary( top=10 ):
+
+	if active_profiler is not None:
+		print( active_profiler.summary( top ) )
+
+def writeReport( path ):
+
+	if active_profiler is not None:
+		with open( path, "w" ) as f:
+			json.dump( active_profiler.report(), f, indent=2 )
@@ -0,0 +1,86 @@
+################################################################################
+## Game Asset Undo
+##
+## Makes the OpenMaya edits of Game Asset Helper Scripts undoable. API calls made
+## from a script never reach the undo queue, so every bulk write ( uvs, vertex
+## colors ) is handed to apiEdit as a pair of functions: one that makes the edit
+## and one that puts the old data back. apiEdit runs them through the
+## gameAssetApiEdit command, which this file registers as a plug-in, so that the
+## edit is undone and redone with the rest of the undo chunk.
+##
+## The plug-in is loaded the first time apiEdit is called.
+################################################################################
+
+import os
+
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+PLUGIN_NAME = "GameAssetUndo"
+COMMAND_NAME = "gameAssetApiEdit"
+
+# the ( do, undo ) pairs waiting for the next gameAssetApiEdit command
+pending = list()
+
+def maya_useNewAPI():
+	# the commands here are written against maya.api.OpenMaya
+	pass
+
+################################################################################
+## Command
+################################################################################
+
+class ApiEditCommand( om2.MPxCommand ):
+
+	def __init__( self ):
+		om2.MPxCommand.__init__( self )
+		self.edit = None
+
+	def doIt( self, args ):
+
+		# Maya may run this file as another module than the one the scripts import,
+		# so the edit is taken from the queue of the imported one
+		import GameAssetUndo
+		if not GameAssetUndo.pending:
+			raise RuntimeError( COMMAND_NAME + " is only run by GameAssetUndo.apiEdit" )
+		self.edit = GameAssetUndo.pending.pop( 0 )
+		self.redoIt()
+
+	def redoIt( self ):
+		self.edit[0]()
+
+	def undoIt( self ):
+		self.edit[1]()
+
+	def isUndoable( self ):
+		return True
+
+def createCommand():
+	return ApiEditCommand()
+
+def initializePlugin( plugin ):
+	om2.MFnPlugin( plugin, "Game Asset Helper Scripts", "1.0" ).registerCommand( COMMAND_NAME, createCommand )
+
+def uninitializePlugin( plugin ):
+	om2.MFnPlugin( plugin ).deregisterCommand( COMMAND_NAME )
+
+################################################################################
+## Edits
+################################################################################
+
+def apiEdit( do, undo ):
+
+	# Runs do() as one undoable command, whose undo runs undo() and whose redo runs do() again.
+	# Both are called without arguments and have to leave the scene the same way every time.
+
+	if not cmds.pluginInfo( PLUGIN_NAME, query=True, loaded=True ):
+		cmds.loadPlugin( os.path.splitext( os.path.abspath( __file__ ) )[0] + ".py", quiet=True )
+
+	# the command takes the edit off the queue, unless it failed before it got to it
+	edit = ( do, undo )
+	pending.append( edit )
+	try:
+		getattr( cmds, COMMAND_NAME )()
+	finally:
+		if edit in pending:
+			pending.remove( edit )
@@ -0,0 +1,594 @@
+################################################################################
+## Game Asset Workers
+##
+## The uv computations of Game Asset Helper Scripts that are pure geometry once
+## the data is out of Maya. Nothing here imports maya, so the kernels also run
+## in plain Python worker processes.
+##
+## runKernel packs the arrays of many meshes end to end into shared memory
+## buffers, lets a pool of worker processes compute the new uvs of a range of
+## meshes each, and hands back one ( u, v ) pair per mesh for the caller to
+## write in bulk. Small batches, and Pythons without shared_memory ( Maya 2022
+## ships Python 3.7 ), run the same kernels in the calling process.
+##
+## The workers are spawned, so a mayapy script that runs the operations has to
+## keep its top level code under an if __name__ == "__main__": guard.
+##
+## packUVShells is the built-in uv shell packer that Unfold and Layout can use in
+## place of u3dLayout.
+################################################################################
+
+import atexit
+import math
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+
+try:
+	from multiprocessing import shared_memory
+except ImportError:
+	shared_memory = None
+
+################################################################################
+## UV Kernels
+################################################################################
+
+def fitUVsToDimension( u, v, scale_dimension ):
+
+	# Scales the uvs to fit the zero to one range in the given dimension and moves them
+	# so that the uv with the lowest u ( and the lowest v among those ) sits at the origin.
+
+	# get the dimension
+	values = u if scale_dimension == "u" else v
+	dimension = values.max() - values.min()
+
+	# get the min uv
+	min_u_uvs = np.flatnonzero( u <= u.min() )
+	corner = min_u_uvs[ np.argmin( v[min_u_uvs] ) ]
+
+	# scale the uvs and reposition them at the origin
+	scale = 1 / dimension
+
+	return ( u - u[corner] ) * scale, ( v - v[corner] ) * scale
+
+def rotateUVs( u, v, angle, pivot_u=0.5, pivot_v=0.5 ):
+
+	# Rotates the uvs counter clockwise by the angle in degrees around the pivot.
+	# Quarter turns are snapped so that a unit square maps back onto itself exactly.
+
+	radians = math.radians( angle )
+	cos_a = round( math.cos( radians ), 12 )
+	sin_a = round( math.sin( radians ), 12 )
+
+	du = u - pivot_u
+	dv = v - pivot_v
+
+	return pivot_u + du * cos_a - dv * sin_a, pivot_v + du * sin_a + dv * cos_a
+
+def normalizePoleTriangleUVs( u, v, pole_uvs, red_uvs, blue_uvs, threshold=0.01 ):
+
+	# Moves the pole uv of every pole triangle to ( 0.5, 1 ) and the other two uvs to ( 0, 0 ) and ( 1, 0 ).
+	# The triangles are given as arrays of uv ids: the pole uv and the two other uvs.
+
+	u = np.array( u, dtype=np.float64 )
+	v = np.array( v, dtype=np.float64 )
+
+	# check case
+	near_u = np.abs( u[pole_uvs] - 1 ) < threshold
+	near_v = np.abs( v[pole_uvs] - 1 ) < threshold
+	case_2 = near_u & ~near_v
+	case_3 = ~near_u
+
+	# in case 2 the uv with the larger u goes to ( 0, 0 ), in case 3 the uv with the smaller v does
+	a_uv = np.where( case_2, np.where( u[red_uvs] > u[blue_uvs], red_uvs, blue_uvs ), np.where( v[red_uvs] > v[blue_uvs], blue_uvs, red_uvs ) )
+	b_uv = np.where( a_uv == red_uvs, blue_uvs, red_uvs )
+	moved = case_2 | case_3
+
+	# move the pole uv
+	u[pole_uvs] = 0.5
+	v[pole_uvs] = 1.0
+
+	# move the other uvs
+	u[ a_uv[moved] ] = 0.0
+	v[ a_uv[moved] ] = 0.0
+	u[ b_uv[moved] ] = 1.0
+	v[ b_uv[moved] ] = 0.0
+
+	return u, v
+
+def poleTriangleUVs( face_counts, face_verts, face_vert_uvs, poles ):
+
+	# The uv ids of the faces around the poles: the pole uv, then the next two uvs around the face.
+
+	face_vert_faces = np.repeat( np.arange( len( face_counts ), dtype=np.int64 ), face_counts )
+
+	# get all faces connected to the pole
+	pole_mask = np.zeros( max( face_verts.max() + 1 if len( face_verts ) else 0, 1 ), dtype=bool )
+	pole_mask[ poles ] = True
+	is_pole = pole_mask[ face_verts ]
+	pole_faces = np.unique( face_vert_faces[is_pole] )
+
+	if len( pole_faces ) == 0:
+		empty = np.zeros( 0, dtype=np.int64 )
+		return empty, empty, empty
+
+	# order the face-vertices of each pole face with the pole first
+	face_vert_ids = np.flatnonzero( np.isin( face_vert_faces, pole_faces ) )
+	order = np.lexsort( ( ~is_pole[face_vert_ids], face_vert_faces[face_vert_ids] ) )
+	face_vert_ids = face_vert_ids[order]
+	starts = np.concatenate( ( [0], np.cumsum( face_counts[pole_faces] )[:-1] ) )
+
+	return face_vert_uvs[ face_vert_ids[starts] ], face_vert_uvs[ face_vert_ids[starts + 1] ], face_vert_uvs[ face_vert_ids[starts + 2] ]
+
+def unitizedOrientation( u, v, face_verts, face_vert_uvs, corner_vert, threshold=0.1 ):
+
+	# The angle that turns a unitized and laid out quad upright, from where the
+	# first uv of the corner vertex ended up, or None when it already is.
+
+	b_uvs = face_vert_uvs[ ( face_verts == corner_vert ) & ( face_vert_uvs >= 0 ) ]
+	b_coord = [ u[ b_uvs.min() ], v[ b_uvs.min() ] ]
+
+	case = 0
+
+	if b_coord[0] > 1 - threshold and b_coord[0] < 1 + threshold:
+		if b_coord[1] > 1 - threshold and b_coord[1] < 1 + threshold:
+			case = 2 # rotate clockwise 90 deg
+		else:
+			case = 1 # leave as is
+	else:
+		if b_coord[1] > 1 - threshold and b_coord[1] < 1 + threshold:
+			case = 3 # rotate 180 deg
+		else:
+			case = 4 # rotate counter clockwise 90 deg
+
+	case_angles = { 2: -90, 3: 180, 4: 90 }
+
+	return case_angles.get( case )
+
+################################################################################
+## UV Packing
+################################################################################
+
+# A skyline packer for uv shells: the shells are packed by their bounding rects,
+# tallest first, each at the lowest spot along the top edge of what is already
+# packed. Ties go to the leftmost spot and the unturned rect, so the same shells
+# always pack the same way.
+
+def skylinePlace( seg_x, seg_y, bin_width, widths, heights ):
+
+	# The best spot along the skyline for one of a few candidate rects ( the same rect turned
+	# or not ), as ( top, x, first segment, last segment, candidate ), or None when none fits.
+	# Segment i runs from seg_x[i] to seg_x[i + 1] at the height seg_y[i]; seg_y holds one
+	# more entry than seg_x, a zero past the last segment.
+
+	candidate, first = np.nonzero( seg_x[None, :] + widths[:, None] <= bin_width + 1e-9 )
+	if len( first ) == 0:
+		return None
+
+	# the segments under the rect when its left edge is at the start of each segment
+	last = np.searchsorted( seg_x, seg_x[first] + widths[candidate] - 1e-12 ) - 1
+	bounds = np.empty( 2 * len( first ), dtype=np.intp )
+	bounds[0::2] = first
+	bounds[1::2] = last + 1
+	top = np.maximum.reduceat( seg_y, bounds )[::2] + heights[candidate]
+
+	# the lowest top, then the leftmost spot, then the unturned rect
+	ties = np.flatnonzero( top == top.min() )
+	best = ties[ np.lexsort( ( candidate[ties], seg_x[first[ties]] ) )[0] ] if len( ties ) > 1 else ties[0]
+
+	return top[best], seg_x[first[best]], first[best], last[best], candidate[best]
+
+def skylinePack( widths, heights, bin_width, rotate ):
+
+	# Packs the rects into a bin of the given width. Returns the corner of each rect,
+	# whether it was turned a quarter, and the height and width that were used.
+
+	num_rects = len( widths )
+	x = np.zeros( num_rects )
+	y = np.zeros( num_rects )
+	turned = np.zeros( num_rects, dtype=bool )
+
+	# every rect adds at most one segment, so the skyline is edited in place in buffers
+	# that hold them all, with the zero skylinePlace expects after the last segment
+	seg_x = np.zeros( num_rects + 2 )
+	seg_y = np.zeros( num_rects + 3 )
+	num_segs = 1
+
+	# tallest first, in the order given on ties
+	sides = np.maximum( widths, heights ) if rotate else heights
+	order = np.lexsort( ( np.arange( num_rects ), -sides ) )
+
+	# the rect as given, then turned
+	candidates = np.stack( ( widths, heights ), axis=1 )
+	if rotate:
+		candidates = np.concatenate( ( candidates, candidates[:, ::-1] ), axis=1 )
+	candidates = candidates.reshape( num_rects, -1, 2 )
+
+	for i in order:
+
+		top, x[i], first, last, candidate = skylinePlace( seg_x[:num_segs], seg_y[:num_segs + 1], bin_width, candidates[i, :, 0], candidates[i, :, 1] )
+		width, height = candidates[i, candidate]
+		turned[i] = candidate == 1
+		y[i] = top - height
+
+		# raise the skyline under the rect, keeping the rest of the last segment it covers
+		right = x[i] + width
+		last_end = seg_x[last + 1] if last + 1 < num_segs else bin_width
+		keep_rest = right < last_end - 1e-12
+		if keep_rest:
+			new_x = ( x[i], right )
+			new_y = ( top, seg_y[last] )
+		else:
+			new_x = ( x[i], )
+			new_y = ( top, )
+
+		# join the new segment to a neighbour at the same height; the rest of the last
+		# segment is lower than the rect, and was already apart from the one after it
+		if first > 0 and seg_y[first - 1] == top:
+			new_x = new_x[1:]
+			new_y = new_y[1:]
+		if not keep_rest and last + 1 < num_segs and seg_y[last + 1] == top:
+			last += 1
+
+		# splice the new segments over the ones under the rect
+		tail = num_segs - last - 1
+		end = first + len( new_x )
+		seg_x[end:end + tail] = seg_x[last + 1:num_segs]
+		seg_y[end:end + tail] = seg_y[last + 1:num_segs]
+		seg_x[first:end] = new_x
+		seg_y[first:end] = new_y
+		num_segs = end + tail
+		seg_y[num_segs] = 0.0
+
+	packed_widths = np.where( turned, heights, widths )
+
+	return x, y, turned, seg_y[:num_segs].max(), ( x + packed_widths ).max()
+
+def packRects( widths, heights, padding=0.0, rotate=True ):
+
+	# Packs the rects, padding apart, into a square as small as the skyline gets it.
+	# Returns the corner of each rect, whether it was turned a quarter, and the side of the square.
+
+	widths = np.asarray( widths, dtype=np.float64 ) + padding
+	heights = np.asarray( heights, dtype=np.float64 ) + padding
+
+	min_width = np.max( np.minimum( widths, heights ) if rotate else widths )
+
+	# start from a bin as wide as a square packed 90% full, and when the packing comes out
+	# taller than that, try once more with a bin as wide as the square of the same area
+	bin_width = max( math.sqrt( np.sum( widths * heights ) / 0.9 ), min_width )
+	best = None
+	for attempt in range( 2 ):
+		x, y, turned, used_height, used_width = skylinePack( widths, heights, bin_width, rotate )
+		side = max( used_width, used_height )
+		if best is None or side < best[3]:
+			best = ( x, y, turned, side )
+		if used_height <= used_width * 1.02:
+			break
+		bin_width = max( math.sqrt( used_width * used_height ), min_width )
+
+	return best
+
+def uvShellBounds( u, v, shells, num_shells ):
+
+	# the min and max u and v of every shell, from the uvs that belong to one ( shell >= 0 )
+	used = shells >= 0
+	order = np.argsort( shells[used], kind="stable" )
+	u_sorted = u[used][order]
+	v_sorted = v[used][order]
+	starts = np.searchsorted( shells[used][order], np.arange( num_shells ) )
+
+	return np.minimum.reduceat( u_sorted, starts ), np.minimum.reduceat( v_sorted, starts ), np.maximum.reduceat( u_sorted, starts ), np.maximum.reduceat( v_sorted, starts )
+
+def packUVShells( meshes, padding=2, resolution=1024, rotate=True ):
+
+	# Packs the uv shells of all of the meshes together into the zero to one uv space,
+	# at least padding texels of a resolution x resolution texture apart. The meshes are
+	# dicts with the uvs and a shell label per uv ( -1 for uvs on no face ), numbered
+	# from zero in each mesh. Returns the new ( u, v ) of each mesh.
+
+	# number the shells of all of the meshes in one range
+	num_shells = [ int( mesh["shells"].max() ) + 1 if len( mesh["shells"] ) else 0 for mesh in meshes ]
+	first_shells = np.concatenate( ( [0], np.cumsum( num_shells ) ) )
+	if first_shells[-1] == 0:
+		return [ ( mesh["u"], mesh["v"] ) for mesh in meshes ]
+
+	u = np.concatenate( [ mesh["u"] for mesh in meshes ] )
+	v = np.concatenate( [ mesh["v"] for mesh in meshes ] )
+	shells = np.concatenate( [ np.where( mesh["shells"] >= 0, mesh["shells"] + first, -1 ) for mesh, first in zip( meshes, first_shells ) ] )
+
+	u_min, v_min, u_max, v_max = uvShellBounds( u, v, shells, int( first_shells[-1] ) )
+	widths = u_max - u_min
+	heights = v_max - v_min
+
+	# the padding depends on the size the shells end up at, so pack again until the square
+	# comes out no larger than the one the padding was worked out for. The square grows about
+	# in line with the padding, so after the second try aim just past where that line meets
+	# the side it was packed for.
+	side = math.sqrt( np.sum( widths * heights ) ) / 0.8
+	last_try = None
+	for attempt in range( 8 ):
+		pad = side * padding / float( resolution )
+		x, y, turned, packed_side = packRects( widths, heights, pad, rotate )
+		if packed_side <= side:
+			break
+		next_side = packed_side
+		if last_try is not None and side != last_try[0]:
+			growth = ( packed_side - last_try[1] ) / ( side - last_try[0] )
+			if growth < 1:
+				next_side = max( ( packed_side - growth * side ) / ( 1 - growth ) * 1.01, packed_side )
+		last_try = ( side, packed_side )
+		side = next_side
+	else:
+		raise ValueError( "%d shells do not fit %d texels apart at a resolution of %d" % ( len( widths ), padding, resolution ) )
+
+	# move every shell to its spot, turning it a quarter counter clockwise where needed
+	used = shells >= 0
+	s = shells[used]
+	local_u = u[used] - u_min[s]
+	local_v = v[used] - v_min[s]
+	turn = turned[s]
+	new_u = np.where( turn, heights[s] - local_v, local_u ) + x[s] + pad / 2
+	new_v = np.where( turn, local_u, local_v ) + y[s] + pad / 2
+
+	u = u.copy()
+	v = v.copy()
+	u[used] = new_u / packed_side
+	v[used] = new_v / packed_side
+
+	offsets = np.concatenate( ( [0], np.cumsum( [ len( mesh["u"] ) for mesh in meshes ] ) ) )
+
+	return [ ( u[first:last], v[first:last] ) for first, last in zip( offsets[:-1], offsets[1:] ) ]
+
+################################################################################
+## Mesh Kernels
+################################################################################
+
+def uvExtent( mesh, scale_dimension ):
+
+	values = mesh["u"] if scale_dimension == "u" else mesh["v"]
+	return values.max() - values.min() if len( values ) else 0.0
+
+# Every kernel takes one mesh, a dict of the packed arrays, plus the arguments given to
+# runKernel, and returns the new u and v arrays, as long as the ones it was given.
+
+def fitMeshUVs( mesh, scale_dimension ):
+
+	# meshes without uvs, or flat in the dimension, have nothing to scale
+	if len( mesh["u"] ) == 0 or uvExtent( mesh, scale_dimension ) == 0:
+		return mesh["u"], mesh["v"]
+
+	return fitUVsToDimension( mesh["u"], mesh["v"], scale_dimension )
+
+def orientUnitizedUVs( mesh ):
+
+	# vert_ids holds the corner verts, the second one decides the orientation
+	angle = unitizedOrientation( mesh["u"], mesh["v"], mesh["face_verts"], mesh["face_vert_uvs"], mesh["vert_ids"][1] )
+
+	if angle is None:
+		return mesh["u"], mesh["v"]
+
+	return rotateUVs( mesh["u"], mesh["v"], angle )
+
+def normalizePoleTriangles( mesh ):
+
+	# vert_ids holds the poles
+	pole_uvs, red_uvs, blue_uvs = poleTriangleUVs( mesh["face_counts"], mesh["face_verts"], mesh["face_vert_uvs"], mesh["vert_ids"] )
+
+	if len( pole_uvs ) == 0:
+		return mesh["u"], mesh["v"]
+
+	return normalizePoleTriangleUVs( mesh["u"], mesh["v"], pole_uvs, red_uvs, blue_uvs )
+
+KERNELS = {
+	"fitMeshUVs": fitMeshUVs,
+	"orientUnitizedUVs": orientUnitizedUVs,
+	"normalizePoleTriangles": normalizePoleTriangles,
+}
+
+################################################################################
+## Mesh Batches
+################################################################################
+
+# the packed arrays of a mesh, and the ones the kernels write
+FIELDS = (
+	( "face_counts", np.int64 ),
+	( "face_verts", np.int64 ),
+	( "face_vert_uvs", np.int64 ),
+	( "vert_ids", np.int64 ),
+	( "u", np.float64 ),
+	( "v", np.float64 ),
+	( "u_out", np.float64 ),
+	( "v_out", np.float64 ),
+)
+
+class MeshBatch( object ):
+
+	# The arrays of many meshes packed end to end, one buffer per field, with the
+	# offsets of every mesh in each. The buffers are shared memory blocks when the
+	# batch goes to worker processes, which attach to them by name.
+
+	def __init__( self, offsets, arrays, blocks ):
+		self.offsets = offsets
+		self.arrays = arrays
+		self.blocks = blocks
+
+	@classmethod
+	def create( cls, meshes, shared ):
+
+		offsets = dict()
+		arrays = dict()
+		blocks = dict()
+
+		try:
+			for field, dtype in FIELDS:
+
+				# the outputs are as long as the uvs they replace
+				source = field[:-4] if field.endswith( "_out" ) else field
+				lengths = [ len( mesh.get( source, () ) ) for mesh in meshes ]
+				offsets[field] = np.concatenate( ( [0], np.cumsum( lengths, dtype=np.int64 ) ) )
+				size = int( offsets[field][-1] )
+
+				if shared:
+					blocks[field] = shared_memory.SharedMemory( create=True, size=max( size * np.dtype( dtype ).itemsize, 1 ) )
+					arrays[field] = np.ndarray( size, dtype=dtype, buffer=blocks[field].buf )
+				else:
+					arrays[field] = np.empty( size, dtype=dtype )
+
+				if field != source:
+					continue
+				for mesh, first, last in zip( meshes, offsets[field][:-1], offsets[field][1:] ):
+					if last > first:
+						arrays[field][first:last] = mesh[field]
+		except BaseException:
+			# the caller never gets a batch to release, so the blocks made so far are freed here
+			cls( offsets, arrays, blocks ).release()
+			raise
+
+		return cls( offsets, arrays, blocks )
+
+	def layout( self ):
+
+		# what a worker needs to attach to the batch
+		return dict( ( field, ( self.blocks[field].name, self.offsets[field] ) ) for field, dtype in FIELDS )
+
+	@classmethod
+	def attach( cls, layout ):
+
+		offsets = dict()
+		arrays = dict()
+		blocks = dict()
+
+		for field, dtype in FIELDS:
+			name, offsets[field] = layout[field]
+			blocks[field] = shared_memory.SharedMemory( name=name )
+			arrays[field] = np.ndarray( int( offsets[field][-1] ), dtype=dtype, buffer=blocks[field].buf )
+
+		return cls( offsets, arrays, blocks )
+
+	def field( self, field, index ):
+		offsets = self.offsets[field]
+		return self.arrays[field][ offsets[index]:offsets[index + 1] ]
+
+	def compute( self, index, kernel, args ):
+
+		mesh = dict( ( field, self.field( field, index ) ) for field, dtype in FIELDS if not field.endswith( "_out" ) )
+		u, v = kernel( mesh, *args )
+		self.field( "u_out", index )[:] = u
+		self.field( "v_out", index )[:] = v
+
+	def release( self, unlink=True ):
+
+		# drop the views before closing the blocks they point into
+		self.arrays = dict()
+		for block in self.blocks.values():
+			block.close()
+			if unlink:
+				block.unlink()
+		self.blocks = dict()
+
+################################################################################
+## Worker Pool
+################################################################################
+
+pool = None
+pool_size = 0
+
+def workerExecutable():
+
+	# Inside Maya the interpreter is the Maya executable itself, so the workers are started with
+	# the mayapy next to it. Returns None when the current interpreter can start them.
+	name = os.path.basename( sys.executable ).lower()
+	if not name.startswith( "maya" ) or name.startswith( "mayapy" ):
+		return None
+
+	mayapy = os.path.join( os.path.dirname( sys.executable ), "mayapy" + ( ".exe" if os.name == "nt" else "" ) )
+
+	return mayapy if os.path.exists( mayapy ) else None
+
+def getPool( processes ):
+
+	global pool, pool_size
+
+	if pool is not None and pool_size != processes:
+		shutdownPool()
+
+	if pool is None:
+		# spawn, never fork: a forked copy of a running Maya session is not safe to use
+		context = multiprocessing.get_context( "spawn" )
+		executable = workerExecutable()
+		if executable:
+			context.set_executable( executable )
+		pool = context.Pool( processes=processes )
+		pool_size = processes
+
+	return pool
+
+def shutdownPool():
+
+	global pool, pool_size
+
+	if pool is not None:
+		pool.terminate()
+		pool.join()
+
+	pool = None
+	pool_size = 0
+
+atexit.register( shutdownPool )
+
+def processMeshes( task ):
+
+	# worker side: compute a range of the meshes in a shared batch
+	kernel_name, args, layout, first, last = task
+	batch = MeshBatch.attach( layout )
+	try:
+		for index in range( first, last ):
+			batch.compute( index, KERNELS[kernel_name], args )
+	finally:
+		batch.release( unlink=False )
+
+	return last - first
+
+def splitRanges( sizes, num_ranges ):
+
+	# split the meshes into consecutive ranges of about the same total size
+	totals = np.cumsum( sizes )
+	targets = totals[-1] * np.arange( 1, num_ranges ) / float( num_ranges )
+	bounds = np.unique( np.concatenate( ( [0], np.searchsorted( totals, targets ) + 1, [ len( sizes ) ] ) ) )
+	bounds = np.minimum( bounds, len( sizes ) )
+
+	return [ ( int( first ), int( last ) ) for first, last in zip( bounds[:-1], bounds[1:] ) if last > first ]
+
+def runKernel( kernel_name, meshes, args=(), processes=None, min_uvs=200000 ):
+
+	# Runs the kernel on every mesh and returns the new ( u, v ) of each. The meshes are dicts
+	# with the fields the kernel reads. Batches of at least min_uvs uvs are spread over
+	# processes workers ( None=one per core, 0=never ), everything else runs here.
+
+	if processes is None:
+		processes = multiprocessing.cpu_count()
+
+	num_uvs = sum( len( mesh.get( "u", () ) ) for mesh in meshes )
+
+	# a daemon process can not start workers of its own, so the workers of GameAssetBatch,
+	# which are started as daemons, run the kernels here
+	parallel = shared_memory is not None and processes > 1 and len( meshes ) > 1 and num_uvs >= min_uvs and not multiprocessing.current_process().daemon
+
+	batch = MeshBatch.create( meshes, parallel )
+	try:
+		if parallel:
+			ranges = splitRanges( [ len( mesh.get( "u", () ) ) + 1 for mesh in meshes ], processes * 4 )
+			layout = batch.layout()
+			getPool( processes ).map( processMeshes, [ ( kernel_name, args, layout, first, last ) for first, last in ranges ] )
+		else:
+			for index in range( len( meshes ) ):
+				batch.compute( index, KERNELS[kernel_name], args )
+
+		return [ ( batch.field( "u_out", i ).copy(), batch.field( "v_out", i ).copy() ) for i in range( len( meshes ) ) ]
+
+	finally:
+		if parallel:
+			batch.release()
@@ -0,0 +1,2453 @@
+################################################################################
+## Maya Scene Emulator
+##
+## An in-memory stand-in for the parts of maya.cmds, maya.mel and
+## maya.api.OpenMaya that Game Asset Helper Scripts uses, backed by NumPy arrays,
+## so that the scripts can be benchmarked and tested without a Maya session.
+##
+## Usage:
+##   import MayaSceneEmulator
+##   MayaSceneEmulator.install()
+##   import GameAssetHelperScripts
+##
+## Scenes are saved and opened as JSON, whatever the file extension, so the
+## batch runner can work on emulated scenes:
+##   mayapy GameAssetBatch.py --standin MayaSceneEmulator ...
+##
+## The synthetic meshes the tests and benchmarks build ( grids, capped tubes,
+## multi-shell meshes, meshes with holes and slabs ) are made by MESH_MAKERS.
+##
+## Modelling commands that only matter to the look of the result ( bevels,
+## unfolds, normals ) are accepted and ignored. Commands and flags that are not
+## emulated raise an EmulatorUnsupportedError naming them, so that they can be
+## told apart from the errors of the scripts.
+##
+## Python plug-ins are loaded from their file. Only the commands they register
+## go on the undo queue, so cmds.undo undoes those and nothing else.
+################################################################################
+
+import collections
+import json
+import math
+import os
+import re
+import shlex
+import sys
+import types
+import uuid
+
+import numpy as np
+
+class EmulatorUnsupportedError( RuntimeError ):
+
+	# a command, flag or OpenMaya name that the emulator does not implement
+	pass
+
+################################################################################
+## Mesh Data
+################################################################################
+
+def unique( items ):
+	return list( collections.OrderedDict.fromkeys( items ) )
+
+def connectedLabels( num_items, a, b ):
+
+	# Labels the connected components of the graph with the edges a[i] - b[i] by hooking
+	# roots onto the smaller root and pointer jumping until every edge is inside one label.
+	labels = np.arange( num_items, dtype=np.int64 )
+	a = np.asarray( a, dtype=np.int64 )
+	b = np.asarray( b, dtype=np.int64 )
+
+	while True:
+		la = labels[a]
+		lb = labels[b]
+		if np.array_equal( la, lb ):
+			break
+		low = np.minimum( la, lb )
+		np.minimum.at( labels, la, low )
+		np.minimum.at( labels, lb, low )
+		while True:
+			jumped = labels[labels]
+			if np.array_equal( jumped, labels ):
+				break
+			labels = jumped
+
+	return labels
+
+class MeshData( object ):
+
+	# A polygon mesh: points, faces as counts plus a flat face-vertex list, and per uv set
+	# the u and v arrays plus the uv id of every face-vertex ( -1 where unmapped ).
+
+	def __init__( self, points, face_counts, face_verts ):
+		self.points = np.asarray( points, dtype=np.float64 ).reshape( -1, 3 ).copy()
+		self.face_counts = np.asarray( face_counts, dtype=np.int64 ).copy()
+		self.face_verts = np.asarray( face_verts, dtype=np.int64 ).copy()
+		self.uv_sets = collections.OrderedDict()
+		self.current_uv_set = None
+		self.color_sets = collections.OrderedDict()
+		self.current_color_set = None
+		self.edge_cache = None
+		self.listeners = collections.OrderedDict()
+
+	def copy( self ):
+		mesh = MeshData( self.points, self.face_counts, self.face_verts )
+		for name, ( u, v, fv_uvs ) in self.uv_sets.items():
+			mesh.uv_sets[name] = [ u.copy(), v.copy(), fv_uvs.copy() ]
+		for name, colors in self.color_sets.items():
+			mesh.color_sets[name] = colors.copy()
+		mesh.current_uv_set = self.current_uv_set
+		mesh.current_color_set = self.current_color_set
+		return mesh
+
+	@property
+	def num_verts( self ):
+		return len( self.points )
+
+	@property
+	def num_faces( self ):
+		return len( self.face_counts )
+
+	def faceOffsets( self ):
+		return np.concatenate( ( [0], np.cumsum( self.face_counts ) ) )
+
+	def faceVertFaces( self ):
+		return np.repeat( np.arange( self.num_faces ), self.face_counts )
+
+	def faceVertNext( self ):
+
+		# the index of the next face-vertex around the same face
+		offsets = self.faceOffsets()
+		nxt = np.arange( len( self.face_verts ) ) + 1
+		nxt[ offsets[1:] - 1 ] = offsets[:-1]
+		return nxt
+
+	def edges( self ):
+
+		# Returns the edge vertex pairs in order of first use, and the edge of every
+		# face-vertex ( the edge from it to the next face-vertex ).
+		if self.edge_cache is None:
+			a = self.face_verts
+			b = self.face_verts[ self.faceVertNext() ]
+			keys = np.minimum( a, b ) * max( self.num_verts, 1 ) + np.maximum( a, b )
+			unique_keys, first, inverse = np.unique( keys, return_index=True, return_inverse=True )
+			order = np.argsort( first )
+			rank = np.empty_like( order )
+			rank[order] = np.arange( len( order ) )
+			# an edge points the way its first face-vertex runs
+			first = first[order]
+			edge_verts = np.stack( ( a[first], b[first] ), axis=1 )
+			self.edge_cache = ( edge_verts, rank[ inverse.ravel() ] )
+		return self.edge_cache
+
+	def topologyChanged( self ):
+		self.edge_cache = None
+		self.changed()
+
+	def changed( self ):
+
+		# tell the node dirty callbacks
+		for listener in list( self.listeners.values() ):
+			listener()
+
+	def addUVSet( self, name ):
+		self.uv_sets[name] = [ np.zeros( 0 ), np.zeros( 0 ), np.full( len( self.face_verts ), -1, dtype=np.int64 ) ]
+		if self.current_uv_set is None:
+			self.current_uv_set = name
+
+	def uvSet( self, name=None ):
+		name = name or self.current_uv_set
+		if name not in self.uv_sets:
+			raise RuntimeError( "No uv set named " + str( name ) )
+		return self.uv_sets[name]
+
+	def keepFaceVerts( self, keep ):
+
+		# remove face-vertices, drop the faces left with less than three corners and the unused points
+		keep = np.asarray( keep, dtype=bool )
+		faces = self.faceVertFaces()
+		counts = np.bincount( faces[keep], minlength=self.num_faces )
+		keep &= ( counts >= 3 )[faces]
+		counts = counts[ counts >= 3 ]
+
+		self.face_verts = self.face_verts[keep]
+		self.face_counts = counts
+		for uv_set in self.uv_sets.values():
+			uv_set[2] = uv_set[2][keep]
+		for name in self.color_sets:
+			self.color_sets[name] = self.color_sets[name][keep]
+
+		self.compact()
+
+	def keepFaces( self, face_mask ):
+		self.keepFaceVerts( np.repeat( np.asarray( face_mask, dtype=bool ), self.face_counts ) )
+
+	def compact( self ):
+
+		# drop the points and uvs that no face uses
+		used = np.zeros( self.num_verts, dtype=bool )
+		used[ self.face_verts ] = True
+		remap = np.cumsum( used ) - 1
+		self.points = self.points[used]
+		self.face_verts = remap[ self.face_verts ]
+
+		for uv_set in self.uv_sets.values():
+			u, v, fv_uvs = uv_set
+			used = np.zeros( len( u ), dtype=bool )
+			used[ fv_uvs[ fv_uvs >= 0 ] ] = True
+			remap = np.cumsum( used ) - 1
+			uv_set[0] = u[used]
+			uv_set[1] = v[used]
+			uv_set[2] = np.where( fv_uvs >= 0, remap[ np.maximum( fv_uvs, 0 ) ], -1 )
+
+		self.topologyChanged()
+
+	def subset( self, face_mask ):
+		mesh = self.copy()
+		mesh.keepFaces( face_mask )
+		return mesh
+
+	def appendFaces( self, faces ):
+
+		# add faces given as lists of point indices, without uvs
+		if not faces:
+			return
+		counts = np.array( [ len( f ) for f in faces ], dtype=np.int64 )
+		verts = np.concatenate( [ np.asarray( f, dtype=np.int64 ) for f in faces ] )
+		self.face_counts = np.concatenate( ( self.face_counts, counts ) )
+		self.face_verts = np.concatenate( ( self.face_verts, verts ) )
+		for uv_set in self.uv_sets.values():
+			uv_set[2] = np.concatenate( ( uv_set[2], np.full( len( verts ), -1, dtype=np.int64 ) ) )
+		for name in self.color_sets:
+			default = np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( len( verts ), 1 ) )
+			self.color_sets[name] = np.vstack( ( self.color_sets[name], default ) )
+		self.topologyChanged()
+
+	@classmethod
+	def merged( cls, meshes, matrices ):
+
+		# Combines meshes placed by their matrices into one. The uv and color sets are
+		# merged by name, faces of a mesh without a set are left unmapped.
+		offsets = np.cumsum( [ 0 ] + [ m.num_verts for m in meshes ] )
+		points = [ transformPoints( m.points, matrix ) for m, matrix in zip( meshes, matrices ) ]
+		mesh = cls( np.vstack( points ) if points else np.zeros( ( 0, 3 ) ), np.concatenate( [ m.face_counts for m in meshes ] ), np.concatenate( [ m.face_verts + offset for m, offset in zip( meshes, offsets ) ] ) )
+
+		for name in unique( [ name for m in meshes for name in m.uv_sets ] ):
+			u = list()
+			v = list()
+			fv_uvs = list()
+			num_uvs = 0
+			for m in meshes:
+				if name in m.uv_sets:
+					mu, mv, mfv = m.uv_sets[name]
+					u.append( mu )
+					v.append( mv )
+					fv_uvs.append( np.where( mfv >= 0, mfv + num_uvs, -1 ) )
+					num_uvs += len( mu )
+				else:
+					fv_uvs.append( np.full( len( m.face_verts ), -1, dtype=np.int64 ) )
+			mesh.uv_sets[name] = [ np.concatenate( u ), np.concatenate( v ), np.concatenate( fv_uvs ) ]
+
+		for name in unique( [ name for m in meshes for name in m.color_sets ] ):
+			default = [ np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( len( m.face_verts ), 1 ) ) for m in meshes ]
+			mesh.color_sets[name] = np.vstack( [ m.color_sets.get( name, d ) for m, d in zip( meshes, default ) ] )
+
+		mesh.current_uv_set = meshes[0].current_uv_set
+		mesh.current_color_set = meshes[0].current_color_set
+		return mesh
+
+	def faceShells( self ):
+
+		# label the faces by the shell they belong to
+		nxt = self.faceVertNext()
+		vert_labels = connectedLabels( self.num_verts, self.face_verts, self.face_verts[nxt] )
+		first_verts = self.face_verts[ self.faceOffsets()[:-1] ]
+		return np.unique( vert_labels[first_verts], return_inverse=True )[1]
+
+	def toDict( self ):
+		data = dict()
+		data["points"] = self.points.tolist()
+		data["face_counts"] = self.face_counts.tolist()
+		data["face_verts"] = self.face_verts.tolist()
+		data["uv_sets"] = [ [ name, u.tolist(), v.tolist(), fv_uvs.tolist() ] for name, ( u, v, fv_uvs ) in self.uv_sets.items() ]
+		data["current_uv_set"] = self.current_uv_set
+		data["color_sets"] = [ [ name, colors.tolist() ] for name, colors in self.color_sets.items() ]
+		data["current_color_set"] = self.current_color_set
+		return data
+
+	@classmethod
+	def fromDict( cls, data ):
+		mesh = cls( data["points"], data["face_counts"], data["face_verts"] )
+		for name, u, v, fv_uvs in data["uv_sets"]:
+			mesh.uv_sets[name] = [ np.array( u, dtype=np.float64 ), np.array( v, dtype=np.float64 ), np.array( fv_uvs, dtype=np.int64 ) ]
+		for name, colors in data["color_sets"]:
+			mesh.color_sets[name] = np.array( colors, dtype=np.float64 ).reshape( -1, 4 )
+		mesh.current_uv_set = data["current_uv_set"]
+		mesh.current_color_set = data["current_color_set"]
+		return mesh
+
+	def boundingBox( self, matrix=None ):
+		points = self.points
+		if matrix is not None:
+			points = transformPoints( points, matrix )
+		if len( points ) == 0:
+			return [ 0.0 ] * 6
+		return np.concatenate( ( points.min( axis=0 ), points.max( axis=0 ) ) ).tolist()
+
+################################################################################
+## Matrices
+################################################################################
+
+def rotationMatrix( rotate ):
+
+	# xyz rotate order with row vectors: rotate about x first
+	rx, ry, rz = [ math.radians( a ) for a in rotate ]
+	mx = np.array( [ [ 1, 0, 0 ], [ 0, math.cos( rx ), math.sin( rx ) ], [ 0, -math.sin( rx ), math.cos( rx ) ] ] )
+	my = np.array( [ [ math.cos( ry ), 0, -math.sin( ry ) ], [ 0, 1, 0 ], [ math.sin( ry ), 0, math.cos( ry ) ] ] )
+	mz = np.array( [ [ math.cos( rz ), math.sin( rz ), 0 ], [ -math.sin( rz ), math.cos( rz ), 0 ], [ 0, 0, 1 ] ] )
+	return np.dot( np.dot( mx, my ), mz )
+
+def translationMatrix( offset ):
+	matrix = np.identity( 4 )
+	matrix[3, :3] = offset
+	return matrix
+
+def composeMatrix( translate, rotate, scale, rotate_pivot=( 0, 0, 0 ), scale_pivot=( 0, 0, 0 ), rotate_pivot_translate=( 0, 0, 0 ) ):
+
+	# Maya's transform order for row vectors: -sp * S * sp * -rp * R * rp * rpt * T
+	s = np.identity( 4 )
+	s[:3, :3] = np.diag( scale )
+	r = np.identity( 4 )
+	r[:3, :3] = rotationMatrix( rotate )
+	matrix = translationMatrix( -np.asarray( scale_pivot, dtype=np.float64 ) )
+	for m in ( s, translationMatrix( scale_pivot ), translationMatrix( -np.asarray( rotate_pivot, dtype=np.float64 ) ), r, translationMatrix( rotate_pivot ), translationMatrix( rotate_pivot_translate ), translationMatrix( translate ) ):
+		matrix = np.dot( matrix, m )
+	return matrix
+
+def decomposeMatrix( matrix ):
+
+	# the translate, xyz rotate and scale of a matrix without shear
+	scale = np.linalg.norm( matrix[:3, :3], axis=1 )
+	r = matrix[:3, :3] / np.maximum( scale, 1e-12 )[:, np.newaxis]
+	if np.linalg.det( r ) < 0:
+		scale[2] = -scale[2]
+		r[2] = -r[2]
+	rx = math.degrees( math.atan2( r[1, 2], r[2, 2] ) )
+	ry = math.degrees( math.asin( max( -1.0, min( 1.0, -r[0, 2] ) ) ) )
+	rz = math.degrees( math.atan2( r[0, 1], r[0, 0] ) )
+	return matrix[3, :3].tolist(), [ rx, ry, rz ], scale.tolist()
+
+def transformPoints( points, matrix ):
+	return np.dot( points, matrix[:3, :3] ) + matrix[3, :3]
+
+################################################################################
+## Scene
+################################################################################
+
+class Node( object ):
+
+	def __init__( self, name, node_type, parent=None ):
+		self.name = name
+		self.type = node_type
+		self.parent = parent
+		self.children = list()
+		self.attrs = dict()
+		self.mesh = None
+		self.intermediate = False
+		self.uuid = str( uuid.uuid4() ).upper()
+		if node_type in DAG_TYPES:
+			self.attrs["visibility"] = True
+		if node_type == "transform":
+			self.attrs["translate"] = [ 0.0, 0.0, 0.0 ]
+			self.attrs["rotate"] = [ 0.0, 0.0, 0.0 ]
+			self.attrs["scale"] = [ 1.0, 1.0, 1.0 ]
+			self.attrs["rotatePivot"] = [ 0.0, 0.0, 0.0 ]
+			self.attrs["scalePivot"] = [ 0.0, 0.0, 0.0 ]
+			self.attrs["rotatePivotTranslate"] = [ 0.0, 0.0, 0.0 ]
+
+	def path( self ):
+		if self.parent is None:
+			return "|" + self.name
+		return self.parent.path() + "|" + self.name
+
+	def isDag( self ):
+		return self.type in DAG_TYPES
+
+	def localMatrix( self ):
+		if self.type != "transform":
+			return np.identity( 4 )
+		a = self.attrs
+		return composeMatrix( a["translate"], a["rotate"], a["scale"], a["rotatePivot"], a["scalePivot"], a["rotatePivotTranslate"] )
+
+	def parentMatrix( self ):
+		if self.parent is None:
+			return np.identity( 4 )
+		return self.parent.worldMatrix()
+
+	def worldMatrix( self ):
+		return np.dot( self.localMatrix(), self.parentMatrix() )
+
+	def setLocalMatrix( self, matrix ):
+
+		# take the translate, rotate and scale from the matrix, keeping the pivots where they are
+		translate, rotate, scale = decomposeMatrix( matrix )
+		a = self.attrs
+		a["rotate"] = rotate
+		a["scale"] = scale
+		a["translate"] = [ 0.0, 0.0, 0.0 ]
+		a["translate"] = ( np.asarray( translate ) - self.localMatrix()[3, :3] ).tolist()
+
+	def setWorldMatrix( self, matrix ):
+		self.setLocalMatrix( np.dot( matrix, np.linalg.inv( self.parentMatrix() ) ) )
+
+	def setPivots( self, rotate_pivot=None, scale_pivot=None ):
+
+		# like moving the pivot in maya, the rotate pivot translate keeps the object in place
+		old_matrix = self.localMatrix()
+		if rotate_pivot is not None:
+			self.attrs["rotatePivot"] = [ float( x ) for x in rotate_pivot ]
+		if scale_pivot is not None:
+			self.attrs["scalePivot"] = [ float( x ) for x in scale_pivot ]
+		offset = old_matrix[3, :3] - self.localMatrix()[3, :3]
+		self.attrs["rotatePivotTranslate"] = ( np.asarray( self.attrs["rotatePivotTranslate"] ) + offset ).tolist()
+
+	def freeze( self, matrix=None ):
+
+		# bake the transform into the shapes and the transforms below, then reset it
+		if matrix is None:
+			matrix = self.localMatrix()
+		if self.type == "transform":
+			a = self.attrs
+			a["rotatePivot"] = transformPoints( np.array( [ a["rotatePivot"] ] ), matrix )[0].tolist()
+			a["scalePivot"] = transformPoints( np.array( [ a["scalePivot"] ] ), matrix )[0].tolist()
+			a["translate"] = [ 0.0, 0.0, 0.0 ]
+			a["rotate"] = [ 0.0, 0.0, 0.0 ]
+			a["scale"] = [ 1.0, 1.0, 1.0 ]
+			a["rotatePivotTranslate"] = [ 0.0, 0.0, 0.0 ]
+		for child in self.children:
+			if child.type == "transform":
+				child.freeze( np.dot( child.localMatrix(), matrix ) )
+			elif child.mesh is not None:
+				child.mesh.points = transformPoints( child.mesh.points, matrix )
+				child.mesh.changed()
+
+	def shapes( self ):
+		return [ c for c in self.children if c.type != "transform" ]
+
+	def meshShape( self ):
+		if self.type == "mesh":
+			return self
+		for child in self.shapes():
+			if child.type == "mesh" and not child.intermediate:
+				return child
+		return None
+
+	def descendants( self ):
+		for child in self.children:
+			yield child
+			for node in child.descendants():
+				yield node
+
+	def isVisible( self ):
+
+		# not an intermediate shape, and neither it nor any node above it has its visibility off
+		node = self
+		while node is not None:
+			if not node.attrs.get( "visibility", True ):
+				return False
+			node = node.parent
+		return not self.intermediate
+
+	def boundingBox( self, space_matrix=None, ignore_invisible=False ):
+
+		# the world bounding box of every mesh at or below the node ( only the visible ones when
+		# ignore_invisible is set ), or None, or the box in another space with the matrix from
+		# world space into it
+		boxes = list()
+		for node in [ self ] + list( self.descendants() ):
+			if node.mesh is not None and not node.intermediate and node.mesh.num_verts and ( node.isVisible() or not ignore_invisible ):
+				matrix = node.parent.worldMatrix()
+				if space_matrix is not None:
+					matrix = np.dot( matrix, space_matrix )
+				boxes.append( node.mesh.boundingBox( matrix ) )
+		if not boxes:
+			return None
+		boxes = np.array( boxes )
+		return boxes[:, :3].min( axis=0 ).tolist() + boxes[:, 3:].max( axis=0 ).tolist()
+
+	def copy( self, parent=None ):
+		node = Node( self.name, self.type, parent )
+		node.attrs = copyAttrs( self.attrs )
+		node.mesh = self.mesh.copy() if self.mesh is not None else None
+		node.intermediate = self.intermediate
+		node.children = [ child.copy( node ) for child in self.children ]
+		return node
+
+	def toDict( self ):
+		data = { "name": self.name, "type": self.type, "uuid": self.uuid, "attrs": self.attrs, "intermediate": self.intermediate }
+		if self.mesh is not None:
+			data["mesh"] = self.mesh.toDict()
+		data["children"] = [ child.toDict() for child in self.children ]
+		return data
+
+	@classmethod
+	def fromDict( cls, data, parent=None ):
+		node = cls( data["name"], data["type"], parent )
+		node.attrs.update( copyAttrs( data["attrs"] ) )
+		node.intermediate = data.get( "intermediate", False )
+		node.uuid = data.get( "uuid", node.uuid )
+		if "mesh" in data:
+			node.mesh = MeshData.fromDict( data["mesh"] )
+		node.children = [ cls.fromDict( child, node ) for child in data.get( "children", list() ) ]
+		return node
+
+def copyAttrs( attrs ):
+	return dict( ( k, list( v ) if isinstance( v, ( list, tuple ) ) else v ) for k, v in attrs.items() )
+
+DAG_TYPES = ( "transform", "mesh", "camera", "locator", "stroke", "joint" )
+SHADER_TYPES = ( "lambert", "blinn", "phong" )
+
+class Scene( object ):
+
+	def __init__( self ):
+		self.reset()
+
+	def reset( self ):
+		self.roots = list()
+		self.dependency_nodes = list()
+		self.selection = list()
+		self.attrs = { "defaultResolution.width": 1920, "defaultResolution.height": 1080 }
+		self.filename = None
+
+	# files
+
+	def toDict( self ):
+		data = dict()
+		data["roots"] = [ node.toDict() for node in self.roots ]
+		data["dependency_nodes"] = [ node.toDict() for node in self.dependency_nodes ]
+		data["attrs"] = self.attrs
+		return data
+
+	def save( self, path ):
+		with open( path, "w" ) as f:
+			json.dump( self.toDict(), f )
+
+	def load( self, path, merge=False ):
+
+		# open a saved scene, or import it into this one with unique names
+		with open( path ) as f:
+			data = json.load( f )
+		if not merge:
+			self.reset()
+			self.attrs.update( data["attrs"] )
+			self.filename = path
+		for node_data in data["roots"] + data["dependency_nodes"]:
+			node = Node.fromDict( node_data )
+			node.name = self.uniqueName( node.name )
+			if node.isDag():
+				self.roots.append( node )
+			else:
+				self.dependency_nodes.append( node )
+
+	# nodes
+
+	def dagNodes( self ):
+		for root in self.roots:
+			yield root
+			for node in root.descendants():
+				yield node
+
+	def allNodes( self ):
+		for node in self.dagNodes():
+			yield node
+		for node in self.dependency_nodes:
+			yield node
+
+	def siblings( self, parent ):
+		return self.roots if parent is None else parent.children
+
+	def uniqueName( self, name, parent=None, ignore=None ):
+
+		# clashing names get the next free trailing number, like pCube1, pCube2
+		taken = set( n.name for n in self.siblings( parent ) if n is not ignore )
+		if parent is None or not parent.isDag():
+			taken |= set( n.name for n in self.dependency_nodes if n is not ignore )
+		if name not in taken:
+			return name
+		base = name.rstrip( "0123456789" ) or name
+		i = 1
+		while base + str( i ) in taken:
+			i += 1
+		return base + str( i )
+
+	def createNode( self, node_type, name=None, parent=None ):
+		name = self.uniqueName( name or ( node_type + "1" ), parent )
+		node = Node( name, node_type, parent )
+		if node.isDag():
+			self.siblings( parent ).append( node )
+		else:
+			self.dependency_nodes.append( node )
+		return node
+
+	def createMesh( self, name, points, face_counts, face_verts, uvs=None, parent=None ):
+
+		# Adds a mesh transform and shape. uvs is an optional ( u, v, face-vertex uv ids ) for map1.
+		# Returns the full path of the transform.
+		if isinstance( parent, str ):
+			parent = self.node( parent )
+		transform = self.createNode( "transform", name, parent )
+		shape = self.createNode( "mesh", transform.name + "Shape", transform )
+		shape.mesh = MeshData( points, face_counts, face_verts )
+		shape.mesh.addUVSet( "map1" )
+		if uvs is not None:
+			u, v, fv_uvs = uvs
+			shape.mesh.uv_sets["map1"] = [ np.asarray( u, dtype=np.float64 ), np.asarray( v, dtype=np.float64 ), np.asarray( fv_uvs, dtype=np.int64 ) ]
+		return transform.path()
+
+	def createCamera( self, name="camera1", translate=( 0, 0, 0 ), rotate=( 0, 0, 0 ), horizontal_fov=54.43 ):
+
+		# a perspective camera looking down its -z axis, returns the full path of the transform
+		transform = self.createNode( "transform", name )
+		transform.attrs["translate"] = [ float( x ) for x in translate ]
+		transform.attrs["rotate"] = [ float( x ) for x in rotate ]
+		shape = self.createNode( "camera", transform.name + "Shape", transform )
+		shape.attrs["horizontalFieldOfView"] = horizontal_fov
+		shape.attrs["nearClipPlane"] = 0.1
+		shape.attrs["farClipPlane"] = 10000.0
+		return transform.path()
+
+	def duplicate( self, node, name=None ):
+		copy = node.copy( node.parent )
+		copy.name = self.uniqueName( name or node.name, node.parent )
+		self.siblings( node.parent ).append( copy )
+		return copy
+
+	def removeNode( self, node ):
+		if node.isDag():
+			self.siblings( node.parent ).remove( node )
+		else:
+			self.dependency_nodes.remove( node )
+		removed = set( [ node ] ) | set( node.descendants() )
+		self.selection = [ s for s in self.selection if self.selectionNode( s ) not in removed ]
+
+	def reparent( self, node, parent ):
+		self.siblings( node.parent ).remove( node )
+		node.parent = parent
+		node.name = self.uniqueName( node.name, parent, node )
+		self.siblings( parent ).append( node )
+
+	# names
+
+	def find( self, name ):
+
+		# resolves a full path, a partial path or a short name to a node, or None
+		name = name.split( "." )[0]
+		if name.startswith( "|" ):
+			# walk down the hierarchy one name at a time
+			node = None
+			for part in name.split( "|" )[1:]:
+				node = next( ( n for n in ( self.roots if node is None else node.children ) if n.name == part ), None )
+				if node is None:
+					return None
+			return node
+		matches = [ n for n in self.allNodes() if n.name == name.split( "|" )[-1] and ( "|" + n.path() ).endswith( "|" + name ) ]
+		if len( matches ) > 1:
+			raise ValueError( "More than one object matches name: " + name )
+		return matches[0] if matches else None
+
+	def node( self, name ):
+		node = self.find( name )
+		if node is None:
+			raise ValueError( "No object matches name: " + name )
+		return node
+
+	def selectionNode( self, item ):
+		return self.find( item )
+
+	def displayName( self, node, long ):
+		if not node.isDag():
+			return node.name
+		if long:
+			return node.path()
+		# the shortest unique name
+		if len( [ n for n in self.dagNodes() if n.name == node.name ] ) == 1:
+			return node.name
+		return node.path()
+
+	def meshNode( self, name ):
+		node = self.node( name )
+		shape = node.meshShape()
+		if shape is None:
+			raise ValueError( name + " is not a mesh." )
+		return shape
+
+scene = Scene()
+
+################################################################################
+## Synthetic Meshes
+################################################################################
+
+def gridFaces( n_u, n_v, first_vert=0 ):
+
+	# the quads of a grid of ( n_u + 1 ) x ( n_v + 1 ) points, row by row, counter clockwise
+	i, j = np.meshgrid( np.arange( n_u ), np.arange( n_v ) )
+	corner = ( j * ( n_u + 1 ) + i ).ravel() + first_vert
+	face_verts = np.stack( ( corner, corner + 1, corner + n_u + 2, corner + n_u + 1 ), axis=1 ).ravel()
+	return np.full( n_u * n_v, 4, dtype=np.int64 ), face_verts
+
+def gridPoints( n_u, n_v, width=1.0, height=1.0 ):
+	x, y = np.meshgrid( np.linspace( 0, width, n_u + 1 ), np.linspace( 0, height, n_v + 1 ) )
+	return np.stack( ( x.ravel(), y.ravel(), np.zeros( x.size ) ), axis=1 )
+
+def planarUVs( points, face_verts ):
+
+	# one uv per point from its x and y
+	size = max( np.ptp( points[:, 0] ), np.ptp( points[:, 1] ), 1e-12 )
+	u = ( points[:, 0] - points[:, 0].min() ) / size
+	v = ( points[:, 1] - points[:, 1].min() ) / size
+	return u, v, face_verts.copy()
+
+def makeGrid( num_verts ):
+
+	# a planar quad grid, twice as wide as it is high
+	n_v = max( int( math.sqrt( num_verts / 2.0 ) ) - 1, 1 )
+	n_u = max( num_verts // ( n_v + 1 ) - 1, 1 )
+	points = gridPoints( n_u, n_v, 2.0, 1.0 )
+	face_counts, face_verts = gridFaces( n_u, n_v )
+	return points, face_counts, face_verts, planarUVs( points, face_verts )
+
+def makeTube( num_verts ):
+
+	# a capped tube: quad rings closed by a triangle fan around a pole at each end
+	segments = max( int( math.sqrt( num_verts ) ), 5 )
+	rings = max( num_verts // segments, 2 )
+	angle = np.linspace( 0, 2 * np.pi, segments, endpoint=False )
+	height = np.linspace( 0, 2.0, rings )
+	a, h = np.meshgrid( angle, height )
+	points = np.stack( ( np.cos( a ).ravel(), h.ravel(), np.sin( a ).ravel() ), axis=1 )
+	points = np.vstack( ( points, [ [ 0.0, -0.5, 0.0 ], [ 0.0, 2.5, 0.0 ] ] ) )
+	bottom_pole = rings * segments
+	top_pole = bottom_pole + 1
+
+	s = np.arange( segments )
+	r = np.arange( rings - 1 )
+	s_next = ( s + 1 ) % segments
+	ring_quads = np.stack( (
+		( r[:, None] * segments + s ).ravel(),
+		( ( r[:, None] + 1 ) * segments + s ).ravel(),
+		( ( r[:, None] + 1 ) * segments + s_next ).ravel(),
+		( r[:, None] * segments + s_next ).ravel()
+	), axis=1 )
+	bottom_fan = np.stack( ( np.full( segments, bottom_pole ), s, s_next ), axis=1 )
+	top_ring = ( rings - 1 ) * segments
+	top_fan = np.stack( ( np.full( segments, top_pole ), top_ring + s_next, top_ring + s ), axis=1 )
+
+	face_counts = np.concatenate( ( np.full( len( bottom_fan ), 3 ), np.full( len( ring_quads ), 4 ), np.full( len( top_fan ), 3 ) ) )
+	face_verts = np.concatenate( ( bottom_fan.ravel(), ring_quads.ravel(), top_fan.ravel() ) )
+	return points, face_counts, face_verts, planarUVs( points, face_verts )
+
+def makeShells( num_verts ):
+
+	# separate grids side by side in one mesh
+	num_shells = 8
+	n = max( int( math.sqrt( num_verts / num_shells ) ) - 1, 1 )
+	points = list()
+	face_verts = list()
+	for i in range( num_shells ):
+		shell_points = gridPoints( n, n )
+		shell_points[:, 0] += i * 1.5
+		points.append( shell_points )
+		face_verts.append( gridFaces( n, n, i * len( shell_points ) )[1] )
+	points = np.vstack( points )
+	face_verts = np.concatenate( face_verts )
+	face_counts = np.full( len( face_verts ) // 4, 4, dtype=np.int64 )
+	return points, face_counts, face_verts, planarUVs( points, face_verts )
+
+def makeOpenMesh( num_verts ):
+
+	# a grid with single face holes punched into it on a regular pattern
+	n = max( int( math.sqrt( num_verts ) ) - 1, 4 )
+	points = gridPoints( n, n )
+	face_counts, face_verts = gridFaces( n, n )
+	i, j = np.meshgrid( np.arange( n ), np.arange( n ) )
+	holes = ( ( i % 8 == 4 ) & ( j % 8 == 4 ) ).ravel()
+	face_verts = face_verts.reshape( -1, 4 )[ ~holes ].ravel()
+	face_counts = face_counts[ ~holes ]
+	return points, face_counts, face_verts, planarUVs( points, face_verts )
+
+def makeSlab( num_verts ):
+
+	# an extruded grid: a front face, a back face and the side walls between their borders
+	n = max( int( math.sqrt( num_verts / 2.0 ) ) - 1, 2 )
+	front = gridPoints( n, n )
+	back = front.copy()
+	back[:, 2] = -0.1
+	points = np.vstack( ( front, back ) )
+	face_counts, front_faces = gridFaces( n, n )
+	back_faces = ( front_faces.reshape( -1, 4 )[:, ::-1] + len( front ) ).ravel()
+
+	# walk around the border of the grid
+	side = n + 1
+	bottom = np.arange( n )
+	right = np.arange( n ) * side + n
+	top = n * side + np.arange( n, 0, -1 )
+	left = np.arange( n, 0, -1 ) * side
+	border = np.concatenate( ( bottom, right, top, left ) )
+	border_next = np.roll( border, -1 )
+	walls = np.stack( ( border_next, border, border + len( front ), border_next + len( front ) ), axis=1 ).ravel()
+
+	face_verts = np.concatenate( ( front_faces, back_faces, walls ) )
+	face_counts = np.full( len( face_verts ) // 4, 4, dtype=np.int64 )
+	return points, face_counts, face_verts, planarUVs( points, face_verts )
+
+MESH_MAKERS = {
+	"grid": makeGrid,
+	"tube": makeTube,
+	"shells": makeShells,
+	"open": makeOpenMesh,
+	"slab": makeSlab,
+}
+
+################################################################################
+## Components
+################################################################################
+
+COMPONENT_PATTERN = re.compile( r"^(.*)\.(vtx|e|f|map)\[(\d+|\*)(?::(\d+))?\]$" )
+COMPONENT_RANGE_PATTERN = re.compile( r"^(.*)\.(vtx|e|f|map)$" )
+
+def componentCount( mesh, kind ):
+	if kind == "vtx":
+		return mesh.num_verts
+	if kind == "e":
+		return len( mesh.edges()[0] )
+	if kind == "f":
+		return mesh.num_faces
+	return len( mesh.uvSet()[0] )
+
+def splitComponent( item ):
+
+	# ( object name, shape, kind, index array ) for a component name, or None for an object
+	match = COMPONENT_PATTERN.match( item )
+	if not match:
+		return None
+	shape = scene.meshNode( match.group( 1 ) )
+	kind = match.group( 2 )
+	if match.group( 3 ) == "*":
+		indices = np.arange( componentCount( shape.mesh, kind ) )
+	else:
+		first = int( match.group( 3 ) )
+		last = int( match.group( 4 ) ) if match.group( 4 ) else first
+		indices = np.arange( first, last + 1 )
+	return match.group( 1 ), shape, kind, indices
+
+def parseComponents( items, by_name=False ):
+
+	# Groups component names by mesh shape: { shape: { kind: index array } }, or by the
+	# object name they were given with. Objects without a component part are returned
+	# in the second list.
+	groups = collections.OrderedDict()
+	objects = list()
+
+	for item in flattenArgs( items ):
+		component = splitComponent( item )
+		if component is None:
+			objects.append( item )
+			continue
+		obj, shape, kind, indices = component
+		key = obj if by_name else shape
+		groups.setdefault( key, collections.OrderedDict() ).setdefault( kind, list() ).append( indices )
+
+	for key in groups:
+		for kind in groups[key]:
+			groups[key][kind] = np.unique( np.concatenate( groups[key][kind] ) )
+
+	return groups, objects
+
+def convertComponents( mesh, kind, indices, to_kind, internal=False ):
+
+	# Converts components through the face-vertices they touch. A face or edge is
+	# converted to when any of its face-vertices is touched, or all of them with internal.
+	indices = np.asarray( indices, dtype=np.int64 )
+	if kind == to_kind:
+		return indices
+
+	fv_faces = mesh.faceVertFaces()
+	edge_verts, fv_edges = mesh.edges()
+	nxt = mesh.faceVertNext()
+	fv_uvs = mesh.uvSet()[2]
+
+	if kind == "vtx":
+		touched = np.isin( mesh.face_verts, indices )
+	elif kind == "f":
+		touched = np.isin( fv_faces, indices )
+	elif kind == "map":
+		touched = np.isin( fv_uvs, indices )
+	else:
+		# the face-vertices at both ends of the edges
+		on_edge = np.isin( fv_edges, indices )
+		touched = on_edge.copy()
+		touched[ nxt[on_edge] ] = True
+
+	if to_kind == "vtx":
+		return np.unique( mesh.face_verts[touched] )
+	if to_kind == "map":
+		return np.unique( fv_uvs[ touched & ( fv_uvs >= 0 ) ] )
+	if to_kind == "f":
+		counts = np.bincount( fv_faces, weights=touched, minlength=mesh.num_faces )
+		return np.flatnonzero( counts == mesh.face_counts if internal else counts > 0 )
+	if internal or kind == "f":
+		return np.unique( fv_edges[ touched & touched[nxt] ] )
+	return np.unique( fv_edges[ touched | touched[nxt] ] )
+
+def componentNames( obj, kind, indices, flatten=False ):
+
+	# compact ( or flat ) names for the indices on the object
+	indices = np.unique( np.asarray( indices, dtype=np.int64 ) )
+	if len( indices ) == 0:
+		return list()
+	prefix = obj + "." + kind + "["
+	if flatten:
+		return [ prefix + str( i ) + "]" for i in indices.tolist() ]
+	breaks = np.flatnonzero( np.diff( indices ) != 1 )
+	firsts = indices[ np.concatenate( ( [0], breaks + 1 ) ) ]
+	lasts = indices[ np.concatenate( ( breaks, [ len( indices ) - 1 ] ) ) ]
+	names = list()
+	for first, last in zip( firsts.tolist(), lasts.tolist() ):
+		names.append( prefix + str( first ) + ( "]" if first == last else ":" + str( last ) + "]" ) )
+	return names
+
+def flattenArgs( args ):
+	items = list()
+	for a in args:
+		if a is None:
+			continue
+		if isinstance( a, ( list, tuple ) ):
+			items.extend( flattenArgs( a ) )
+		else:
+			items.append( str( a ) )
+	return items
+
+def flag( kwargs, long_name, short_name=None, default=None ):
+	if long_name in kwargs:
+		return kwargs[long_name]
+	if short_name and short_name in kwargs:
+		return kwargs[short_name]
+	return default
+
+def targets( args ):
+
+	# the objects a command works on: its arguments, or the selection
+	items = flattenArgs( args )
+	if not items:
+		items = list( scene.selection )
+	return items
+
+def meshesOf( args ):
+	shapes = list()
+	for item in targets( args ):
+		shape = scene.meshNode( item.split( "." )[0] )
+		if shape not in shapes:
+			shapes.append( shape )
+	return shapes
+
+################################################################################
+## Commands
+################################################################################
+
+CMDS = dict()
+IGNORED_CMDS = ( "polySetToFaceNormal", "polySoftEdge", "u3dUnfold", "u3dLayout", "polyBevel3", "polyRetopo", "deleteUI", "window", "showWindow", "progressWindow" )
+
+def command( func ):
+	CMDS[ func.__name__ ] = func
+	return func
+
+@command
+def about( *args, **kwargs ):
+	if flag( kwargs, "batch", "b" ):
+		return True
+	if flag( kwargs, "version", "v" ):
+		return "emulator"
+	return ""
+
+# the undoable commands run so far, one list per undo chunk, how deep the open chunks are nested,
+# and whether undo is on
+undo_queue = list()
+undo_chunk_depth = [ 0 ]
+undo_state = [ True ]
+
+# the python plug-ins loaded, by name
+plugins = dict()
+
+@command
+def undoInfo( *args, **kwargs ):
+	if flag( kwargs, "query", "q" ):
+		if flag( kwargs, "state", "st" ):
+			return undo_state[0]
+		raise EmulatorUnsupportedError( "undoInfo query of " + str( sorted( kwargs ) ) )
+	state = flag( kwargs, "state", "st" )
+	if state is not None:
+		# turning undo off flushes the queue, as in Maya
+		undo_state[0] = bool( state )
+		if not state:
+			del undo_queue[:]
+	state = flag( kwargs, "stateWithoutFlush", "swf" )
+	if state is not None:
+		undo_state[0] = bool( state )
+	if flag( kwargs, "openChunk", "ock" ):
+		if undo_chunk_depth[0] == 0 and undo_state[0]:
+			undo_queue.append( list() )
+		undo_chunk_depth[0] += 1
+	if flag( kwargs, "closeChunk", "cck" ):
+		undo_chunk_depth[0] = max( undo_chunk_depth[0] - 1, 0 )
+	return None
+
+def recordUndo( command_object ):
+	if not undo_state[0]:
+		return
+	if undo_chunk_depth[0] > 0:
+		undo_queue[-1].append( command_object )
+	else:
+		undo_queue.append( [ command_object ] )
+
+@command
+def undo( *args, **kwargs ):
+	if undo_queue:
+		for command_object in reversed( undo_queue.pop() ):
+			command_object.undoIt()
+
+@command
+def loadPlugin( *args, **kwargs ):
+
+	# python plug-ins are run from their file, the rest ( fbxmaya, Unfold3D ) are taken as loaded
+	for path in flattenArgs( args ):
+		name = os.path.splitext( os.path.basename( path ) )[0]
+		if path.endswith( ".py" ) and name not in plugins:
+			module = types.ModuleType( name )
+			module.__file__ = path
+			with open( path ) as plugin_file:
+				exec( compile( plugin_file.read(), path, "exec" ), module.__dict__ )
+			module.initializePlugin( MObject() )
+			plugins[name] = module
+	return None
+
+@command
+def pluginInfo( name, **kwargs ):
+	if flag( kwargs, "loaded", "l" ):
+		return os.path.splitext( os.path.basename( name ) )[0] in plugins
+	raise EmulatorUnsupportedError( "pluginInfo of " + str( sorted( kwargs ) ) )
+
+@command
+def refresh( *args, **kwargs ):
+	return None
+
+@command
+def evaluationManager( *args, **kwargs ):
+	if flag( kwargs, "query", "q" ):
+		return [ "parallel" ]
+	return None
+
+@command
+def confirmDialog( *args, **kwargs ):
+	print( "confirmDialog: " + str( flag( kwargs, "message", "m", "" ) ) )
+	return "OK"
+
+@command
+def ls( *args, **kwargs ):
+
+	long = flag( kwargs, "long", "l", False )
+	node_types = flag( kwargs, "type", "typ" )
+	if isinstance( node_types, str ):
+		node_types = [ node_types ]
+
+	if flag( kwargs, "selection", "sl" ):
+		items = list( scene.selection )
+	elif args:
+		items = flattenArgs( args )
+	else:
+		items = [ n.path() if n.isDag() else n.name for n in scene.allNodes() ]
+
+	names = list()
+	for item in items:
+		node = scene.find( item )
+		if node is None:
+			continue
+
+		# components are listed as they are, one by one with flatten, or as their shape with objectsOnly
+		component = splitComponent( item )
+		if component is not None:
+			if flag( kwargs, "objectsOnly", "o" ):
+				name = scene.displayName( node.meshShape() or node, long )
+				if name not in names:
+					names.append( name )
+			elif flag( kwargs, "flatten", "fl" ):
+				obj, shape, kind, indices = component
+				names.extend( n for n in componentNames( obj, kind, indices, True ) if n not in names )
+			elif not node_types:
+				names.append( item )
+			continue
+
+		nodes = [ node ]
+		if flag( kwargs, "dag", "dag" ):
+			nodes += list( node.descendants() )
+		for n in nodes:
+			if flag( kwargs, "shapes", "s" ) and n.type == "transform":
+				continue
+			if flag( kwargs, "noIntermediate", "ni" ) and n.intermediate:
+				continue
+			if node_types and n.type not in node_types and not ( "lambert" in node_types and n.type in SHADER_TYPES ):
+				continue
+			name = scene.displayName( n, long )
+			if name not in names:
+				names.append( name )
+
+	return names
+
+@command
+def listRelatives( *args, **kwargs ):
+
+	full_path = flag( kwargs, "fullPath", "f", False )
+	node_type = flag( kwargs, "type", "typ" )
+	nodes = [ scene.node( item ) for item in targets( args ) ]
+
+	result = list()
+	seen = set()
+	for node in nodes:
+		if flag( kwargs, "parent", "p" ):
+			relatives = [ node.parent ] if node.parent is not None else list()
+		elif flag( kwargs, "allDescendents", "ad" ):
+			relatives = list( node.descendants() )[::-1]
+		elif flag( kwargs, "shapes", "s" ):
+			relatives = node.shapes()
+		else:
+			relatives = list( node.children )
+		for r in relatives:
+			if node_type and r.type != node_type:
+				continue
+			if r.intermediate and flag( kwargs, "noIntermediate", "ni" ):
+				continue
+			name = r.path() if full_path else r.name
+			if name not in seen:
+				seen.add( name )
+				result.append( name )
+
+	# like maya, no relatives is None rather than an empty list
+	return result or None
+
+@command
+def nodeType( name, **kwargs ):
+	return scene.node( name ).type
+
+@command
+def objectType( name, **kwargs ):
+	node = scene.node( name )
+	is_type = flag( kwargs, "isType", "i" )
+	if is_type:
+		return node.type == is_type
+	return node.type
+
+@command
+def objExists( name ):
+	return scene.find( name ) is not None
+
+@command
+def select( *args, **kwargs ):
+	items = flattenArgs( args )
+	if flag( kwargs, "clear", "cl" ):
+		scene.selection = list()
+		return
+	for item in items:
+		scene.node( item )
+	if flag( kwargs, "add", "add" ):
+		scene.selection += [ i for i in items if i not in scene.selection ]
+	elif flag( kwargs, "deselect", "d" ):
+		scene.selection = [ s for s in scene.selection if s not in items ]
+	else:
+		scene.selection = items
+
+@command
+def rename( *args, **kwargs ):
+	items = flattenArgs( args )
+	if len( items ) == 1:
+		old, new = scene.selection[0], items[0]
+	else:
+		old, new = items
+	node = scene.node( old )
+	node.name = scene.uniqueName( new.split( "|" )[-1], node.parent, node )
+	return node.name
+
+@command
+def delete( *args, **kwargs ):
+
+	# history is not kept, so deleting it does nothing
+	if flag( kwargs, "constructionHistory", "ch" ):
+		return
+
+	groups, objects = parseComponents( targets( args ) )
+
+	for shape, kinds in groups.items():
+		mesh = shape.mesh
+		face_mask = np.ones( mesh.num_faces, dtype=bool )
+		if "f" in kinds:
+			face_mask[ kinds["f"] ] = False
+		if "vtx" in kinds:
+			vert_mask = np.zeros( mesh.num_verts, dtype=bool )
+			vert_mask[ kinds["vtx"] ] = True
+			face_mask &= np.bincount( mesh.faceVertFaces(), weights=vert_mask[ mesh.face_verts ], minlength=mesh.num_faces ) == 0
+		if "e" in kinds:
+			edge_mask = np.zeros( len( mesh.edges()[0] ), dtype=bool )
+			edge_mask[ kinds["e"] ] = True
+			face_mask &= np.bincount( mesh.faceVertFaces(), weights=edge_mask[ mesh.edges()[1] ], minlength=mesh.num_faces ) == 0
+		mesh.keepFaces( face_mask )
+
+	for item in objects:
+		node = scene.find( item )
+		if node is not None:
+			scene.removeNode( node )
+
+@command
+def setAttr( attr, *values, **kwargs ):
+	node_name, attr_name = attr.split( ".", 1 )
+	node = scene.find( node_name )
+	value = list( values ) if len( values ) > 1 else values[0]
+	if node is None:
+		scene.attrs[attr] = value
+	elif attr_name in ( "translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ" ):
+		node.attrs[ attr_name[:-1] ][ "XYZ".index( attr_name[-1] ) ] = float( value )
+	else:
+		node.attrs[attr_name] = value
+
+@command
+def getAttr( attr, **kwargs ):
+	node_name, attr_name = attr.split( ".", 1 )
+	node = scene.find( node_name )
+	if node is None:
+		return scene.attrs[attr]
+	if attr_name in ( "translate", "rotate", "scale" ):
+		return [ tuple( node.attrs[attr_name] ) ]
+	if attr_name in ( "translateX", "translateY", "translateZ", "rotateX", "rotateY", "rotateZ", "scaleX", "scaleY", "scaleZ" ):
+		return node.attrs[ attr_name[:-1] ][ "XYZ".index( attr_name[-1] ) ]
+	return node.attrs[attr_name]
+
+@command
+def xform( *args, **kwargs ):
+
+	items = targets( args )
+	world_space = flag( kwargs, "worldSpace", "ws", False )
+
+	if flag( kwargs, "query", "q" ):
+
+		# the positions of components are the flat list of the points of their vertices
+		groups, objects = parseComponents( items )
+		if groups:
+			if not flag( kwargs, "translation", "t" ):
+				raise EmulatorUnsupportedError( "xform query of components with " + str( sorted( kwargs ) ) )
+			points = list()
+			for shape, kinds in groups.items():
+				verts = np.unique( np.concatenate( [ convertComponents( shape.mesh, kind, ids, "vtx" ) for kind, ids in kinds.items() ] ) )
+				points.append( transformPoints( shape.mesh.points[verts], shape.parent.worldMatrix() ) if world_space else shape.mesh.points[verts] )
+			return np.concatenate( points ).ravel().tolist()
+
+		node = scene.node( items[0] )
+		if flag( kwargs, "matrix", "m" ):
+			return ( node.worldMatrix() if world_space else node.localMatrix() ).ravel().tolist()
+		if flag( kwargs, "translation", "t" ):
+			if world_space:
+				return transformPoints( np.array( [ node.attrs["translate"] ] ), node.parentMatrix() )[0].tolist()
+			return list( node.attrs["translate"] )
+		if flag( kwargs, "rotation", "ro" ):
+			return list( node.attrs["rotate"] )
+		if flag( kwargs, "scale", "s" ):
+			return list( node.attrs["scale"] )
+		for long_name, short_name, attrs in ( ( "pivots", "piv", ( "rotatePivot", "scalePivot" ) ), ( "rotatePivot", "rp", ( "rotatePivot", ) ), ( "scalePivot", "sp", ( "scalePivot", ) ) ):
+			if flag( kwargs, long_name, short_name ):
+				points = np.array( [ node.attrs[a] for a in attrs ] )
+				if world_space:
+					points = transformPoints( points, node.worldMatrix() )
+				return points.ravel().tolist()
+		if flag( kwargs, "boundingBox", "bb" ):
+			return node.boundingBox( None if world_space else np.linalg.inv( node.worldMatrix() ) ) or [ 0.0 ] * 6
+		raise EmulatorUnsupportedError( "xform query of " + str( sorted( kwargs ) ) )
+
+	relative = flag( kwargs, "relative", "r", False )
+
+	for item in items:
+		node = scene.node( item )
+		a = node.attrs
+
+		translate = flag( kwargs, "translation", "t" )
+		if translate is not None:
+			translate = np.asarray( translate, dtype=np.float64 )
+			if world_space:
+				# a world position or offset, seen from the parent
+				parent_matrix = np.linalg.inv( node.parentMatrix() )
+				translate = np.dot( translate, parent_matrix[:3, :3] ) if relative else transformPoints( translate[np.newaxis], parent_matrix )[0]
+			a["translate"] = ( translate + ( np.asarray( a["translate"] ) if relative else 0 ) ).tolist()
+
+		rotate = flag( kwargs, "rotation", "ro" )
+		if rotate is not None:
+			rotate = [ float( x ) for x in rotate ]
+			if relative:
+				rotate = [ x + y for x, y in zip( a["rotate"], rotate ) ]
+			if world_space and node.parent is not None:
+				parent_rotation = node.parent.worldMatrix()[:3, :3]
+				parent_rotation = parent_rotation / np.linalg.norm( parent_rotation, axis=1 )[:, np.newaxis]
+				matrix = np.identity( 4 )
+				matrix[:3, :3] = np.dot( rotationMatrix( rotate ), parent_rotation.T )
+				rotate = decomposeMatrix( matrix )[1]
+			a["rotate"] = rotate
+
+		scale = flag( kwargs, "scale", "s" )
+		if scale is not None:
+			scale = [ float( x ) for x in scale ]
+			if relative:
+				scale = [ x * y for x, y in zip( a["scale"], scale ) ]
+			if world_space and node.parent is not None:
+				# each world axis gets the length asked for through the rotation of the node and the
+				# parent, with z negated under a mirrored parent so that the world is not mirrored
+				axes = np.dot( rotationMatrix( a["rotate"] ), node.parent.worldMatrix()[:3, :3] )
+				parent_scale = np.linalg.norm( axes, axis=1 )
+				if np.linalg.det( axes ) < 0:
+					parent_scale[2] = -parent_scale[2]
+				scale = ( np.asarray( scale ) / parent_scale ).tolist()
+			a["scale"] = scale
+
+		matrix = flag( kwargs, "matrix", "m" )
+		if matrix is not None:
+			matrix = np.asarray( matrix, dtype=np.float64 ).reshape( 4, 4 )
+			if world_space:
+				node.setWorldMatrix( matrix )
+			else:
+				node.setLocalMatrix( matrix )
+
+		# pivots are points in object space, world space pivots are taken back through the world matrix
+		for long_name, short_name, attrs in ( ( "pivots", "piv", ( "rotatePivot", "scalePivot" ) ), ( "rotatePivot", "rp", ( "rotatePivot", ) ), ( "scalePivot", "sp", ( "scalePivot", ) ) ):
+			pivot = flag( kwargs, long_name, short_name )
+			if pivot is None:
+				continue
+			pivot = np.asarray( pivot, dtype=np.float64 )[:3]
+			if world_space:
+				pivot = transformPoints( pivot[np.newaxis], np.linalg.inv( node.worldMatrix() ) )[0]
+			node.setPivots( pivot if "rotatePivot" in attrs else None, pivot if "scalePivot" in attrs else None )
+
+		if flag( kwargs, "centerPivots", "cp" ):
+			bbox = node.boundingBox( np.linalg.inv( node.worldMatrix() ) )
+			if bbox is not None:
+				center = [ ( bbox[i] + bbox[i + 3] ) / 2 for i in range( 3 ) ]
+				node.setPivots( center, center )
+
+@command
+def exactWorldBoundingBox( *args, **kwargs ):
+
+	# the world bounding box around everything given, zeros when there is nothing to bound
+	ignore_invisible = flag( kwargs, "ignoreInvisible", "ii", False )
+	boxes = [ scene.node( item ).boundingBox( ignore_invisible=ignore_invisible ) for item in targets( args ) ]
+	boxes = np.array( [ b for b in boxes if b is not None ] )
+	if len( boxes ) == 0:
+		return [ 0.0 ] * 6
+	return boxes[:, :3].min( axis=0 ).tolist() + boxes[:, 3:].max( axis=0 ).tolist()
+
+@command
+def makeIdentity( *args, **kwargs ):
+
+	channels = [ flag( kwargs, long_name, short_name, False ) for long_name, short_name in ( ( "translate", "t" ), ( "rotate", "r" ), ( "scale", "s" ) ) ]
+	if not any( channels ):
+		channels = [ True, True, True ]
+
+	for item in targets( args ):
+		node = scene.node( item )
+		if not flag( kwargs, "apply", "a" ):
+			for attr, value, reset in zip( ( "translate", "rotate", "scale" ), ( 0.0, 0.0, 1.0 ), channels ):
+				if reset:
+					node.attrs[attr] = [ value ] * 3
+		elif all( channels ):
+			node.freeze()
+		else:
+			raise EmulatorUnsupportedError( "makeIdentity -apply of only some of translate, rotate and scale" )
+
+# Hierarchy
+
+def parentNode( node, parent, keep_world=True ):
+	if node.parent is parent:
+		return
+	world = node.worldMatrix()
+	scene.reparent( node, parent )
+	if keep_world and node.type == "transform":
+		node.setWorldMatrix( world )
+
+@command
+def group( *args, **kwargs ):
+
+	nodes = list()
+	if not flag( kwargs, "empty", "em" ):
+		nodes = [ scene.node( item ) for item in targets( args ) ]
+
+	# the group goes under the parent the grouped nodes share, unless one is given
+	parent = flag( kwargs, "parent", "p" )
+	if parent is not None:
+		parent = scene.node( parent )
+	elif nodes and not flag( kwargs, "world", "w" ) and len( set( n.parent for n in nodes ) ) == 1:
+		parent = nodes[0].parent
+
+	grp = scene.createNode( "transform", flag( kwargs, "name", "n" ) or "group1", parent )
+	for node in nodes:
+		parentNode( node, grp )
+
+	scene.selection = [ grp.path() ]
+	return scene.displayName( grp, False )
+
+@command
+def parent( *args, **kwargs ):
+
+	items = targets( args )
+	if flag( kwargs, "world", "w" ):
+		children, new_parent = items, None
+	else:
+		children, new_parent = items[:-1], scene.node( items[-1] )
+
+	result = list()
+	for child in children:
+		node = scene.node( child )
+		parentNode( node, new_parent, not flag( kwargs, "relative", "r" ) )
+		result.append( scene.displayName( node, False ) )
+
+	return result
+
+@command
+def reorder( *args, **kwargs ):
+	for item in targets( args ):
+		node = scene.node( item )
+		siblings = scene.siblings( node.parent )
+		index = siblings.index( node )
+		siblings.remove( node )
+		if flag( kwargs, "front", "f" ):
+			index = 0
+		elif flag( kwargs, "back", "b" ):
+			index = len( siblings )
+		else:
+			index = min( max( index + int( flag( kwargs, "relative", "r", 0 ) ), 0 ), len( siblings ) )
+		siblings.insert( index, node )
+
+@command
+def duplicate( *args, **kwargs ):
+	name = flag( kwargs, "name", "n" )
+	copies = [ scene.duplicate( scene.node( item ), name ) for item in targets( args ) ]
+	scene.selection = [ c.path() for c in copies ]
+	return [ scene.displayName( c, False ) for c in copies ]
+
+@command
+def spaceLocator( *args, **kwargs ):
+	transform = scene.createNode( "transform", flag( kwargs, "name", "n" ) or "locator1" )
+	shape = scene.createNode( "locator", transform.name.replace( "locator", "locatorShape" ) if "locator" in transform.name else transform.name + "Shape", transform )
+	for axis in "XYZ":
+		shape.attrs["localScale" + axis] = 1.0
+	transform.attrs["translate"] = [ float( x ) for x in flag( kwargs, "position", "p", ( 0, 0, 0 ) ) ]
+	scene.selection = [ transform.path() ]
+	return [ scene.displayName( transform, False ) ]
+
+# Files
+
+@command
+def file( *args, **kwargs ):
+
+	path = args[0] if args else None
+
+	if flag( kwargs, "query", "q" ):
+		if flag( kwargs, "sceneName", "sn" ):
+			return scene.filename or ""
+		raise EmulatorUnsupportedError( "file query of " + str( sorted( kwargs ) ) )
+
+	if flag( kwargs, "new", "new" ):
+		scene.reset()
+		return ""
+	if flag( kwargs, "open", "o" ):
+		scene.load( path )
+		return path
+	if flag( kwargs, "i", "i" ) or flag( kwargs, "import", "import" ):
+		scene.load( path, merge=True )
+		return path
+	if flag( kwargs, "rename", "rn" ):
+		scene.filename = flag( kwargs, "rename", "rn" )
+		return scene.filename
+	if flag( kwargs, "save", "s" ):
+		if not scene.filename:
+			raise RuntimeError( "The scene has no name, rename it before saving." )
+		scene.save( scene.filename )
+		return scene.filename
+	if flag( kwargs, "exportAll", "ea" ):
+		scene.save( path )
+		return path
+
+	raise EmulatorUnsupportedError( "file with " + str( sorted( kwargs ) ) )
+
+# UV sets
+
+@command
+def polyUVSet( *args, **kwargs ):
+
+	shapes = meshesOf( args )
+	uv_set = flag( kwargs, "uvSet", "uvs" )
+
+	if flag( kwargs, "query", "q" ):
+		mesh = shapes[0].mesh
+		if flag( kwargs, "allUVSets", "auv" ):
+			return list( mesh.uv_sets.keys() )
+		if flag( kwargs, "currentUVSet", "cuv" ):
+			return [ mesh.current_uv_set ]
+		return None
+
+	for shape in shapes:
+		mesh = shape.mesh
+		if flag( kwargs, "create", "cr" ):
+			mesh.addUVSet( uv_set )
+		elif flag( kwargs, "delete", "d" ):
+			del mesh.uv_sets[uv_set]
+			if mesh.current_uv_set == uv_set:
+				mesh.current_uv_set = next( iter( mesh.uv_sets ), None )
+		elif flag( kwargs, "rename", "rn" ):
+			new_name = flag( kwargs, "newUVSet", "nuv" )
+			mesh.uv_sets = collections.OrderedDict( ( new_name if k == uv_set else k, v ) for k, v in mesh.uv_sets.items() )
+			if mesh.current_uv_set == uv_set:
+				mesh.current_uv_set = new_name
+		elif flag( kwargs, "currentUVSet", "cuv" ):
+			mesh.uvSet( uv_set )
+			mesh.current_uv_set = uv_set
+
+@command
+def polyMapDel( *args, **kwargs ):
+	for shape in meshesOf( args ):
+		mesh = shape.mesh
+		mesh.uv_sets[ mesh.current_uv_set ] = [ np.zeros( 0 ), np.zeros( 0 ), np.full( len( mesh.face_verts ), -1, dtype=np.int64 ) ]
+
+@command
+def polyCopyUV( *args, **kwargs ):
+	for shape in meshesOf( args ):
+		mesh = shape.mesh
+		source = flag( kwargs, "uvSetNameInput", "uvi" ) or mesh.current_uv_set
+		dest = flag( kwargs, "uvSetName", "uvs" ) or mesh.current_uv_set
+		u, v, fv_uvs = mesh.uvSet( source )
+		mesh.uv_sets[dest] = [ u.copy(), v.copy(), fv_uvs.copy() ]
+
+@command
+def transferAttributes( *args, **kwargs ):
+
+	# uvs by topology only: the target gets the uvs of the source face-vertex by face-vertex
+	if not flag( kwargs, "transferUVs", "uvs" ) or flag( kwargs, "sampleSpace", "spa" ) != 4:
+		raise EmulatorUnsupportedError( "transferAttributes with " + str( sorted( kwargs ) ) )
+
+	shapes = meshesOf( args )
+	source = shapes[0].mesh
+	u, v, fv_uvs = source.uvSet( flag( kwargs, "sourceUvSet", "suv" ) )
+	for shape in shapes[1:]:
+		mesh = shape.mesh
+		if not np.array_equal( mesh.face_counts, source.face_counts ):
+			raise RuntimeError( "transferAttributes: the topology of " + shape.name + " does not match the source" )
+		uv_set = flag( kwargs, "targetUvSet", "tuv" ) or mesh.current_uv_set
+		if uv_set not in mesh.uv_sets:
+			mesh.addUVSet( uv_set )
+		mesh.uv_sets[uv_set] = [ u.copy(), v.copy(), fv_uvs.copy() ]
+
+	return [ "transferAttributes1" ]
+
+def planarProject( mesh, face_mask, uv_set ):
+
+	# one uv per point from its x and y, fitted to the zero to one range
+	used = np.unique( mesh.face_verts[ np.repeat( face_mask, mesh.face_counts ) ] )
+	points = mesh.points[used]
+	low = points.min( axis=0 ) if len( points ) else np.zeros( 3 )
+	size = max( ( points.max( axis=0 ) - low )[:2].max() if len( points ) else 1.0, 1e-12 )
+	u, v, fv_uvs = mesh.uvSet( uv_set )
+	remap = np.full( mesh.num_verts, -1, dtype=np.int64 )
+	remap[used] = np.arange( len( used ) ) + len( u )
+	mapped = np.repeat( face_mask, mesh.face_counts )
+	fv_uvs = fv_uvs.copy()
+	fv_uvs[mapped] = remap[ mesh.face_verts[mapped] ]
+	u = np.concatenate( ( u, ( points[:, 0] - low[0] ) / size ) )
+	v = np.concatenate( ( v, ( points[:, 1] - low[1] ) / size ) )
+	mesh.uv_sets[ uv_set or mesh.current_uv_set ] = [ u, v, fv_uvs ]
+	mesh.compact()
+
+@command
+def polyProjection( *args, **kwargs ):
+	groups, objects = parseComponents( targets( args ) )
+	for shape, kinds in groups.items():
+		face_mask = np.zeros( shape.mesh.num_faces, dtype=bool )
+		face_mask[ kinds.get( "f", np.arange( shape.mesh.num_faces ) ) ] = True
+		planarProject( shape.mesh, face_mask, flag( kwargs, "uvSetName", "uvs" ) )
+	for item in objects:
+		shape = scene.meshNode( item )
+		planarProject( shape.mesh, np.ones( shape.mesh.num_faces, dtype=bool ), flag( kwargs, "uvSetName", "uvs" ) )
+
+@command
+def polyPlanarProjection( *args, **kwargs ):
+	for shape in meshesOf( args ):
+		planarProject( shape.mesh, np.ones( shape.mesh.num_faces, dtype=bool ), None )
+
+@command
+def polyForceUV( *args, **kwargs ):
+
+	# unitize: every face gets its own uvs on the corners of the unit square
+	for shape in meshesOf( args ):
+		mesh = shape.mesh
+		offsets = mesh.faceOffsets()
+		corner = np.arange( len( mesh.face_verts ) ) - np.repeat( offsets[:-1], mesh.face_counts )
+		angle = np.radians( 225.0 ) + 2 * np.pi * corner / np.repeat( mesh.face_counts, mesh.face_counts )
+		u = np.clip( np.round( np.cos( angle ) * math.sqrt( 2 ) / 2 + 0.5, 12 ), 0, 1 )
+		v = np.clip( np.round( np.sin( angle ) * math.sqrt( 2 ) / 2 + 0.5, 12 ), 0, 1 )
+		mesh.uv_sets[ mesh.current_uv_set ] = [ u, v, np.arange( len( mesh.face_verts ) ) ]
+
+def sewUVs( mesh, edges ):
+
+	# merge the uvs on both sides of the edges that are shared by two mapped faces
+	u, v, fv_uvs = mesh.uvSet()
+	edge_verts, fv_edges = mesh.edges()
+	nxt = mesh.faceVertNext()
+	edge_mask = np.zeros( len( edge_verts ), dtype=bool )
+	edge_mask[edges] = True
+
+	fvs = np.flatnonzero( edge_mask[fv_edges] & ( fv_uvs >= 0 ) & ( fv_uvs[nxt] >= 0 ) )
+	order = np.argsort( fv_edges[fvs], kind="stable" )
+	fvs = fvs[order]
+	same = fv_edges[ fvs[:-1] ] == fv_edges[ fvs[1:] ]
+	i = fvs[:-1][same]
+	j = fvs[1:][same]
+
+	labels = connectedLabels( len( u ), np.concatenate( ( fv_uvs[i], fv_uvs[ nxt[i] ] ) ), np.concatenate( ( fv_uvs[ nxt[j] ], fv_uvs[j] ) ) )
+	roots, new_ids = np.unique( labels, return_inverse=True )
+	mesh.uv_sets[ mesh.current_uv_set ] = [ u[roots], v[roots], np.where( fv_uvs >= 0, new_ids[ np.maximum( fv_uvs, 0 ) ], -1 ) ]
+
+@command
+def polyMapSewMove( *args, **kwargs ):
+	groups, objects = parseComponents( targets( args ) )
+	for shape, kinds in groups.items():
+		sewUVs( shape.mesh, kinds.get( "e", np.zeros( 0, dtype=np.int64 ) ) )
+	for item in objects:
+		mesh = scene.meshNode( item ).mesh
+		sewUVs( mesh, np.arange( len( mesh.edges()[0] ) ) )
+
+def layoutUVs( mesh ):
+
+	# fit all of the uvs into the zero to one square
+	u, v, fv_uvs = mesh.uvSet()
+	if len( u ) == 0:
+		return
+	size = max( u.max() - u.min(), v.max() - v.min(), 1e-12 )
+	mesh.uv_sets[ mesh.current_uv_set ] = [ ( u - u.min() ) / size, ( v - v.min() ) / size, fv_uvs ]
+
+@command
+def polyLayoutUV( *args, **kwargs ):
+	for shape in meshesOf( args ):
+		layoutUVs( shape.mesh )
+
+@command
+def polyMultiLayoutUV( *args, **kwargs ):
+	for shape in meshesOf( args ):
+		layoutUVs( shape.mesh )
+
+@command
+def polyListComponentConversion( *args, **kwargs ):
+
+	kind = None
+	for long_name, short_name, k in ( ( "toVertex", "tv", "vtx" ), ( "toEdge", "te", "e" ), ( "toFace", "tf", "f" ), ( "toUV", "tuv", "map" ) ):
+		if flag( kwargs, long_name, short_name ):
+			kind = k
+	if kind is None:
+		return targets( args )
+	internal = flag( kwargs, "internal", "in", False )
+
+	groups, objects = parseComponents( targets( args ), by_name=True )
+
+	result = list()
+	for obj, kinds in groups.items():
+		mesh = scene.meshNode( obj ).mesh
+		indices = np.concatenate( [ convertComponents( mesh, k, ids, kind, internal ) for k, ids in kinds.items() ] )
+		result.extend( componentNames( obj, kind, indices ) )
+
+	for item in objects:
+		shape = scene.node( item ).meshShape()
+		if shape is None:
+			continue
+		count = componentCount( shape.mesh, kind )
+		if count:
+			result.extend( componentNames( item, kind, np.arange( count ) ) )
+
+	return result
+
+def uvShellLabels( mesh ):
+
+	# label the uvs by the uv shell they belong to
+	fv_uvs = mesh.uvSet()[2]
+	nxt = mesh.faceVertNext()
+	mapped = ( fv_uvs >= 0 ) & ( fv_uvs[nxt] >= 0 )
+	return connectedLabels( len( mesh.uvSet()[0] ), fv_uvs[mapped], fv_uvs[ nxt[mapped] ] )
+
+def editUVs( *args, **kwargs ):
+
+	# The uvs the components convert to, on each mesh. Returns { shape: uv ids }.
+	groups, objects = parseComponents( targets( args ) )
+	uvs = collections.OrderedDict()
+	for shape, kinds in groups.items():
+		uvs[shape] = np.unique( np.concatenate( [ convertComponents( shape.mesh, k, ids, "map" ) for k, ids in kinds.items() ] ) )
+	for item in objects:
+		shape = scene.meshNode( item )
+		uvs[shape] = np.arange( len( shape.mesh.uvSet()[0] ) )
+	return uvs
+
+def moveUVs( mesh, ids, **kwargs ):
+
+	# scale, then rotate about the pivot, then move, like polyEditUV
+	uv_set = mesh.uvSet( flag( kwargs, "uvSetName", "uvs" ) )
+	u = uv_set[0][ids]
+	v = uv_set[1][ids]
+	pivot_u = flag( kwargs, "pivotU", "pu", 0.0 )
+	pivot_v = flag( kwargs, "pivotV", "pv", 0.0 )
+
+	u = ( u - pivot_u ) * flag( kwargs, "scaleU", "su", 1.0 ) + pivot_u
+	v = ( v - pivot_v ) * flag( kwargs, "scaleV", "sv", 1.0 ) + pivot_v
+
+	angle = math.radians( flag( kwargs, "angle", "a", 0.0 ) )
+	if angle:
+		cos_a = round( math.cos( angle ), 12 )
+		sin_a = round( math.sin( angle ), 12 )
+		u, v = ( u - pivot_u ) * cos_a - ( v - pivot_v ) * sin_a + pivot_u, ( u - pivot_u ) * sin_a + ( v - pivot_v ) * cos_a + pivot_v
+
+	move_u = flag( kwargs, "uValue", "u" )
+	move_v = flag( kwargs, "vValue", "v" )
+	if flag( kwargs, "relative", "r", True ):
+		u = u + ( move_u or 0.0 )
+		v = v + ( move_v or 0.0 )
+	else:
+		u = u if move_u is None else np.full( len( u ), float( move_u ) )
+		v = v if move_v is None else np.full( len( v ), float( move_v ) )
+
+	uv_set[0] = uv_set[0].copy()
+	uv_set[1] = uv_set[1].copy()
+	uv_set[0][ids] = u
+	uv_set[1][ids] = v
+
+@command
+def polyInfo( *args, **kwargs ):
+
+	# only edgeToVertex, one line per edge like Maya's "EDGE      0:      0      1  Hard"
+	if not flag( kwargs, "edgeToVertex", "ev" ):
+		raise EmulatorUnsupportedError( "polyInfo of " + str( sorted( kwargs ) ) )
+	groups, objects = parseComponents( targets( args ) )
+	lines = list()
+	for shape, kinds in groups.items():
+		edge_verts = shape.mesh.edges()[0]
+		for e in kinds.get( "e", [] ):
+			lines.append( "EDGE %6d: %6d %6d  Hard\n" % ( e, edge_verts[e][0], edge_verts[e][1] ) )
+	return lines
+
+@command
+def polyEditUV( *args, **kwargs ):
+
+	uvs = editUVs( *args )
+
+	if flag( kwargs, "query", "q" ):
+		values = list()
+		for shape, ids in uvs.items():
+			u, v, fv_uvs = shape.mesh.uvSet( flag( kwargs, "uvSetName", "uvs" ) )
+			values.extend( np.stack( ( u[ids], v[ids] ), axis=1 ).ravel().tolist() )
+		return values
+
+	for shape, ids in uvs.items():
+		moveUVs( shape.mesh, ids, **kwargs )
+
+@command
+def polyEditUVShell( *args, **kwargs ):
+
+	# like polyEditUV on every uv of the shells the components touch
+	for shape, ids in editUVs( *args ).items():
+		labels = uvShellLabels( shape.mesh )
+		moveUVs( shape.mesh, np.flatnonzero( np.isin( labels, labels[ids] ) ), **kwargs )
+
+# Modelling
+
+@command
+def polySeparate( *args, **kwargs ):
+
+	node = scene.node( flattenArgs( args )[0] )
+	shape = node.meshShape()
+	mesh = shape.mesh
+	face_shells = mesh.faceShells()
+	num_shells = face_shells.max() + 1 if len( face_shells ) else 0
+	if num_shells < 2:
+		raise RuntimeError( "polySeparate works only on polygonal objects with more than one piece" )
+
+	# the original transform becomes the group of the pieces
+	node.children.remove( shape )
+	pieces = list()
+	for i in range( num_shells ):
+		transform = scene.createNode( "transform", "polySurface1", node )
+		piece = scene.createNode( "mesh", transform.name + "Shape", transform )
+		piece.mesh = mesh.subset( face_shells == i )
+		pieces.append( transform.path() )
+
+	# like the other commands that make objects, it selects them
+	scene.selection = list( pieces )
+	return pieces + [ scene.createNode( "polySeparate", "polySeparate1" ).name ]
+
+@command
+def polyCloseBorder( *args, **kwargs ):
+
+	# fill every loop of the given border edges with one face
+	groups, objects = parseComponents( targets( args ) )
+	groups = list( groups.items() ) + [ ( scene.meshNode( o ), None ) for o in objects ]
+
+	for shape, kinds in groups:
+		mesh = shape.mesh
+		edge_verts, fv_edges = mesh.edges()
+		uses = np.bincount( fv_edges, minlength=len( edge_verts ) )
+		border = uses == 1
+		if kinds is not None:
+			selected = np.zeros( len( edge_verts ), dtype=bool )
+			selected[ kinds.get( "e", [] ) ] = True
+			border &= selected
+
+		# the new faces run against the direction of the border face-vertices
+		fvs = np.flatnonzero( border[fv_edges] )
+		nxt = mesh.faceVertNext()
+		successor = dict( zip( mesh.face_verts[ nxt[fvs] ].tolist(), mesh.face_verts[fvs].tolist() ) )
+
+		faces = list()
+		visited = set()
+		for start in successor:
+			if start in visited:
+				continue
+			loop = list()
+			vert = start
+			while vert in successor and vert not in visited:
+				visited.add( vert )
+				loop.append( vert )
+				vert = successor[vert]
+			if len( loop ) >= 3 and vert == start:
+				faces.append( loop )
+		mesh.appendFaces( faces )
+
+@command
+def polyMergeVertex( *args, **kwargs ):
+
+	# merge the points of each set of components into their center
+	groups, objects = parseComponents( targets( args ) )
+
+	for shape, kinds in groups.items():
+		mesh = shape.mesh
+		verts = list()
+		if "vtx" in kinds:
+			verts.append( kinds["vtx"] )
+		if "f" in kinds:
+			fv_mask = np.isin( mesh.faceVertFaces(), kinds["f"] )
+			verts.append( mesh.face_verts[fv_mask] )
+		if "e" in kinds:
+			verts.append( mesh.edges()[0][ kinds["e"] ].ravel() )
+		verts = np.unique( np.concatenate( verts ) )
+		if len( verts ) < 2:
+			continue
+
+		target = verts[0]
+		mesh.points[target] = mesh.points[verts].mean( axis=0 )
+		remap = np.arange( mesh.num_verts )
+		remap[verts] = target
+		mesh.face_verts = remap[ mesh.face_verts ]
+
+		# drop the face-vertices that now repeat the next one
+		keep = mesh.face_verts != mesh.face_verts[ mesh.faceVertNext() ]
+		mesh.keepFaceVerts( keep )
+
+@command
+def polyUnite( *args, **kwargs ):
+
+	# combine every mesh at or below the targets in world space into a new object at the root
+	shapes = list()
+	for item in targets( args ):
+		node = scene.node( item )
+		for n in [ node ] + list( node.descendants() ):
+			if n.mesh is not None and not n.intermediate and n not in shapes:
+				shapes.append( n )
+	if len( shapes ) < 2:
+		raise RuntimeError( "polyUnite needs at least two meshes to combine" )
+
+	transform = scene.createNode( "transform", flag( kwargs, "name", "n" ) or "polySurface1" )
+	shape = scene.createNode( "mesh", transform.name + "Shape", transform )
+	shape.mesh = MeshData.merged( [ s.mesh for s in shapes ], [ s.parent.worldMatrix() for s in shapes ] )
+
+	# the original objects go away with their meshes, their parents stay
+	for s in shapes:
+		obj = s.parent
+		scene.removeNode( s )
+		if not obj.children:
+			scene.removeNode( obj )
+
+	if flag( kwargs, "centerPivot", "cp" ):
+		xform( transform.path(), centerPivots=True )
+
+	scene.selection = [ transform.path() ]
+	return [ scene.displayName( transform, False ), scene.createNode( "polyUnite", "polyUnite1" ).name ]
+
+@command
+def polyColorPerVertex( *args, **kwargs ):
+
+	# paint the components, or the whole mesh, into the current color set
+	groups, objects = parseComponents( targets( args ) )
+	painted = [ ( shape, np.concatenate( [ convertComponents( shape.mesh, k, ids, "vtx" ) for k, ids in kinds.items() ] ) ) for shape, kinds in groups.items() ]
+	painted += [ ( scene.meshNode( item ), None ) for item in objects ]
+
+	for shape, verts in painted:
+		mesh = shape.mesh
+		if mesh.current_color_set is None:
+			mesh.current_color_set = "colorSet1"
+			mesh.color_sets[ mesh.current_color_set ] = np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( len( mesh.face_verts ), 1 ) )
+		colors = mesh.color_sets[ mesh.current_color_set ]
+		fvs = np.arange( len( mesh.face_verts ) ) if verts is None else np.flatnonzero( np.isin( mesh.face_verts, verts ) )
+		# relative colors are added to the ones there
+		keep = 1.0 if flag( kwargs, "relative", "rel", False ) else 0.0
+		rgb = flag( kwargs, "rgb", "rgb" )
+		if rgb is not None:
+			colors[fvs, :3] = colors[fvs, :3] * keep + rgb
+		for channel, long_name, short_name in ( ( 0, "red", "r" ), ( 1, "green", "g" ), ( 2, "blue", "b" ), ( 3, "alpha", "a" ) ):
+			value = flag( kwargs, long_name, short_name )
+			if value is not None:
+				colors[fvs, channel] = colors[fvs, channel] * keep + value
+
+################################################################################
+## OpenMaya
+################################################################################
+
+class MSpace( object ):
+	kTransform = 1
+	kObject = 2
+	kWorld = 4
+
+def MColor( color=( 0.0, 0.0, 0.0, 1.0 ) ):
+	return tuple( float( c ) for c in color )
+
+def MColorArray( colors=() ):
+	return list( colors )
+
+def checkApiType( value, api_type ):
+
+	# OpenMaya only takes its own objects, so a stand-in ( a profiler proxy ) is refused as it is in Maya
+	if not isinstance( value, api_type ):
+		raise TypeError( "an " + api_type.__name__ + " is required, not " + type( value ).__name__ )
+
+def MVector( vector=( 0.0, 0.0, 0.0 ) ):
+	return tuple( float( c ) for c in vector )
+
+class MObject( object ):
+
+	def __init__( self, node=None ):
+		self.dag_node = node
+
+	def isNull( self ):
+		return self.dag_node is None
+
+class MPxCommand( object ):
+
+	def __init__( self ):
+		pass
+
+	def isUndoable( self ):
+		return False
+
+class MFnPlugin( object ):
+
+	def __init__( self, plugin=None, vendor="", version="" ):
+		pass
+
+	def registerCommand( self, name, creator ):
+
+		# the command is added to maya.cmds, and goes on the undo queue when it is undoable
+		def runCommand( *args, **kwargs ):
+			command_object = creator()
+			command_object.doIt( list( args ) )
+			if command_object.isUndoable():
+				recordUndo( command_object )
+
+		runCommand.__name__ = name
+		setattr( sys.modules["maya.cmds"], name, runCommand )
+
+	def deregisterCommand( self, name ):
+		delattr( sys.modules["maya.cmds"], name )
+
+
+class MObjectHandle( object ):
+
+	def __init__( self, mobject ):
+		checkApiType( mobject, MObject )
+		self.dag_node = mobject.dag_node
+
+	def isValid( self ):
+
+		# the node is still in the scene
+		node = self.dag_node
+		while node.parent is not None:
+			if node not in node.parent.children:
+				return False
+			node = node.parent
+		return node in scene.roots or node in scene.dependency_nodes
+
+	def isAlive( self ):
+		return self.isValid()
+
+class MUuid( object ):
+
+	def __init__( self, value ):
+		self.value = value
+
+	def asString( self ):
+		return self.value
+
+class MFnDependencyNode( object ):
+
+	def __init__( self, mobject ):
+		checkApiType( mobject, MObject )
+		self.dag_node = mobject.dag_node
+
+	def name( self ):
+		return self.dag_node.name
+
+	def uuid( self ):
+		return MUuid( self.dag_node.uuid )
+
+	@property
+	def typeName( self ):
+		return self.dag_node.type
+
+class MFn( object ):
+	kInvalid = 0
+	kTransform = 110
+	kMesh = 296
+
+	# the node types each function set type takes in, derived types included
+	TYPES = { kTransform: ( "transform", "joint" ), kMesh: ( "mesh", ) }
+
+class MItDag( object ):
+
+	kDepthFirst = 0
+
+	def __init__( self, traversal=kDepthFirst, filter_type=MFn.kInvalid ):
+		self.reset( None, traversal, filter_type )
+
+	def reset( self, root=None, traversal=kDepthFirst, filter_type=MFn.kInvalid ):
+
+		# the nodes at or below the root ( the whole scene without one ), depth first, that pass the filter
+		if root is not None:
+			checkApiType( root, MDagPath )
+		nodes = [ root.dag_node ] + list( root.dag_node.descendants() ) if root is not None else list( scene.dagNodes() )
+		if filter_type != MFn.kInvalid:
+			nodes = [ n for n in nodes if n.type in MFn.TYPES[filter_type] ]
+		self.nodes = nodes
+		self.index = 0
+
+	def isDone( self ):
+		return self.index >= len( self.nodes )
+
+	def next( self ):
+		self.index += 1
+
+	def fullPathName( self ):
+		return self.nodes[ self.index ].path()
+
+	def currentItem( self ):
+		return MObject( self.nodes[ self.index ] )
+
+	def getPath( self ):
+		return MDagPath( self.nodes[ self.index ] )
+
+class MMessage( object ):
+
+	# callback id: the mesh it listens to
+	callbacks = dict()
+	next_id = 1
+
+	@classmethod
+	def register( cls, mesh, listener ):
+		callback_id = MMessage.next_id
+		MMessage.next_id += 1
+		mesh.listeners[callback_id] = listener
+		MMessage.callbacks[callback_id] = mesh
+		return callback_id
+
+	@staticmethod
+	def removeCallback( callback_id ):
+		mesh = MMessage.callbacks.pop( callback_id, None )
+		if mesh is None:
+			raise RuntimeError( "(kInvalidParameter): No callback with id " + str( callback_id ) )
+		mesh.listeners.pop( callback_id, None )
+
+class MNodeMessage( MMessage ):
+
+	@classmethod
+	def addNodeDirtyCallback( cls, mobject, func, client_data=None ):
+
+		checkApiType( mobject, MObject )
+		# only mesh shapes call back, whenever their points or topology change
+		mesh = mobject.dag_node.mesh
+		if mesh is None:
+			raise RuntimeError( "(kInvalidParameter): MayaSceneEmulator only calls back on meshes" )
+		return cls.register( mesh, lambda: func( mobject, client_data ) )
+
+class MDagPath( object ):
+
+	def __init__( self, node=None ):
+		self.dag_node = node
+
+	def extendToShape( self ):
+		node = self.dag_node
+		self.dag_node = node.meshShape() or ( node.shapes() or [ node ] )[0]
+		return self
+
+	def node( self ):
+		return MObject( self.dag_node )
+
+	def fullPathName( self ):
+		return self.dag_node.path()
+
+	def isVisible( self ):
+		return self.dag_node.isVisible()
+
+	def transform( self ):
+		return self.dag_node if self.dag_node.type == "transform" else self.dag_node.parent
+
+	def inclusiveMatrix( self ):
+		return MMatrix( self.transform().worldMatrix() )
+
+	def exclusiveMatrix( self ):
+		return MMatrix( self.transform().parentMatrix() )
+
+class MMatrix( object ):
+
+	def __init__( self, values=None ):
+		self.values = np.identity( 4 ) if values is None else np.array( values, dtype=np.float64 ).reshape( 4, 4 )
+
+	def getElement( self, row, col ):
+		return float( self.values[row, col] )
+
+	def inverse( self ):
+		return MMatrix( np.linalg.inv( self.values ) )
+
+	def transpose( self ):
+		return MMatrix( self.values.T )
+
+	def __mul__( self, other ):
+		checkApiType( other, MMatrix )
+		return MMatrix( np.dot( self.values, other.values ) )
+
+	def __getitem__( self, index ):
+		return float( self.values.ravel()[index] )
+
+	def __len__( self ):
+		return 16
+
+class MSelectionList( object ):
+
+	def __init__( self ):
+		self.nodes = list()
+
+	def add( self, name ):
+		self.nodes.append( scene.node( name ) )
+		return self
+
+	def length( self ):
+		return len( self.nodes )
+
+	def getDagPath( self, index ):
+		return MDagPath( self.nodes[index] )
+
+	def getDependNode( self, index ):
+		return MObject( self.nodes[index] )
+
+class MFnMesh( object ):
+
+	def __init__( self, dag_path ):
+		checkApiType( dag_path, MDagPath )
+		self.shape = dag_path.dag_node.meshShape()
+		if self.shape is None:
+			raise RuntimeError( "(kInvalidParameter): Object is incompatible with this method" )
+		self.mesh = self.shape.mesh
+
+	def fullPathName( self ):
+		return self.shape.path()
+
+	@property
+	def numVertices( self ):
+		return self.mesh.num_verts
+
+	@property
+	def numEdges( self ):
+		return len( self.mesh.edges()[0] )
+
+	@property
+	def numPolygons( self ):
+		return self.mesh.num_faces
+
+	@property
+	def numFaceVertices( self ):
+		return len( self.mesh.face_verts )
+
+	@property
+	def numColorSets( self ):
+		return len( self.mesh.color_sets )
+
+	@property
+	def numUVSets( self ):
+		return len( self.mesh.uv_sets )
+
+	def getPoints( self, space=MSpace.kObject ):
+		points = self.mesh.points
+		if space == MSpace.kWorld:
+			points = transformPoints( points, self.shape.parent.worldMatrix() )
+		return np.hstack( ( points, np.ones( ( len( points ), 1 ) ) ) ).tolist()
+
+	def setPoints( self, points, space=MSpace.kObject ):
+		points = np.array( points, dtype=np.float64 ).reshape( len( self.mesh.points ), -1 )[:, :3]
+		if space == MSpace.kWorld:
+			points = transformPoints( points, np.linalg.inv( self.shape.parent.worldMatrix() ) )
+		self.mesh.points = points
+		self.mesh.changed()
+
+	def getVertices( self ):
+		return self.mesh.face_counts.tolist(), self.mesh.face_verts.tolist()
+
+	def getEdgeVertices( self, edge ):
+		a, b = self.mesh.edges()[0][edge]
+		return ( int( a ), int( b ) )
+
+	def getUVSetNames( self ):
+		return list( self.mesh.uv_sets.keys() )
+
+	def currentUVSetName( self ):
+		return self.mesh.current_uv_set
+
+	def numUVs( self, uv_set=None ):
+		return len( self.mesh.uvSet( uv_set )[0] )
+
+	def getUVs( self, uv_set=None ):
+		u, v, fv_uvs = self.mesh.uvSet( uv_set )
+		return u.tolist(), v.tolist()
+
+	def setUVs( self, u, v, uv_set=None ):
+		uv = self.mesh.uvSet( uv_set )
+		if len( u ) != len( v ):
+			raise RuntimeError( "(kInvalidParameter): u and v arrays must have the same length" )
+		uv[0] = np.array( u, dtype=np.float64 )
+		uv[1] = np.array( v, dtype=np.float64 )
+
+	def getAssignedUVs( self, uv_set=None ):
+		fv_uvs = self.mesh.uvSet( uv_set )[2]
+		faces = self.mesh.faceVertFaces()
+		mapped = fv_uvs >= 0
+		face_mapped = np.bincount( faces, weights=mapped, minlength=self.mesh.num_faces ) == self.mesh.face_counts
+		counts = np.where( face_mapped, self.mesh.face_counts, 0 )
+		return counts.tolist(), fv_uvs[ np.repeat( face_mapped, self.mesh.face_counts ) ].tolist()
+
+	def assignUVs( self, uv_counts, uv_ids, uv_set=None ):
+		uv = self.mesh.uvSet( uv_set )
+		uv_counts = np.asarray( uv_counts, dtype=np.int64 )
+		if len( uv_counts ) != self.mesh.num_faces or np.any( ( uv_counts != 0 ) & ( uv_counts != self.mesh.face_counts ) ):
+			raise RuntimeError( "(kInvalidParameter): uv counts do not match the faces" )
+		fv_uvs = np.full( len( self.mesh.face_verts ), -1, dtype=np.int64 )
+		fv_uvs[ np.repeat( uv_counts > 0, self.mesh.face_counts ) ] = np.asarray( uv_ids, dtype=np.int64 )
+		uv[2] = fv_uvs
+
+	def createUVSet( self, name ):
+		self.mesh.addUVSet( name )
+		return name
+
+	def deleteUVSet( self, name ):
+		del self.mesh.uv_sets[name]
+		if self.mesh.current_uv_set == name:
+			self.mesh.current_uv_set = next( iter( self.mesh.uv_sets ), None )
+
+	def clearUVs( self, uv_set=None ):
+		uv = self.mesh.uvSet( uv_set )
+		uv[0] = np.zeros( 0 )
+		uv[1] = np.zeros( 0 )
+		uv[2] = np.full( len( self.mesh.face_verts ), -1, dtype=np.int64 )
+
+	def updateSurface( self ):
+		return None
+
+	def currentColorSetName( self ):
+		return self.mesh.current_color_set or ""
+
+	def createColorSet( self, name, clamped=True ):
+		self.mesh.color_sets[name] = np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( len( self.mesh.face_verts ), 1 ) )
+		return name
+
+	def setCurrentColorSetName( self, name ):
+		self.mesh.current_color_set = name
+
+	def deleteColorSet( self, name ):
+		del self.mesh.color_sets[name]
+		if self.mesh.current_color_set == name:
+			self.mesh.current_color_set = next( iter( self.mesh.color_sets ), None )
+
+	def getFaceVertexColors( self, color_set=None, default=None ):
+		colors = self.mesh.color_sets[ color_set or self.mesh.current_color_set ]
+		return [ tuple( c ) for c in colors.tolist() ]
+
+	def getVertexColors( self, color_set=None, default=None ):
+		colors = self.mesh.color_sets[ color_set or self.mesh.current_color_set ]
+		sums = np.zeros( ( self.mesh.num_verts, 4 ) )
+		np.add.at( sums, self.mesh.face_verts, colors )
+		counts = np.maximum( np.bincount( self.mesh.face_verts, minlength=self.mesh.num_verts ), 1 )
+		return [ tuple( c ) for c in ( sums / counts[:, np.newaxis] ).tolist() ]
+
+	def setFaceVertexColors( self, colors, face_ids, vert_ids ):
+		mesh = self.mesh
+		keys = mesh.faceVertFaces() * mesh.num_verts + mesh.face_verts
+		order = np.argsort( keys )
+		wanted = np.asarray( face_ids, dtype=np.int64 ) * mesh.num_verts + np.asarray( vert_ids, dtype=np.int64 )
+		fvs = order[ np.searchsorted( keys[order], wanted ) ]
+		mesh.color_sets[ mesh.current_color_set ][fvs] = np.array( colors, dtype=np.float64 ).reshape( -1, 4 )
+
+	def removeFaceVertexColors( self, face_ids, vert_ids ):
+		# there are no unset colors here, removed ones go back to the color a new color set starts with
+		self.setFaceVertexColors( [ ( 0.0, 0.0, 0.0, 1.0 ) ] * len( face_ids ), face_ids, vert_ids )
+
+	def setVertexColors( self, colors, vert_ids ):
+		mesh = self.mesh
+		vert_colors = np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( mesh.num_verts, 1 ) )
+		vert_colors[ np.asarray( vert_ids, dtype=np.int64 ) ] = np.array( colors, dtype=np.float64 ).reshape( -1, 4 )
+		mesh.color_sets[ mesh.current_color_set ] = vert_colors[ mesh.face_verts ]
+
+class MFnTransform( object ):
+
+	def __init__( self, dag_path ):
+		checkApiType( dag_path, MDagPath )
+		self.node = dag_path.transform()
+
+	def translation( self, space ):
+		translate = np.array( [ self.node.attrs["translate"] ], dtype=np.float64 )
+		if space == MSpace.kWorld:
+			translate = transformPoints( translate, self.node.parentMatrix() )
+		return MVector( translate[0] )
+
+	def rotationOrder( self ):
+		# the scene only rotates in xyz order
+		return MTransformationMatrix.kXYZ
+
+class MTransformationMatrix( object ):
+
+	kXYZ, kYZX, kZXY, kXZY, kYXZ, kZYX = range( 1, 7 )
+
+class MFnCamera( object ):
+
+	def __init__( self, dag_path ):
+		checkApiType( dag_path, MDagPath )
+		self.shape = dag_path.dag_node
+		if self.shape.type != "camera":
+			raise RuntimeError( "(kInvalidParameter): Object is incompatible with this method" )
+
+	def projectionMatrix( self ):
+
+		# an OpenGL style perspective projection for row vectors, fitted to the render resolution
+		a = self.shape.attrs
+		aspect = float( scene.attrs["defaultResolution.width"] ) / scene.attrs["defaultResolution.height"]
+		near = a["nearClipPlane"]
+		far = a["farClipPlane"]
+		scale_x = 1.0 / math.tan( math.radians( a["horizontalFieldOfView"] ) / 2 )
+		matrix = np.zeros( ( 4, 4 ) )
+		matrix[0, 0] = scale_x
+		matrix[1, 1] = scale_x * aspect
+		matrix[2, 2] = -( far + near ) / ( far - near )
+		matrix[2, 3] = -1.0
+		matrix[3, 2] = -2 * far * near / ( far - near )
+		return MMatrix( matrix )
+
+OM2_NAMES = ( "MSpace", "MColor", "MColorArray", "MObject", "MObjectHandle", "MUuid", "MDagPath", "MSelectionList", "MMatrix", "MVector", "MFn", "MItDag", "MFnDependencyNode", "MFnMesh", "MFnTransform", "MTransformationMatrix", "MFnCamera", "MMessage", "MNodeMessage", "MPxCommand", "MFnPlugin" )
+
+################################################################################
+## Mel
+################################################################################
+
+# the xform flags mel scripts may set, by the number of values they take ( none for switches )
+MEL_XFORM_FLAGS = { "m": 16, "matrix": 16, "piv": 3, "pivots": 3, "t": 3, "translation": 3 }
+
+def melEval( script ):
+
+	# only setAttr and xform statements do anything, the mel commands the scripts run for their ui side effects are ignored
+	for statement in script.split( ";" ):
+		words = shlex.split( statement )
+		if words and words[0] == "setAttr":
+			# setAttr [-type <type>] <plug> <values>
+			if words[1] in ( "-type", "-typ" ):
+				words = words[:1] + words[3:]
+			setAttr( words[1], *[ float( v ) for v in words[2:] ] )
+		elif words and words[0] == "xform":
+			# xform [-ws] [-r] [-m <16 values>] [-piv <3 values>] [-t <3 values>] <object>
+			kwargs = dict()
+			i = 1
+			while i < len( words ) - 1:
+				name = words[i].lstrip( "-" )
+				count = MEL_XFORM_FLAGS.get( name, 0 )
+				kwargs[name] = [ float( v ) for v in words[i + 1:i + 1 + count] ] if count else True
+				i += 1 + count
+			xform( words[-1], **kwargs )
+
+	return None
+
+################################################################################
+## Install
+################################################################################
+
+def unsupported( module_name ):
+	def __getattr__( name ):
+		if name.startswith( "__" ):
+			raise AttributeError( name )
+		raise EmulatorUnsupportedError( "MayaSceneEmulator does not emulate " + module_name + "." + name )
+	return __getattr__
+
+def ignored( name ):
+	def ignoredCommand( *args, **kwargs ):
+		return None
+	ignoredCommand.__name__ = name
+	return ignoredCommand
+
+def install():
+
+	# installing again, as a forked batch worker does, keeps the modules in place, which the
+	# scripts imported since hold on to
+	if getattr( sys.modules.get( "maya" ), "emulated_scene", None ) is scene:
+		return scene
+
+	# register the stand-in modules, so that "import maya.cmds as cmds" finds them
+	maya = types.ModuleType( "maya" )
+	maya.emulated_scene = scene
+	cmds = types.ModuleType( "maya.cmds" )
+	mel = types.ModuleType( "maya.mel" )
+	api = types.ModuleType( "maya.api" )
+	om2 = types.ModuleType( "maya.api.OpenMaya" )
+
+	# the API 1 module can be imported, but none of it is emulated
+	om = types.ModuleType( "maya.OpenMaya" )
+	om.__getattr__ = unsupported( "OpenMaya ( API 1 )" )
+
+	for name in IGNORED_CMDS:
+		setattr( cmds, name, ignored( name ) )
+	for name, func in CMDS.items():
+		setattr( cmds, name, func )
+	cmds.__getattr__ = unsupported( "cmds" )
+
+	mel.eval = melEval
+	mel.__getattr__ = unsupported( "mel" )
+
+	for name in OM2_NAMES:
+		setattr( om2, name, globals()[name] )
+	om2.__getattr__ = unsupported( "OpenMaya" )
+
+	maya.cmds = cmds
+	maya.mel = mel
+	maya.api = api
+	maya.OpenMaya = om
+	api.OpenMaya = om2
+
+	sys.modules["maya"] = maya
+	sys.modules["maya.cmds"] = cmds
+	sys.modules["maya.mel"] = mel
+	sys.modules["maya.api"] = api
+	sys.modules["maya.OpenMaya"] = om
+	sys.modules["maya.api.OpenMaya"] = om2
+
+	return scene
@@ -0,0 +1,45 @@
+################################################################################
+## Emulated Scene
+##
+## The set up shared by the tests: MayaSceneEmulator is installed in place of
+## maya before any of the scripts are imported, and the synthetic meshes of the
+## emulator are built in its scene.
+################################################################################
+
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+sys.path.insert( 0, ROOT )
+
+import MayaSceneEmulator
+
+# the emulator has to stand in for maya before the scripts import it
+scene = MayaSceneEmulator.install()
+
+import maya.cmds as cmds
+
+import GameAssetHelperScripts as helpers
+
+def makeMesh( mesh_type, num_verts, name, parent=None ):
+	points, face_counts, face_verts, uvs = MayaSceneEmulator.MESH_MAKERS[mesh_type]( num_verts )
+	obj = scene.createMesh( name, points, face_counts, face_verts, uvs )
+	if parent:
+		obj = cmds.parent( obj, parent )[0]
+	return obj
+
+def makeGridMesh( name, n_u, n_v, width=1.0, height=1.0 ):
+
+	# a grid of n_u x n_v quads, with planar uvs
+	points = MayaSceneEmulator.gridPoints( n_u, n_v, width, height )
+	face_counts, face_verts = MayaSceneEmulator.gridFaces( n_u, n_v )
+	return scene.createMesh( name, points, face_counts, face_verts, MayaSceneEmulator.planarUVs( points, face_verts ) )
+
+class SceneTestCase( unittest.TestCase ):
+
+	# every test starts from an empty scene and an empty mesh cache
+
+	def setUp( self ):
+		scene.reset()
+		helpers.mesh_cache.clear()
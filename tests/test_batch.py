@@ -0,0 +1,105 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from emulated_scene import SceneTestCase, cmds, helpers, makeMesh, scene
+
+import GameAssetBatch as batch
+
+def crashScene( objs ):
+	# dies the way Maya does on a bad scene, without raising anything, on the first scene only
+	if cmds.xform( "|mesh", q=True, t=True )[0] == 0:
+		os._exit( 3 )
+
+def hangScene( objs ):
+	time.sleep( 60 )
+
+def checkWorkerPool( objs ):
+	# a batch worker has to run the uv kernels itself rather than start a pool on every core
+	if not multiprocessing.current_process().daemon:
+		raise RuntimeError( "the batch worker is not a daemon" )
+
+# the worker processes only see the operations the tests add when they are forked
+@unittest.skipUnless( multiprocessing.get_start_method() == "fork", "the batch tests fork their workers" )
+class BatchTest( SceneTestCase ):
+
+	def setUp( self ):
+		SceneTestCase.setUp( self )
+		self.folder = tempfile.mkdtemp()
+		self.scenes = os.path.join( self.folder, "scenes" )
+		os.makedirs( self.scenes )
+
+		# three scenes saved by the emulator, and a file that is not a scene at all
+		for i, mesh_type in enumerate( ( "grid", "tube", "shells" ) ):
+			scene.reset()
+			makeMesh( mesh_type, 100, "mesh" )
+			cmds.xform( "|mesh", t=[ i, 0, 0 ] )
+			cmds.file( rename=os.path.join( self.scenes, "scene%d.ma" % i ) )
+			cmds.file( save=True )
+		with open( os.path.join( self.scenes, "broken.ma" ), "w" ) as f:
+			f.write( "not a scene" )
+		scene.reset()
+
+	def tearDown( self ):
+		shutil.rmtree( self.folder )
+
+	def runBatch( self, *args ):
+		report_path = os.path.join( self.folder, "report.json" )
+		exit_code = batch.main( [ self.scenes, "--standin", "MayaSceneEmulator", "--workers", "2", "--report", report_path, "--output-dir", os.path.join( self.folder, "out" ) ] + list( args ) )
+		with open( report_path ) as f:
+			return exit_code, json.load( f )
+
+	def testReport( self ):
+		exit_code, report = self.runBatch( "--ops", "Fit UVs U,Center Y Min" )
+
+		self.assertEqual( exit_code, 1 )
+		self.assertEqual( report["files"], 4 )
+		self.assertEqual( report["failed"], 1 )
+		statuses = dict( ( os.path.basename( r["file"] ), r["status"] ) for r in report["results"] )
+		self.assertEqual( statuses, { "broken.ma": "failed", "scene0.ma": "ok", "scene1.ma": "ok", "scene2.ma": "ok" } )
+
+		# the four scenes went through the two workers, which each started once
+		self.assertLessEqual( len( set( r["worker"] for r in report["results"] ) ), 2 )
+
+		# the saved scenes have the operations applied
+		scene.reset()
+		cmds.file( os.path.join( self.folder, "out", "scene1.ma" ), open=True, force=True )
+		self.assertAlmostEqual( cmds.exactWorldBoundingBox( "|mesh" )[1], 0.0 )
+		u, v = helpers.getMeshUVs( "|mesh" )
+		self.assertAlmostEqual( u.max() - u.min(), 1.0 )
+
+	def testWorkersStartNoPool( self ):
+		batch.OPERATIONS["Check Pool"] = ( "checkWorkerPool", () )
+		helpers.checkWorkerPool = checkWorkerPool
+		try:
+			os.remove( os.path.join( self.scenes, "broken.ma" ) )
+			exit_code, report = self.runBatch( "--ops", "Check Pool" )
+		finally:
+			del batch.OPERATIONS["Check Pool"], helpers.checkWorkerPool
+
+		self.assertEqual( [ r["status"] for r in report["results"] ], [ "ok" ] * 3 )
+
+	def testCrashAndTimeout( self ):
+
+		# a worker that dies, or hangs past the timeout, costs only its own scene and is replaced
+		batch.OPERATIONS["Crash"] = ( "crashScene", () )
+		batch.OPERATIONS["Hang"] = ( "hangScene", () )
+		helpers.crashScene = crashScene
+		helpers.hangScene = hangScene
+		try:
+			os.remove( os.path.join( self.scenes, "broken.ma" ) )
+			exit_code, crashed = self.runBatch( "--ops", "Crash" )
+			exit_code, timed_out = self.runBatch( "--ops", "Hang", "--timeout", "1" )
+		finally:
+			del batch.OPERATIONS["Crash"], batch.OPERATIONS["Hang"], helpers.crashScene, helpers.hangScene
+
+		self.assertEqual( [ r["status"] for r in crashed["results"] ], [ "crashed", "ok", "ok" ] )
+		self.assertIn( "exited with code 3", crashed["results"][0]["error"] )
+		self.assertEqual( crashed["failed"], 1 )
+		self.assertEqual( [ r["status"] for r in timed_out["results"] ], [ "timeout" ] * 3 )
+		self.assertEqual( timed_out["failed"], 3 )
+		self.assertLess( timed_out["wall_seconds"], 10 )
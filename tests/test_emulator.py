@@ -0,0 +1,88 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from emulated_scene import MayaSceneEmulator, SceneTestCase, cmds, makeGridMesh, scene
+
+import maya.api.OpenMaya as om2
+
+class MeshTest( SceneTestCase ):
+
+	def testApiReadsTheArrays( self ):
+		obj = makeGridMesh( "grid", 3, 2 )
+		sel_list = om2.MSelectionList()
+		sel_list.add( obj )
+		fn_mesh = om2.MFnMesh( sel_list.getDagPath( 0 ) )
+
+		face_counts, face_verts = fn_mesh.getVertices()
+		self.assertEqual( list( face_counts ), [ 4 ] * 6 )
+		self.assertEqual( list( face_verts[:4] ), [ 0, 1, 5, 4 ] )
+		self.assertEqual( fn_mesh.numVertices, 12 )
+		self.assertEqual( fn_mesh.numEdges, 17 )
+		self.assertEqual( fn_mesh.getUVSetNames(), [ "map1" ] )
+
+	def testComponentConversion( self ):
+		obj = makeGridMesh( "grid", 3, 2 )
+
+		# the faces around the middle vertex of the bottom row, and the vertices of a face
+		self.assertEqual( cmds.polyListComponentConversion( obj + ".vtx[1]", fromVertex=True, toFace=True ), [ obj + ".f[0:1]" ] )
+		self.assertEqual( cmds.ls( cmds.polyListComponentConversion( obj + ".f[4]", toVertex=True ), flatten=True ), [ obj + ".vtx[%d]" % i for i in ( 5, 6, 9, 10 ) ] )
+		self.assertEqual( len( cmds.ls( obj + ".e[*]", flatten=True ) ), 17 )
+
+class TransformTest( SceneTestCase ):
+
+	def testWorldSpaceUnderAParent( self ):
+		grp = cmds.group( em=True, n="grp" )
+		cmds.xform( grp, t=[ 1, 2, 3 ], ro=[ 0, 90, 0 ], s=[ 2, 2, 2 ] )
+		obj = cmds.parent( makeGridMesh( "grid", 2, 2 ), grp )[0]
+		cmds.xform( obj, t=[ 4, 5, 6 ], ws=True )
+
+		np.testing.assert_allclose( cmds.xform( obj, q=True, t=True, ws=True ), [ 4, 5, 6 ], atol=1e-9 )
+		np.testing.assert_allclose( cmds.getAttr( obj + ".translate" )[0], [ -1.5, 1.5, 1.5 ], atol=1e-9 )
+
+		# parenting kept the unit grid where it was in the world, so it moved without turning or scaling
+		np.testing.assert_allclose( cmds.exactWorldBoundingBox( obj ), [ 4, 5, 6, 5, 6, 6 ], atol=1e-9 )
+		np.testing.assert_allclose( cmds.getAttr( obj + ".scale" )[0], [ 0.5, 0.5, 0.5 ], atol=1e-9 )
+
+	def testHierarchyEdits( self ):
+		a = cmds.group( em=True, n="a" )
+		b = cmds.group( em=True, n="b" )
+		cmds.parent( b, a )
+		cmds.rename( "|a|b", "c" )
+		self.assertEqual( cmds.listRelatives( "|a", c=True, f=True ), [ "|a|c" ] )
+		cmds.group( em=True, n="d", p="|a" )
+		cmds.reorder( "|a|d", front=True )
+		self.assertEqual( cmds.listRelatives( "|a", c=True ), [ "d", "c" ] )
+
+class FileTest( SceneTestCase ):
+
+	def setUp( self ):
+		SceneTestCase.setUp( self )
+		self.folder = tempfile.mkdtemp()
+
+	def tearDown( self ):
+		shutil.rmtree( self.folder )
+
+	def testSaveAndOpen( self ):
+		obj = makeGridMesh( "grid", 3, 2 )
+		cmds.xform( obj, t=[ 1, 0, 0 ] )
+		cmds.file( rename=os.path.join( self.folder, "scene.json" ) )
+		cmds.file( save=True )
+
+		cmds.file( new=True, force=True )
+		self.assertFalse( cmds.objExists( obj ) )
+
+		cmds.file( os.path.join( self.folder, "scene.json" ), open=True, force=True )
+		self.assertEqual( cmds.getAttr( obj + ".translate" )[0], ( 1.0, 0.0, 0.0 ) )
+		self.assertEqual( scene.meshNode( obj ).mesh.num_faces, 6 )
+
+	def testUnsupportedCommandsRaise( self ):
+		with self.assertRaises( MayaSceneEmulator.EmulatorUnsupportedError ):
+			cmds.someCommandThatIsNotEmulated()
+
+		# flags that are not emulated raise the same error, which is not a NotImplementedError
+		with self.assertRaises( MayaSceneEmulator.EmulatorUnsupportedError ) as raised:
+			cmds.file( query=True, someFlag=True )
+		self.assertNotIsInstance( raised.exception, NotImplementedError )
@@ -0,0 +1,169 @@
+import contextlib
+import io
+import unittest.mock
+
+import numpy as np
+
+from emulated_scene import MayaSceneEmulator, SceneTestCase, cmds, helpers, makeMesh
+
+import GameAssetUndo as undo
+
+class RecordingProfiler( object ):
+
+	# stands in for GameAssetProfiler, and remembers which operations were begun and ended
+	def __init__( self ):
+		self.calls = list()
+
+	def beginOperation( self, name ):
+		self.calls.append( ( "begin", name ) )
+
+	def endOperation( self ):
+		self.calls.append( ( "end", ) )
+
+class ApiEditTest( SceneTestCase ):
+
+	def testUndoAndRedo( self ):
+		state = [ "old" ]
+		undo.apiEdit( lambda: state.__setitem__( 0, "new" ), lambda: state.__setitem__( 0, "old" ) )
+		self.assertEqual( state, [ "new" ] )
+		cmds.undo()
+		self.assertEqual( state, [ "old" ] )
+		self.assertEqual( undo.pending, [] )
+
+	def testUVsUndo( self ):
+		obj = makeMesh( "grid", 50, "grid" )
+		u, v = helpers.getMeshUVs( obj, "map1" )
+		helpers.setMeshUVs( obj, u * 2, v + 1, "map1" )
+		np.testing.assert_allclose( helpers.getMeshUVs( obj, "map1" )[0], u * 2 )
+		cmds.undo()
+		np.testing.assert_allclose( helpers.getMeshUVs( obj, "map1" )[0], u )
+		np.testing.assert_allclose( helpers.getMeshUVs( obj, "map1" )[1], v )
+
+	def testUVLayoutUndo( self ):
+
+		# the copy by index into a new uv set takes the set away again on undo, into an old one puts its uvs back
+		source = makeMesh( "grid", 50, "source" )
+		dest = makeMesh( "grid", 50, "dest" )
+		u, v = helpers.getMeshUVs( dest, "map1" )
+		helpers.setMeshUVs( source, u * 2, v * 3, "map1" )
+		helpers.transferUVSet( source, [ dest ], "map1", "signature" )
+		cmds.polyCopyUV( source, uvSetNameInput="map1", uvSetName="copied", createNewMap=True )
+		helpers.transferUVSet( source, [ dest ], "copied", "signature" )
+		self.assertIn( "copied", helpers.getMeshFn( dest ).getUVSetNames() )
+		cmds.undo()
+		self.assertNotIn( "copied", helpers.getMeshFn( dest ).getUVSetNames() )
+		cmds.undo()
+		np.testing.assert_allclose( helpers.getMeshUVs( dest, "map1" )[0], u )
+		np.testing.assert_allclose( helpers.getMeshUVs( dest, "map1" )[1], v )
+
+	def testColorsUndo( self ):
+
+		# the color set the write made is taken away again
+		obj = makeMesh( "grid", 50, "grid" )
+		helpers.applyVertexColor( [ obj ], "uv_v", "r" )
+		self.assertEqual( helpers.getMeshFn( obj ).numColorSets, 1 )
+		cmds.undo()
+		self.assertEqual( helpers.getMeshFn( obj ).numColorSets, 0 )
+
+class FastExecutionTest( SceneTestCase ):
+
+	def setUp( self ):
+		SceneTestCase.setUp( self )
+		self.obj = makeMesh( "grid", 50, "grid" )
+		self.u, self.v = helpers.getMeshUVs( self.obj )
+		self.profiler = RecordingProfiler()
+		self.patches = [
+			unittest.mock.patch.object( helpers, "profiler", self.profiler ),
+			unittest.mock.patch.object( helpers, "fast_exec_evaluation_mode", "off" ),
+			unittest.mock.patch.object( cmds, "refresh", unittest.mock.Mock() ),
+			unittest.mock.patch.object( cmds, "evaluationManager", unittest.mock.Mock( return_value=[ "parallel" ] ) ),
+		]
+		for patch in self.patches:
+			patch.start()
+
+	def tearDown( self ):
+		for patch in reversed( self.patches ):
+			patch.stop()
+
+	def assertRestored( self ):
+		self.assertEqual( MayaSceneEmulator.undo_chunk_depth[0], 0 )
+		self.assertEqual( cmds.refresh.call_args_list[-1], unittest.mock.call( suspend=False ) )
+		self.assertEqual( cmds.evaluationManager.call_args_list[-1], unittest.mock.call( mode="parallel" ) )
+		self.assertEqual( self.profiler.calls[-1], ( "end", ) )
+
+	def edit( self, *args ):
+
+		# two writes that have to come back as one undo step
+		helpers.setMeshUVs( self.obj, self.u * 2, self.v )
+		helpers.setMeshUVs( self.obj, self.u * 2, self.v * 3 )
+
+	def testSingleUndoStep( self ):
+		result = helpers.fastExecution( self.edit )( False )
+		self.assertIsNone( result )
+		self.assertRestored()
+		self.assertEqual( self.profiler.calls, [ ( "begin", "edit" ), ( "end", ) ] )
+
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[1], self.v * 3 )
+		cmds.undo()
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u )
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[1], self.v )
+
+	def testReportsWallTime( self ):
+		output = io.StringIO()
+		with contextlib.redirect_stdout( output ):
+			helpers.fastExecution( self.edit )( False )
+		self.assertRegex( output.getvalue(), r"^edit: \d+\.\d{3}s$" )
+
+	def testRestoreAfterAnException( self ):
+		def failing( *args ):
+			self.edit()
+			raise ValueError( "failed" )
+
+		with self.assertRaises( ValueError ):
+			helpers.fastExecution( failing )( False )
+		self.assertRestored()
+
+		# the edits made before the error are still one undo step
+		cmds.undo()
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u )
+
+	def testUndoOnCancel( self ):
+		def cancelled( *args ):
+			self.edit()
+			raise helpers.OperationCancelled()
+
+		self.assertIsNone( helpers.fastExecution( cancelled )( False ) )
+		self.assertRestored()
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u )
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[1], self.v )
+
+	def testCancelWithUndoOff( self ):
+		def cancelled( *args ):
+			self.edit()
+			raise helpers.OperationCancelled()
+
+		# an earlier action still in the queue, then undo off: the cancel must not take it back
+		helpers.setMeshUVs( self.obj, self.u + 1, self.v )
+		cmds.undoInfo( stateWithoutFlush=False )
+		try:
+			self.assertIsNone( helpers.fastExecution( cancelled )( False ) )
+		finally:
+			cmds.undoInfo( stateWithoutFlush=True )
+		self.assertRestored()
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u * 2 )
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[1], self.v * 3 )
+
+		# and the earlier action is still the one undo takes back
+		cmds.undo()
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u )
+
+	def testOpeningFails( self ):
+
+		# when suspending the refresh fails, the chunk and the profiler operation opened before it are closed
+		cmds.refresh.side_effect = [ RuntimeError( "no viewport" ) ]
+		with self.assertRaises( RuntimeError ):
+			helpers.fastExecution( self.edit )( False )
+		self.assertEqual( MayaSceneEmulator.undo_chunk_depth[0], 0 )
+		self.assertEqual( cmds.refresh.call_count, 1 )
+		self.assertEqual( self.profiler.calls, [ ( "begin", "edit" ), ( "end", ) ] )
+		np.testing.assert_allclose( helpers.getMeshUVs( self.obj )[0], self.u )
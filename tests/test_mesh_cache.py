@@ -0,0 +1,115 @@
+import os
+import shutil
+import tempfile
+import unittest.mock
+
+from emulated_scene import SceneTestCase, cmds, helpers, makeMesh
+
+import maya.api.OpenMaya as om2
+
+cache = helpers.mesh_cache
+
+class MeshDataCacheTest( SceneTestCase ):
+
+	def totalBytes( self ):
+		return sum( helpers.entryBytes( entry ) for entry in cache.entries.values() )
+
+	def testDirtyCallbackMarksStale( self ):
+		obj = makeMesh( "tube", 200, "tube" )
+		entry = cache.entry( obj )
+		helpers.getPoleVerts( obj )
+		poles = entry["derived"]["poles"]
+		self.assertFalse( entry["stale"] )
+
+		# moving the points marks the entry stale, and the unchanged face-vertex lists keep it
+		fn_mesh = helpers.getMeshFn( obj )
+		points = fn_mesh.getPoints()
+		points[0][1] += 1.0
+		fn_mesh.setPoints( points )
+		self.assertTrue( entry["stale"] )
+		self.assertIs( cache.entry( obj ), entry )
+		self.assertFalse( entry["stale"] )
+		self.assertIs( entry["derived"]["poles"], poles )
+
+	def testTopologyChangeRebuilds( self ):
+		obj = makeMesh( "grid", 200, "grid" )
+		entry = cache.entry( obj )
+		num_faces = entry["topology"].num_faces
+		helpers.getHalfEdgeMesh( obj )
+		callbacks = len( om2.MMessage.callbacks )
+
+		cmds.delete( obj + ".f[0:4]" )
+		self.assertTrue( entry["stale"] )
+		rebuilt = cache.entry( obj )
+		self.assertIsNot( rebuilt, entry )
+		self.assertEqual( rebuilt["topology"].num_faces, num_faces - 5 )
+		self.assertEqual( rebuilt["derived"], dict() )
+		self.assertEqual( cache.numBytes(), self.totalBytes() )
+
+		# the old callback went with the old entry
+		self.assertEqual( len( om2.MMessage.callbacks ), callbacks )
+		self.assertNotIn( entry["callback"], om2.MMessage.callbacks )
+
+	def testReusedUUID( self ):
+		folder = tempfile.mkdtemp()
+		try:
+			obj = makeMesh( "grid", 200, "grid" )
+			cmds.file( rename=os.path.join( folder, "scene.ma" ) )
+			cmds.file( save=True )
+			entry = cache.entry( obj )
+			uuids = list( cache.entries )
+
+			# the reopened scene has a new shape under the same uuid, which never marked the entry stale
+			cmds.file( os.path.join( folder, "scene.ma" ), open=True, force=True )
+			self.assertFalse( entry["stale"] )
+			self.assertFalse( entry["handle"].isValid() )
+			reopened = cache.entry( obj )
+			self.assertIsNot( reopened, entry )
+			self.assertTrue( reopened["handle"].isValid() )
+			self.assertEqual( list( cache.entries ), uuids )
+		finally:
+			shutil.rmtree( folder )
+
+	def testDisabled( self ):
+
+		# with no cache nothing is kept and no callbacks are added, and each query reads the mesh once
+		obj = makeMesh( "tube", 200, "tube" )
+		callbacks = len( om2.MMessage.callbacks )
+		read_mesh = unittest.mock.Mock( side_effect=helpers.MeshTopology.readMesh )
+		with unittest.mock.patch.object( helpers, "mesh_cache_max_mb", 0 ), unittest.mock.patch.object( helpers.MeshTopology, "readMesh", read_mesh ):
+			for query in ( helpers.getPoleVerts, helpers.getBorderEdgeGroups, helpers.getHalfEdgeMesh ):
+				read_mesh.reset_mock()
+				query( obj )
+				self.assertEqual( read_mesh.call_count, 1 )
+
+		self.assertEqual( len( cache.entries ), 0 )
+		self.assertEqual( len( om2.MMessage.callbacks ), callbacks )
+		self.assertEqual( helpers.getPoleVerts( obj ).indices.tolist(), cache.entry( obj )["derived"]["poles"].tolist() )
+
+	def testLeastRecentlyUsedEviction( self ):
+		objs = [ makeMesh( "grid", 1000, "grid%d" % i ) for i in range( 4 ) ]
+		entry_bytes = helpers.entryBytes( cache.entry( objs[0] ) )
+		cache.clear()
+		self.assertEqual( cache.numBytes(), 0 )
+
+		# room for two entries, and not for three
+		with unittest.mock.patch.object( helpers, "mesh_cache_max_mb", 2.5 * entry_bytes / ( 1024.0 * 1024.0 ) ):
+			first = cache.entry( objs[0] )
+			cache.entry( objs[1] )
+			self.assertEqual( cache.numBytes(), 2 * entry_bytes )
+
+			# using the first one again makes the second the least recently used
+			self.assertIs( cache.entry( objs[0] ), first )
+			cache.entry( objs[2] )
+			self.assertEqual( [ entry["topology"].obj for entry in cache.entries.values() ], [ objs[0], objs[2] ] )
+			self.assertEqual( cache.numBytes(), self.totalBytes() )
+
+			# derived data counts towards the total, and the entry it grew is the one that stays
+			helpers.getHalfEdgeMesh( objs[2] )
+			self.assertEqual( [ entry["topology"].obj for entry in cache.entries.values() ], [ objs[2] ] )
+			self.assertEqual( cache.numBytes(), self.totalBytes() )
+			self.assertGreater( cache.numBytes(), entry_bytes )
+
+			cache.entry( objs[3] )
+			self.assertEqual( [ entry["topology"].obj for entry in cache.entries.values() ], [ objs[3] ] )
+			self.assertEqual( cache.numBytes(), entry_bytes )
@@ -0,0 +1,95 @@
+import sys
+
+import numpy as np
+
+from emulated_scene import SceneTestCase, cmds, helpers, makeMesh, scene
+
+import GameAssetProfiler as profiler
+import GameAssetUndo as undo
+
+import maya.api.OpenMaya as om2
+
+class ProfilerTest( SceneTestCase ):
+
+	def tearDown( self ):
+		profiler.disable()
+
+	def testCommandCounts( self ):
+		obj = makeMesh( "grid", 50, "grid" )
+		u, v = helpers.getMeshUVs( obj )
+
+		# the edit command is run by GameAssetUndo, and the uv write by the api object it got from the scripts
+		with profiler.enable().operation( "setMeshUVs" ):
+			helpers.setMeshUVs( obj, u * 2, v )
+		commands = profiler.disable().operations[0]["commands"]
+
+		counts = dict( ( name, command["calls"] ) for name, command in commands.items() )
+		for name in ( "cmds.pluginInfo", "cmds.gameAssetApiEdit", "om2.MFnMesh", "MFnMesh.getUVs", "MFnMesh.setUVs" ):
+			self.assertEqual( counts[name], 1, name )
+
+	def testPatchesAndRestoresEveryModule( self ):
+
+		# a script in __main__ that imported cmds under its own name is profiled too
+		main = sys.modules["__main__"]
+		main.mc = cmds
+		try:
+			active = profiler.enable()
+			for module, attr in ( ( helpers, "cmds" ), ( helpers, "mel" ), ( helpers, "om2" ), ( undo, "cmds" ), ( undo, "om2" ), ( main, "mc" ) ):
+				self.assertIsInstance( getattr( module, attr ), profiler.ProfiledObject, attr )
+			self.assertIs( helpers.profiler, active )
+
+			profiler.disable()
+			self.assertIs( helpers.cmds, cmds )
+			self.assertIs( undo.cmds, cmds )
+			self.assertIs( main.mc, cmds )
+			self.assertIsNone( helpers.profiler )
+		finally:
+			del main.mc
+
+	def testOperationsRunProfiled( self ):
+
+		# the scripts only hold proxies while profiled, and OpenMaya only ever gets the real objects
+		results = list()
+		for enabled in ( False, True ):
+			scene.reset()
+			cam = scene.createCamera( "camera1", ( 1.0, 0.5, 6.0 ), ( 0.0, 10.0, 0.0 ) )
+			objs = [ makeMesh( "grid", 60, "grid" ), makeMesh( "tube", 60, "tube" ) ]
+			if enabled:
+				profiler.enable().beginOperation( "project" )
+			helpers.cameraProjectUVs( objs, cam, "map1", 1 )
+			helpers.applyVertexColor( objs, "uv_v", "r" )
+			results.append( [ helpers.getMeshUVs( obj, "map1" ) for obj in objs ] + [ helpers.getMeshColors( obj, True ) for obj in objs ] )
+			if enabled:
+				profiler.active_profiler.endOperation()
+				counts = profiler.disable().operations[0]["commands"]
+				self.assertEqual( counts["om2.MFnCamera"]["calls"], 1 )
+
+		for profiled, expected in zip( results[1], results[0] ):
+			np.testing.assert_allclose( profiled, expected )
+
+	def testResetTransformsRunsProfiled( self ):
+
+		# the DAG iterator is a proxy too, and is reset from a proxied MDagPath
+		top = cmds.group( em=True, n="top" )
+		cmds.xform( top, t=[ 1, 2, 3 ], ro=[ 10, 20, 30 ], s=[ 2, 2, 2 ] )
+		cmds.group( em=True, n="grp", p="|top" )
+		makeMesh( "grid", 20, "piece", "|top|grp" )
+		cmds.xform( "|top|grp|piece", t=[ 1, 1, 1 ], ro=[ 5, 3, 1 ] )
+
+		with profiler.enable().operation( "resetTransforms" ):
+			helpers.resetTransforms( [ "|top|grp" ], ( "trans", "rot", "scale" ) )
+		counts = profiler.disable().operations[0]["commands"]
+		self.assertEqual( counts["om2.MItDag"]["calls"], 1 )
+
+		world = np.array( cmds.xform( "|top|grp", q=True, ws=True, m=True ) ).reshape( 4, 4 )
+		np.testing.assert_allclose( world, np.eye( 4 ), atol=1e-9 )
+		self.assertEqual( cmds.getAttr( "|top|grp|piece.rotate" )[0], ( 0.0, 0.0, 0.0 ) )
+
+	def testOpenMayaRefusesProxies( self ):
+		sel_list = om2.MSelectionList()
+		sel_list.add( makeMesh( "grid", 20, "grid" ) )
+		dag_path = profiler.ProfiledObject( sel_list.getDagPath( 0 ), "MDagPath", profiler.Profiler() )
+		with self.assertRaises( TypeError ):
+			om2.MFnMesh( dag_path )
+		with self.assertRaises( TypeError ):
+			om2.MItDag().reset( dag_path )
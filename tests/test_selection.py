@@ -0,0 +1,119 @@
+import unittest.mock
+
+from emulated_scene import SceneTestCase, cmds, helpers, makeMesh, scene
+
+import maya.mel as mel
+
+# the operations the emulator can run, on meshes it can run them on
+OPERATIONS = (
+	( "deleteHistory", lambda m: helpers.deleteHistory( [ m["grid"] ] ) ),
+	( "fixNormals", lambda m: helpers.fixNormals( [ m["grid"] ] ) ),
+	( "deleteExtruded", lambda m: helpers.deleteExtruded( [ m["slab"] ] ) ),
+	( "retopologize", lambda m: helpers.retopologize( [ m["grid"] ], 20 ) ),
+	( "deleteUVs", lambda m: helpers.deleteUVs( [ m["grid"] ] ) ),
+	( "scaleUVQuad", lambda m: helpers.scaleUVQuad( [ m["grid"] ], "map1" ) ),
+	( "fitMeshUVsToDimension", lambda m: helpers.fitMeshUVsToDimension( [ m["shells"] ], "u" ) ),
+	( "initializeUVs", lambda m: helpers.initializeUVs( [ m["grid"] ] ) ),
+	( "copyUVSet", lambda m: helpers.copyUVSet( [ m["grid"] ], "StackedUV" ) ),
+	( "unitizeUVPlanar", lambda m: helpers.unitizeUVPlanar( [ m["grid"] ], "map1" ) ),
+	( "unitizeUVPolar", lambda m: helpers.unitizeUVPolar( [ m["tube"] ], "map1" ) ),
+	( "closeHolesAndBevel", lambda m: helpers.closeHolesAndBevel( [ m["open"] ] ) ),
+	( "centerYMin", lambda m: helpers.centerYMin( [ m["grid"], m["tube"] ] ) ),
+	( "centerPole", lambda m: helpers.centerPole( [ m["tube"] ] ) ),
+	( "setPivot", lambda m: helpers.setPivot( [ m["grid"], m["tube"] ], "ymin" ) ),
+	( "pivotToWorldOrigin", lambda m: helpers.pivotToWorldOrigin( [ m["grid"] ] ) ),
+	( "randomizeRotation", lambda m: helpers.randomizeRotation( [ m["grid"], m["tube"] ], "xyz", 0, 360, 1 ) ),
+	( "distribute", lambda m: helpers.distribute( [ m["group"] ], "x", 1.0 ) ),
+	( "resetTransforms", lambda m: helpers.resetTransforms( [ m["grid"], m["tube"] ], "rot" ) ),
+	( "matchTransforms", lambda m: helpers.matchTransforms( [ m["grid"] ], m["tube"], True ) ),
+	( "sortOutliner", lambda m: helpers.sortOutliner( [ m["group"] ], True, False ) ),
+	( "applyVertexColor", lambda m: helpers.applyVertexColor( [ m["grid"] ], "uv_v", "r" ) ),
+	( "renameObjects", lambda m: helpers.renameObjects( [ m["grid"], m["tube"] ], 2, 2, 1, "renamed" ) ),
+)
+
+# the operations that run commands which select, and put the selection back with keepSelection
+SELECTING_OPERATIONS = (
+	( "separateMeshes", lambda m: helpers.separateMeshes( [ m["shells"] ] ) ),
+	( "combineMeshes", lambda m: helpers.combineMeshes( [ m["grid"], m["tube"] ] ) ),
+	( "combineGroups", lambda m: helpers.combineGroups( [ m["group"] ] ) ),
+	( "makeNullAbove", lambda m: helpers.makeNullAbove( m["tube"] ) ),
+	( "locatorsFromTransforms", lambda m: helpers.locatorsFromTransforms( [ m["grid"] ] ) ),
+)
+
+class SelectionTest( SceneTestCase ):
+
+	def makeScene( self ):
+		meshes = dict()
+		meshes["group"] = cmds.group( em=True, name="meshes" )
+		for mesh_type in ( "grid", "tube", "shells" ):
+			meshes[mesh_type] = cmds.ls( makeMesh( mesh_type, 60, mesh_type, meshes["group"] ), long=True )[0]
+		meshes["slab"] = makeMesh( "slab", 60, "slab" )
+		meshes["open"] = makeMesh( "open", 60, "open" )
+
+		# the user's selection, which is none of the meshes the operations are given
+		cmds.select( makeMesh( "grid", 20, "selected" ) + ".f[0:2]", replace=True )
+		return meshes
+
+	def testOperationsDoNotSelect( self ):
+		for name, operation in OPERATIONS:
+			with self.subTest( name ):
+				scene.reset()
+				meshes = self.makeScene()
+				selection = cmds.ls( selection=True, long=True )
+				with unittest.mock.patch.object( cmds, "select", wraps=cmds.select ) as select:
+					operation( meshes )
+				select.assert_not_called()
+				self.assertEqual( cmds.ls( selection=True, long=True ), selection )
+
+	def testSelectingOperationsRestoreTheSelection( self ):
+		for name, operation in SELECTING_OPERATIONS:
+			with self.subTest( name ):
+				scene.reset()
+				meshes = self.makeScene()
+				selection = cmds.ls( selection=True, long=True )
+				operation( meshes )
+				self.assertEqual( cmds.ls( selection=True, long=True ), selection )
+
+		# with nothing selected, nothing is selected afterwards
+		scene.reset()
+		meshes = self.makeScene()
+		cmds.select( clear=True )
+		helpers.combineMeshes( [ meshes["grid"], meshes["tube"] ] )
+		self.assertEqual( cmds.ls( selection=True ), list() )
+
+	def testCombineButtonSelectsTheResult( self ):
+
+		# combining deletes the selected sources, so there is nothing of the old selection to put back
+		meshes = self.makeScene()
+		num_verts = sum( scene.meshNode( meshes[name] ).mesh.num_verts for name in ( "grid", "tube" ) )
+		cmds.select( [ meshes["grid"], meshes["tube"] ], replace=True )
+		helpers.OnBtnCombine( False, 1 )
+		selection = cmds.ls( selection=True, long=True )
+		self.assertEqual( len( selection ), 1 )
+		self.assertFalse( cmds.objExists( meshes["tube"] ) )
+		self.assertEqual( scene.meshNode( selection[0] ).mesh.num_verts, num_verts )
+
+		# what survives of a selection is put back, and the errors of the operation are not hidden
+		cmds.select( [ meshes["shells"], meshes["slab"] + ".f[0]" ], replace=True )
+		helpers.combineMeshes( [ meshes["shells"], meshes["open"] ] )
+		self.assertEqual( cmds.ls( selection=True, long=True ), [ meshes["slab"] + ".f[0]" ] )
+		with unittest.mock.patch.object( cmds, "polyUnite", side_effect=RuntimeError( "polyUnite failed" ) ):
+			with self.assertRaisesRegex( RuntimeError, "polyUnite failed" ):
+				helpers.combineMeshes( [ meshes["slab"] ] )
+
+	def testOrientShellsRestoresTheSelection( self ):
+
+		# texOrientEdge only works on the selection, so orientShells is an exception
+		meshes = self.makeScene()
+		selection = cmds.ls( selection=True, long=True )
+		selected_in_mel = list()
+		with unittest.mock.patch.object( mel, "eval", lambda script: selected_in_mel.append( cmds.ls( selection=True ) ) ):
+			helpers.orientShells( [ meshes["grid"] + ".e[0]", meshes["grid"] + ".e[3]" ] )
+		self.assertEqual( selected_in_mel, [ [ meshes["grid"] + ".e[0]", meshes["grid"] + ".e[3]" ] ] )
+		self.assertEqual( cmds.ls( selection=True, long=True ), selection )
+
+		# and it puts the selection back when the mel command fails
+		with unittest.mock.patch.object( mel, "eval", side_effect=RuntimeError ):
+			with self.assertRaises( RuntimeError ):
+				helpers.orientShells( [ meshes["grid"] + ".e[0]" ] )
+		self.assertEqual( cmds.ls( selection=True, long=True ), selection )
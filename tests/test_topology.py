@@ -0,0 +1,257 @@
+import numpy as np
+
+from emulated_scene import SceneTestCase, cmds, helpers, makeGridMesh, makeMesh
+
+def baselineEdgeLength( edge ):
+
+	# the length the scripts measured before, from a world space xform query of the two vertices
+	p = cmds.xform( cmds.polyListComponentConversion( edge, toVertex=True ), q=True, t=True, ws=True )
+	return np.sqrt( ( p[0] - p[3] ) ** 2 + ( p[1] - p[4] ) ** 2 + ( p[2] - p[5] ) ** 2 )
+
+def baselineConnectedEdges( edge_list ):
+
+	# the expanding selection the scripts grouped edges with before, capped at 100 steps
+	edge_groups = list()
+	initial_edges = set( edge_list )
+	while initial_edges:
+		chosen_edges = { next( iter( sorted( initial_edges ) ) ) }
+		for i in range( 100 ):
+			expanded_verts = cmds.polyListComponentConversion( list( chosen_edges ), toVertex=True )
+			expanded_edges = set( cmds.ls( cmds.polyListComponentConversion( expanded_verts, toEdge=True ), long=True, flatten=True ) )
+			found_edges = expanded_edges.difference( chosen_edges ).intersection( initial_edges )
+			if not found_edges:
+				break
+			chosen_edges = chosen_edges.union( found_edges )
+		edge_groups.append( chosen_edges )
+		initial_edges = initial_edges.difference( chosen_edges )
+	return edge_groups
+
+class MeshTopologyTest( SceneTestCase ):
+
+	def testValenceMatchesComponentConversion( self ):
+
+		# the verts the edge count query found one polyListComponentConversion at a time
+		obj = makeMesh( "tube", 60, "tube" )
+		expected = dict()
+		for vert in cmds.ls( cmds.polyListComponentConversion( obj, toVertex=True ), flatten=True ):
+			num_edges = len( cmds.ls( cmds.polyListComponentConversion( vert, toEdge=True ), flatten=True ) )
+			expected.setdefault( num_edges, list() ).append( vert )
+
+		for num_edges, verts in expected.items():
+			self.assertEqual( cmds.ls( helpers.getVertsWithEdgeCount( obj, num_edges ).toNames(), flatten=True ), verts )
+
+	def testEdgesInMayaOrder( self ):
+		for mesh_type in ( "grid", "tube", "open" ):
+			obj = makeMesh( mesh_type, 80, mesh_type )
+			fn_mesh = helpers.getMeshFn( obj )
+			topo = helpers.MeshTopology.fromMesh( obj )
+			expected = [ list( fn_mesh.getEdgeVertices( e ) ) for e in range( fn_mesh.numEdges ) ]
+			self.assertEqual( topo.edge_verts.tolist(), expected )
+
+	def testBoundary( self ):
+		obj = makeMesh( "open", 100, "open" )
+		topo = helpers.MeshTopology.fromMesh( obj )
+		border = topo.boundaryEdges()
+
+		# a border edge has one face, and its vertices are border vertices
+		self.assertTrue( np.all( topo.edgeFaceCount()[border] == 1 ) )
+		self.assertTrue( np.all( topo.boundaryVertMask()[ topo.edge_verts[border].ravel() ] ) )
+		self.assertEqual( np.count_nonzero( topo.edgeFaceCount() == 1 ), len( border ) )
+
+	def testEdgesMustMatchTheFaces( self ):
+
+		# two quads sharing the edge 1-4, with that edge left out of the edge list
+		face_counts = [ 4, 4 ]
+		face_verts = [ 0, 1, 4, 3, 1, 2, 5, 4 ]
+		edge_verts = [ [ 0, 1 ], [ 1, 2 ], [ 3, 4 ], [ 4, 5 ], [ 0, 3 ], [ 2, 5 ] ]
+		with self.assertRaisesRegex( ValueError, "2 face sides have no edge, the first on face 0" ):
+			helpers.MeshTopology( 6, face_counts, face_verts, edge_verts )
+		with self.assertRaises( ValueError ):
+			helpers.MeshTopology( 6, face_counts, face_verts, [] )
+
+		topo = helpers.MeshTopology( 6, face_counts, face_verts, edge_verts + [ [ 1, 4 ] ] )
+		self.assertEqual( topo.face_edges[[ 1, 7 ]].tolist(), [ 6, 6 ] )
+
+class LabelComponentsTest( SceneTestCase ):
+
+	def testChainsAndSingles( self ):
+		labels, num_labels = helpers.labelComponents( 7, [ 0, 1, 4, 6 ], [ 1, 2, 5, 6 ] )
+		self.assertEqual( num_labels, 4 )
+		self.assertEqual( len( set( labels[[ 0, 1, 2 ]].tolist() ) ), 1 )
+		self.assertEqual( labels[4], labels[5] )
+		self.assertEqual( len( set( labels[[ 0, 3, 4, 6 ]].tolist() ) ), 4 )
+
+	def testMatchesUnorderedPairs( self ):
+		rng = np.random.default_rng( 3 )
+		a = rng.integers( 0, 200, 150 )
+		b = rng.integers( 0, 200, 150 )
+		labels, num_labels = helpers.labelComponents( 200, b, a )
+
+		# the items share a label exactly when a walk over the pairs joins them
+		groups = [ { i } for i in range( 200 ) ]
+		for i, j in zip( a.tolist(), b.tolist() ):
+			if groups[i] is not groups[j]:
+				merged = groups[i] | groups[j]
+				for k in merged:
+					groups[k] = merged
+		self.assertEqual( num_labels, len( set( id( group ) for group in groups ) ) )
+		for i in range( 200 ):
+			self.assertEqual( set( np.flatnonzero( labels == labels[i] ).tolist() ), groups[i] )
+
+	def testShellsMatchAFloodFill( self ):
+
+		# grow each shell from its first vertex through the faces around it, like the shell constraint did
+		obj = makeMesh( "shells", 200, "shells" )
+		remaining = cmds.ls( cmds.polyListComponentConversion( obj, toVertex=True ), flatten=True )
+		expected = list()
+		while remaining:
+			shell = { remaining[0] }
+			while True:
+				faces = cmds.polyListComponentConversion( list( shell ), fromVertex=True, toFace=True )
+				grown = set( cmds.ls( cmds.polyListComponentConversion( faces, toVertex=True ), flatten=True ) )
+				if grown == shell:
+					break
+				shell = grown
+			expected.append( sorted( shell ) )
+			remaining = [ v for v in remaining if v not in shell ]
+
+		shells = helpers.getShells( obj )
+		self.assertEqual( helpers.getShellCount( obj ), 8 )
+		self.assertEqual( sorted( sorted( cmds.ls( shell.toNames(), flatten=True ) ) for shell in shells ), sorted( expected ) )
+
+class ConnectedEdgesTest( SceneTestCase ):
+
+	def groupNames( self, groups ):
+		return sorted( sorted( cmds.ls( group.toNames(), flatten=True ) ) for group in groups )
+
+	def testBorderGroupsMatchBaseline( self ):
+
+		# the border of a grid with holes: the outer border and one ring around every hole
+		obj = makeMesh( "open", 600, "open" )
+		border = helpers.MeshTopology.fromMesh( obj ).boundaryEdges()
+		border_names = cmds.ls( helpers.ComponentSet( obj, "e", border ).toNames(), flatten=True )
+
+		expected = sorted( sorted( group ) for group in baselineConnectedEdges( border_names ) )
+		self.assertEqual( len( expected ), 10 )
+		self.assertEqual( self.groupNames( helpers.getConnectedEdges( border_names ) ), expected )
+		self.assertEqual( self.groupNames( helpers.getBorderEdgeGroups( obj ) ), expected )
+
+	def testLongBorderIsOneGroup( self ):
+
+		# the border of a strip takes more than 100 expansions to walk, where the old loop split it
+		obj = makeGridMesh( "strip", 150, 1 )
+		border_names = cmds.ls( helpers.getBorderEdgeGroups( obj )[0].toNames(), flatten=True )
+		self.assertEqual( len( helpers.getBorderEdgeGroups( obj ) ), 1 )
+		self.assertEqual( len( border_names ), 302 )
+		self.assertGreater( len( baselineConnectedEdges( border_names ) ), 1 )
+
+class EdgeLengthTest( SceneTestCase ):
+
+	def testSetsMatchBaseline( self ):
+		grid = makeMesh( "grid", 60, "grid" )
+		tube = makeMesh( "tube", 60, "tube" )
+		cmds.xform( grid, t=[ 1, 2, 3 ], ro=[ 30, 0, 10 ], s=[ 2, 1, 3 ] )
+		cmds.xform( tube, s=[ 0.5, 4, 0.5 ] )
+
+		rng = np.random.default_rng( 6 )
+		sets = [
+			( grid, [ rng.choice( 80, 20, replace=False ), np.array( [], dtype=np.int64 ), np.arange( 10 ) ] ),
+			( tube, [ rng.choice( 100, 35, replace=False ) ] ),
+		]
+		results = helpers.measureEdgeSets( sets )
+
+		# every length and every set total, the prefix sums split at the right bounds
+		self.assertEqual( [ len( mesh_results ) for mesh_results in results ], [ 3, 1 ] )
+		for ( obj, edge_sets ), mesh_results in zip( sets, results ):
+			for edges, ( lengths, total ) in zip( edge_sets, mesh_results ):
+				expected = [ baselineEdgeLength( obj + ".e[%d]" % e ) for e in edges ]
+				np.testing.assert_allclose( lengths, expected, rtol=1e-12 )
+				self.assertAlmostEqual( total, sum( expected ), places=9 )
+
+		names = [ grid + ".e[%d]" % e for e in sets[0][1][0] ] + [ tube + ".e[%d]" % e for e in sets[1][1][0] ]
+		self.assertAlmostEqual( helpers.getEdgeLengthSum( names ), sum( baselineEdgeLength( name ) for name in names ), places=9 )
+		self.assertEqual( helpers.getEdgeLengthSum( [] ), 0 )
+
+class HalfEdgeMeshTest( SceneTestCase ):
+
+	def setUp( self ):
+		SceneTestCase.setUp( self )
+		self.n_u = 4
+		self.n_v = 3
+		self.topo = helpers.MeshTopology.fromMesh( makeGridMesh( "grid", self.n_u, self.n_v ) )
+		self.half_edges = helpers.HalfEdgeMesh( self.topo )
+
+	def edgeIds( self, pairs ):
+		rows = [ tuple( sorted( row ) ) for row in self.topo.edge_verts.tolist() ]
+		return sorted( rows.index( tuple( sorted( pair ) ) ) for pair in pairs )
+
+	def vert( self, i, j ):
+		return j * ( self.n_u + 1 ) + i
+
+	def rowEdges( self, j ):
+		return self.edgeIds( [ ( self.vert( i, j ), self.vert( i + 1, j ) ) for i in range( self.n_u ) ] )
+
+	def columnEdges( self, i ):
+		return self.edgeIds( [ ( self.vert( i, j ), self.vert( i, j + 1 ) ) for j in range( self.n_v ) ] )
+
+	def testInnerLoop( self ):
+		edges = self.rowEdges( 1 )
+		self.assertEqual( sorted( self.half_edges.edgeLoop( edges[1] ) ), edges )
+		self.assertEqual( sorted( self.half_edges.edgeLoop( self.columnEdges( 2 )[0] ) ), self.columnEdges( 2 ) )
+
+	def testBorderLoop( self ):
+		edges = self.rowEdges( 0 )
+		self.assertEqual( sorted( self.half_edges.edgeLoop( edges[2] ) ), edges )
+
+	def testRing( self ):
+		rungs = self.edgeIds( [ ( self.vert( 2, j ), self.vert( 3, j ) ) for j in range( self.n_v + 1 ) ] )
+		self.assertEqual( sorted( self.half_edges.edgeRing( self.rowEdges( 1 )[2] ) ), rungs )
+		self.assertEqual( sorted( self.half_edges.edgeRing( self.columnEdges( 0 )[1] ) ), self.edgeIds( [ ( self.vert( i, 1 ), self.vert( i, 2 ) ) for i in range( self.n_u + 1 ) ] ) )
+
+	def testNoPolesNoSeam( self ):
+
+		# a grid has no poles, so there is no seam, and unitizing it polar still goes through
+		obj = self.topo.obj
+		poles = helpers.getPoleVerts( obj )
+		self.assertEqual( len( poles.indices ), 0 )
+		self.assertEqual( len( helpers.getSeamEdges( obj, poles ).indices ), 0 )
+		helpers.unitizeUVPolar( [ obj ], "map1" )
+
+	def testClosedLoopAndRingOnATube( self ):
+
+		# a loop around the tube closes on itself, and a ring along it stops at the triangle fans
+		topo = helpers.MeshTopology.fromMesh( makeMesh( "tube", 60, "tube" ) )
+		half_edges = helpers.HalfEdgeMesh( topo )
+		around = topo.edgeKeys( np.array( [ 7 ] ), np.array( [ 8 ] ) )
+		edge = int( np.flatnonzero( topo.edgeKeys( topo.edge_verts[:, 0], topo.edge_verts[:, 1] ) == around[0] )[0] )
+		loop = half_edges.edgeLoop( edge )
+		self.assertEqual( len( loop ), 7 )
+		self.assertEqual( len( set( loop ) ), 7 )
+		self.assertEqual( len( half_edges.edgeRing( edge ) ), 8 )
+
+class ComponentSetTest( SceneTestCase ):
+
+	def testCompactNames( self ):
+		components = helpers.ComponentSet( "|grp|mesh", "e", [ 7, 3, 4, 5, 9, 3, 10 ] )
+		self.assertEqual( components.toNames(), [ "|grp|mesh.e[3:5]", "|grp|mesh.e[7]", "|grp|mesh.e[9:10]" ] )
+		self.assertEqual( helpers.ComponentSet( "|mesh", "f" ).toNames(), [] )
+
+	def testNamesRoundTrip( self ):
+
+		# the compact names list the same components as the flat names Maya would give
+		obj = makeMesh( "grid", 60, "grid" )
+		names = [ obj + ".vtx[%d]" % i for i in ( 1, 2, 3, 8, 20, 21 ) ] + [ makeMesh( "grid", 60, "other" ) + ".vtx[0:4]" ]
+		sets = helpers.ComponentSet.fromNames( names, "vtx" )
+		self.assertEqual( [ s.obj for s in sets ], [ obj, "|other" ] )
+		self.assertEqual( cmds.ls( [ name for s in sets for name in s.toNames() ], flatten=True ), cmds.ls( names, flatten=True ) )
+
+	def testSetAlgebra( self ):
+		a = helpers.ComponentSet( "|mesh", "vtx", range( 0, 6 ) )
+		b = helpers.ComponentSet( "|mesh", "vtx", range( 4, 10 ) )
+		self.assertEqual( list( a | b ), list( range( 10 ) ) )
+		self.assertEqual( list( a - b ), [ 0, 1, 2, 3 ] )
+		self.assertEqual( ( a & b ).toNames(), [ "|mesh.vtx[4:5]" ] )
+		self.assertIn( 5, a )
+		self.assertNotIn( 6, a )
+		with self.assertRaises( ValueError ):
+			a | helpers.ComponentSet( "|mesh", "f", [ 1 ] )
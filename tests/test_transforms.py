@@ -0,0 +1,415 @@
+import contextlib
+import io
+import unittest.mock
+
+import numpy as np
+
+from emulated_scene import MayaSceneEmulator, SceneTestCase, cmds, helpers, makeMesh
+
+import maya.api.OpenMaya as om2
+
+class WorldBoundingBoxTest( SceneTestCase ):
+
+	def makeGroup( self, name, hidden_only=False ):
+
+		# a group with a visible slab, a slab with its shape hidden, and a slab under a hidden transform
+		group = "|" + cmds.group( empty=True, name=name )
+		if not hidden_only:
+			makeMesh( "slab", 50, name + "_visible", group )
+		hidden_shape = makeMesh( "slab", 50, name + "_hidden_shape", group )
+		cmds.xform( hidden_shape, t=[ 10, 5, 0 ] )
+		cmds.setAttr( hidden_shape + "|" + name + "_hidden_shapeShape.visibility", False )
+		cmds.group( empty=True, name=name + "_hidden_group", parent=group )
+		hidden_group = group + "|" + name + "_hidden_group"
+		cmds.setAttr( hidden_group + ".visibility", False )
+		hidden_child = makeMesh( "slab", 50, name + "_hidden_child", hidden_group )
+		cmds.xform( hidden_child, t=[ -10, -5, 3 ] )
+		return group
+
+	def testHiddenMeshesLeftOut( self ):
+		group = self.makeGroup( "group" )
+		hidden = self.makeGroup( "hidden", hidden_only=True )
+
+		# the box exactWorldBoundingBox -ignoreInvisible gives, and none for a group of hidden meshes
+		bboxes = helpers.getWorldBoundingBoxes( [ group, hidden ] )
+		np.testing.assert_allclose( bboxes[0], cmds.exactWorldBoundingBox( group, ii=True ) )
+		self.assertNotEqual( cmds.exactWorldBoundingBox( group ), cmds.exactWorldBoundingBox( group, ii=True ) )
+		self.assertTrue( np.isnan( bboxes[1] ).all() )
+
+	def testLargeMeshesFromExactWorldBoundingBox( self ):
+		group = self.makeGroup( "group" )
+		cmds.xform( group, ro=[ 30, 20, 10 ], s=[ 1, 2, 3 ] )
+		objs = [ group ] + cmds.listRelatives( group, allDescendents=True, type="transform", fullPath=True )
+
+		# the boxes of the meshes over the vertex limit come from exactWorldBoundingBox, and match the points
+		bboxes = helpers.getWorldBoundingBoxes( objs )
+		with unittest.mock.patch.object( helpers, "BOUNDING_BOX_QUERY_VERTS", 0 ):
+			np.testing.assert_allclose( helpers.getWorldBoundingBoxes( objs ), bboxes, atol=1e-9 )
+
+	def testPivotToolsIgnoreHiddenMeshes( self ):
+		group = self.makeGroup( "group" )
+		bbox = cmds.exactWorldBoundingBox( group, ii=True )
+
+		helpers.setPivot( [ group ], "ymin" )
+		np.testing.assert_allclose( cmds.xform( group, query=True, ws=True, rp=True ), [ ( bbox[0] + bbox[3] ) / 2, bbox[1], ( bbox[2] + bbox[5] ) / 2 ], atol=1e-9 )
+
+		helpers.centerYMin( [ group ] )
+		bbox = cmds.exactWorldBoundingBox( group, ii=True )
+		np.testing.assert_allclose( [ ( bbox[0] + bbox[3] ) / 2, bbox[1], ( bbox[2] + bbox[5] ) / 2 ], [ 0, 0, 0 ], atol=1e-9 )
+
+class DistributeTest( SceneTestCase ):
+
+	def makeSlabs( self, scales ):
+		objs = list()
+		for i, scale in enumerate( scales ):
+			obj = makeMesh( "slab", 50, "slab%d" % i )
+			cmds.xform( obj, t=[ i * 3.0, 1.0, -2.0 ], s=scale )
+			objs.append( obj )
+		return objs
+
+	def testGrid( self ):
+		objs = self.makeSlabs( [ [ 1, 1, 1 ] ] * 5 )
+		helpers.distribute( objs, "grid", 0.5 )
+
+		# three columns of cells as large as the largest slab plus the spacing
+		bboxes = helpers.getWorldBoundingBoxes( objs )
+		cell = bboxes[0, 3:] - bboxes[0, :3] + 0.5
+		index = np.arange( 5 )
+		np.testing.assert_allclose( ( bboxes[:, 0] + bboxes[:, 3] ) / 2, ( index % 3 ) * cell[0], atol=1e-9 )
+		np.testing.assert_allclose( ( bboxes[:, 2] + bboxes[:, 5] ) / 2, ( index // 3 ) * cell[2], atol=1e-9 )
+
+	def testShelves( self ):
+		rng = np.random.default_rng( 2 )
+		objs = self.makeSlabs( np.stack( ( rng.uniform( 0.5, 3, 12 ), np.ones( 12 ), rng.uniform( 2, 20, 12 ) ), axis=1 ).tolist() )
+		helpers.distribute( objs, "shelf", 0.25 )
+
+		# no two slabs overlap on the ground plane, and the rows start at the origin
+		bboxes = helpers.getWorldBoundingBoxes( objs )
+		overlap_x = np.minimum( bboxes[:, None, 3], bboxes[:, 3] ) - np.maximum( bboxes[:, None, 0], bboxes[:, 0] )
+		overlap_z = np.minimum( bboxes[:, None, 5], bboxes[:, 5] ) - np.maximum( bboxes[:, None, 2], bboxes[:, 2] )
+		overlaps = ( overlap_x > 1e-9 ) & ( overlap_z > 1e-9 )
+		np.fill_diagonal( overlaps, False )
+		self.assertFalse( overlaps.any() )
+		self.assertAlmostEqual( bboxes[:, 0].min(), 0.125 )
+		self.assertAlmostEqual( bboxes[:, 2].min(), 0.125 )
+
+	def testAlongAxis( self ):
+		objs = self.makeSlabs( [ [ 1, 1, 1 ], [ 2, 1, 1 ], [ 1, 1, 1 ] ] )
+
+		# a hidden child takes no room, and is not laid out on its own
+		hidden = makeMesh( "slab", 50, "hidden", objs[1] )
+		cmds.xform( hidden, t=[ 5, 0, 0 ], s=[ 4, 1, 1 ] )
+		cmds.setAttr( hidden + ".visibility", False )
+
+		helpers.distribute( objs, "x", 1.0 )
+
+		# the pivots go half a width past the end of the one before, plus the spacing
+		positions = [ cmds.xform( obj, q=True, ws=True, t=True ) for obj in objs ]
+		np.testing.assert_allclose( positions, [ [ 0, 0, 0 ], [ 2.5, 0, 0 ], [ 5, 0, 0 ] ], atol=1e-9 )
+		np.testing.assert_allclose( cmds.xform( hidden, q=True, t=True ), [ 5, 0, 0 ] )
+
+class RandomizeRotationTest( SceneTestCase ):
+
+	def rotations( self, objs ):
+		return [ cmds.getAttr( obj + ".rotate" )[0] for obj in objs ]
+
+	def testSeedIsIndependentOfSelection( self ):
+		objs = [ makeMesh( "grid", 25, "rock%d" % i ) for i in range( 12 ) ]
+		helpers.randomizeRotation( objs, "y", 0, 360, 7 )
+		first = self.rotations( objs )
+
+		# the same seed on part of the selection, in the other order, gives those objects the same angles
+		for obj in objs:
+			cmds.setAttr( obj + ".rotate", 0, 0, 0 )
+		helpers.randomizeRotation( objs[::-1][:5], "y", 0, 360, 7 )
+		self.assertEqual( self.rotations( objs[::-1][:5] ), first[::-1][:5] )
+
+		# another seed scatters them differently, within the range
+		helpers.randomizeRotation( objs, "y", 0, 360, 8 )
+		second = np.array( self.rotations( objs ) )
+		self.assertFalse( np.allclose( second, first ) )
+		self.assertTrue( np.all( ( second[:, 1] >= 0 ) & ( second[:, 1] < 360 ) ) )
+
+	def testAxesAreIndependent( self ):
+
+		# y gets the same angles whether or not x and z are randomized with it
+		objs = [ makeMesh( "grid", 25, "rock%d" % i ) for i in range( 6 ) ]
+		helpers.randomizeRotation( objs, "y", -90, 90, 11 )
+		only_y = np.array( self.rotations( objs ) )
+		helpers.randomizeRotation( objs, "xyz", -90, 90, 11 )
+		all_axes = np.array( self.rotations( objs ) )
+		np.testing.assert_array_equal( all_axes[:, 1], only_y[:, 1] )
+		self.assertTrue( np.all( only_y[:, [ 0, 2 ]] == 0 ) )
+		self.assertTrue( np.all( all_axes[:, [ 0, 2 ]] != 0 ) )
+
+	def testNoSeedDrawsOneAndPrintsIt( self ):
+		objs = [ makeMesh( "grid", 25, "rock%d" % i ) for i in range( 4 ) ]
+		output = io.StringIO()
+		with contextlib.redirect_stdout( output ):
+			helpers.randomizeRotation( objs, "y" )
+		drawn = self.rotations( objs )
+
+		# the printed seed gives the same scatter again
+		seed = int( output.getvalue().split()[-1] )
+		self.assertNotEqual( seed, 0 )
+		for obj in objs:
+			cmds.setAttr( obj + ".rotate", 0, 0, 0 )
+		helpers.randomizeRotation( objs, "y", seed=seed )
+		self.assertEqual( self.rotations( objs ), drawn )
+
+class ResetTransformsTest( SceneTestCase ):
+
+	def build( self ):
+		top = cmds.group( em=True, n="top" )
+		cmds.xform( top, t=[ 1, 2, 3 ], ro=[ 10, 20, 30 ], s=[ 2, 2, 2 ] )
+		cmds.group( em=True, n="grp", p="|top" )
+		cmds.xform( "|top|grp", t=[ 5, 5, 5 ], ro=[ 45, 0, 0 ], s=[ 1, 2, 1 ] )
+		for i in range( 3 ):
+			makeMesh( "grid", 25, "piece%d" % i, "|top|grp" )
+			cmds.xform( "|top|grp|piece%d" % i, t=[ i, i + 1, 2 ], ro=[ i * 5, 3, 1 ], s=[ 1, 3, 1 ] )
+		return [ "|top|grp" ] + [ "|top|grp|piece%d" % i for i in range( 3 ) ]
+
+	def testWorldTranslations( self ):
+		transforms = self.build()
+		helpers.resetTransforms( [ "|top|grp" ], "trans" )
+
+		# everything reset sits at the world origin, the parent above it stays where it was
+		for obj in transforms:
+			np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, t=True ), [ 0, 0, 0 ], atol=1e-9 )
+		np.testing.assert_allclose( cmds.xform( "|top", q=True, ws=True, t=True ), [ 1, 2, 3 ], atol=1e-9 )
+		self.assertEqual( cmds.getAttr( "|top|grp|piece1.rotate" )[0], ( 5.0, 3.0, 1.0 ) )
+
+	def testWorldRotateAndScale( self ):
+		transforms = self.build()
+		helpers.resetTransforms( [ "|top|grp" ], ( "rot", "scale" ) )
+
+		# the topmost transform cancels the rotation and scale of its parent, the rest are reset locally
+		world = np.array( cmds.xform( "|top|grp", q=True, ws=True, m=True ) ).reshape( 4, 4 )
+		np.testing.assert_allclose( world[:3, :3], np.eye( 3 ), atol=1e-9 )
+		for obj in transforms[1:]:
+			self.assertEqual( cmds.getAttr( obj + ".rotate" )[0], ( 0.0, 0.0, 0.0 ) )
+			self.assertEqual( cmds.getAttr( obj + ".scale" )[0], ( 1.0, 1.0, 1.0 ) )
+
+	def worldAxes( self, obj ):
+		return np.array( cmds.xform( obj, q=True, ws=True, m=True ) ).reshape( 4, 4 )[:3, :3]
+
+	def makeChild( self, parent_scale, rotate=( 0, 0, 0 ), scale=( 1, 1, 1 ) ):
+		cmds.group( em=True, n="parent" )
+		cmds.xform( "|parent", t=[ 1, 2, 3 ], s=parent_scale )
+		child = cmds.ls( makeMesh( "grid", 25, "child", "|parent" ), long=True )[0]
+		cmds.xform( child, t=[ 1, 0, 0 ], ro=rotate, s=scale )
+		return child
+
+	def testMirroredParent( self ):
+		child = self.makeChild( [ -2, 1, 1 ], scale=[ 3, 1, 1 ] )
+		helpers.resetTransforms( [ child ], "scale" )
+
+		# every world axis has a length of one, and the world is no longer mirrored
+		axes = self.worldAxes( child )
+		np.testing.assert_allclose( np.linalg.norm( axes, axis=1 ), [ 1, 1, 1 ], atol=1e-9 )
+		self.assertGreater( np.linalg.det( axes ), 0 )
+
+		# with the rotation reset too, the world matrix has no rotation or scale left
+		helpers.resetTransforms( [ child ], ( "rot", "scale" ) )
+		np.testing.assert_allclose( self.worldAxes( child ), np.identity( 3 ), atol=1e-9 )
+
+	def testRotatedChildOfNonUniformParent( self ):
+		child = self.makeChild( [ 2, 1, 1 ], rotate=[ 0, 0, 45 ] )
+		with unittest.mock.patch.object( cmds, "xform", wraps=cmds.xform ) as xform:
+			helpers.resetTransforms( [ child ], "scale" )
+		xform.assert_not_called()
+
+		# the child keeps its rotation, and its world axes are a unit long through the parent's scale
+		self.assertEqual( cmds.getAttr( child + ".rotate" )[0], ( 0.0, 0.0, 45.0 ) )
+		np.testing.assert_allclose( np.linalg.norm( self.worldAxes( child ), axis=1 ), [ 1, 1, 1 ], atol=1e-9 )
+
+	def testMirroredChildGoesThroughXform( self ):
+		child = self.makeChild( [ 2, 1, 1 ], rotate=[ 0, 0, 45 ], scale=[ -1, 2, 1 ] )
+		with unittest.mock.patch.object( cmds, "xform", wraps=cmds.xform ) as xform:
+			helpers.resetTransforms( [ child ], "scale" )
+
+		# a negative local scale hides which axis is mirrored, so that transform is reset by xform -ws
+		xform.assert_called_once_with( child, s=[ 1, 1, 1 ], ws=True )
+		axes = self.worldAxes( child )
+		np.testing.assert_allclose( np.linalg.norm( axes, axis=1 ), [ 1, 1, 1 ], atol=1e-9 )
+		self.assertGreater( np.linalg.det( axes ), 0 )
+
+	def testZeroScaledParent( self ):
+		transforms = self.build()
+		cmds.xform( "|top", s=[ 2, 0, 2 ] )
+		helpers.resetTransforms( [ "|top|grp" ], ( "rot", "scale" ) )
+
+		# the scale under a flattened parent cannot be undone, so the topmost transform keeps its own
+		self.assertEqual( cmds.getAttr( "|top|grp.scale" )[0], ( 1.0, 2.0, 1.0 ) )
+		self.assertTrue( np.isfinite( cmds.getAttr( "|top|grp.rotate" )[0] ).all() )
+		for obj in transforms[1:]:
+			self.assertEqual( cmds.getAttr( obj + ".scale" )[0], ( 1.0, 1.0, 1.0 ) )
+
+	def testEulerFromMatrices( self ):
+		rng = np.random.default_rng( 4 )
+		angles = rng.uniform( -80, 80, ( 30, 3 ) )
+		matrices = np.array( [ MayaSceneEmulator.rotationMatrix( a ) for a in angles ] )
+		np.testing.assert_allclose( helpers.eulerFromMatrices( matrices, np.zeros( 30, dtype=np.int64 ) ), angles, atol=1e-9 )
+
+class MatchGroupTransformsTest( SceneTestCase ):
+
+	def build( self ):
+		cmds.group( em=True, n="A" )
+		cmds.group( em=True, n="B" )
+		cmds.xform( "|B", t=[ 3, 0, 0 ], ro=[ 0, 30, 0 ] )
+		cmds.group( em=True, n="sub", p="|A" )
+		cmds.group( em=True, n="sub", p="|B" )
+		cmds.xform( "|B|sub", t=[ 0, 1, 0 ], s=[ 2, 2, 2 ] )
+		for i in range( 3 ):
+			makeMesh( "grid", 25 * ( i + 1 ), "piece%d" % i, "|A|sub" )
+		for i in reversed( range( 3 ) ):
+			makeMesh( "grid", 25 * ( i + 1 ), "piece%d_01" % i, "|B|sub" )
+			cmds.xform( "|B|sub|piece%d_01" % i, t=[ i, 2 * i, 0 ], ro=[ 10 * i, 0, 5 ] )
+		makeMesh( "grid", 25, "extra", "|A" )
+
+	def matchedNames( self, key_mode ):
+		self.build()
+		with contextlib.redirect_stdout( io.StringIO() ):
+			result = helpers.matchGroupTransforms( "|A", "|B", True, key_mode )
+		for obj, target in result["matched"]:
+			np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, m=True ), cmds.xform( target, q=True, ws=True, m=True ), atol=1e-9 )
+		return [ ( obj.rsplit( "|", 1 )[-1], target.rsplit( "|", 1 )[-1] ) for obj, target in result["matched"] ], result
+
+	def testRegex( self ):
+		pairs, result = self.matchedNames( "regex" )
+		self.assertEqual( pairs, [ ( "sub", "sub" ), ( "piece0", "piece0_01" ), ( "piece1", "piece1_01" ), ( "piece2", "piece2_01" ) ] )
+		self.assertEqual( result["unmatched"], [ "|A|extra" ] )
+
+	def testTopology( self ):
+		pairs, result = self.matchedNames( "topology" )
+		self.assertEqual( pairs[1:], [ ( "piece0", "piece0_01" ), ( "piece1", "piece1_01" ), ( "piece2", "piece2_01" ) ] )
+
+	def testName( self ):
+		pairs, result = self.matchedNames( "name" )
+		self.assertEqual( pairs, [ ( "sub", "sub" ) ] )
+		self.assertEqual( len( result["unused"] ), 3 )
+
+class PivotToolsTest( SceneTestCase ):
+
+	def makeObjects( self ):
+
+		# parented, rotated and scaled meshes, a tube with poles, and a group without meshes
+		cmds.group( em=True, n="parent" )
+		cmds.xform( "|parent", t=[ 1, -2, 3 ], ro=[ 0, 45, 0 ], s=[ 2, 2, 2 ] )
+		objs = list()
+		for i, mesh_type in enumerate( [ "slab", "tube", "grid" ] ):
+			obj = makeMesh( mesh_type, 50, "piece%d" % i, "|parent" if i != 2 else None )
+			cmds.xform( obj, t=[ i, 2 * i + 1, -i ], ro=[ 10 * i, 20, 5 ], s=[ 1, 1 + i, 1 ] )
+			objs.append( cmds.ls( obj, long=True )[0] )
+		objs.append( "|" + cmds.group( em=True, n="empty" ) )
+		cmds.xform( objs[-1], t=[ 4, 5, 6 ] )
+		return objs
+
+	def testSetPivotModes( self ):
+		objs = self.makeObjects()
+		for mode in [ "center", "xmin", "xmax", "ymin", "ymax", "zmin", "zmax" ]:
+			helpers.setPivot( objs, mode )
+
+			# the center of each exactWorldBoundingBox, with the min or max side along the axis of the mode
+			for obj in objs[:-1]:
+				bbox = cmds.exactWorldBoundingBox( obj, ii=True )
+				pivot = [ ( bbox[i] + bbox[i + 3] ) / 2 for i in range( 3 ) ]
+				if mode != "center":
+					axis = "xyz".index( mode[0] )
+					pivot[axis] = bbox[axis + ( 3 if mode[1:] == "max" else 0 )]
+				np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, rp=True ), pivot, atol=1e-9 )
+				np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, sp=True ), pivot, atol=1e-9 )
+
+			# the group without meshes keeps its pivot
+			np.testing.assert_allclose( cmds.xform( objs[-1], q=True, ws=True, rp=True ), [ 4, 5, 6 ], atol=1e-9 )
+
+	def testCenterYMinFreezes( self ):
+		objs = self.makeObjects()
+		helpers.centerYMin( objs[:-1] )
+
+		# the center at Y min of each box is on the origin, and each transform is frozen with its pivot there
+		for obj in objs[:-1]:
+			bbox = cmds.exactWorldBoundingBox( obj, ii=True )
+			np.testing.assert_allclose( [ ( bbox[0] + bbox[3] ) / 2, bbox[1], ( bbox[2] + bbox[5] ) / 2 ], [ 0, 0, 0 ], atol=1e-9 )
+			self.assertEqual( cmds.xform( obj, q=True, t=True ), [ 0, 0, 0 ] )
+			self.assertEqual( cmds.xform( obj, q=True, ro=True ), [ 0, 0, 0 ] )
+			self.assertEqual( cmds.xform( obj, q=True, r=True, s=True ), [ 1, 1, 1 ] )
+			np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, rp=True ), [ 0, 0, 0 ], atol=1e-9 )
+
+	def testLowestPolesInOneBatch( self ):
+
+		# tubes with poles between grids without, read with no cmds calls once the poles are cached
+		objs = [ makeMesh( "grid" if i % 2 else "tube", 60, "mesh%d" % i ) for i in range( 6 ) ]
+		for i, obj in enumerate( objs ):
+			cmds.xform( obj, t=[ i, -i, 2 * i ], ro=[ 10 * i, 0, 5 * i ] )
+		expected = list()
+		for obj in objs:
+			poles = helpers.getPoleVerts( obj ).indices
+			pole_pos = helpers.getMeshPoints( obj )[ poles ]
+			expected.append( pole_pos[ np.argmin( pole_pos[:, 1] ) ] if len( poles ) else [ np.nan ] * 3 )
+
+		recorded = unittest.mock.Mock( wraps=cmds )
+		sel_lists = unittest.mock.Mock( wraps=om2.MSelectionList )
+		with unittest.mock.patch.object( helpers, "cmds", recorded ), unittest.mock.patch.object( om2, "MSelectionList", sel_lists ):
+			positions = helpers.getLowestPoles( objs )
+		np.testing.assert_allclose( positions, expected, atol=1e-12 )
+
+		# only the progress reporter asks Maya anything, and besides the cache lookup of each mesh
+		# the points of all of them are read through one selection list
+		self.assertEqual( set( call[0].split( "." )[0] for call in recorded.mock_calls ) - { "about" }, set() )
+		self.assertEqual( sel_lists.call_count, len( objs ) + 1 )
+
+	def testCenterPoleUnderParent( self ):
+		objs = self.makeObjects()
+		tube = objs[1]
+
+		# the lowest pole is found among the world positions of the poles
+		poles = helpers.getPoleVerts( tube ).indices
+		pole_pos = np.array( cmds.xform( [ tube + ".vtx[%d]" % v for v in poles ], q=True, ws=True, t=True ) ).reshape( -1, 3 )
+		np.testing.assert_allclose( helpers.getLowestPoles( [ tube ] )[0], pole_pos[ np.argmin( pole_pos[:, 1] ) ], atol=1e-9 )
+
+		with contextlib.redirect_stdout( io.StringIO() ):
+			helpers.centerPole( objs[:3] )
+		np.testing.assert_allclose( helpers.getLowestPoles( [ tube ] ), [ [ 0, 0, 0 ] ], atol=1e-9 )
+		np.testing.assert_allclose( cmds.xform( tube, q=True, ws=True, rp=True ), [ 0, 0, 0 ], atol=1e-9 )
+
+	def testPivotToWorldOrigin( self ):
+		objs = self.makeObjects()
+		before = [ cmds.exactWorldBoundingBox( obj ) for obj in objs[:-1] ]
+		helpers.pivotToWorldOrigin( objs[:-1] )
+
+		# the meshes stay where they are, with frozen transforms pivoting on the origin
+		for obj, bbox in zip( objs[:-1], before ):
+			np.testing.assert_allclose( cmds.exactWorldBoundingBox( obj ), bbox, atol=1e-9 )
+			np.testing.assert_allclose( cmds.xform( obj, q=True, ws=True, rp=True ), [ 0, 0, 0 ], atol=1e-9 )
+			self.assertEqual( cmds.xform( obj, q=True, ro=True ), [ 0, 0, 0 ] )
+	def testNonFiniteValuesRefused( self ):
+		objs = self.makeObjects()
+		pivots = [ cmds.xform( obj, q=True, ws=True, rp=True ) for obj in objs ]
+
+		# a nan or inf anywhere refuses the whole write, naming the objects, before any pivot or channel moves
+		with self.assertRaisesRegex( ValueError, objs[1] ):
+			helpers.setWorldPivots( objs, [ [ 0, 0, 0 ], [ 0, np.nan, 0 ], [ 0, 0, 0 ], [ 0, 0, 0 ] ] )
+		self.assertEqual( [ cmds.xform( obj, q=True, ws=True, rp=True ) for obj in objs ], pivots )
+		with self.assertRaisesRegex( ValueError, objs[2] ):
+			helpers.setTransformAttrs( objs[:3], "scale", [ [ 1, 1, 1 ], [ 1, 1, 1 ], [ np.inf, 1, 1 ] ] )
+		self.assertEqual( cmds.getAttr( objs[0] + ".scale" )[0], ( 1.0, 1.0, 1.0 ) )
+
+class CenterPoleTest( SceneTestCase ):
+
+	def testMeshesWithoutPolesOnOneLine( self ):
+		tube = makeMesh( "tube", 50, "tube" )
+		cmds.xform( tube, t=[ 3, 2, 1 ] )
+		grids = [ makeMesh( "grid", 50, "grid%d" % i ) for i in range( 3 ) ]
+		for grid in grids:
+			cmds.xform( grid, t=[ 0, 5, 0 ] )
+
+		output = io.StringIO()
+		with contextlib.redirect_stdout( output ):
+			helpers.centerPole( grids[:2] + [ tube ] + grids[2:] )
+		self.assertEqual( output.getvalue(), "Center Pole: no poles on 3 meshes: |grid0, |grid1, |grid2\n" )
+
+		# the tube has its lowest pole on the origin, the grids stay where they were
+		np.testing.assert_allclose( helpers.getLowestPoles( [ tube ] ), [ [ 0, 0, 0 ] ], atol=1e-12 )
+		for grid in grids:
+			self.assertEqual( cmds.xform( grid, query=True, t=True, ws=True ), [ 0, 5, 0 ] )
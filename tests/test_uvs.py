@@ -0,0 +1,228 @@
+import contextlib
+import io
+import unittest.mock
+
+import numpy as np
+
+from emulated_scene import MayaSceneEmulator, SceneTestCase, cmds, helpers, makeMesh, scene
+
+import maya.api.OpenMaya as om2
+
+def baselineFitUVs( obj, scale_dimension ):
+
+	# the uv by uv fit the scripts ran before: scale from the origin, then move the lowest uv of
+	# the leftmost ones to the origin
+	sel_uv = cmds.ls( cmds.polyListComponentConversion( obj, toUV=True ), long=True, flatten=True )
+	uv_name_val = [ [ uv ] + cmds.polyEditUV( uv, query=True ) for uv in sel_uv ]
+	column = 1 if scale_dimension == "u" else 2
+	values = [ elem[column] for elem in uv_name_val ]
+	scale = 1 / abs( max( values ) - min( values ) )
+	min_u = min( elem[1] for elem in uv_name_val )
+	min_uv_name = sorted( [ elem for elem in uv_name_val if elem[1] <= min_u ], key=lambda elem: elem[2] )[0][0]
+	cmds.polyEditUV( sel_uv, su=scale, sv=scale )
+	min_uv_val = cmds.polyEditUV( min_uv_name, query=True )
+	cmds.polyEditUV( sel_uv, u=0 - min_uv_val[0], v=0 - min_uv_val[1] )
+
+def baselineScreenPosition( cam, world_pos ):
+
+	# one point at a time through the inverse camera matrix and the projection matrix
+	sel_list = om2.MSelectionList()
+	sel_list.add( cam )
+	dag_path = sel_list.getDagPath( 0 )
+	dag_path.extendToShape()
+	mtx = dag_path.inclusiveMatrix().inverse() * om2.MFnCamera( dag_path ).projectionMatrix()
+	point = list( world_pos ) + [ 1.0 ]
+	clip = [ sum( point[r] * mtx.getElement( r, c ) for r in range( 4 ) ) for c in range( 4 ) ]
+	return [ clip[0] / clip[3] / 2 + .5, clip[1] / clip[3] / 2 + .5 ]
+
+def baselineCameraProject( objs, cam, uv_set, scale_u, scale_v ):
+
+	# the uv by uv projection the scripts ran before
+	for obj in objs:
+		cmds.polyPlanarProjection( obj, ch=True, ibd=True, md="z" )
+	uvs = cmds.ls( cmds.polyListComponentConversion( objs, toUV=True ), flatten=True, l=True )
+	for uv in uvs:
+		vertex = cmds.ls( cmds.polyListComponentConversion( uv, toVertex=True ), flatten=True, l=True )[0]
+		uv_coord = baselineScreenPosition( cam, cmds.xform( vertex, t=True, ws=True, query=True ) )
+		cmds.polyEditUV( uv, r=False, uValue=uv_coord[0], vValue=uv_coord[1], uvs=uv_set )
+	cmds.polyEditUV( uvs, scaleU=scale_u, scaleV=scale_v, pivotU=0.5, pivotV=0.5, uvs=uv_set )
+
+def baselineVertexColor( obj, channel ):
+
+	# the vertex by vertex "V Coord -> R" the scripts ran before: the v of the first uv of each vertex,
+	# added to its color
+	vertex_color = [ 1.0 if c == channel else 0.0 for c in "rgb" ]
+	for vert in cmds.ls( cmds.polyListComponentConversion( obj, toVertex=True ), flatten=True ):
+		uv = cmds.ls( cmds.polyListComponentConversion( vert, toUV=True ), flatten=True )[0]
+		value = cmds.polyEditUV( uv, query=True )[1]
+		cmds.polyColorPerVertex( vert, rgb=[ value * c for c in vertex_color ], rel=True, cdo=True )
+
+def makeSeamMesh( name ):
+
+	# two quads side by side, where the right one has its own copy of the uvs along the shared edge
+	points = [ [ 0, 0, 0 ], [ 1, 0, 0 ], [ 2, 0, 0 ], [ 0, 1, 0 ], [ 1, 1, 0 ], [ 2, 1, 0 ] ]
+	u = [ 0.0, 0.5, 0.0, 0.5, 0.6, 1.0, 1.0, 0.6 ]
+	v = [ 0.0, 0.0, 0.5, 0.5, 0.1, 0.1, 0.9, 0.9 ]
+	return scene.createMesh( name, points, [ 4, 4 ], [ 0, 1, 4, 3, 1, 2, 5, 4 ], ( u, v, [ 0, 1, 3, 2, 4, 5, 6, 7 ] ) )
+
+class FitUVsTest( SceneTestCase ):
+
+	def testMatchesBaseline( self ):
+		for scale_dimension in ( "u", "v" ):
+			objs = list()
+			for name in ( "fitted", "baseline" ):
+				obj = makeMesh( "shells", 120, name + scale_dimension )
+				cmds.polyEditUV( obj, su=0.3, sv=0.7, pu=0.2, pv=0.1, a=10, u=2.0, v=-1.0 )
+				objs.append( obj )
+
+			helpers.fitMeshUVsToDimension( objs[:1], scale_dimension )
+			baselineFitUVs( objs[1], scale_dimension )
+			for fitted, expected in zip( helpers.getMeshUVs( objs[0] ), helpers.getMeshUVs( objs[1] ) ):
+				np.testing.assert_allclose( fitted, expected, atol=1e-12 )
+
+	def testSkipsFlatShells( self ):
+		flat = makeMesh( "shells", 120, "flat" )
+		fitted = makeMesh( "shells", 120, "fitted" )
+		# every u at 0.5 leaves no extent to scale in u
+		cmds.polyEditUV( flat, su=0.0, pu=0.5 )
+		before = helpers.getMeshUVs( flat )
+		self.assertTrue( np.all( before[0] == 0.5 ) )
+
+		output = io.StringIO()
+		with contextlib.redirect_stdout( output ):
+			helpers.fitMeshUVsToDimension( [ flat, fitted ], "u" )
+
+		self.assertIn( "Fit UVs: no extent in u on 1 meshes: " + flat, output.getvalue() )
+		for after, expected in zip( helpers.getMeshUVs( flat ), before ):
+			np.testing.assert_array_equal( after, expected )
+		u, v = helpers.getMeshUVs( fitted )
+		self.assertTrue( np.all( np.isfinite( u ) ) and np.all( np.isfinite( v ) ) )
+		self.assertAlmostEqual( u.max() - u.min(), 1.0 )
+
+class CameraProjectionTest( SceneTestCase ):
+
+	def testPointsMatchBaseline( self ):
+		cam = scene.createCamera( "camera1", ( 1.0, 2.0, 8.0 ), ( -10.0, 5.0, 0.0 ) )
+		points = np.random.default_rng( 1 ).uniform( -2, 2, ( 40, 3 ) )
+		x, y = helpers.projectPointsToScreen( points, helpers.getCameraMatrix( cam ) )
+		np.testing.assert_allclose( np.stack( ( x, y ), axis=1 ), [ baselineScreenPosition( cam, p ) for p in points ], atol=1e-12 )
+		self.assertEqual( helpers.worldSpaceToScreenSpace( cam, points[3] ), [ x[3], y[3] ] )
+
+	def testUVsMatchBaseline( self ):
+
+		# a moved grid and a scaled tube, in each fill mode
+		for projection_fill, scale_u, scale_v in ( ( 0, 1, 1 ), ( 1, 1, 1080 / 1920.0 ), ( 2, 1920 / 1080.0, 1 ) ):
+			scene.reset()
+			cam = scene.createCamera( "camera1", ( 1.0, 0.5, 6.0 ), ( 0.0, 10.0, 0.0 ) )
+			meshes = dict()
+			for name in ( "projected", "baseline" ):
+				meshes[name] = [ makeMesh( "grid", 60, name + "_grid" ), makeMesh( "tube", 60, name + "_tube" ) ]
+				cmds.xform( meshes[name][0], t=[ -1, 0, 0 ], ro=[ 0, 20, 0 ] )
+				cmds.xform( meshes[name][1], t=[ 1, -1, -2 ], s=[ 0.5, 0.5, 0.5 ] )
+
+			helpers.cameraProjectUVs( meshes["projected"], cam, "map1", projection_fill )
+			baselineCameraProject( meshes["baseline"], cam, "map1", scale_u, scale_v )
+			for projected, expected in zip( meshes["projected"], meshes["baseline"] ):
+				for a, b in zip( helpers.getMeshUVs( projected, "map1" ), helpers.getMeshUVs( expected, "map1" ) ):
+					np.testing.assert_allclose( a, b, atol=1e-12 )
+
+class VertexColorTest( SceneTestCase ):
+
+	def colors( self, obj ):
+		return helpers.getMeshColors( obj, True )
+
+	def testMatchesBaselineWithoutSeams( self ):
+
+		# with one uv per vertex, every face-vertex gets the color the vertex got, added twice over
+		for channel in "rgb":
+			scene.reset()
+			colored = makeMesh( "tube", 60, "colored" )
+			expected = makeMesh( "tube", 60, "expected" )
+			for i in range( 2 ):
+				helpers.applyVertexColor( [ colored ], "uv_v", channel )
+				baselineVertexColor( expected, channel )
+			np.testing.assert_allclose( self.colors( colored ), self.colors( expected ), atol=1e-12 )
+
+	def testSeamsKeepTheirOwnValues( self ):
+		obj = makeSeamMesh( "seam" )
+		helpers.applyVertexColor( [ obj ], "uv_v", "r" )
+		np.testing.assert_allclose( self.colors( obj )[:, 0], [ 0.0, 0.0, 0.5, 0.5, 0.1, 0.1, 0.9, 0.9 ] )
+		np.testing.assert_allclose( self.colors( obj )[:, 1:], [ [ 0, 0, 1 ] ] * 8 )
+
+		# the old loop gave both sides of the seam the value of the first uv of the vertex
+		expected = makeSeamMesh( "expected" )
+		baselineVertexColor( expected, "r" )
+		self.assertEqual( self.colors( expected )[:, 0].tolist(), [ 0.0, 0.0, 0.5, 0.5, 0.0, 0.1, 0.9, 0.5 ] )
+
+	def testClear( self ):
+		obj = makeMesh( "grid", 60, "grid" )
+		helpers.applyVertexColor( [ obj ], "uv_v", "g" )
+		helpers.applyVertexColor( [ obj ], "clear", "g" )
+		np.testing.assert_array_equal( self.colors( obj ), np.tile( [ 0.0, 0.0, 0.0, 1.0 ], ( len( self.colors( obj ) ), 1 ) ) )
+
+def baselineTransferUVSet( source_obj, dest_objs, uv_set ):
+
+	# the transfer the scripts ran before: every destination through transferAttributes
+	for dest_obj in dest_objs:
+		cmds.transferAttributes( source_obj, dest_obj, transferUVs=True, sampleSpace=4, sourceUvSet=uv_set, targetUvSet=uv_set )
+	for obj in list( dest_objs ) + [ source_obj ]:
+		cmds.polyUVSet( obj, currentUVSet=True, uvSet=uv_set )
+
+class TransferUVSetTest( SceneTestCase ):
+
+	def makeMeshes( self, prefix ):
+
+		# a source with its own uvs in the set, two copies of its topology, and one with the same
+		# faces on renumbered vertices, which has another signature
+		points, face_counts, face_verts, uvs = MayaSceneEmulator.makeGrid( 200 )
+		source = scene.createMesh( prefix + "source", points, face_counts, face_verts, uvs )
+		u, v, fv_uvs = uvs
+		rng = np.random.default_rng( 2 )
+		helpers.setMeshUVLayout( source, rng.uniform( 0, 1, len( u ) ), rng.uniform( 0, 1, len( v ) ), face_counts, fv_uvs[::-1].copy(), "UnitizeUV" )
+
+		order = np.arange( len( points ) )[::-1]
+		renumbered = np.empty_like( order )
+		renumbered[order] = np.arange( len( order ) )
+		dests = [ scene.createMesh( prefix + "copy%d" % i, points, face_counts, face_verts, uvs ) for i in range( 2 ) ]
+		dests.append( scene.createMesh( prefix + "renumbered", points[order], face_counts, renumbered[face_verts], uvs ) )
+
+		return source, dests
+
+	def assertSameUVs( self, objs, expected_objs, uv_set ):
+		for obj, expected in zip( objs, expected_objs ):
+			for a, b in zip( helpers.getMeshUVs( obj, uv_set ), helpers.getMeshUVs( expected, uv_set ) ):
+				np.testing.assert_array_equal( a, b )
+			fn_mesh = helpers.getMeshFn( obj )
+			for a, b in zip( fn_mesh.getAssignedUVs( uv_set ), helpers.getMeshFn( expected ).getAssignedUVs( uv_set ) ):
+				np.testing.assert_array_equal( a, b )
+			self.assertEqual( fn_mesh.currentUVSetName(), helpers.getMeshFn( expected ).currentUVSetName() )
+
+	def testMatchesBaseline( self ):
+		for mode, copied in ( ( "signature", 2 ), ( "sample", 0 ) ):
+			scene.reset()
+			helpers.mesh_cache.clear()
+			source, dests = self.makeMeshes( "transferred_" )
+			expected_source, expected_dests = self.makeMeshes( "expected_" )
+
+			counts = helpers.transferUVSet( source, dests, "UnitizeUV", mode )
+			self.assertEqual( dict( counts ), { "copied": copied, "transferred": 3 - copied } )
+			baselineTransferUVSet( expected_source, expected_dests, "UnitizeUV" )
+			self.assertSameUVs( [ source ] + dests, [ expected_source ] + expected_dests, "UnitizeUV" )
+			self.assertEqual( helpers.getMeshFn( dests[0] ).currentUVSetName(), "UnitizeUV" )
+
+			# map1 is left as it was
+			self.assertSameUVs( dests, expected_dests, "map1" )
+
+	def testSignatureReadsNoEdges( self ):
+
+		# the signature only hashes the face-vertex lists, so no destination has its edges parsed
+		source, dests = self.makeMeshes( "" )
+		with unittest.mock.patch.object( cmds, "polyInfo", side_effect=AssertionError( "parsed the edges" ) ):
+			signatures = [ helpers.getTopologySignature( obj ) for obj in [ source ] + dests ]
+		self.assertEqual( signatures[1:3], [ signatures[0] ] * 2 )
+		self.assertNotEqual( signatures[3], signatures[0] )
+
+	def testOnlyTopologyTransfersAreEmulated( self ):
+		source, dests = self.makeMeshes( "" )
+		with self.assertRaises( MayaSceneEmulator.EmulatorUnsupportedError ):
+			cmds.transferAttributes( source, dests[0], transferUVs=2, sampleSpace=0 )
@@ -0,0 +1,174 @@
+import unittest
+import unittest.mock
+
+import numpy as np
+
+from emulated_scene import MayaSceneEmulator
+
+import GameAssetWorkers as workers
+
+class RunKernelTest( unittest.TestCase ):
+
+	@classmethod
+	def tearDownClass( cls ):
+		workers.shutdownPool()
+
+	def meshes( self ):
+		meshes = list()
+		for i, num_verts in enumerate( ( 300, 500, 700, 900 ) ):
+			points, face_counts, face_verts, ( u, v, face_vert_uvs ) = MayaSceneEmulator.makeGrid( num_verts )
+			meshes.append( dict( face_counts=face_counts, face_verts=face_verts, face_vert_uvs=face_vert_uvs, u=u * ( i + 1 ), v=v * ( i + 2 ) + i, vert_ids=np.array( [ 0, 1 ] ) ) )
+		return meshes
+
+	def testKernelsMatchInline( self ):
+
+		# the batch has to give the results the kernel gives when called on each mesh
+		meshes = self.meshes()
+		results = workers.runKernel( "fitMeshUVs", meshes, ( "v", ), processes=0 )
+		for mesh, ( u, v ) in zip( meshes, results ):
+			expected_u, expected_v = workers.fitMeshUVs( mesh, "v" )
+			np.testing.assert_array_equal( u, expected_u )
+			np.testing.assert_array_equal( v, expected_v )
+
+	@unittest.skipIf( workers.shared_memory is None, "no shared memory in this Python" )
+	def testPooledMatchesInline( self ):
+		meshes = self.meshes()
+		for kernel_name, args in ( ( "fitMeshUVs", ( "u", ) ), ( "orientUnitizedUVs", () ) ):
+			inline = workers.runKernel( kernel_name, meshes, args, processes=0 )
+			pooled = workers.runKernel( kernel_name, meshes, args, processes=2, min_uvs=1 )
+			for ( u, v ), ( pooled_u, pooled_v ) in zip( inline, pooled ):
+				np.testing.assert_array_equal( u, pooled_u )
+				np.testing.assert_array_equal( v, pooled_v )
+
+	def testDaemonRunsInline( self ):
+
+		# a batch worker is a daemon, and has to run the kernels without a pool
+		meshes = self.meshes()
+		inline = workers.runKernel( "fitMeshUVs", meshes, ( "u", ), processes=0 )
+		daemon = unittest.mock.Mock( daemon=True )
+		with unittest.mock.patch.object( workers.multiprocessing, "current_process", return_value=daemon ):
+			with unittest.mock.patch.object( workers, "getPool", side_effect=AssertionError( "started a pool" ) ):
+				results = workers.runKernel( "fitMeshUVs", meshes, ( "u", ), processes=2, min_uvs=1 )
+		for ( u, v ), ( daemon_u, daemon_v ) in zip( inline, results ):
+			np.testing.assert_array_equal( u, daemon_u )
+			np.testing.assert_array_equal( v, daemon_v )
+
+	@unittest.skipIf( workers.shared_memory is None, "no shared memory in this Python" )
+	def testFailedBatchFreesItsBlocks( self ):
+
+		# uvs that can not be copied fail the batch after the blocks of the fields before them were made
+		meshes = self.meshes()
+		meshes[-1]["v"] = [ "not a number" ] * len( meshes[-1]["v"] )
+		created = list()
+		SharedMemory = workers.shared_memory.SharedMemory
+		def recordBlock( *args, **kwargs ):
+			block = SharedMemory( *args, **kwargs )
+			created.append( block.name )
+			return block
+
+		with unittest.mock.patch.object( workers.shared_memory, "SharedMemory", recordBlock ):
+			with self.assertRaises( ValueError ):
+				workers.runKernel( "fitMeshUVs", meshes, ( "u", ), processes=2, min_uvs=1 )
+
+		self.assertEqual( len( created ), 6 )
+		for name in created:
+			with self.assertRaises( FileNotFoundError ):
+				SharedMemory( name=name )
+
+class SkylinePackerTest( unittest.TestCase ):
+
+	def pack( self, seed, rotate ):
+		rng = np.random.default_rng( seed )
+		widths = rng.uniform( 0.05, 1.0, 60 )
+		heights = rng.uniform( 0.05, 1.0, 60 )
+		x, y, turned, side = workers.packRects( widths, heights, 0.01, rotate )
+		return widths + 0.01, heights + 0.01, x, y, turned, side
+
+	def assertNoOverlaps( self, x, y, widths, heights ):
+		overlap_x = np.minimum( x[:, None] + widths[:, None], x + widths ) - np.maximum( x[:, None], x )
+		overlap_y = np.minimum( y[:, None] + heights[:, None], y + heights ) - np.maximum( y[:, None], y )
+		overlaps = ( overlap_x > 1e-9 ) & ( overlap_y > 1e-9 )
+		np.fill_diagonal( overlaps, False )
+		self.assertFalse( overlaps.any() )
+
+	def testNoOverlaps( self ):
+		for rotate in ( True, False ):
+			widths, heights, x, y, turned, side = self.pack( 5, rotate )
+			if not rotate:
+				self.assertFalse( turned.any() )
+			packed_widths = np.where( turned, heights, widths )
+			packed_heights = np.where( turned, widths, heights )
+
+			# every rect in the square, and no two rects covering the same area
+			self.assertTrue( np.all( x >= -1e-9 ) and np.all( y >= -1e-9 ) )
+			self.assertTrue( np.all( x + packed_widths <= side + 1e-9 ) and np.all( y + packed_heights <= side + 1e-9 ) )
+			self.assertNoOverlaps( x, y, packed_widths, packed_heights )
+
+			# not much larger than the area of the rects
+			self.assertLess( np.sum( widths * heights ) / side ** 2, 1.0 )
+			self.assertGreater( np.sum( widths * heights ) / side ** 2, 0.6 )
+
+	def testDeterministic( self ):
+		first = self.pack( 9, True )
+		second = self.pack( 9, True )
+		for a, b in zip( first, second ):
+			np.testing.assert_array_equal( a, b )
+
+	def testPackUVShells( self ):
+
+		# two meshes with square shells of different sizes, far outside the zero to one space
+		rng = np.random.default_rng( 3 )
+		meshes = list()
+		for num_shells in ( 5, 8 ):
+			sizes = rng.uniform( 0.5, 4.0, num_shells )
+			corners = np.array( [ [ 0, 0 ], [ 1, 0 ], [ 1, 1 ], [ 0, 1 ] ] )
+			uvs = ( corners[None] * sizes[:, None, None] + rng.uniform( -10, 10, ( num_shells, 1, 2 ) ) ).reshape( -1, 2 )
+			shells = np.append( np.repeat( np.arange( num_shells ), 4 ), -1 )
+			meshes.append( dict( u=np.append( uvs[:, 0], 7.0 ), v=np.append( uvs[:, 1], 7.0 ), shells=shells ) )
+
+		packed = workers.packUVShells( meshes, padding=4, resolution=256 )
+
+		widths = list()
+		boxes = list()
+		for mesh, ( u, v ) in zip( meshes, packed ):
+
+			# the uv on no face stays where it was
+			self.assertEqual( ( u[-1], v[-1] ), ( 7.0, 7.0 ) )
+			u = u[:-1].reshape( -1, 4 )
+			v = v[:-1].reshape( -1, 4 )
+			self.assertTrue( np.all( u >= 0 ) and np.all( u <= 1 ) and np.all( v >= 0 ) and np.all( v <= 1 ) )
+			widths.append( ( u.max( axis=1 ) - u.min( axis=1 ) ) / np.ptp( mesh["u"][:-1].reshape( -1, 4 ), axis=1 ) )
+			boxes.append( np.stack( ( u.min( axis=1 ), v.min( axis=1 ), np.ptp( u, axis=1 ), np.ptp( v, axis=1 ) ), axis=1 ) )
+
+		# every shell scaled by the same amount, and at least the padding apart
+		widths = np.concatenate( widths )
+		np.testing.assert_allclose( widths, widths[0] )
+		boxes = np.concatenate( boxes )
+		pad = 4 / 256.0
+		self.assertNoOverlaps( boxes[:, 0] - pad / 2 + 1e-9, boxes[:, 1] - pad / 2 + 1e-9, boxes[:, 2] + pad - 2e-9, boxes[:, 3] + pad - 2e-9 )
+
+	def testPaddingHoldsForManyShells( self ):
+
+		# enough shells that the padding grows the square well past the first guess
+		rng = np.random.default_rng( 11 )
+		num_shells = 2000
+		sizes = rng.uniform( 0.02, 0.2, ( num_shells, 2 ) )
+		corners = np.array( [ [ 0, 0 ], [ 1, 0 ], [ 1, 1 ], [ 0, 1 ] ] )
+		uvs = ( corners[None] * sizes[:, None, :] ).reshape( -1, 2 )
+		mesh = dict( u=uvs[:, 0], v=uvs[:, 1], shells=np.repeat( np.arange( num_shells ), 4 ) )
+
+		u, v = workers.packUVShells( [ mesh ], padding=4, resolution=512 )[0]
+
+		# the smallest gap between two shells, along the axis they are apart on, in texels
+		u = u.reshape( -1, 4 )
+		v = v.reshape( -1, 4 )
+		low = np.stack( ( u.min( axis=1 ), v.min( axis=1 ) ), axis=1 )
+		high = np.stack( ( u.max( axis=1 ), v.max( axis=1 ) ), axis=1 )
+		gaps = np.maximum( low[:, None] - high[None], low[None] - high[:, None] ).max( axis=2 )
+		np.fill_diagonal( gaps, np.inf )
+		self.assertGreaterEqual( gaps.min() * 512, 4 - 1e-9 )
+
+	def testPaddingTooLarge( self ):
+		mesh = dict( u=np.tile( [ 0.0, 1.0, 1.0, 0.0 ], 100 ), v=np.tile( [ 0.0, 0.0, 1.0, 1.0 ], 100 ), shells=np.repeat( np.arange( 100 ), 4 ) )
+		with self.assertRaises( ValueError ):
+			workers.packUVShells( [ mesh ], padding=16, resolution=128 )